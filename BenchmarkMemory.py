@@ -0,0 +1,88 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+Memory benchmark for a book of FX forwards.
+
+Each trade carries its deal price, a forward rate (with its spot rate and swap point)
+and the discount factors of both currencies to maturity, which is what a PnL or PVBP
+run keeps alive per trade. The same trades are also measured alone, as objects and as
+a columnar trade book.
+
+Usage:
+    python BenchmarkMemory.py [number_of_trades]
+"""
+
+import sys
+import datetime
+import tracemalloc
+import Rate2 as Rate
+import Trade
+
+
+def create_trade_book(number_of_trades: int)->list:
+
+    today = datetime.date(2016, 9, 1)
+    spot_date = datetime.date(2016, 9, 6)
+
+    eur_ccy = Rate.cls_currency("EUR", 360, Rate.date_shift_enum.D2)
+    usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+    eur_usd = Rate.cls_currency_pair(eur_ccy, usd_ccy, Rate.quotation_mode_enum.base_und)
+
+    trade_book = []
+
+    for trade_iter in range(number_of_trades):
+        maturity_date = spot_date + datetime.timedelta(days=trade_iter % 3650 + 1)
+
+        trade = Trade.create_fx_trade("UTI" + str(trade_iter), "CPTY", "PORTFOLIO", today, maturity_date,
+                                      "EUR", "EUR-USD", "EUR", 1000000, "USD", -1100000)
+
+        forward_rate = Rate.cls_fx_forward_rate(eur_usd, Rate.cls_tenor(spot_date, maturity_date), 1.1)
+
+        df_eur = Rate.cls_discount_factor(eur_ccy, Rate.cls_tenor(today, maturity_date), 0.99)
+        df_usd = Rate.cls_discount_factor(usd_ccy, Rate.cls_tenor(today, maturity_date), 0.98)
+
+        trade_book.append((trade, forward_rate, df_eur, df_usd))
+
+    return trade_book
+
+
+def create_trades(number_of_trades: int)->list:
+
+    today = datetime.date(2016, 9, 1)
+    spot_date = datetime.date(2016, 9, 6)
+
+    return [Trade.create_fx_trade("UTI" + str(trade_iter), "CPTY", "PORTFOLIO", today, spot_date + datetime.timedelta(days=trade_iter % 3650 + 1),
+                                  "EUR", "EUR-USD", "EUR", 1000000, "USD", -1100000)
+            for trade_iter in range(number_of_trades)]
+
+
+def create_columnar_trade_book(number_of_trades: int)->Trade.cls_trade_book:
+    return Trade.create_trade_book_by_trades(create_trades(number_of_trades))
+
+
+def get_bytes_per_trade(number_of_trades: int, create_function=create_trade_book)->float:
+
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+
+    trade_book = create_function(number_of_trades)
+
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated_bytes = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename'))
+
+    del trade_book
+    return allocated_bytes / number_of_trades
+
+
+if __name__ == "__main__":
+    number_of_trades = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print("{number_of_trades} trades: {bytes_per_trade:.0f} bytes per trade".format(number_of_trades=number_of_trades,
+                                                                                     bytes_per_trade=get_bytes_per_trade(number_of_trades)))
+
+    for label, create_function in (("trade objects", create_trades), ("trade book", create_columnar_trade_book)):
+        print("{number_of_trades} {label}: {bytes_per_trade:.0f} bytes per trade".format(number_of_trades=number_of_trades,
+                                                                                          label=label,
+                                                                                          bytes_per_trade=get_bytes_per_trade(number_of_trades, create_function)))
@@ -1,2093 +1,4093 @@
-#!/usr/bin/python
-# -*- coding: utf-8 -*-
-
-import datetime
-import math
-from log4py import logger
-
-from enum import Enum
-
-def build_quotation(ccy1: str, ccy2: str):
-    return ccy1 + "-" + ccy2
-
-
-class quotation_mode_enum(Enum):
-    base_und = "base-und"
-    und_base = "und-base"
-
-def get_reversed_quotation_mode(quotation_mode:quotation_mode_enum)->quotation_mode_enum:
-    if quotation_mode == quotation_mode_enum.base_und:
-        return quotation_mode_enum.und_base
-    elif quotation_mode == quotation_mode_enum.und_base:
-        return quotation_mode_enum.base_und
-
-
-def get_reversed_quotation(quotation:str)->str:
-    return quotation[0:3] + quotation[3:4] + quotation[4:7]
-
-
-class linearization_enum(Enum):
-    """Enumeration for different interpolation methods used in rate calculations"""
-    # Interpolate Log(DiscountFactor) linearly
-    log_ds_factor = "log_ds_factor"
-
-    # Interpolate DiscountRate linearly  
-    linear_ds_rate = "linear_ds_rate"
-
-    # Interpolate DiscountRate*Time linearly
-    linear_rate_time = "linear_rate_time"
-
-class base_or_und_enum(Enum):
-    base = "base"
-    und = "und"
-
-class discount_factor_methodology(Enum):
-    lin_act_365 = "LIN ACT/365"
-    lin_act_360 = "LIN ACT/360"
-    exp_act_365 = "EXP ACT/365"
-
-class tenor_label(Enum):
-    ON = 100
-    TN = 200
-    SN = 300
-    W1 = 400
-    W2 = 500
-    W3 = 600
-    W4 = 700
-    M1 = 800
-    M2 = 900
-    M3 = 1000
-    M4 = 1100
-    M5 = 1200
-    M6 = 1300
-    M7 = 1400
-    M8 = 1500
-    M9 = 1600
-    M10 = 1700
-    M11 = 1800
-    Y1 = 1900
-    M15 = 2000
-    M18 = 2100
-    M21 = 2200
-    Y2 = 2300
-    Y3 = 2400
-    Y4 = 2500
-    Y5 = 2600
-    Y6 = 2700
-    Y7 = 2800
-    Y8 = 2900
-    Y9 = 3000
-    Y10 = 3100
-    Y11 = 3200
-    Y12 = 3300
-    Y15 = 3400
-    Y20 = 3500
-
-class date_shift_enum(Enum):
-    D0 = 0
-    D1 = 1
-    D2 = 2
-
-
-class cls_currency:
-    def __init__(self,
-                 label: str=None,
-                 number_of_days_1year: int=365,
-                 spot_date_shift: date_shift_enum = date_shift_enum.D2):
-        self.label = label.upper() if label is not None else label
-        self.number_of_days_1year = number_of_days_1year
-        self.spot_date_shift = spot_date_shift
-
-
-class cls_currency_pair:
-    def __init__(self,
-                 base: cls_currency,
-                 underlying: cls_currency,
-                 quotation_mode: quotation_mode_enum,
-                 swap_point_factor: int=10000,
-                 day_shift: date_shift_enum = None):
-        self.base = base
-        self.underlying = underlying
-
-        self.quotation_mode = quotation_mode
-        self.swap_point_factor = swap_point_factor
-
-        if day_shift is None:
-            self.day_shift = base.spot_date_shift if base.spot_date_shift._value_ >= underlying.spot_date_shift._value_ else underlying.spot_date_shift
-        else:
-            self.day_shift = day_shift
-
-        self.__quotation = ""
-
-        if quotation_mode == quotation_mode_enum.base_und:
-            self.__quotation = build_quotation(base.label, underlying.label)
-        elif quotation_mode == quotation_mode_enum.und_base:
-            self.__quotation = build_quotation(underlying.label, base.label)
-        else:
-            assert("quotation_mode is invalid")
-            logger.critical("{class_name} : parameter quotation_mode {quotation_mode} is invalid".format(class_name=self.__class__.__name__.replace("cls_",""),  quotation_mode=quotation_mode.__repr__()))
-            # ("quotation is " + self.__quotation)
-
-    @property
-    def quotation(self)->str:
-        return self.__quotation
-
-    def get_reversed_quotation_mode(self) -> quotation_mode_enum:
-        if self.quotation_mode == quotation_mode_enum.base_und:
-            quotation_mode = quotation_mode_enum.und_base
-        elif self.quotation_mode == quotation_mode_enum.und_base:
-            quotation_mode = quotation_mode_enum.base_und
-        else:
-            quotation_mode = quotation_mode_enum.und_base
-
-        # print("quotation_mode is " + self.quotation_mode.__repr__())
-        return quotation_mode
-
-    def get_reversed_pair(self):
-        return cls_currency_pair(self.base, self.underlying,
-                                 self.get_reversed_quotation_mode(),
-                                 self.swap_point_factor,
-                                 self.day_shift)
-
-    def get_another_currency(self,ccy1:cls_currency)->cls_currency:
-        if ccy1.label == self.base.label:
-            return self.underlying
-        elif ccy1.label == self.underlying.label:
-            return self.base
-
-    @property
-    def label(self)->str:
-        if self.quotation_mode == quotation_mode_enum.base_und:
-            return self.base.label + "/" + self.underlying.label
-        elif self.quotation_mode == quotation_mode_enum.und_base:
-            return self.underlying.label + "/" + self.base.label
-
-
-
-class cls_tenor:
-    def __init__(self,
-                 start_date: datetime.date,
-                 maturity_date: datetime.date,
-                 label: str=None):
-        self.label = label.upper() if label is not None else label
-        self.start_date = start_date
-        self.maturity_date = maturity_date
-
-        self.__number_of_days = (self.maturity_date - self.start_date).days
-
-    @property
-    def number_of_days(self)->int:
-        return self.__number_of_days
-
-    def get_inverse_tenor(self, label: str=None):
-        return cls_tenor(self.maturity_date, self.start_date,
-                         (self.label + " inverse").upper() if label is None else label)
-
-        # print(self.start_date.strftime('%Y-%m-%d'))
-        # print(self.maturity_date.strftime('%Y-%m-%d'))
-        # print(self.number_of_days)
-
-        # print(self.label + " " + str(self.start_date) + " " + str(self.maturity_date))
-
-
-class cls_rate:
-    def __init__(self,
-                 mid: float=0,
-                 bid: float=0,
-                 ask: float=0):
-        self.__mid = 0.0
-        self.__bid = 0.0
-        self.__ask = 0.0
-        self.__spread = 0.0
-
-        if mid == 0 and bid != 0 and ask != 0:
-            self.set_rate_by_bid_ask(bid, ask)
-        else:
-            self.__mid = mid
-            if bid == 0 and ask == 0:
-                self.set_rate_by_mid_spread(mid, 0)
-            else:
-                self.set_rate_by_bid_ask(bid, ask)
-
-    def set_rate_by_bid_ask(self, bid: float, ask: float):
-        self.__bid = bid
-        self.__ask = ask
-        self.__mid = (self.__bid + self.__ask) / 2
-        self.__spread = abs(self.__bid - self.__mid)
-
-    def set_rate_by_mid_bid_ask(self, mid: float, bid: float, ask: float):
-        self.__mid = mid
-        self.__bid = bid
-        self.__ask = ask
-        self.__spread = abs(self.__bid - self.__mid)
-
-    def set_rate_by_mid_spread(self, mid: float, spread: float=None):
-        self.__mid = mid
-
-        if spread is not None:
-            self.__spread = spread
-
-        self.__bid = self.__mid - self.__spread
-        self.__ask = self.__mid + self.__spread
-
-    @property
-    def mid(self)->float:
-        return self.__mid
-
-    @mid.setter
-    def mid(self, mid:float):
-        self.set_rate_by_mid_spread(mid, self.__spread)
-
-    @property
-    def bid(self)->float:
-        return self.__bid
-
-    @bid.setter
-    def bid(self, bid:float):
-        self.set_rate_by_bid_ask(bid, self.__ask)
-
-    @property
-    def ask(self)->float:
-        return self.__ask
-
-    @ask.setter
-    def ask(self, ask:float):
-        self.set_rate_by_bid_ask(self.__bid, ask)
-
-    @property
-    def spread(self)->float:
-        return self.__spread
-
-    @spread.setter
-    def spread(self, spread:float):
-        self.set_rate_by_mid_spread(self.__mid, spread)
-
-    @property
-    def value(self)->float:
-        return self.__mid
-
-    @value.setter
-    def value(self, value:float):
-        self.set_rate_by_mid_spread(value, self.__spread)
-
-class cls_single_currency_rate(cls_rate):
-    def __init__(self,
-                 currency: cls_currency=None,
-                 tenor: cls_tenor=None,
-                 mid: float=0,
-                 bid: float=0,
-                 ask: float=0,
-                 basis: int=None):
-        self.currency = currency
-        self.tenor = tenor
-
-        if basis is not None:
-            self.basis = basis
-        else:
-            self.basis = currency.number_of_days_1year
-
-
-        super().__init__(mid, bid, ask)
-        self.__unique_key = self.__get_unique_key()
-
-    def __get_unique_key(self)->str:
-        return (self.__class__.__name__.replace("cls_","") + "#" +
-                self.currency.label + "#" +
-                self.tenor.start_date.strftime('%Y-%m-%d') + "#" +
-                self.tenor.maturity_date.strftime('%Y-%m-%d'))
-
-    @property
-    def unique_key(self):
-        return self.__unique_key
-
-    @property
-    def currency_label(self):
-        return self.currency.label
-
-    @property
-    def start_date(self):
-        return self.tenor.start_date
-
-    @property
-    def maturity_date(self):
-        return self.tenor.maturity_date
-
-    @property
-    def label(self):
-        return self.tenor.label
-
-
-class cls_discount_factor(cls_single_currency_rate):
-    def get_capitalized_factor(self):
-        return cls_capitalized_factor(self.currency, self.tenor, 1 / self.mid, basis=self.basis)
-
-    def get_discount_rate(self)->cls_single_currency_rate:
-
-        # to review
-        return cls_discount_rate(
-            self.currency, self.tenor, (1 / self.mid - 1) *
-                                       self.basis / self.tenor.number_of_days, basis=self.basis)
-
-    def get_remaining_df(self, df1, label: str=None):
-
-        # assume self = df1 * df2
-        # get df2
-
-        if self.tenor.start_date == df1.tenor.start_date:
-
-            df2_tenor = cls_tenor(df1.tenor.maturity_date,
-                                  self.tenor.maturity_date,
-                                  label if label is not None else None)
-
-            return cls_discount_factor(df1.currency, df2_tenor, self.mid / df1.mid, basis=self.basis)
-
-        elif self.tenor.maturity_date == df1.tenor.maturity_date:
-
-            df2_tenor = cls_tenor(self.tenor.start_date,
-                                  df1.tenor.start_date,
-                                  label if label is not None else None)
-
-            return cls_discount_factor(df1.currency, df2_tenor, self.mid / df1.mid, basis=self.basis)
-
-        elif self.tenor.start_date == df1.tenor.start_date and self.tenor.maturity_date == df1.tenor.maturity_date and self.mid != df1.mid:
-            logger.critical("parameter df1 tenor start data: %s maturity date: %s match current start date: %s maturity date: %s, but df value %s does not match %s", df1.start_date, df1.maturity_date, self.start_date, self.maturity_date, df1.value, self.value)
-            return None
-
-
-        else:
-            logger.critical("parameter df1 tenor start data: %s maturity date: %s does not match current start date: %s maturity date: %s", df1.start_date, df1.maturity_date, self.start_date, self.maturity_date)
-            return None
-
-    def extend_by_df(self, df1, label: str=None):
-        # assume df2 = self * df1
-        # get df2
-
-        if self.tenor.maturity_date == df1.tenor.start_date:
-
-            df2_tenor = cls_tenor(self.tenor.start_date,
-                                  df1.tenor.maturity_date, label if label is not None else None)
-
-            return cls_discount_factor(self.currency, df2_tenor, self.mid * df1.mid, basis=self.basis)
-
-        elif df1.tenor.maturity_date == self.tenor.start_date:
-
-            df2_tenor = cls_tenor(df1.tenor.start_date,
-                                  self.tenor.maturity_date, label if label is not None else None)
-
-            return cls_discount_factor(self.currency, df2_tenor, df1.mid * self.mid, basis=self.basis)
-
-        else:
-            logger.critical("parameter df1 tenor start data: %s maturity date: %s does not match current start date: %s maturity date: %s", df1.tenor.start_date, df1.tenor.maturity_date, self.tenor.start_date, self.tenor.maturity_date)
-            return None
-
-
-class cls_capitalized_factor(cls_single_currency_rate):
-    def get_discount_factor(self) -> cls_discount_factor:
-        return cls_discount_factor(self.currency, self.tenor, 1 / self.mid, basis=self.basis)
-
-    def get_discount_rate(self)->cls_single_currency_rate:
-        return cls_discount_rate(
-            self.currency, self.tenor, (self.mid - 1) * self.basis / self.tenor.number_of_days, basis=self.basis)
-
-
-class cls_market_quote(cls_single_currency_rate):
-    def get_discount_rate(self, discount_factor_today_spot: cls_discount_factor)->cls_single_currency_rate:
-
-        # to be reviewed
-        if self.maturity_date > discount_factor_today_spot.maturity_date:
-            number_of_days_spot_to_maturity = self.tenor.number_of_days
-            number_of_days_today_to_maturity = discount_factor_today_spot.tenor.number_of_days + number_of_days_spot_to_maturity
-
-            ds_rate_value = self.basis * (
-                1 / discount_factor_today_spot.mid *
-                (1 + self.mid * number_of_days_spot_to_maturity / self.basis) - 1
-            ) / number_of_days_today_to_maturity
-
-            return cls_discount_rate(self.currency,
-                                     cls_tenor(discount_factor_today_spot.start_date, self.maturity_date, self.tenor.label ),
-                                     ds_rate_value,
-                                     basis=self.basis)
-
-
-        # for O/N of T+1 currency
-        if self.currency.spot_date_shift == date_shift_enum.D1 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
-            return cls_discount_rate(self.currency,
-                                     cls_tenor(self.start_date, self.maturity_date, self.tenor.label ),
-                                     self.value,
-                                     basis=self.basis)
-
-        # for T/N of T+2 currency
-        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date > discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
-            # to enhance
-            pass
-
-        # for O/N of T+2 currency
-        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date < discount_factor_today_spot.maturity_date:
-            return cls_discount_rate(self.currency,
-                                     cls_tenor(self.start_date, self.maturity_date, self.tenor.label ),
-                                     self.value,
-                                     basis=self.basis)
-
-
-    # only applicable to maturity date <= 1Y
-    def get_discount_factor_today_maturity(self, discount_factor_today_spot: cls_discount_factor)->cls_discount_factor:
-
-        if self.maturity_date > discount_factor_today_spot.maturity_date:
-            number_of_days_spot_to_maturity = self.tenor.number_of_days
-
-            ds_factor_value = discount_factor_today_spot.mid * ( 1 / (  1 + self.mid * number_of_days_spot_to_maturity / self.basis) )
-
-            return cls_discount_factor(self.currency,
-                                       cls_tenor(discount_factor_today_spot.start_date, self.maturity_date, self.tenor.label),
-                                       ds_factor_value,
-                                       basis=self.basis)
-
-        # for O/N of T+1 currency
-        if self.currency.spot_date_shift == date_shift_enum.D1 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
-            return discount_factor_today_spot
-
-        # for T/N of T+2 currency
-        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date > discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
-            number_of_days_tom_to_next = self.tenor.number_of_days
-
-            ds_factor_value = discount_factor_today_spot.mid / (1 / (1 + self.mid * number_of_days_tom_to_next / self.basis) )
-
-            return cls_discount_factor(self.currency,
-                                     cls_tenor(discount_factor_today_spot.start_date, self.maturity_date, self.tenor.label),
-                                     ds_factor_value,
-                                     basis=self.basis)
-
-        # for O/N of T+2 currency
-        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date < discount_factor_today_spot.maturity_date:
-            return cls_discount_factor(self.currency,
-                                      cls_tenor(self.start_date, self.maturity_date, self.tenor.label),
-                                      self.mid,
-                                      basis=self.basis)
-
-
-    # only applicable to maturity date <= 1Y
-    def get_discount_factor_spot_maturity(self, ds_factor_value_input:float=None)->cls_discount_factor:
-
-        number_of_days_spot_to_maturity = self.tenor.number_of_days
-
-        if ds_factor_value_input is None:
-            ds_factor_value = 1 / (  1 + self.mid * number_of_days_spot_to_maturity / self.basis)
-        else:
-            ds_factor_value = ds_factor_value_input
-
-        return cls_discount_factor(self.currency,
-                                   cls_tenor(self.start_date, self.maturity_date, self.tenor.label),
-                                   ds_factor_value,
-                                   basis=self.basis)
-
-
-class cls_discount_rate(cls_single_currency_rate):
-    def get_discount_factor(self)->cls_discount_factor:
-        return cls_discount_factor(self.currency,
-                                   self.tenor,
-                                   1 / (1 + self.mid * self.tenor.number_of_days / self.basis),
-                                   basis=self.basis)
-
-    def get_capitalized_factor(self)->cls_capitalized_factor:
-        return cls_capitalized_factor(self.currency,
-                                      self.tenor,
-                                      1 + self.mid * self.basis / self.tenor.number_of_days,
-                                      basis=self.basis)
-
-    def get_market_quote(self, discount_factor_today_spot: cls_discount_factor
-                         ) -> cls_market_quote:
-
-        if self.tenor.maturity_date > discount_factor_today_spot.tenor.maturity_date:
-            number_of_days_today_to_maturity = self.tenor.number_of_days
-            number_of_days_spot_to_maturity = number_of_days_today_to_maturity - discount_factor_today_spot.tenor.number_of_days
-
-
-            # to review
-            market_quote_value = self.basis * (
-                discount_factor_today_spot.mid *
-                (1 + self.mid * number_of_days_today_to_maturity / self.basis) - 1
-            ) / number_of_days_spot_to_maturity
-
-            return cls_market_quote(self.currency,
-                                    cls_tenor(discount_factor_today_spot.tenor.maturity_date,
-                                    self.tenor.maturity_date), market_quote_value,
-                                    basis=self.basis)
-
-        # for O/N of T+1 currency
-        if self.currency.spot_date_shift == date_shift_enum.D1 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
-            return cls_market_quote(self.currency,
-                                    cls_tenor(self.start_date, self.maturity_date, self.tenor.label),
-                                    self.mid,
-                                    basis=self.basis)
-
-        # for T/N of T+2 currency
-        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date > discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
-            # to enhance
-            pass
-
-        # for O/N of T+2 currency
-        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date < discount_factor_today_spot.maturity_date:
-            return cls_market_quote(self.currency,
-                                    cls_tenor(self.start_date, self.maturity_date, self.tenor.label),
-                                    self.mid,
-                                    basis=self.basis)
-
-
-class cls_overnight_funding_rate(cls_single_currency_rate):
-    pass
-
-class cls_on_funding_rate_panel:
-    def __init__(
-            self,
-            currency: cls_currency,
-            on_rate_list: list):
-        if on_rate_list is not None:
-            on_rate_list.sort(
-                key=lambda on_rate: on_rate.tenor.start_date, reverse=False)
-            self.on_rate_list = on_rate_list
-        else:
-            self.on_rate_list = []
-
-        self.currency = currency
-
-        self.__list_start_date = self.on_rate_list[0].tenor.start_date
-        self.__list_end_date = self.on_rate_list[-1].tenor.maturity_date
-
-    @property
-    def list_start_date(self)->datetime.date:
-        return self.__list_start_date
-
-    @property
-    def list_end_date(self)->datetime.date:
-        return self.__list_end_date
-
-    def get_on_rate_dict_by_start_end_date(
-            self, start_date:datetime.date, end_date:datetime.date)->dict:
-
-        result_dict = {}
-        for on_rate_iter in self.on_rate_list:
-            if on_rate_iter.tenor.start_date >= start_date and on_rate_iter.tenor.maturity_date <= end_date :
-                result_dict[on_rate_iter.tenor.start_date] = on_rate_iter
-                #print("add to dict , key is " + on_rate_iter.tenor.start_date.strftime('%Y-%m-%d') + " maturity is " + on_rate_iter.tenor.maturity_date.strftime('%Y-%m-%d'))
-
-            if on_rate_iter.tenor.start_date < start_date and on_rate_iter.tenor.maturity_date <= end_date and on_rate_iter.tenor.maturity_date > start_date:
-                result_dict[on_rate_iter.tenor.start_date] = cls_overnight_funding_rate(self.currency,
-                                                                                        cls_tenor(start_date, on_rate_iter.tenor.maturity_date),
-                                                                                        on_rate_iter.mid,
-                                                                                        on_rate_iter.bid,
-                                                                                        on_rate_iter.ask
-                                                                                        )
-
-            if on_rate_iter.tenor.start_date < start_date and on_rate_iter.tenor.maturity_date > end_date:
-                result_dict[on_rate_iter.tenor.start_date] = cls_overnight_funding_rate(self.currency,
-                                                                                        cls_tenor(start_date, end_date),
-                                                                                        on_rate_iter.mid,
-                                                                                        on_rate_iter.bid,
-                                                                                        on_rate_iter.ask
-                                                                                        )
-                break
-            elif on_rate_iter.tenor.start_date >= start_date and on_rate_iter.tenor.maturity_date > end_date :
-                result_dict[on_rate_iter.tenor.start_date] = cls_overnight_funding_rate(self.currency,
-                                                                                        cls_tenor(on_rate_iter.tenor.start_date, end_date),
-                                                                                        on_rate_iter.mid,
-                                                                                        on_rate_iter.bid,
-                                                                                        on_rate_iter.ask
-                                                                                        )
-                #print("add to dict , key is " + on_rate_iter.tenor.start_date.strftime('%Y-%m-%d') + " maturity is " + end_date.strftime('%Y-%m-%d'))
-
-                break
-        return result_dict
-
-
-
-class cls_deal_price(cls_rate):
-    def __init__(self,
-                 currency_pair: cls_currency_pair,
-                 maturity_date: datetime.date,
-                 value: float=0,
-                 quotation_mode: quotation_mode_enum = None):
-        self.currency_pair = currency_pair
-        self.maturity_date = maturity_date
-        super().__init__(value, value, value)
-
-        if quotation_mode is None:
-            self.quotation_mode = self.currency_pair.quotation_mode
-        else:
-            self.quotation_mode = quotation_mode
-
-    @property
-    def value(self):
-        return self.mid
-
-    @value.setter
-    def value(self, value:float):
-        self.set_rate_by_mid_spread(value)
-
-
-    def get_deal_price_by_quotation_mode(self,quotation_mode: quotation_mode_enum):
-        if quotation_mode == self.quotation_mode:
-            return self
-        else:
-            return self.get_reversed_deal_price()
-
-    def get_reversed_deal_price(self)->cls_rate:
-        return cls_deal_price(self.currency_pair, self.maturity_date, 1/self.value, get_reversed_quotation_mode(self.quotation_mode))
-
-
-class cls_currency_pair_rate(cls_rate):
-    def __init__(self,
-                 currency_pair: cls_currency_pair,
-                 tenor: cls_tenor=None,
-                 mid: float=0,
-                 bid: float=0,
-                 ask: float=0,
-                 quotation_mode: quotation_mode_enum=None):
-        self.currency_pair = currency_pair
-        self.tenor = tenor
-        super().__init__(mid, bid, ask)
-        self.__unique_key = self.__get_unique_key()
-
-        if quotation_mode is None:
-            self.quotation_mode = self.currency_pair.quotation_mode
-        else:
-            self.quotation_mode = quotation_mode
-
-    def __get_unique_key(self)->str:
-        return (self.__class__.__name__.replace("cls_","") + "#" +
-                self.currency_pair.quotation + "#" +
-                self.tenor.start_date.strftime('%Y-%m-%d') + "#" +
-                self.tenor.maturity_date.strftime('%Y-%m-%d'))
-
-    @property
-    def unique_key(self):
-        return self.__unique_key
-
-    @property
-    def maturity_date(self)->datetime.date:
-        return self.tenor.maturity_date
-
-    @property
-    def start_date(self)->datetime.date:
-        return self.tenor.start_date
-
-    @property
-    def label(self)->str:
-        return self.tenor.label
-
-    @property
-    def quotation(self)->str:
-        if self.quotation_mode == quotation_mode_enum.base_und:
-            return build_quotation(self.currency_pair.base.label, self.currency_pair.underlying.label)
-        elif self.quotation_mode == quotation_mode_enum.und_base:
-            return build_quotation(self.currency_pair.underlying.label, self.currency_pair.base.label)
-
-
-class cls_fx_rate(cls_currency_pair_rate):
-    def get_reversed_fx_rate(self):
-        return cls_fx_rate(self.currency_pair, self.tenor,
-                           1 / self.mid, 1 / self.bid, 1 / self.ask, get_reversed_quotation_mode(self.quotation_mode))
-
-    def get_fx_rate_by_quotation_mode(self,
-                                      quotation_mode: quotation_mode_enum):
-        if quotation_mode == self.quotation_mode:
-            return self
-        else:
-            return self.get_reversed_fx_rate()
-
-    def get_fx_rate_by_quotation(self, quotation: str):
-        if quotation == self.quotation:
-            return self
-        elif quotation == get_reversed_quotation(self.quotation):
-            return self.get_reversed_fx_rate()
-        else:
-            logger.critical("parameter quotation {quotation} is invalid".format(quotation=quotation))
-            return None
-
-    def init_by_cross_fx_rate(self, fx_rate_1, fx_rate_2):
-
-        # Assume Maturity Date of fx_rate_1 and fx_rate_2 are the same
-
-        fx1_base_und = fx_rate_1.get_fx_rate_by_quotation_mode(
-            quotation_mode_enum.base_und)
-        fx2_base_und = fx_rate_2.get_fx_rate_by_quotation_mode(
-            quotation_mode_enum.base_und)
-
-        if self.currency_pair.quotation == build_quotation(fx1_base_und.currency_pair.base.label, fx2_base_und.currency_pair.base.label) \
-                and fx1_base_und.currency_pair.underlying.label == fx2_base_und.currency_pair.base.label:
-            #EUR/USD GBP/USD --> EUR/GBP
-            self.set_rate_by_bid_ask(fx1_base_und.bid / fx2_base_und.ask,
-                                     fx1_base_und.ask / fx2_base_und.bid)
-
-        elif self.currency_pair.quotation == build_quotation(fx1_base_und.currency_pair.base.label, fx2_base_und.currency_pair.underlying.label) \
-                and fx1_base_und.currency_pair.underlying.label == fx2_base_und.currency_pair.base.label:
-            # EUR/USD USD/HKD --> EUR/HKD
-            self.set_rate_by_bid_ask(fx1_base_und.bid * fx2_base_und.bid,
-                                     fx1_base_und.ask * fx2_base_und.ask)
-
-        elif self.currency_pair.quotation == build_quotation(fx1_base_und.currency_pair.underlying.label, fx2_base_und.currency_pair.base.label) \
-                and fx1_base_und.currency_pair.base.label == fx2_base_und.currency_pair.underlying.label:
-            # USD/CAD AUD/USD --> CAD/AUD
-            self.set_rate_by_bid_ask(1 / (fx1_base_und.ask * fx2_base_und.ask),
-                                     1 / (fx1_base_und.bid * fx2_base_und.bid))
-
-        elif self.currency_pair.quotation == build_quotation(fx1_base_und.currency_pair.underlying.label, fx2_base_und.currency_pair.underlying.label) \
-                and fx1_base_und.currency_pair.base.label == fx2_base_und.currency_pair.base.label:
-            # USD/HKD USD/JPY --> HKD/JPY
-            self.set_rate_by_bid_ask(fx2_base_und.bid / fx1_base_und.ask,
-                                     fx2_base_und.ask / fx1_base_und.bid)
-
-        elif self.currency_pair.quotation == build_quotation(fx2_base_und.currency_pair.base.label, fx1_base_und.currency_pair.base.label) \
-                and fx1_base_und.currency_pair.underlying.label == fx2_base_und.currency_pair.underlying.label:
-            # GBP/USD EUR/USD --> EUR/GBP
-            self.set_rate_by_bid_ask(fx2_base_und.bid / fx1_base_und.ask,
-                                     fx2_base_und.ask / fx1_base_und.bid)
-
-        elif self.currency_pair.quotation == build_quotation(fx2_base_und.currency_pair.base.label, fx1_base_und.currency_pair.underlying.label) \
-                and fx1_base_und.currency_pair.base.label == fx2_base_und.currency_pair.underlying.label:
-            # USD/HKD EUR/USD  --> EUR/HKD
-            self.set_rate_by_bid_ask(fx1_base_und.bid * fx2_base_und.bid,
-                                     fx1_base_und.ask * fx2_base_und.ask)
-
-        elif self.currency_pair.quotation == build_quotation(fx2_base_und.currency_pair.underlying.label, fx1_base_und.currency_pair.base.label) \
-                and fx1_base_und.currency_pair.underlying.label == fx2_base_und.currency_pair.base.label:
-            # AUD/USD USD/CAD --> CAD/AUD
-            self.set_rate_by_bid_ask(1 / (fx1_base_und.ask * fx2_base_und.ask),
-                                     1 / (fx1_base_und.bid * fx2_base_und.bid))
-
-        elif self.currency_pair.quotation == build_quotation(fx2_base_und.currency_pair.underlying.label, fx1_base_und.currency_pair.underlying.label) \
-                and fx1_base_und.currency_pair.base.label == fx2_base_und.currency_pair.base.label:
-            # USD/JPY USD/HKD --> HKD/JPY
-            self.set_rate_by_bid_ask(fx1_base_und.ask / fx2_base_und.bid,
-                                     fx1_base_und.bid / fx2_base_und.ask)
-
-
-
-class cls_fx_spot_rate(cls_fx_rate):
-    def __init__(self,
-                 currency_pair: cls_currency_pair,
-                 tenor: cls_tenor,
-                 mid: float=0,
-                 bid: float=0,
-                 ask: float=0,
-                 quotation_mode: quotation_mode_enum = None):
-
-        super().__init__(currency_pair, tenor, mid, bid, ask, quotation_mode)
-        self.tenor.label = "SPT"
-        # print(str(self.mid))
-
-    def get_spot_cls(self, fx_rate: cls_fx_rate):
-        return cls_fx_spot_rate(fx_rate.currency_pair, fx_rate.tenor,
-                                fx_rate.mid, fx_rate.bid, fx_rate.ask, fx_rate.quotation_mode)
-
-    def get_fx_rate_by_quotation(self, quotation: str):
-        if quotation == self.quotation:
-            return self
-        elif quotation == get_reversed_quotation(self.quotation):
-            return self.get_spot_cls(self.get_reversed_fx_rate())
-        else:
-            logger.critical("parameter quotation {quotation}is invalid.".format(quotation=quotation))
-            return None
-
-
-    def get_fx_rate_by_quotation_mode(self, quotation_mode: quotation_mode_enum):
-        if quotation_mode == self.quotation_mode:
-            return self
-        else:
-            return self.get_reversed_fx_rate()
-
-    def get_reversed_fx_rate(self):
-        return self.get_spot_cls(cls_fx_rate(self.currency_pair, self.tenor, 1 / self.mid, 1 / self.bid, 1 / self.ask, get_reversed_quotation_mode(self.quotation_mode)))
-
-
-
-    def get_discounted_spot_rate(self, base_ccy_df_t_s:cls_discount_factor, und_ccy_df_t_s:cls_discount_factor)->cls_fx_rate:
-
-        tenor = cls_tenor(self.start_date, self.start_date)
-
-        if self.quotation_mode == quotation_mode_enum.base_und :
-            return self.get_spot_cls(cls_fx_rate(self.currency_pair, tenor, self.mid * und_ccy_df_t_s.value / base_ccy_df_t_s.value, quotation_mode=self.quotation_mode))
-        else:
-            return self.get_spot_cls(cls_fx_rate(self.currency_pair, tenor, self.mid * base_ccy_df_t_s.value / und_ccy_df_t_s.value, quotation_mode=self.quotation_mode))
-
-    @property
-    def spot_date(self)->datetime.date:
-        return self.tenor.maturity_date
-
-
-class cls_fx_forward_rate(cls_fx_rate):
-    def __init__(self,
-                 currency_pair: cls_currency_pair,
-                 tenor: cls_tenor,
-                 mid: float=0,
-                 bid: float=0,
-                 ask: float=0,
-                 quotation_mode: quotation_mode_enum = None):
-        super().__init__(currency_pair, tenor, mid, bid, ask, quotation_mode)
-
-        self.__spot_rate = cls_fx_spot_rate(currency_pair, tenor, mid, bid, ask, quotation_mode)
-        self.__swap_point = cls_swap_point(currency_pair, tenor, 0, 0, 0) #multiped by factor
-
-    @property
-    def swap_point_factor(self)->float:
-        return self.currency_pair.swap_point_factor
-
-    @property
-    def spot_rate(self)->cls_fx_spot_rate:
-        return self.__spot_rate
-
-
-    @spot_rate.setter
-    def spot_rate(self, spot_rate: cls_fx_rate):
-        self.__spot_rate.set_rate_by_mid_bid_ask(
-            spot_rate.mid, spot_rate.bid, spot_rate.ask)
-        self.set_rate_by_mid_bid_ask(
-            spot_rate.mid +
-            self.__swap_point.mid / self.swap_point_factor,
-            spot_rate.bid +
-            self.__swap_point.bid / self.swap_point_factor,
-            spot_rate.ask +
-            self.__swap_point.ask / self.swap_point_factor)
-
-    @property
-    def swap_point_value_with_factor(self)->float:
-        #multiplied with swap point factor
-        return self.__swap_point.mid
-
-    @property
-    def swap_point_value_in_unit(self)->float:
-        return self.__swap_point.mid / self.swap_point_factor
-
-    @property
-    def swap_point(self)->cls_currency_pair_rate:
-        return self.__swap_point
-
-
-    @swap_point.setter
-    def swap_point(self, swap_point_with_factor: cls_currency_pair_rate):
-        self.set_rate_by_mid_bid_ask(
-            swap_point_with_factor.mid, swap_point_with_factor.bid, swap_point_with_factor.ask)
-
-        self.set_rate_by_mid_bid_ask(
-            self.__spot_rate.mid + swap_point_with_factor.mid / self.swap_point_factor,
-            self.__spot_rate.bid + swap_point_with_factor.bid / self.swap_point_factor,
-            self.__spot_rate.ask + swap_point_with_factor.ask / self.swap_point_factor)
-
-    def set_forward_rate_by_spot_and_df(
-            self,
-            spot_rate: cls_fx_spot_rate,
-            base_ccy_df_s_m: cls_discount_factor, # Discount factor for base currency from maturity date to spot date
-            und_ccy_df_s_m: cls_discount_factor): # Discount factor for underlying currency from maturity date to spot date
-        """
-        Sets the forward rate using spot rate and discount factors.
-
-        Args:
-            spot_rate: The spot exchange rate
-            base_ccy_df_s_m: Discount factor for base currency, discounted from maturity date to spot date
-            und_ccy_df_s_m: Discount factor for underlying currency, discounted from maturity date to spot date
-
-        The forward rate is calculated by adjusting the spot rate with the ratio of discount factors
-        between the base and underlying currencies over the period from spot to maturity date.
-        """
-        spot_rate_with_aligned_quotation_mode = spot_rate.get_fx_rate_by_quotation_mode(self.currency_pair.quotation_mode)
-
-        # quotation is base-und
-        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
-            self.mid = spot_rate_with_aligned_quotation_mode.mid * (base_ccy_df_s_m.mid / und_ccy_df_s_m.mid )
-
-        # quotation is und-base
-        elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
-            self.mid = spot_rate_with_aligned_quotation_mode.mid * (und_ccy_df_s_m.mid / base_ccy_df_s_m.mid )
-
-
-    def set_forward_rate_by_discounted_spot_and_df(
-            self,
-            discounted_spot_rate: cls_fx_rate,
-            base_ccy_df_t_m: cls_discount_factor, #base currency discount factor spot date to maturity date
-            und_ccy_df_t_m: cls_discount_factor): #underlying currency discount factor spot date to maturity date
-
-        discounted_spot_rate_with_aligned_quotation_mode = discounted_spot_rate.get_fx_rate_by_quotation_mode(self.currency_pair.quotation_mode)
-
-        # quotation is base-und
-        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
-            self.mid =  discounted_spot_rate_with_aligned_quotation_mode.mid * (base_ccy_df_t_m.mid / und_ccy_df_t_m.mid)
-
-        # quotation is und-base
-        elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
-            self.mid = discounted_spot_rate_with_aligned_quotation_mode.mid * (und_ccy_df_t_m.mid / base_ccy_df_t_m.mid)
-
-    def set_forward_rate_by_spot_and_swp(self,
-                                         spot_rate: cls_fx_spot_rate,
-                                         swap_point: cls_currency_pair_rate):
-        self.spot_rate = spot_rate
-        self.swap_point = swap_point
-
-
-def create_forward_rate_by_spot_and_df(currency_pair: cls_currency_pair,
-                                       tenor: cls_tenor,
-                                       spot_rate: cls_fx_spot_rate,
-                                       base_ccy_df_s_m: cls_discount_factor,
-                                       und_ccy_df_s_m: cls_discount_factor)->cls_fx_forward_rate:
-
-    spot_rate_with_aligned_quotation_mode = spot_rate.get_fx_rate_by_quotation_mode(currency_pair.quotation_mode)
-
-    # quotation is base-und
-    if currency_pair.quotation_mode == quotation_mode_enum.base_und:
-        forward_rate_value = spot_rate_with_aligned_quotation_mode.mid * (base_ccy_df_s_m.mid / und_ccy_df_s_m.mid)
-
-    # quotation is und-base
-    elif currency_pair.quotation_mode == quotation_mode_enum.und_base:
-        forward_rate_value = spot_rate_with_aligned_quotation_mode.mid * (und_ccy_df_s_m.mid / base_ccy_df_s_m.mid)
-
-    else:
-        forward_rate_value = 0
-
-    return cls_fx_forward_rate(currency_pair, tenor, forward_rate_value)
-
-
-def create_forward_rate_by_discounted_spot_and_df(currency_pair: cls_currency_pair,
-                                                  tenor: cls_tenor,
-                                                  discounted_spot_rate: cls_fx_rate,
-                                                  base_ccy_df_t_m: cls_discount_factor,
-                                                  und_ccy_df_t_m: cls_discount_factor)->cls_fx_forward_rate:
-
-    discounted_spot_rate_with_aligned_quotation_mode = discounted_spot_rate.get_fx_rate_by_quotation_mode(currency_pair.quotation_mode)
-
-    # quotation is base-und
-    if currency_pair.quotation_mode == quotation_mode_enum.base_und:
-        forward_rate_value = discounted_spot_rate_with_aligned_quotation_mode.mid * (base_ccy_df_t_m.mid / und_ccy_df_t_m.mid)
-
-    # quotation is und-base
-    elif currency_pair.quotation_mode == quotation_mode_enum.und_base:
-        forward_rate_value = discounted_spot_rate_with_aligned_quotation_mode.mid * (und_ccy_df_t_m.mid / base_ccy_df_t_m.mid)
-
-    else:
-        forward_rate_value = 0
-
-    return cls_fx_forward_rate(currency_pair, tenor, forward_rate_value)
-
-
-
-
-class cls_fx_discounted_spot_rate(cls_fx_forward_rate):
-    """
-    A class representing a discounted spot rate for FX trades.
-    
-    This class inherits from cls_fx_forward_rate and represents the spot rate 
-    discounted to the current date (today). The discounted spot rate is used 
-    for calculating present values and mark-to-market valuations of FX trades.
-
-    Attributes:
-        currency_pair (cls_currency_pair): The currency pair for the rate
-        tenor (cls_tenor): The time period for the rate
-        mid (float): The mid-market rate value
-        bid (float): The bid rate value
-        ask (float): The ask rate value
-        
-    Notes:
-        - The tenor label is always set to "TDY" (today) since this represents 
-          a spot rate discounted to the current date
-        - Used in PnL calculations to determine the present value of future 
-          cash flows
-        - Inherits rate handling functionality from cls_fx_forward_rate
-    """
-    def __init__(self,
-                 currency_pair: cls_currency_pair,
-                 tenor: cls_tenor, 
-                 mid: float=0,
-                 bid: float=0,
-                 ask: float=0):
-        """
-        Initialize a discounted spot rate.
-
-        Args:
-            currency_pair: The currency pair for the rate (e.g. EUR/USD)
-            tenor: The time period for the rate
-            mid: The mid-market rate value, defaults to 0
-            bid: The bid rate value, defaults to 0  
-            ask: The ask rate value, defaults to 0
-
-        Notes:
-            The tenor label is set to "TDY" on initialization to indicate 
-            this is a today-discounted rate.
-        """
-        super().__init__(currency_pair, tenor, mid, bid, ask)
-        self.tenor.label = "TDY"
-
-
-class cls_swap_point(cls_currency_pair_rate):
-    def __init__(self,
-                 currency_pair: cls_currency_pair,
-                 tenor: cls_tenor,
-                 mid: float=0,
-                 bid: float=0,
-                 ask: float=0):
-        super().__init__(currency_pair, tenor, mid, bid, ask)
-
-    def set_swap_point_by_forward_rate_and_spot(
-                                                self, spot_rate: cls_fx_spot_rate,
-                                                forward_rate: cls_fx_forward_rate):
-
-        spot_rate_with_aligned_quotation_mode = spot_rate.get_fx_rate_by_quotation_mode(self.currency_pair.quotation_mode)
-        forward_rate_with_aligned_quotation_mode = forward_rate.get_fx_rate_by_quotation_mode(self.currency_pair.quotation_mode)
-
-        self.mid = (forward_rate_with_aligned_quotation_mode.mid - spot_rate_with_aligned_quotation_mode.mid) * self.currency_pair.swap_point_factor
-
-    def set_swap_point_by_discount_factors(
-            self,
-            spot_rate: cls_fx_spot_rate,
-            df_base_s_m: cls_discount_factor,
-            df_und_s_m: cls_discount_factor):
-
-        # for maturity is not spot date
-        if self.tenor.maturity_date > spot_rate.tenor.maturity_date or self.tenor.maturity_date < spot_rate.tenor.maturity_date :
-
-            # quotation is base-und
-            if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
-                self.set_rate_by_bid_ask(
-                    spot_rate.mid *
-                    (df_base_s_m.ask / df_und_s_m.bid - 1),
-                    spot_rate.mid *
-                    (df_base_s_m.bid / df_und_s_m.ask - 1))
-
-            # quotation is und-base
-            elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
-                self.set_rate_by_bid_ask(
-                    spot_rate.mid *
-                    (df_und_s_m.ask / df_base_s_m.bid - 1),
-                    spot_rate.mid *
-                    (df_und_s_m.bid / df_base_s_m.ask - 1))
-
-        # for maturity is spot date
-        # always return 0
-        elif self.tenor.maturity_date == spot_rate.tenor.maturity_date:
-            self.set_rate_by_bid_ask(0, 0)
-
-        else:
-            pass
-
-    @property
-    def swap_point_factor(self)->int:
-        return self.currency_pair.swap_point_factor
-
-    @property
-    def swap_point_value_multi_by_factor(self)->float:
-        return self.mid * self.swap_point_factor
-
-
-class cls_rate_curve:
-    def __init__(self, fx_rate_list: list):
-
-        # sort by maturity date, then start date
-        if fx_rate_list is not None:
-            fx_rate_list.sort(
-                key=lambda fx_rate: fx_rate.tenor.start_date, reverse=False)
-            fx_rate_list.sort(
-                key=lambda fx_rate: fx_rate.tenor.maturity_date, reverse=False)
-            self.fx_rate_list = fx_rate_list
-        else:
-            logger.info("Empty rate curve is created")
-            self.fx_rate_list = []
-
-    @property
-    def max_maturity_date(self)->datetime.date:
-        return self.fx_rate_list[-1].tenor.maturity_date
-
-
-class cls_single_currency_rate_curve(cls_rate_curve):
-    def __init__(self, currency: cls_currency, fx_rate_list: list, basis:int=None):
-
-        super().__init__(fx_rate_list)
-        self.currency = currency
-
-        if basis is not None:
-            self.basis = basis
-        else:
-            self.basis = currency.number_of_days_1year
-
-    @property
-    def spot_date_shift(self)->date_shift_enum:
-        return self.currency.spot_date_shift
-
-    @property
-    def currency_label(self):
-        return self.currency.label
-
-
-    def get_item_by_label(self, label:str):
-        for iter in self.fx_rate_list:
-            if iter.tenor.label == label.upper():
-                return iter
-        else:
-            return None
-
-
-
-class cls_discount_factor_curve(cls_single_currency_rate_curve):
-    def __init__(self,
-                 currency: cls_currency,
-                 fx_rate_list: list,
-                 linearization: linearization_enum,
-                 basis: int = None):
-        super().__init__(currency, fx_rate_list, basis)
-        self.linearization = linearization
-
-    def get_discount_factor_by_interpolation(
-            self,
-            df_early: cls_discount_factor,
-            df_late: cls_discount_factor,
-            tenor_mid: cls_tenor,
-            linearization: linearization_enum,
-            basis:int)->cls_discount_factor:
-
-        if linearization == linearization_enum.log_ds_factor:
-            value_of_df_mid = 10 ** ((math.log10(df_late.mid) - math.log10(df_early.mid)) / (df_late.tenor.number_of_days - df_early.tenor.number_of_days) * (tenor_mid.number_of_days - df_early.tenor.number_of_days) + math.log10(df_early.mid))
-            return cls_discount_factor(df_early.currency, tenor_mid, value_of_df_mid, basis=basis)
-
-        elif linearization == linearization_enum.linear_ds_rate:
-
-            ds_rate_late = df_late.get_discount_rate()
-            ds_rate_early = df_early.get_discount_rate()
-
-            value_of_ds_mid = (ds_rate_late.mid - ds_rate_early.mid) / (
-                ds_rate_late.tenor.number_of_days -
-                ds_rate_early.tenor.number_of_days
-            ) * (tenor_mid.number_of_days - ds_rate_early.tenor.number_of_days
-                 ) + ds_rate_early.mid
-
-            return cls_discount_rate(df_early.currency, tenor_mid, value_of_ds_mid, basis=basis).get_discount_factor()
-
-        elif linearization == linearization_enum.linear_rate_time:
-            #to be enhanced
-            pass
-
-        else:
-            return None
-
-    def get_discount_factor_by_maturity_date(
-            self, maturity_date: datetime.date) -> cls_discount_factor:
-
-        #search in existing tenor
-        for ds_factor_iter in self.fx_rate_list:
-            if ds_factor_iter.tenor.maturity_date == maturity_date:
-                return ds_factor_iter
-
-        #interpolation
-        else:
-            #create the target tenor
-            tenor_mid = cls_tenor(self.today_date, maturity_date)
-
-            # print("tenor_mid.start_date is ", tenor_mid.start_date, "tenor_mid.maturity_date is ", tenor_mid.maturity_date)
-
-            if maturity_date == tenor_mid.start_date:
-                # print("maturity_date == tenor_mid.start_date")
-                return cls_discount_factor(self.currency, cls_tenor(tenor_mid.start_date, maturity_date), 1, basis=self.basis)
-            elif maturity_date > self.max_maturity_date:
-                # print("The target maturity date is ", maturity_date, ". The max maturity date in curve is ", tenor_mid.maturity_date)
-                # need extrapolation
-
-                return self.get_discount_factor_by_interpolation(self.fx_rate_list[-2], self.fx_rate_list[-1], tenor_mid, self.linearization, self.basis)
-
-            else:
-                # find out the discount factor earlier than target one , and the one later than target one
-                previous_df = self.fx_rate_list[0]
-                for ds_factor_iter in self.fx_rate_list:
-
-                    if ds_factor_iter.tenor.maturity_date > maturity_date:
-                        df_late = ds_factor_iter
-                        # print("df_late's maturity date is " +
-                        #      df_late.tenor.maturity_date.strftime('%Y-%m-%d'))
-
-                        df_early = previous_df
-                        # print("df_early's maturity date is " +
-                        #      df_early.tenor.maturity_date.strftime('%Y-%m-%d'))
-
-                        return self.get_discount_factor_by_interpolation(df_early, df_late, tenor_mid, self.linearization, self.basis)
-
-                    previous_df = ds_factor_iter
-
-    def get_discount_factor_by_start_maturity(self, start_date: datetime.date, maturity_date: datetime.date) -> cls_discount_factor:
-
-        # print("get_discount_factor_by_tenor ", "tenor_input.start_date is ", tenor_input.start_date, "tenor_input.maturity_date is ", tenor_input.maturity_date)
-
-        df_today_maturity = self.get_discount_factor_by_maturity_date(maturity_date)
-        # print("get_discount_factor_by_tenor ", "df_today_maturity.tenor.start_date is ", df_today_maturity.tenor.start_date, "df_today_maturity.tenor.maturity_date is ", df_today_maturity.tenor.maturity_date)
-
-        df_today_start = self.get_discount_factor_by_maturity_date(start_date)
-        # print("get_discount_factor_by_tenor ", "df_today_start.tenor.start_date is ", df_today_start.tenor.start_date, "df_today_start.tenor.maturity_date is ", df_today_start.tenor.maturity_date)
-
-
-        if start_date != maturity_date:
-            df_start_maturity = df_today_maturity.get_remaining_df(df_today_start, df_today_maturity.tenor.label)
-        else:
-            df_start_maturity = cls_discount_factor(self.currency, cls_tenor(start_date, start_date), 1, basis=self.basis)
-        # print("get_discount_factor_by_tenor ", "df_start_maturity.tenor.start_date is ", df_start_maturity.tenor.start_date, "df_start_maturity.tenor.maturity_date is ", df_start_maturity.tenor.maturity_date)
-
-        return df_start_maturity
-
-    def get_discount_factor_by_label(
-            self, label: str) -> cls_discount_factor:
-
-        return self.get_item_by_label(label)
-
-        # for ds_factor_iter in self.fx_rate_list:
-        #     if ds_factor_iter.tenor.label == label.upper():
-        #         return ds_factor_iter
-        # else:
-        #     return None
-
-
-    def get_neighbor_tenor_dates_by_maturity_date(
-            self, maturity_date: datetime.date) -> tuple:
-
-        #search in existing tenor
-        for ds_factor_iter in self.fx_rate_list:
-            if ds_factor_iter.tenor.maturity_date == maturity_date:
-                return (maturity_date, maturity_date)
-
-        else:
-
-            # find out the discount factor earlier than target one , and the one later than target one
-            previous_df = self.fx_rate_list[0]
-            for ds_factor_iter in self.fx_rate_list:
-
-                if ds_factor_iter.tenor.maturity_date > maturity_date:
-                    df_late = ds_factor_iter
-
-                    df_early = previous_df
-
-                    return (df_early.maturity_date, df_late.maturity_date)
-
-                previous_df = ds_factor_iter
-
-    def get_neighbor_discount_factors_by_maturity_date(
-            self, maturity_date: datetime.date) -> tuple:
-
-        #search in existing tenor
-        for ds_factor_iter in self.fx_rate_list:
-            if ds_factor_iter.tenor.maturity_date == maturity_date:
-                return (maturity_date, maturity_date)
-
-        else:
-
-            # find out the discount factor earlier than target one , and the one later than target one
-            previous_df = self.fx_rate_list[0]
-            for ds_factor_iter in self.fx_rate_list:
-
-                if ds_factor_iter.tenor.maturity_date > maturity_date:
-                    df_late = ds_factor_iter
-
-                    df_early = previous_df
-
-                    return (df_early, df_late)
-
-                previous_df = ds_factor_iter
-
-
-    @property
-    def today_date(self)->datetime.date:
-        return self.get_discount_factor_by_label('O/N').tenor.start_date
-
-    @property
-    def tom_date(self) -> datetime.date:
-        return self.get_discount_factor_by_label('O/N').tenor.maturity_date
-
-    @property
-    def spot_date(self) -> datetime.date:
-        """
-        Gets the spot date based on the spot date shift convention.
-        
-        Returns:
-            datetime.date: The spot date determined by the following rules:
-            - For T+1 currencies (D1): Returns the maturity date of O/N rate
-            - For T+2 currencies (D2): Returns the maturity date of T/N rate  
-            - For T+0 currencies (D0): Returns the start date of O/N rate
-            
-        Raises:
-            AssertionError: If the spot_date_shift is not one of the valid enum values
-            
-        Notes:
-            - O/N = Overnight rate
-            - T/N = Tomorrow/Next rate
-            - The spot date is when FX trades typically settle
-            - Different currencies have different standard settlement periods (T+0, T+1, T+2)
-        """
-        if self.spot_date_shift == date_shift_enum.D1:
-            return self.get_discount_factor_by_label('O/N').tenor.maturity_date
-
-        elif self.spot_date_shift == date_shift_enum.D2:
-            return self.get_discount_factor_by_label('T/N').tenor.maturity_date
-
-        elif self.spot_date_shift == date_shift_enum.D0:
-            return self.get_discount_factor_by_label('O/N').tenor.start_date
-
-        else:
-            assert("invalid spot date shift")
-
-
-class cls_capitalized_factor_curve(cls_single_currency_rate_curve):
-    def __init__(self,
-                 currency: cls_currency,
-                 fx_rate_list: list,
-                 linearization: linearization_enum,
-                 basis: int=None):
-
-        super().__init__(currency, fx_rate_list, basis)
-        self.linearization = linearization
-        self.discount_factor_curve = cls_discount_factor_curve(currency, [capitalized_factor_iter.get_discount_factor_by_label()
-                                                                          for capitalized_factor_iter in self.fx_rate_list
-                                                                         ],
-                                                               linearization,
-                                                               basis
-                                                               )
-
-    def get_capitalized_factor_by_maturity_date(self, maturity_date: datetime.date) -> cls_capitalized_factor:
-        return self.discount_factor_curve.get_discount_factor_by_maturity_date(
-            maturity_date).get_capitalized_factor()
-
-
-def get_1Ybackwardshifted_tenor_label(input_tenor_label:str)->str:
-    shifted_tenor_label = None
-    if input_tenor_label is None:
-        pass
-    elif input_tenor_label == "13M":
-        shifted_tenor_label = "1M"
-    elif input_tenor_label == "14M":
-        shifted_tenor_label = "2M"
-    elif input_tenor_label == "15M":
-        shifted_tenor_label = "3M"
-    elif input_tenor_label == "16M":
-        shifted_tenor_label = "4M"
-    elif input_tenor_label == "17M":
-        shifted_tenor_label = "5M"
-    elif input_tenor_label == "18M":
-        shifted_tenor_label = "6M"
-    elif input_tenor_label == "19M":
-        shifted_tenor_label = "7M"
-    elif input_tenor_label == "20M":
-        shifted_tenor_label = "8M"
-    elif input_tenor_label == "21M":
-        shifted_tenor_label = "9M"
-    elif input_tenor_label == "22M":
-        shifted_tenor_label = "10M"
-    elif input_tenor_label == "23M":
-        shifted_tenor_label = "11M"
-    elif input_tenor_label == "2Y":
-        shifted_tenor_label = "1Y"
-    elif input_tenor_label == "30M":
-        shifted_tenor_label = "18M"
-    elif input_tenor_label == "3Y":
-        shifted_tenor_label = "2Y"
-    elif input_tenor_label == "4Y":
-        shifted_tenor_label = "3Y"
-    elif input_tenor_label == "5Y":
-        shifted_tenor_label = "4Y"
-    elif input_tenor_label == "6Y":
-        shifted_tenor_label = "5Y"
-    elif input_tenor_label == "7Y":
-        shifted_tenor_label = "6Y"
-    elif input_tenor_label == "8Y":
-        shifted_tenor_label = "7Y"
-    elif input_tenor_label == "9Y":
-        shifted_tenor_label = "8Y"
-    elif input_tenor_label == "10Y":
-        shifted_tenor_label = "9Y"
-    else:
-        shifted_tenor_label = str(int(input_tenor_label[0:-1]) - 1) + input_tenor_label[-1]
-
-    return shifted_tenor_label
-
-
-class cls_market_quote_curve(cls_single_currency_rate_curve):
-
-    def __init__(self,
-                 currency: cls_currency,
-                 fx_rate_list: list,
-                 basis: int=None):
-
-        super().__init__(currency, fx_rate_list, basis)
-
-    def get_market_quote_by_label(self, label: str) -> cls_market_quote:
-
-        return self.get_item_by_label(label)
-
-        # for market_quote_iter in self.fx_rate_list:
-        #     if market_quote_iter.tenor.label == label.upper():
-        #         return market_quote_iter
-        # else:
-        #     return None
-
-    def __get_discount_factor_on(self)->cls_discount_factor:
-        market_quote_on = self.get_market_quote_by_label("O/N")
-
-        return cls_discount_factor(
-            self.currency, market_quote_on.tenor,
-            1 / (1 + market_quote_on.mid * market_quote_on.tenor.number_of_days / market_quote_on.basis), basis=self.basis)
-
-    def __get_discount_factor_tn(self, ds_factor_on:cls_discount_factor)->cls_discount_factor:
-
-        market_quote_tn = self.get_market_quote_by_label("T/N")
-        if market_quote_tn is not None :
-            ds_factor_tomorrow_next = cls_discount_factor(
-            self.currency, market_quote_tn.tenor,
-            1 / (1 + market_quote_tn.mid * market_quote_tn.tenor.number_of_days / market_quote_tn.basis), basis=self.basis)
-        else:
-            ds_factor_tomorrow_next = cls_discount_factor(
-            self.currency, cls_tenor(ds_factor_on.tenor.maturity_date,ds_factor_on.tenor.maturity_date),1 , basis=self.basis)
-
-        return ds_factor_on.extend_by_df(ds_factor_tomorrow_next,"T/N")
-
-    # to be tested
-    def get_discount_factor_today_spot(self)->cls_discount_factor:
-
-        ds_factor_on = self.__get_discount_factor_on()
-
-        if self.spot_date_shift == date_shift_enum.D1:
-            return ds_factor_on
-
-        elif self.spot_date_shift == date_shift_enum.D2:
-            return self.__get_discount_factor_tn(ds_factor_on)
-
-        elif self.spot_date_shift == date_shift_enum.D0:
-            return cls_discount_factor(self.currency, cls_tenor(self.today_date, self.today_date, "TDY"), 1, basis=self.basis)
-
-
-    def get_discount_factor_by_label(self, tenor_label:str)->cls_discount_factor:
-        if tenor_label == 'O/N':
-            return self.__get_discount_factor_on()
-
-        elif tenor_label == 'T/N':
-            return self.get_discount_factor_today_spot()
-
-        else:
-            market_quote = self.get_market_quote_by_label(tenor_label)
-            if market_quote is None:
-                assert("tenor label {tenor_label} is not found in market quote curve".format(tenor_label=tenor_label))
-                return None
-            else:
-                return market_quote.get_discount_factor_today_maturity(self.get_discount_factor_today_spot())
-
-
-    def get_market_quote_backwardshifted(self, input_tenor_label:str)->cls_market_quote:
-
-        mq_input_tenor = self.get_market_quote_by_label(input_tenor_label)
-        mq_1Y = self.get_market_quote_by_label('1Y')
-
-        # already within 1Y
-        if mq_input_tenor.maturity_date <= mq_1Y.maturity_date:
-            return mq_input_tenor
-
-        # greater than 1Y
-        else:
-            shifted_tenor_label = get_1Ybackwardshifted_tenor_label(input_tenor_label)
-            mq_backward_1Y_shifted = self.get_market_quote_by_label(shifted_tenor_label)
-
-            while mq_backward_1Y_shifted is None and shifted_tenor_label is not None :
-                shifted_tenor_label = get_1Ybackwardshifted_tenor_label(shifted_tenor_label)
-                mq_backward_1Y_shifted = self.get_market_quote_by_label(shifted_tenor_label)
-            else:
-                assert ("backwardshifted tenor not found")
-
-            if mq_backward_1Y_shifted.maturity_date <= mq_1Y.maturity_date:
-                return mq_backward_1Y_shifted
-            else:
-                return self.get_market_quote_backwardshifted(shifted_tenor_label)
-
-
-    def get_market_quote_list_backwardshifted(self, input_tenor_label:str, market_quote_list_input:list=None)->list:
-
-        mq_input_tenor = self.get_market_quote_by_label(input_tenor_label)
-        mq_1Y = self.get_market_quote_by_label('1Y')
-
-        # recursive called
-        if market_quote_list_input is not None :
-            mq_result_list = market_quote_list_input
-
-        # initial called
-        else:
-            mq_result_list = []
-
-        # already within 1Y
-        if mq_input_tenor.maturity_date <= mq_1Y.maturity_date:
-            return [mq_input_tenor]
-
-        # greater than 1Y
-        else:
-            shifted_tenor_label = get_1Ybackwardshifted_tenor_label(input_tenor_label)
-            mq_backward_1Y_shifted = self.get_market_quote_by_label(shifted_tenor_label)
-
-            # work around only
-            while mq_backward_1Y_shifted is None and shifted_tenor_label is not None :
-                shifted_tenor_label = get_1Ybackwardshifted_tenor_label(shifted_tenor_label)
-                mq_backward_1Y_shifted = self.get_market_quote_by_label(shifted_tenor_label)
-
-            if mq_backward_1Y_shifted is not None:
-                mq_result_list.append(mq_backward_1Y_shifted)
-            else:
-                assert("not able to find the backward shifted tenor for {input_tenor_label}".format(input_tenor_label=input_tenor_label))
-                # to be enhanced
-
-            # if the result is within 1Y, then return the list
-            if mq_backward_1Y_shifted.maturity_date <= mq_1Y.maturity_date:
-
-                # sort and make the list ascending
-                mq_result_list.reverse()
-                return mq_result_list
-
-            # otherwise continue to get the tenor(s) until it is within 1Y
-            else:
-                return self.get_market_quote_list_backwardshifted(shifted_tenor_label, mq_result_list)
-
-
-
-    def get_discount_factor_curve(self, linearization:linearization_enum, basis_input:int=None) -> cls_discount_factor_curve:
-
-        if basis_input is None:
-            basis = self.basis
-        else:
-            basis = basis_input
-
-        discount_factor_today_spot = self.get_discount_factor_today_spot()
-
-        ds_factor_list = []
-
-        market_quote_1Y = self.get_discount_factor_by_label('1Y')
-
-        for market_quote_iter in self.fx_rate_list:
-            if market_quote_iter.tenor.label == 'O/N':
-                discount_factor_iter = self.__get_discount_factor_on()
-            elif market_quote_iter.tenor.label == 'T/N':
-                discount_factor_iter = discount_factor_today_spot
-            else:
-
-                if market_quote_1Y is None :
-                    discount_factor_iter = market_quote_iter.get_discount_factor_today_maturity(discount_factor_today_spot)
-
-                elif market_quote_iter.maturity_date <= market_quote_1Y.maturity_date :
-                    discount_factor_iter = market_quote_iter.get_discount_factor_today_maturity(discount_factor_today_spot)
-
-                else:
-
-                    #market_quote_backwardshifted_within_1Y = self.get_market_quote_backwardshifted(market_quote_iter.label)
-                    market_quote_list_backwardshifted = self.get_market_quote_list_backwardshifted(market_quote_iter.label)
-
-                    discount_factor_iter = get_discounted_factor_today_maturity_from_market_quote_over_1Ys(discount_factor_today_spot, market_quote_list_backwardshifted, market_quote_iter)
-
-            ds_factor_list.append(discount_factor_iter)
-
-            #print("--", df_iter.tenor.label, df_iter.mid )
-
-        return cls_discount_factor_curve(self.currency, ds_factor_list, linearization, basis)
-
-    @property
-    def spot_date(self)->datetime.date:
-        """
-        Gets the spot date based on the spot date shift convention.
-        
-        Returns:
-            datetime.date: The spot date determined by the following rules:
-            - For T+1 currencies (D1): Returns the maturity date of O/N rate
-            - For T+2 currencies (D2): Returns the maturity date of T/N rate  
-            - For T+0 currencies (D0): Returns the start date of O/N rate
-            
-        Raises:
-            AssertionError: If the spot_date_shift is not one of the valid enum values
-            
-        Notes:
-            - O/N = Overnight rate
-            - T/N = Tomorrow/Next rate
-            - The spot date is when FX trades typically settle
-            - Different currencies have different standard settlement periods (T+0, T+1, T+2)
-        """
-        if self.spot_date_shift == date_shift_enum.D1:
-            return self.get_market_quote_by_label('O/N').tenor.maturity_date
-
-        elif self.spot_date_shift == date_shift_enum.D2:
-            return self.get_market_quote_by_label('T/N').tenor.maturity_date
-
-        elif self.spot_date_shift == date_shift_enum.D0:
-            return self.get_market_quote_by_label('O/N').tenor.start_date
-
-        else:
-            assert("invalid spot date shift")
-
-    @property
-    def today_date(self)->datetime.date:
-        return self.get_market_quote_by_label('O/N').tenor.start_date
-
-    @property
-    def last_item(self)->cls_market_quote:
-        return self.fx_rate_list[-1]
-
-
-def get_discounted_factor_spot_maturity_from_market_quote_over_1Y(discount_factor_spot_backwardshifteddate:cls_discount_factor, market_quote_spot_maturity:cls_market_quote)->cls_discount_factor:
-    #                                                       |<-----------------1 year--------->|
-    # |-------------------|---------------------------------|-------------------------|--------|-------------------time axis--->
-    # today-----------spot date------------intermediate interest payment date -------1Y------maturity date
-
-
-    # for easy calculation only , any positive amount is workable. Not refecting in  result.
-    virtual_principal = 1000000
-
-    cash_flow_principal_spot_date = virtual_principal
-    cash_flow_principal_maturity = -1 * virtual_principal
-
-    # Calculate interest payment at intermediate date
-    cash_flow_intermediate_interest = -1 * virtual_principal * (
-        market_quote_spot_maturity.value * 
-        discount_factor_spot_backwardshifteddate.tenor.number_of_days / 
-        discount_factor_spot_backwardshifteddate.basis
-    )
-
-    # Discount intermediate interest payment to spot date
-    discounted_cash_flow_intermediate_interest = cash_flow_intermediate_interest * discount_factor_spot_backwardshifteddate.value
-
-    # Calculate total discounted cash flow at maturity (including principal)
-    discounted_cash_flow_maturity = 0 - cash_flow_principal_spot_date - discounted_cash_flow_intermediate_interest
-
-    # Calculate interest for period from intermediate date to maturity
-    cash_flow_maturity_interest = -1 * virtual_principal * (
-        market_quote_spot_maturity.value * 
-        (market_quote_spot_maturity.tenor.number_of_days - discount_factor_spot_backwardshifteddate.tenor.number_of_days) / 
-        discount_factor_spot_backwardshifteddate.basis
-    )
-
-    # Calculate discount factor value from cash flows
-    discount_factor_spot_maturity_value = discounted_cash_flow_maturity / (cash_flow_maturity_interest + cash_flow_principal_maturity)
-
-    # Create and return discount factor object
-    discount_factor_spot_maturity = market_quote_spot_maturity.get_discount_factor_spot_maturity(discount_factor_spot_maturity_value)
-
-    return discount_factor_spot_maturity
-
-
-
-
-def get_discounted_factor_today_maturity_from_market_quote_over_1Y(discount_factor_today_spot:cls_discount_factor,
-                                                                   market_quote_spot_backwardshifteddate:cls_market_quote,
-                                                                   market_quote_spot_maturity:cls_market_quote
-                                                                  )->cls_discount_factor:
-    # backward shift date is the interpayment date
-    discount_factor_spot_interpayment = market_quote_spot_backwardshifteddate.get_discount_factor_spot_maturity()
-
-    discount_factor_spot_maturity = get_discounted_factor_spot_maturity_from_market_quote_over_1Y(discount_factor_spot_interpayment, market_quote_spot_maturity)
-
-    discount_factor_today_maturity = discount_factor_today_spot.extend_by_df(discount_factor_spot_maturity, discount_factor_spot_maturity.label)
-
-    return discount_factor_today_maturity
-
-
-
-def get_discounted_factor_spot_maturity_from_market_quote_over_1Ys(discount_factor_list_spot_backwardshifteddate:list, market_quote_spot_maturity:cls_market_quote)->cls_discount_factor:
-    #                                                            |<-----------------1 year------------>|<--------------------1 year--------->|
-    # |-------------------|--------------------------------------|-------------------|-----------------|----------------------------|--------|-------------------time axis--->
-    # today-----------spot date----------intermediate interest payment date1--------1Y---intermediate interest payment date2-------2Y------maturity date
-
-
-    # for easy calculation only , any positive amount is workable. Not reflecting in result.
-    virtual_principal = 1000000
-
-    cash_flow_spot_date_principal = virtual_principal
-    cash_flow_maturity_principal = -1 * virtual_principal
-
-    # sum up the intermediate discounted interest payment
-    discounted_cash_flow_intermediate_interest_sum = 0
-
-    aggregated_days = 0
-
-    for discount_factor_spot_backwardshifteddate in discount_factor_list_spot_backwardshifteddate :
-        # duration is last intermediate payment date  to current intermediate payment date
-        cash_flow_intermediate_interest = -1 * virtual_principal * (market_quote_spot_maturity.value * (discount_factor_spot_backwardshifteddate.tenor.number_of_days - aggregated_days )/ discount_factor_spot_backwardshifteddate.basis)
-
-        # get the discounted amount of the cash flow , discounted from intermediate payment date to spot date.
-        discounted_cash_flow_intermediate_interest = cash_flow_intermediate_interest * discount_factor_spot_backwardshifteddate.value
-
-
-        discounted_cash_flow_intermediate_interest_sum = discounted_cash_flow_intermediate_interest_sum + discounted_cash_flow_intermediate_interest
-        aggregated_days = discount_factor_spot_backwardshifteddate.tenor.number_of_days
-
-    # including principal and maturity payment
-    discounted_cash_flow_maturity = 0 - cash_flow_spot_date_principal - discounted_cash_flow_intermediate_interest_sum
-
-    # duration is the last intermediate interest payment date to maturity date
-    # equal to ( spot date to maturity date   MINUS   spot date to last intermediate interest payment date  )
-    discount_factor_spot_lastinterpayment = discount_factor_list_spot_backwardshifteddate[-1]
-
-    cash_flow_maturity_interest = -1 * virtual_principal * (market_quote_spot_maturity.value * (market_quote_spot_maturity.tenor.number_of_days - discount_factor_spot_lastinterpayment.tenor.number_of_days) / discount_factor_spot_lastinterpayment.basis)
-
-    discount_factor_spot_maturity_value = discounted_cash_flow_maturity / (cash_flow_maturity_interest + cash_flow_maturity_principal)
-
-    discount_factor_spot_maturity = market_quote_spot_maturity.get_discount_factor_spot_maturity(discount_factor_spot_maturity_value)
-
-    return discount_factor_spot_maturity
-
-
-def get_discounted_factor_today_maturity_from_market_quote_over_1Ys(discount_factor_today_spot:cls_discount_factor,
-                                                                    market_quote_list_spot_backwardshifteddate:list,
-                                                                    market_quote_spot_maturity:cls_market_quote
-                                                                   )->cls_discount_factor:
-    discount_factor_list =[]
-
-    market_quote_list = market_quote_list_spot_backwardshifteddate + [market_quote_spot_maturity]
-
-    #market_quote_spot_backwardshifteddate_iter = cls_market_quote()
-
-    for i in range(len(market_quote_list) - 1):
-        if i == 0:
-            # assume the first one is within 1Y
-            market_quote_spot_backwardshifteddate_iter = market_quote_list[i]
-
-            # for the market quote within 1Y, discount factor could be calculated directly.
-            discount_factor_spot_backwardshifteddate_iter = market_quote_spot_backwardshifteddate_iter.get_discount_factor_spot_maturity()
-            discount_factor_list.append(discount_factor_spot_backwardshifteddate_iter)
-
-        else:
-            pass
-
-        # the next payment date as iterated maturity date
-        market_quote_spot_next_backwardshifteddate_iter = market_quote_list[i + 1]
-
-        discount_factor_spot_maturity_iter = get_discounted_factor_spot_maturity_from_market_quote_over_1Ys(discount_factor_list, market_quote_spot_next_backwardshifteddate_iter)
-
-        # add result to discount factor list
-        discount_factor_list.append(discount_factor_spot_maturity_iter)
-
-    else:
-        discount_factor_spot_maturity = discount_factor_list[-1]
-        discount_factor_today_maturity = discount_factor_today_spot.extend_by_df(discount_factor_spot_maturity, discount_factor_spot_maturity.label)
-
-    return discount_factor_today_maturity
-
-
-
-class cls_swap_point_panel(cls_rate_curve):
-
-    def __init__(
-            self,
-            currency_pair: cls_currency_pair,
-            spot_rate_input: cls_fx_spot_rate=None,
-            df_curve_base_ccy: cls_discount_factor_curve=None,
-            df_curve_und_ccy: cls_discount_factor_curve=None,
-            set_swap_point_list_when_initial: bool = True):
-
-        self.currency_pair = currency_pair
-        super().__init__([])
-
-        self.df_curve_base_ccy = df_curve_base_ccy
-        self.df_curve_und_ccy = df_curve_und_ccy
-
-        self.spot_rate = spot_rate_input.get_fx_rate_by_quotation(currency_pair.quotation)
-
-        if set_swap_point_list_when_initial == True :
-            #logger.info("swap point list is auto set.")
-            self.refresh_swap_point_list()
-        else:
-            pass
-            #logger.info("swap point list is not auto set.")
-
-    @property
-    def swap_point_factor(self)->int:
-        return self.currency_pair.swap_point_factor
-
-    @property
-    def spot_date(self)->datetime.date:
-        return self.spot_rate.tenor.maturity_date
-
-    @property
-    def today_date(self)->datetime.date:
-        return self.spot_rate.tenor.start_date
-
-    @property
-    def swap_point_list(self)->list:
-        return self.fx_rate_list
-
-    @property
-    def base_currency_label(self)->str:
-        return self.currency_pair.base.label
-
-    @property
-    def und_currency_label(self)->str:
-        return self.currency_pair.underlying.label
-
-    def get_swap_point_from_list_by_tenor_label(self, label:str) -> cls_swap_point:
-
-        for swap_point_iter in self.swap_point_list:
-            if swap_point_iter.tenor.label == label.upper().strip():
-                return swap_point_iter
-        else:
-            logger.warning("parameter label {label} is not found in swap point list.".format(label=label))
-            return None
-
-
-    def get_swap_point_from_list_by_maturity(self, maturity_date: datetime.date) -> cls_swap_point:
-
-        for swap_point_iter in self.swap_point_list:
-            if swap_point_iter.tenor.maturity_date == maturity_date:
-                return swap_point_iter
-        else:
-            logger.warning("parameter maturity_date {maturity_date} is not found in swap point list.".format(maturity_date=maturity_date.__str__()))
-            return None
-
-
-
-    def refresh_swap_point_list(self):
-        # follow the tenors of underlying currency
-        for df_und_iter in self.df_curve_und_ccy.fx_rate_list:
-
-            df_base_iter = self.df_curve_base_ccy.get_discount_factor_by_maturity_date(df_und_iter.tenor.maturity_date)
-
-            if df_base_iter is not None:
-                swap_point_iter = self.get_swap_point_by_maturity(df_und_iter.tenor.maturity_date)
-                self.swap_point_list.append(swap_point_iter)
-
-        return self.swap_point_list
-
-    def get_swap_point_by_maturity(self, maturity_date: datetime.date) -> cls_swap_point:
-
-        if maturity_date == self.df_curve_und_ccy.tom_date :
-
-            df_base_spot_tom = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
-            df_und_spot_tom = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
-
-            df_base_spot_today = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, self.today_date)
-            df_und_spot_today = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, self.today_date)
-
-            swap_point_spot_tom = self.__set_and_return_swap_point_by_df(df_base_spot_tom, df_und_spot_tom)
-            swap_point_spot_today = self.__set_and_return_swap_point_by_df(df_base_spot_today, df_und_spot_today)
-
-            return cls_swap_point(self.currency_pair, cls_tenor(self.today_date, maturity_date, 'O/N'), swap_point_spot_tom.mid - swap_point_spot_today.mid)
-
-        elif maturity_date == self.df_curve_und_ccy.spot_date and self.df_curve_und_ccy.spot_date_shift == date_shift_enum.D2:
-
-            date_tom = self.get_swap_point_from_list_by_tenor_label("O/N").tenor.maturity_date
-
-            df_base_spot_tom = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, date_tom)
-            df_und_spot_tom = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, date_tom)
-
-            swap_point_spot_tom = self.__set_and_return_swap_point_by_df(df_base_spot_tom, df_und_spot_tom)
-
-            return cls_swap_point(self.currency_pair, cls_tenor(date_tom, maturity_date, 'T/N'), -1 * swap_point_spot_tom.mid)
-
-        elif maturity_date == self.df_curve_und_ccy.spot_date and self.df_curve_und_ccy.spot_date_shift == date_shift_enum.D0:
-
-            return cls_swap_point(self.currency_pair, cls_tenor(maturity_date, maturity_date, 'TDY'),  0)
-
-        else:
-            df_base_spot_maturity = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
-            # print("get_swap_point_by_start_maturity ", "df_base_s_m.tenor.start_date is ", df_base_s_m.tenor.start_date, "df_base_s_m.tenor.maturity_date is ", df_base_s_m.tenor.maturity_date)
-
-            df_und_spot_maturity = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
-
-            return self.__set_and_return_swap_point_by_df(df_base_spot_maturity, df_und_spot_maturity)
-
-    def __set_and_return_swap_point_by_df(
-                            self,
-                            df_base: cls_discount_factor,
-                            df_und: cls_discount_factor) -> cls_swap_point:
-
-        swap_point = cls_swap_point(self.currency_pair, df_und.tenor)
-
-        swap_point.set_swap_point_by_discount_factors(
-                                                    self.spot_rate,
-                                                    df_base,
-                                                    df_und)
-
-        return swap_point
-
-    def get_forward_rate_by_maturity(self, maturity_date:datetime.date)->cls_fx_forward_rate:
-
-        df_base_spot_maturity = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
-
-        df_und_spot_maturity = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
-
-        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
-            forward_rate_value = self.spot_rate.mid * df_base_spot_maturity.mid / df_und_spot_maturity.mid
-        elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
-            forward_rate_value = self.spot_rate.mid * df_und_spot_maturity.mid / df_base_spot_maturity.mid
-
-        return cls_fx_forward_rate(self.currency_pair, cls_tenor(self.today_date, maturity_date),
-                                   forward_rate_value, quotation_mode=self.currency_pair.quotation_mode)
-
-
-    # get underlying currency discount factor curve by base currency discount factor curve and swap point
-    def get_und_df_curve_by_swap_point_list(self, linearization_of_df_curve_und:linearization_enum, basis_input: int=None)->cls_discount_factor_curve:
-
-        und_ccy = self.currency_pair.underlying
-
-        if basis_input is None :
-            basis = und_ccy.number_of_days_1year
-        else:
-            basis = basis_input
-
-
-        df_list_und = []
-
-        swap_point_on = self.get_swap_point_from_list_by_tenor_label("O/N")
-
-
-        # get swap point of today --> spot date
-        if und_ccy.spot_date_shift == date_shift_enum.D2:
-            swap_point_tn = self.get_swap_point_from_list_by_tenor_label("T/N")
-
-            swap_point_today_spot_value = swap_point_on.value + swap_point_tn.value
-            swap_point_today_spot = cls_swap_point(self.currency_pair, cls_tenor(self.today_date, self.spot_date), swap_point_today_spot_value)
-
-        elif und_ccy.spot_date_shift == date_shift_enum.D1:
-            swap_point_today_spot = cls_swap_point(self.currency_pair, cls_tenor(self.today_date, self.spot_date), swap_point_on.value)
-
-        elif und_ccy.spot_date_shift == date_shift_enum.D0:
-            swap_point_today_spot = cls_swap_point(self.currency_pair, cls_tenor(self.today_date, self.today_date), 0)
-
-        else:
-            pass
-
-        # get discount factor of underlying currency , today --> spot
-        df_base_today_spot = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.today_date, self.spot_date)
-        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
-            df_und_today_spot_value = df_base_today_spot.value * (1 - swap_point_today_spot.value / self.spot_rate.value )
-
-
-        elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
-            df_und_today_spot_value = df_base_today_spot.value / (1 - swap_point_today_spot.value / self.spot_rate.value )
-
-        else:
-            pass
-
-        if und_ccy.spot_date_shift == date_shift_enum.D2:
-            df_und_today_spot = cls_discount_factor(und_ccy, cls_tenor(self.today_date, self.spot_date, "T/N"), df_und_today_spot_value, basis=basis)
-        elif und_ccy.spot_date_shift == date_shift_enum.D1:
-            df_und_today_spot = cls_discount_factor(und_ccy, cls_tenor(self.today_date, self.spot_date, "O/N"), df_und_today_spot_value, basis=basis)
-        elif und_ccy.spot_date_shift == date_shift_enum.D0:
-            df_und_today_spot = cls_discount_factor(und_ccy, cls_tenor(self.today_date, self.spot_date, "TDY"), 1, basis=basis)
-        else:
-            pass
-
-        #print("df_und_today_spot_value={df_und_today_spot_value}".format(df_und_today_spot_value=df_und_today_spot_value))
-        df_list_und.append(df_und_today_spot) # append discount factor "T/N" to result
-
-
-
-        # get discount factor of underlying currency , today -> tom , and others
-        for swap_point_iter in self.fx_rate_list:
-
-            df_base_spot_maturity = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, swap_point_iter.maturity_date)
-
-            if swap_point_iter.label == "O/N":
-                pass
-
-            elif swap_point_iter.label == "T/N" and und_ccy.spot_date_shift == date_shift_enum.D2:
-                df_base_tom_spot = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(swap_point_iter.start_date, self.spot_date)
-
-                if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
-                    df_und_tom_spot_value = df_base_tom_spot.value * (1 - swap_point_iter.value / self.spot_rate.value)
-
-                elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
-                    df_und_tom_spot_value = df_base_tom_spot.value / (1 - swap_point_iter.value / self.spot_rate.value)
-
-                else:
-                    pass
-
-                df_und_today_tom_value = df_und_today_spot.value / df_und_tom_spot_value
-
-                df_und_today_tom = cls_discount_factor(und_ccy, cls_tenor(self.today_date, swap_point_iter.maturity_date, "O/N"), df_und_today_tom_value, basis=basis)
-
-                #print("df_und_on_value={df_und_on_value}".format(df_und_on_value=df_und_today_tom_value))
-                df_list_und.append(df_und_today_tom) # append discount factor "O/N" to result
-
-            else:
-                if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
-                    df_und_spot_maturity_value = df_base_spot_maturity.value / (swap_point_iter.value / self.spot_rate.value + 1)
-
-                elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
-                    df_und_spot_maturity_value = df_base_spot_maturity.value * (swap_point_iter.value / self.spot_rate.value + 1)
-
-                else:
-                    pass
-
-                df_und_today_maturity_value = df_und_today_spot_value * df_und_spot_maturity_value
-
-                df_und_today_maturity = cls_discount_factor(und_ccy,
-                                                            cls_tenor(self.today_date, swap_point_iter.maturity_date, swap_point_iter.label),
-                                                            df_und_today_maturity_value,
-                                                            basis=basis)
-
-                df_list_und.append(df_und_today_maturity) # append discount factor greater than "T/N" to result
-
-        df_curve_und = cls_discount_factor_curve(und_ccy, df_list_und, linearization_of_df_curve_und, basis=basis)
-        return df_curve_und
-
-    def get_and_set_und_df_curve_by_swap_point_list(self, linearization_of_df_curve_und:linearization_enum):
-        self.df_curve_und_ccy = self.get_und_df_curve_by_swap_point_list(linearization_of_df_curve_und)
-
-
-def create_swap_point_panel_by_market_quote_curves(currency_pair: cls_currency_pair,
-                                                   spot_rate_input: cls_fx_spot_rate,
-                                                   mq_curve_base_ccy: cls_market_quote_curve,
-                                                   mq_curve_und_ccy: cls_market_quote_curve,
-                                                   df_curve_base_linearization: linearization_enum = linearization_enum.log_ds_factor,
-                                                   df_curve_und_linearization: linearization_enum = linearization_enum.log_ds_factor,
-                                                   df_curve_base_basis: int=None,
-                                                   df_curve_und_basis: int=None,
-                                                   set_swap_point_list_when_initial: bool = False
-                                                   )->cls_swap_point_panel:
-
-    df_curve_base_ccy = mq_curve_base_ccy.get_discount_factor_curve(df_curve_base_linearization,df_curve_base_basis)
-    df_curve_und_ccy = mq_curve_und_ccy.get_discount_factor_curve(df_curve_und_linearization, df_curve_und_basis)
-
-    return cls_swap_point_panel(currency_pair, spot_rate_input, df_curve_base_ccy, df_curve_und_ccy, set_swap_point_list_when_initial)
-
-
-class cls_rate_dict:
-    def __init__(self ,
-                 today_date: datetime.date,
-                 curve_dict: dict=None):
-        self.today_date = today_date
-        self.curve_dict = {} if curve_dict is None else curve_dict
-
-    def get_curve_by_currency_label(self, currency_label:str)->cls_discount_factor_curve:
-        if currency_label in self.curve_dict:
-            return self.curve_dict[currency_label]
-        else:
-            return None
-
-    def add_curve_to_dict(self, label:str, curve:cls_rate_curve)->None:
-        self.curve_dict[label] = curve
-
-    def remove_curve_from_dict(self, label:str)->None:
-        del self.curve_dict[label]
-
-    def clear_dict(self)->None:
-        self.curve_dict.clear()
-
-
-class cls_discount_factor_curve_dict(cls_rate_dict):
-    def get_swap_point_panel_by_currency_pair(self,currency_pair:cls_currency_pair, spot_rate:cls_fx_spot_rate)->cls_swap_point_panel:
-
-        if currency_pair.base.label in self.curve_dict:
-            df_curve_base_ccy = self.get_curve_by_currency_label(currency_pair.base.label)
-        else:
-            assert("currency {label} is not in dict".format(label=currency_pair.base.label))
-            return None
-
-        if currency_pair.underlying.label in self.curve_dict:
-            df_curve_und_ccy = self.get_curve_by_currency_label(currency_pair.underlying.label)
-        else:
-            assert ("currency {label} is not in dict".format(label=currency_pair.underlying.label))
-            return None
-
-        return cls_swap_point_panel(currency_pair, spot_rate, df_curve_base_ccy, df_curve_und_ccy)
-
-
-class cls_market_quote_curve_dict(cls_rate_dict):
-
-    def get_discount_factor_curve_dict(self, linearization:linearization_enum)->cls_discount_factor_curve_dict:
-        df_curve_dict = cls_discount_factor_curve_dict(self.today_date)
-
-        for ccy_label, mq_curve_iter in self.curve_dict.items():
-            df_curve_iter = mq_curve_iter.get_discount_factor_curve(linearization, mq_curve_iter.basis)
-            if ccy_label in df_curve_dict.curve_dict:
-                assert("ccy_name {ccy_name} is already in df_curve_dict".format(ccy_name=ccy_label))
-            else:
-                pass
-            df_curve_dict.curve_dict[ccy_label] = df_curve_iter
-
-        return df_curve_dict
\ No newline at end of file
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import bisect
+import collections
+import concurrent.futures
+import csv
+import datetime
+import functools
+import hashlib
+import itertools
+import json
+import math
+import re
+import types
+import numpy as np
+from log4py import logger
+
+from enum import Enum
+
+def build_quotation(ccy1: str, ccy2: str):
+    return ccy1 + "-" + ccy2
+
+
+# dates are carried as integer ordinals internally, datetime.date only at the API edge
+def get_ordinal_array_by_dates(dates)->np.ndarray:
+    return np.fromiter((date_iter.toordinal() for date_iter in dates), dtype=np.int32)
+
+
+def get_dates_by_ordinal_array(ordinals)->list:
+    return [datetime.date.fromordinal(ordinal) for ordinal in np.asarray(ordinals).tolist()]
+
+
+def get_buckets_fractions_by_ordinals(earlier_bucket_ordinal:int, later_bucket_ordinal:int, maturity_ordinals)->tuple:
+    """
+    Linear interpolation fractions between two bucket dates, as date ordinals.
+
+    Args:
+        earlier_bucket_ordinal: ordinal of the earlier bucket date
+        later_bucket_ordinal: ordinal of the later bucket date
+        maturity_ordinals: ordinal of the maturity date, or np.ndarray of them
+
+    Returns:
+        tuple: (fraction for earlier bucket, fraction for later bucket), arrays if maturity_ordinals is an array
+    """
+    if later_bucket_ordinal != earlier_bucket_ordinal:
+        earlier_bucket_fraction = (later_bucket_ordinal - maturity_ordinals) / (later_bucket_ordinal - earlier_bucket_ordinal)
+        later_bucket_fraction = (maturity_ordinals - earlier_bucket_ordinal) / (later_bucket_ordinal - earlier_bucket_ordinal)
+    else:
+        # same bucket dates, all on the earlier one
+        earlier_bucket_fraction = 1 if np.isscalar(maturity_ordinals) else np.ones(np.shape(maturity_ordinals))
+        later_bucket_fraction = 0 if np.isscalar(maturity_ordinals) else np.zeros(np.shape(maturity_ordinals))
+
+    return (earlier_bucket_fraction, later_bucket_fraction)
+
+
+class quotation_mode_enum(Enum):
+    base_und = "base-und"
+    und_base = "und-base"
+
+def get_reversed_quotation_mode(quotation_mode:quotation_mode_enum)->quotation_mode_enum:
+    if quotation_mode == quotation_mode_enum.base_und:
+        return quotation_mode_enum.und_base
+    elif quotation_mode == quotation_mode_enum.und_base:
+        return quotation_mode_enum.base_und
+
+
+def get_reversed_quotation(quotation:str)->str:
+    return quotation[0:3] + quotation[3:4] + quotation[4:7]
+
+
+class linearization_enum(Enum):
+    """Enumeration for different interpolation methods used in rate calculations"""
+    # Interpolate Log(DiscountFactor) linearly
+    log_ds_factor = "log_ds_factor"
+
+    # Interpolate DiscountRate linearly  
+    linear_ds_rate = "linear_ds_rate"
+
+    # Interpolate DiscountRate*Time linearly
+    linear_rate_time = "linear_rate_time"
+
+class base_or_und_enum(Enum):
+    base = "base"
+    und = "und"
+
+class discount_factor_methodology(Enum):
+    lin_act_365 = "LIN ACT/365"
+    lin_act_360 = "LIN ACT/360"
+    exp_act_365 = "EXP ACT/365"
+
+class tenor_label(Enum):
+    ON = 100
+    TN = 200
+    SN = 300
+    W1 = 400
+    W2 = 500
+    W3 = 600
+    W4 = 700
+    M1 = 800
+    M2 = 900
+    M3 = 1000
+    M4 = 1100
+    M5 = 1200
+    M6 = 1300
+    M7 = 1400
+    M8 = 1500
+    M9 = 1600
+    M10 = 1700
+    M11 = 1800
+    Y1 = 1900
+    M15 = 2000
+    M18 = 2100
+    M21 = 2200
+    Y2 = 2300
+    Y3 = 2400
+    Y4 = 2500
+    Y5 = 2600
+    Y6 = 2700
+    Y7 = 2800
+    Y8 = 2900
+    Y9 = 3000
+    Y10 = 3100
+    Y11 = 3200
+    Y12 = 3300
+    Y15 = 3400
+    Y20 = 3500
+
+class date_shift_enum(Enum):
+    D0 = 0
+    D1 = 1
+    D2 = 2
+
+
+class cls_currency:
+    __slots__ = ('label', 'number_of_days_1year', 'spot_date_shift', '__is_canonical')
+
+    def __init__(self,
+                 label: str=None,
+                 number_of_days_1year: int=365,
+                 spot_date_shift: date_shift_enum = date_shift_enum.D2):
+        self.label = label.upper() if label is not None else label
+        self.number_of_days_1year = number_of_days_1year
+        self.spot_date_shift = spot_date_shift
+        self.__is_canonical = False
+
+    @classmethod
+    def _create_canonical(cls, label: str, number_of_days_1year: int, spot_date_shift: date_shift_enum):
+        """Creates a canonical currency, for cls_currency_registry only."""
+        currency = cls(label, number_of_days_1year, spot_date_shift)
+        currency.__is_canonical = True
+        return currency
+
+    @property
+    def is_canonical(self)->bool:
+        """True for the currencies handed out by cls_currency_registry."""
+        return self.__is_canonical
+
+    # identity first, shared canonical instances compare without reading their conventions
+    def __eq__(self, other)->bool:
+        if self is other:
+            return True
+        if not isinstance(other, cls_currency):
+            return False
+        return (self.label == other.label and
+                self.number_of_days_1year == other.number_of_days_1year and
+                self.spot_date_shift == other.spot_date_shift)
+
+    def __ne__(self, other)->bool:
+        return not self.__eq__(other)
+
+    def __hash__(self)->int:
+        return hash(self.label)
+
+    # canonical currencies are unpickled as the canonical currency of the receiving process
+    def __reduce__(self):
+        if self.__is_canonical:
+            return (get_canonical_currency, (self.label, self.number_of_days_1year, self.spot_date_shift))
+        return (cls_currency, (self.label, self.number_of_days_1year, self.spot_date_shift))
+
+
+class cls_currency_pair:
+    __slots__ = ('base', 'underlying', 'quotation_mode', 'swap_point_factor', 'day_shift', '__quotation')
+
+    def __init__(self,
+                 base: cls_currency,
+                 underlying: cls_currency,
+                 quotation_mode: quotation_mode_enum,
+                 swap_point_factor: int=10000,
+                 day_shift: date_shift_enum = None):
+        self.base = base
+        self.underlying = underlying
+
+        self.quotation_mode = quotation_mode
+        self.swap_point_factor = swap_point_factor
+
+        if day_shift is None:
+            self.day_shift = base.spot_date_shift if base.spot_date_shift._value_ >= underlying.spot_date_shift._value_ else underlying.spot_date_shift
+        else:
+            self.day_shift = day_shift
+
+        self.__quotation = ""
+
+        if quotation_mode == quotation_mode_enum.base_und:
+            self.__quotation = build_quotation(base.label, underlying.label)
+        elif quotation_mode == quotation_mode_enum.und_base:
+            self.__quotation = build_quotation(underlying.label, base.label)
+        else:
+            assert("quotation_mode is invalid")
+            logger.critical("{class_name} : parameter quotation_mode {quotation_mode} is invalid".format(class_name=self.__class__.__name__.replace("cls_",""),  quotation_mode=quotation_mode.__repr__()))
+            # ("quotation is " + self.__quotation)
+
+    @property
+    def quotation(self)->str:
+        return self.__quotation
+
+    def get_reversed_quotation_mode(self) -> quotation_mode_enum:
+        if self.quotation_mode == quotation_mode_enum.base_und:
+            quotation_mode = quotation_mode_enum.und_base
+        elif self.quotation_mode == quotation_mode_enum.und_base:
+            quotation_mode = quotation_mode_enum.base_und
+        else:
+            quotation_mode = quotation_mode_enum.und_base
+
+        # print("quotation_mode is " + self.quotation_mode.__repr__())
+        return quotation_mode
+
+    def get_reversed_pair(self):
+        return cls_currency_pair(self.base, self.underlying,
+                                 self.get_reversed_quotation_mode(),
+                                 self.swap_point_factor,
+                                 self.day_shift)
+
+    def get_another_currency(self,ccy1:cls_currency)->cls_currency:
+        if ccy1 is self.base:
+            return self.underlying
+        elif ccy1 is self.underlying:
+            return self.base
+        elif ccy1.label == self.base.label:
+            return self.underlying
+        elif ccy1.label == self.underlying.label:
+            return self.base
+
+    def get_base_or_und(self, ccy: cls_currency)->base_or_und_enum:
+        """
+        Tells whether a currency is the base or the underlying currency of the pair, by identity first, then by label.
+
+        Returns:
+            base_or_und_enum: None if the currency is neither
+        """
+        if ccy is self.base:
+            return base_or_und_enum.base
+        elif ccy is self.underlying:
+            return base_or_und_enum.und
+        elif ccy.label == self.base.label:
+            return base_or_und_enum.base
+        elif ccy.label == self.underlying.label:
+            return base_or_und_enum.und
+        return None
+
+    @property
+    def label(self)->str:
+        if self.quotation_mode == quotation_mode_enum.base_und:
+            return self.base.label + "/" + self.underlying.label
+        elif self.quotation_mode == quotation_mode_enum.und_base:
+            return self.underlying.label + "/" + self.base.label
+
+
+class cls_currency_registry:
+    """
+    Flyweight registry of canonical currencies and currency pairs.
+
+    One cls_currency per label and one cls_currency_pair per (base, underlying, quotation mode)
+    is created and then shared, carrying the conventions configured for it.
+    Conventions of currencies not configured are the cls_currency defaults.
+    Instances handed out are never changed: configuring a convention replaces the canonical instances
+    it affects, and the curves, pairs and trades already built keep the conventions they were built with.
+    """
+    def __init__(self):
+        self.__currency_dict = {}
+        self.__currency_pair_dict = {}
+        self.__swap_point_factor_dict = {}
+        self.__configured_label_set = set()
+
+        # canonical instances by (label, number of days of 1 year, spot date shift), a convention set back gets its instance back
+        self.__canonical_currency_dict = {}
+
+    def __get_canonical_currency(self, label: str, number_of_days_1year: int, spot_date_shift: date_shift_enum)->cls_currency:
+        key = (label, number_of_days_1year, spot_date_shift)
+
+        currency = self.__canonical_currency_dict.get(key)
+        if currency is None:
+            currency = self.__canonical_currency_dict[key] = cls_currency._create_canonical(label, number_of_days_1year, spot_date_shift)
+        return currency
+
+    def set_currency_convention(self,
+                                label: str,
+                                number_of_days_1year: int=365,
+                                spot_date_shift: date_shift_enum=date_shift_enum.D2)->cls_currency:
+        """
+        Configures the conventions of a currency.
+
+        If the canonical instance already created has other conventions, it is replaced by the canonical instance
+        of the new conventions, created once per conventions, and so are the canonical currency pairs of the currency;
+        the instances already handed out are left as they are.
+
+        Returns:
+            cls_currency: canonical instance with the conventions
+        """
+        label = label.upper()
+        self.__configured_label_set.add(label)
+
+        currency = self.__currency_dict.get(label)
+        if currency is not None and currency.number_of_days_1year == number_of_days_1year and currency.spot_date_shift == spot_date_shift:
+            return currency
+
+        currency = self.__currency_dict[label] = self.__get_canonical_currency(label, number_of_days_1year, spot_date_shift)
+
+        for key in [key for key in self.__currency_pair_dict if label in key[:2]]:
+            del self.__currency_pair_dict[key]
+
+        return currency
+
+    def set_swap_point_factor(self, base_label: str, und_label: str, swap_point_factor: int)->None:
+        """
+        Configures the swap point factor of a currency pair, replacing its canonical instances already created.
+        """
+        key = (base_label.upper(), und_label.upper())
+        self.__swap_point_factor_dict[key] = swap_point_factor
+
+        for key_iter in [key_iter for key_iter in self.__currency_pair_dict if key_iter[:2] == key]:
+            del self.__currency_pair_dict[key_iter]
+
+    def is_currency_configured(self, label: str)->bool:
+        """True if the conventions of the currency were set by set_currency_convention, not the cls_currency defaults."""
+        return label.upper() in self.__configured_label_set
+
+    def get_currency(self, label: str)->cls_currency:
+        label = label.upper()
+
+        currency = self.__currency_dict.get(label)
+        if currency is None:
+            default_currency = cls_currency(label)
+            currency = self.__currency_dict[label] = self.__get_canonical_currency(label, default_currency.number_of_days_1year, default_currency.spot_date_shift)
+        return currency
+
+    def get_currency_by_conventions(self,
+                                    label: str,
+                                    number_of_days_1year: int,
+                                    spot_date_shift: date_shift_enum)->cls_currency:
+        """
+        Gets the canonical currency if it has the conventions, otherwise a currency of its own with them.
+        """
+        currency = self.get_currency(label)
+        if currency.number_of_days_1year == number_of_days_1year and currency.spot_date_shift == spot_date_shift:
+            return currency
+        return cls_currency(label, number_of_days_1year, spot_date_shift)
+
+    def get_currency_pair(self, base_label: str, und_label: str, quotation_mode: quotation_mode_enum)->cls_currency_pair:
+        key = (base_label.upper(), und_label.upper(), quotation_mode)
+
+        currency_pair = self.__currency_pair_dict.get(key)
+        if currency_pair is None:
+            currency_pair = self.__currency_pair_dict[key] = cls_currency_pair(self.get_currency(key[0]),
+                                                                               self.get_currency(key[1]),
+                                                                               quotation_mode,
+                                                                               self.__swap_point_factor_dict.get(key[:2], 10000))
+        return currency_pair
+
+    def clear(self)->None:
+        self.__currency_dict.clear()
+        self.__currency_pair_dict.clear()
+        self.__swap_point_factor_dict.clear()
+        self.__configured_label_set.clear()
+        self.__canonical_currency_dict.clear()
+
+
+currency_registry = cls_currency_registry()
+
+
+def get_canonical_currency(label: str, number_of_days_1year: int, spot_date_shift: date_shift_enum)->cls_currency:
+    return currency_registry.get_currency_by_conventions(label, number_of_days_1year, spot_date_shift)
+
+
+class cls_tenor:
+    __slots__ = ('label', '__start_date', '__maturity_date', '__start_ordinal', '__maturity_ordinal')
+
+    def __init__(self,
+                 start_date: datetime.date,
+                 maturity_date: datetime.date,
+                 label: str=None):
+        self.label = label.upper() if label is not None else label
+        self.start_date = start_date
+        self.maturity_date = maturity_date
+
+    @property
+    def start_date(self)->datetime.date:
+        return self.__start_date
+
+    @start_date.setter
+    def start_date(self, start_date:datetime.date):
+        self.__start_date = start_date
+        self.__start_ordinal = start_date.toordinal()
+
+    @property
+    def maturity_date(self)->datetime.date:
+        return self.__maturity_date
+
+    @maturity_date.setter
+    def maturity_date(self, maturity_date:datetime.date):
+        self.__maturity_date = maturity_date
+        self.__maturity_ordinal = maturity_date.toordinal()
+
+    @property
+    def start_ordinal(self)->int:
+        return self.__start_ordinal
+
+    @property
+    def maturity_ordinal(self)->int:
+        return self.__maturity_ordinal
+
+    @property
+    def number_of_days(self)->int:
+        return self.__maturity_ordinal - self.__start_ordinal
+
+    def get_inverse_tenor(self, label: str=None):
+        return cls_tenor(self.maturity_date, self.start_date,
+                         (self.label + " inverse").upper() if label is None else label)
+
+        # print(self.start_date.strftime('%Y-%m-%d'))
+        # print(self.maturity_date.strftime('%Y-%m-%d'))
+        # print(self.number_of_days)
+
+        # print(self.label + " " + str(self.start_date) + " " + str(self.maturity_date))
+
+
+class cls_rate:
+    __slots__ = ('__mid', '__bid', '__ask', '__spread')
+
+    def __init__(self,
+                 mid: float=0,
+                 bid: float=0,
+                 ask: float=0):
+        self.__mid = 0.0
+        self.__bid = 0.0
+        self.__ask = 0.0
+        self.__spread = 0.0
+
+        if mid == 0 and bid != 0 and ask != 0:
+            self.set_rate_by_bid_ask(bid, ask)
+        else:
+            self.__mid = mid
+            if bid == 0 and ask == 0:
+                self.set_rate_by_mid_spread(mid, 0)
+            else:
+                self.set_rate_by_bid_ask(bid, ask)
+
+    def set_rate_by_bid_ask(self, bid: float, ask: float):
+        self.__bid = bid
+        self.__ask = ask
+        self.__mid = (self.__bid + self.__ask) / 2
+        self.__spread = abs(self.__bid - self.__mid)
+
+    def set_rate_by_mid_bid_ask(self, mid: float, bid: float, ask: float):
+        self.__mid = mid
+        self.__bid = bid
+        self.__ask = ask
+        self.__spread = abs(self.__bid - self.__mid)
+
+    def set_rate_by_mid_spread(self, mid: float, spread: float=None):
+        self.__mid = mid
+
+        if spread is not None:
+            self.__spread = spread
+
+        self.__bid = self.__mid - self.__spread
+        self.__ask = self.__mid + self.__spread
+
+    @property
+    def mid(self)->float:
+        return self.__mid
+
+    @mid.setter
+    def mid(self, mid:float):
+        self.set_rate_by_mid_spread(mid, self.__spread)
+
+    @property
+    def bid(self)->float:
+        return self.__bid
+
+    @bid.setter
+    def bid(self, bid:float):
+        self.set_rate_by_bid_ask(bid, self.__ask)
+
+    @property
+    def ask(self)->float:
+        return self.__ask
+
+    @ask.setter
+    def ask(self, ask:float):
+        self.set_rate_by_bid_ask(self.__bid, ask)
+
+    @property
+    def spread(self)->float:
+        return self.__spread
+
+    @spread.setter
+    def spread(self, spread:float):
+        self.set_rate_by_mid_spread(self.__mid, spread)
+
+    @property
+    def value(self)->float:
+        return self.__mid
+
+    @value.setter
+    def value(self, value:float):
+        self.set_rate_by_mid_spread(value, self.__spread)
+
+class cls_single_currency_rate(cls_rate):
+    __slots__ = ('currency', 'tenor', 'basis', '__unique_key')
+
+    def __init__(self,
+                 currency: cls_currency=None,
+                 tenor: cls_tenor=None,
+                 mid: float=0,
+                 bid: float=0,
+                 ask: float=0,
+                 basis: int=None):
+        self.currency = currency
+        self.tenor = tenor
+
+        if basis is not None:
+            self.basis = basis
+        else:
+            self.basis = currency.number_of_days_1year
+
+
+        super().__init__(mid, bid, ask)
+        self.__unique_key = None
+
+    def __get_unique_key(self)->str:
+        return (self.__class__.__name__.replace("cls_","") + "#" +
+                self.currency.label + "#" +
+                self.tenor.start_date.strftime('%Y-%m-%d') + "#" +
+                self.tenor.maturity_date.strftime('%Y-%m-%d'))
+
+    @property
+    def unique_key(self):
+        # formatted on first access only
+        if self.__unique_key is None:
+            self.__unique_key = self.__get_unique_key()
+        return self.__unique_key
+
+    @property
+    def currency_label(self):
+        return self.currency.label
+
+    @property
+    def start_date(self):
+        return self.tenor.start_date
+
+    @property
+    def maturity_date(self):
+        return self.tenor.maturity_date
+
+    @property
+    def label(self):
+        return self.tenor.label
+
+
+class cls_discount_factor(cls_single_currency_rate):
+    __slots__ = ()
+
+    def get_capitalized_factor(self):
+        return cls_capitalized_factor(self.currency, self.tenor, 1 / self.mid, basis=self.basis)
+
+    def get_discount_rate(self)->cls_single_currency_rate:
+
+        # to review
+        return cls_discount_rate(
+            self.currency, self.tenor, (1 / self.mid - 1) *
+                                       self.basis / self.tenor.number_of_days, basis=self.basis)
+
+    def get_remaining_df(self, df1, label: str=None):
+
+        # assume self = df1 * df2
+        # get df2
+
+        if self.tenor.start_date == df1.tenor.start_date:
+
+            df2_tenor = cls_tenor(df1.tenor.maturity_date,
+                                  self.tenor.maturity_date,
+                                  label if label is not None else None)
+
+            return cls_discount_factor(df1.currency, df2_tenor, self.mid / df1.mid, basis=self.basis)
+
+        elif self.tenor.maturity_date == df1.tenor.maturity_date:
+
+            df2_tenor = cls_tenor(self.tenor.start_date,
+                                  df1.tenor.start_date,
+                                  label if label is not None else None)
+
+            return cls_discount_factor(df1.currency, df2_tenor, self.mid / df1.mid, basis=self.basis)
+
+        elif self.tenor.start_date == df1.tenor.start_date and self.tenor.maturity_date == df1.tenor.maturity_date and self.mid != df1.mid:
+            logger.critical("parameter df1 tenor start data: %s maturity date: %s match current start date: %s maturity date: %s, but df value %s does not match %s", df1.start_date, df1.maturity_date, self.start_date, self.maturity_date, df1.value, self.value)
+            return None
+
+
+        else:
+            logger.critical("parameter df1 tenor start data: %s maturity date: %s does not match current start date: %s maturity date: %s", df1.start_date, df1.maturity_date, self.start_date, self.maturity_date)
+            return None
+
+    def extend_by_df(self, df1, label: str=None):
+        # assume df2 = self * df1
+        # get df2
+
+        if self.tenor.maturity_date == df1.tenor.start_date:
+
+            df2_tenor = cls_tenor(self.tenor.start_date,
+                                  df1.tenor.maturity_date, label if label is not None else None)
+
+            return cls_discount_factor(self.currency, df2_tenor, self.mid * df1.mid, basis=self.basis)
+
+        elif df1.tenor.maturity_date == self.tenor.start_date:
+
+            df2_tenor = cls_tenor(df1.tenor.start_date,
+                                  self.tenor.maturity_date, label if label is not None else None)
+
+            return cls_discount_factor(self.currency, df2_tenor, df1.mid * self.mid, basis=self.basis)
+
+        else:
+            logger.critical("parameter df1 tenor start data: %s maturity date: %s does not match current start date: %s maturity date: %s", df1.tenor.start_date, df1.tenor.maturity_date, self.tenor.start_date, self.tenor.maturity_date)
+            return None
+
+
+class cls_capitalized_factor(cls_single_currency_rate):
+    __slots__ = ()
+
+    def get_discount_factor(self) -> cls_discount_factor:
+        return cls_discount_factor(self.currency, self.tenor, 1 / self.mid, basis=self.basis)
+
+    def get_discount_rate(self)->cls_single_currency_rate:
+        return cls_discount_rate(
+            self.currency, self.tenor, (self.mid - 1) * self.basis / self.tenor.number_of_days, basis=self.basis)
+
+
+class cls_market_quote(cls_single_currency_rate):
+    __slots__ = ()
+
+    def get_discount_rate(self, discount_factor_today_spot: cls_discount_factor)->cls_single_currency_rate:
+
+        # to be reviewed
+        if self.maturity_date > discount_factor_today_spot.maturity_date:
+            number_of_days_spot_to_maturity = self.tenor.number_of_days
+            number_of_days_today_to_maturity = discount_factor_today_spot.tenor.number_of_days + number_of_days_spot_to_maturity
+
+            ds_rate_value = self.basis * (
+                1 / discount_factor_today_spot.mid *
+                (1 + self.mid * number_of_days_spot_to_maturity / self.basis) - 1
+            ) / number_of_days_today_to_maturity
+
+            return cls_discount_rate(self.currency,
+                                     cls_tenor(discount_factor_today_spot.start_date, self.maturity_date, self.tenor.label ),
+                                     ds_rate_value,
+                                     basis=self.basis)
+
+
+        # for O/N of T+1 currency
+        if self.currency.spot_date_shift == date_shift_enum.D1 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
+            return cls_discount_rate(self.currency,
+                                     cls_tenor(self.start_date, self.maturity_date, self.tenor.label ),
+                                     self.value,
+                                     basis=self.basis)
+
+        # for T/N of T+2 currency
+        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date > discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
+            # to enhance
+            pass
+
+        # for O/N of T+2 currency
+        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date < discount_factor_today_spot.maturity_date:
+            return cls_discount_rate(self.currency,
+                                     cls_tenor(self.start_date, self.maturity_date, self.tenor.label ),
+                                     self.value,
+                                     basis=self.basis)
+
+
+    # only applicable to maturity date <= 1Y
+    def get_discount_factor_today_maturity(self, discount_factor_today_spot: cls_discount_factor)->cls_discount_factor:
+
+        if self.maturity_date > discount_factor_today_spot.maturity_date:
+            number_of_days_spot_to_maturity = self.tenor.number_of_days
+
+            ds_factor_value = discount_factor_today_spot.mid * ( 1 / (  1 + self.mid * number_of_days_spot_to_maturity / self.basis) )
+
+            return cls_discount_factor(self.currency,
+                                       cls_tenor(discount_factor_today_spot.start_date, self.maturity_date, self.tenor.label),
+                                       ds_factor_value,
+                                       basis=self.basis)
+
+        # for O/N of T+1 currency
+        if self.currency.spot_date_shift == date_shift_enum.D1 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
+            return discount_factor_today_spot
+
+        # for T/N of T+2 currency
+        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date > discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
+            number_of_days_tom_to_next = self.tenor.number_of_days
+
+            ds_factor_value = discount_factor_today_spot.mid / (1 / (1 + self.mid * number_of_days_tom_to_next / self.basis) )
+
+            return cls_discount_factor(self.currency,
+                                     cls_tenor(discount_factor_today_spot.start_date, self.maturity_date, self.tenor.label),
+                                     ds_factor_value,
+                                     basis=self.basis)
+
+        # for O/N of T+2 currency
+        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date < discount_factor_today_spot.maturity_date:
+            return cls_discount_factor(self.currency,
+                                      cls_tenor(self.start_date, self.maturity_date, self.tenor.label),
+                                      self.mid,
+                                      basis=self.basis)
+
+
+    # only applicable to maturity date <= 1Y
+    def get_discount_factor_spot_maturity(self, ds_factor_value_input:float=None)->cls_discount_factor:
+
+        number_of_days_spot_to_maturity = self.tenor.number_of_days
+
+        if ds_factor_value_input is None:
+            ds_factor_value = 1 / (  1 + self.mid * number_of_days_spot_to_maturity / self.basis)
+        else:
+            ds_factor_value = ds_factor_value_input
+
+        return cls_discount_factor(self.currency,
+                                   cls_tenor(self.start_date, self.maturity_date, self.tenor.label),
+                                   ds_factor_value,
+                                   basis=self.basis)
+
+
+class cls_discount_rate(cls_single_currency_rate):
+    __slots__ = ()
+
+    def get_discount_factor(self)->cls_discount_factor:
+        return cls_discount_factor(self.currency,
+                                   self.tenor,
+                                   1 / (1 + self.mid * self.tenor.number_of_days / self.basis),
+                                   basis=self.basis)
+
+    def get_capitalized_factor(self)->cls_capitalized_factor:
+        return cls_capitalized_factor(self.currency,
+                                      self.tenor,
+                                      1 + self.mid * self.basis / self.tenor.number_of_days,
+                                      basis=self.basis)
+
+    def get_market_quote(self, discount_factor_today_spot: cls_discount_factor
+                         ) -> cls_market_quote:
+
+        if self.tenor.maturity_date > discount_factor_today_spot.tenor.maturity_date:
+            number_of_days_today_to_maturity = self.tenor.number_of_days
+            number_of_days_spot_to_maturity = number_of_days_today_to_maturity - discount_factor_today_spot.tenor.number_of_days
+
+
+            # to review
+            market_quote_value = self.basis * (
+                discount_factor_today_spot.mid *
+                (1 + self.mid * number_of_days_today_to_maturity / self.basis) - 1
+            ) / number_of_days_spot_to_maturity
+
+            return cls_market_quote(self.currency,
+                                    cls_tenor(discount_factor_today_spot.tenor.maturity_date,
+                                    self.tenor.maturity_date), market_quote_value,
+                                    basis=self.basis)
+
+        # for O/N of T+1 currency
+        if self.currency.spot_date_shift == date_shift_enum.D1 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
+            return cls_market_quote(self.currency,
+                                    cls_tenor(self.start_date, self.maturity_date, self.tenor.label),
+                                    self.mid,
+                                    basis=self.basis)
+
+        # for T/N of T+2 currency
+        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date > discount_factor_today_spot.start_date and self.maturity_date == discount_factor_today_spot.maturity_date:
+            # to enhance
+            pass
+
+        # for O/N of T+2 currency
+        if  self.currency.spot_date_shift == date_shift_enum.D2 and self.start_date == discount_factor_today_spot.start_date and self.maturity_date < discount_factor_today_spot.maturity_date:
+            return cls_market_quote(self.currency,
+                                    cls_tenor(self.start_date, self.maturity_date, self.tenor.label),
+                                    self.mid,
+                                    basis=self.basis)
+
+
+class cls_overnight_funding_rate(cls_single_currency_rate):
+    __slots__ = ()
+
+    pass
+
+class cls_on_funding_rate_panel:
+    """
+    Overnight funding fixings of one currency, in date order.
+
+    The fixings are also kept as the columns of a float64 array (start ordinal, maturity ordinal, mid, bid, ask
+    and the cumulative mid * days before the fixing), which new fixings are appended to and which can be saved
+    to and memory-mapped from a .npy file.
+    """
+    __column_start_ordinal, __column_maturity_ordinal, __column_mid, __column_bid, __column_ask, __column_cumulative_rate_days = range(6)
+    __number_of_columns = 6
+    __minimum_capacity = 64
+
+    def __init__(
+            self,
+            currency: cls_currency,
+            on_rate_list: list):
+        self.currency = currency
+
+        if on_rate_list is not None:
+            self.on_rate_list = on_rate_list
+        else:
+            self.on_rate_list = []
+
+    @property
+    def on_rate_list(self)->list:
+        # fixings loaded from a file are created as objects on first access only
+        if self.__on_rate_list is None:
+            self.__on_rate_list = [cls_overnight_funding_rate(self.currency, cls_tenor(start_date_iter, maturity_date_iter), mid_iter, bid_iter, ask_iter)
+                                   for start_date_iter, maturity_date_iter, mid_iter, bid_iter, ask_iter
+                                   in zip(get_dates_by_ordinal_array(self.__get_column(self.__column_start_ordinal).astype(np.int32)),
+                                          get_dates_by_ordinal_array(self.__get_column(self.__column_maturity_ordinal).astype(np.int32)),
+                                          self.__get_column(self.__column_mid).tolist(),
+                                          self.__get_column(self.__column_bid).tolist(),
+                                          self.__get_column(self.__column_ask).tolist())]
+        return self.__on_rate_list
+
+    @on_rate_list.setter
+    def on_rate_list(self, on_rate_list:list):
+        on_rate_list.sort(
+            key=lambda on_rate: on_rate.tenor.start_date, reverse=False)
+        self.__on_rate_list = on_rate_list
+
+        self.refresh_accrual_index()
+
+    @property
+    def number_of_fixings(self)->int:
+        return self.__number_of_fixings
+
+    @property
+    def list_start_date(self)->datetime.date:
+        if self.__number_of_fixings == 0:
+            return None
+        return datetime.date.fromordinal(int(self.__fixing_array[0, self.__column_start_ordinal]))
+
+    @property
+    def list_end_date(self)->datetime.date:
+        if self.__number_of_fixings == 0:
+            return None
+        return datetime.date.fromordinal(int(self.__fixing_array[self.__number_of_fixings - 1, self.__column_maturity_ordinal]))
+
+    def __get_column(self, column:int)->np.ndarray:
+        # columns of the fortran ordered array are contiguous
+        return self.__fixing_array[:self.__number_of_fixings, column]
+
+    def __set_fixing_array(self, fixing_array:np.ndarray, number_of_fixings:int)->None:
+        self.__fixing_array = fixing_array
+        self.__number_of_fixings = number_of_fixings
+
+        if number_of_fixings > 0:
+            last_fixing = fixing_array[number_of_fixings - 1]
+            self.__total_rate_days = float(last_fixing[self.__column_cumulative_rate_days] +
+                                           last_fixing[self.__column_mid] * (last_fixing[self.__column_maturity_ordinal] - last_fixing[self.__column_start_ordinal]))
+        else:
+            self.__total_rate_days = 0.0
+
+    def refresh_accrual_index(self)->None:
+        """
+        Rebuilds the fixing array, with the cumulative mid * days, from on_rate_list.
+
+        Called when on_rate_list is set, to be called again if on_rate_list is modified in place afterwards.
+        """
+        number_of_fixings = len(self.__on_rate_list)
+        fixing_array = np.zeros((max(number_of_fixings, self.__minimum_capacity), self.__number_of_columns), dtype=np.float64, order='F')
+
+        if number_of_fixings > 0:
+            fixing_array[:number_of_fixings, self.__column_start_ordinal] = np.fromiter((on_rate_iter.tenor.start_ordinal for on_rate_iter in self.__on_rate_list), dtype=np.float64)
+            fixing_array[:number_of_fixings, self.__column_maturity_ordinal] = np.fromiter((on_rate_iter.tenor.maturity_ordinal for on_rate_iter in self.__on_rate_list), dtype=np.float64)
+            fixing_array[:number_of_fixings, self.__column_mid] = np.fromiter((on_rate_iter.mid for on_rate_iter in self.__on_rate_list), dtype=np.float64)
+            fixing_array[:number_of_fixings, self.__column_bid] = np.fromiter((on_rate_iter.bid for on_rate_iter in self.__on_rate_list), dtype=np.float64)
+            fixing_array[:number_of_fixings, self.__column_ask] = np.fromiter((on_rate_iter.ask for on_rate_iter in self.__on_rate_list), dtype=np.float64)
+
+            # cumulative rate * days before each fixing
+            rate_days = fixing_array[:number_of_fixings, self.__column_mid] * (fixing_array[:number_of_fixings, self.__column_maturity_ordinal] - fixing_array[:number_of_fixings, self.__column_start_ordinal])
+            fixing_array[1:number_of_fixings, self.__column_cumulative_rate_days] = np.cumsum(rate_days)[:-1]
+
+        self.__set_fixing_array(fixing_array, number_of_fixings)
+
+    def append(self, on_rate:cls_overnight_funding_rate)->bool:
+        """
+        Appends the fixing following the last one, see extend.
+        """
+        return self.extend([on_rate])
+
+    def extend(self, on_rate_list:list)->bool:
+        """
+        Appends new fixings, in date order, after the last one, in amortized constant time per fixing.
+
+        Args:
+            on_rate_list: fixings, each one starting on or after the maturity date of the one before
+
+        Returns:
+            bool: False, and nothing is appended, if a fixing is out of order or overlaps the one before
+        """
+        if self.__number_of_fixings > 0:
+            previous_maturity_ordinal = int(self.__fixing_array[self.__number_of_fixings - 1, self.__column_maturity_ordinal])
+        else:
+            previous_maturity_ordinal = None
+
+        for on_rate_iter in on_rate_list:
+            if on_rate_iter.tenor.maturity_ordinal < on_rate_iter.tenor.start_ordinal or (previous_maturity_ordinal is not None and on_rate_iter.tenor.start_ordinal < previous_maturity_ordinal):
+                logger.critical("overnight funding rate {unique_key} is out of order or overlaps the fixings of the panel".format(unique_key=on_rate_iter.unique_key))
+                return False
+            previous_maturity_ordinal = on_rate_iter.tenor.maturity_ordinal
+
+        number_of_fixings = self.__number_of_fixings + len(on_rate_list)
+
+        # a memory-mapped history is copied in memory on the first append
+        if number_of_fixings > len(self.__fixing_array) or not self.__fixing_array.flags.writeable:
+            fixing_array = np.zeros((max(2 * len(self.__fixing_array), number_of_fixings, self.__minimum_capacity), self.__number_of_columns), dtype=np.float64, order='F')
+            fixing_array[:self.__number_of_fixings] = self.__fixing_array[:self.__number_of_fixings]
+            self.__fixing_array = fixing_array
+
+        total_rate_days = self.__total_rate_days
+        for position, on_rate_iter in enumerate(on_rate_list, self.__number_of_fixings):
+            self.__fixing_array[position] = (on_rate_iter.tenor.start_ordinal, on_rate_iter.tenor.maturity_ordinal,
+                                             on_rate_iter.mid, on_rate_iter.bid, on_rate_iter.ask, total_rate_days)
+            total_rate_days += on_rate_iter.mid * on_rate_iter.tenor.number_of_days
+
+        self.__number_of_fixings = number_of_fixings
+        self.__total_rate_days = total_rate_days
+
+        if self.__on_rate_list is not None:
+            self.__on_rate_list.extend(on_rate_list)
+
+        return True
+
+    def save_fixings(self, file_path:str)->None:
+        """
+        Saves the fixing array to a .npy file, to be memory-mapped by load_fixings.
+        """
+        np.save(file_path, np.asfortranarray(self.__fixing_array[:self.__number_of_fixings]))
+
+    def load_fixings(self, file_path:str, mmap_mode:str='r')->None:
+        """
+        Replaces the fixings of the panel by the ones saved by save_fixings.
+
+        Args:
+            file_path: .npy file written by save_fixings
+            mmap_mode: memory-map mode of numpy.load, None to read the file in memory
+
+        The history stays on disk with the default mmap_mode, no fixing object is created until on_rate_list is asked for.
+        """
+        fixing_array = np.load(file_path, mmap_mode=mmap_mode)
+
+        if fixing_array.ndim != 2 or fixing_array.shape[1] != self.__number_of_columns:
+            logger.critical("file {file_path} is not a fixing array of overnight funding rates".format(file_path=file_path))
+            return None
+
+        self.__on_rate_list = None
+        self.__set_fixing_array(fixing_array, len(fixing_array))
+
+    def __get_cumulative_rate_days_by_ordinals(self, ordinals:np.ndarray)->np.ndarray:
+        if self.__number_of_fixings == 0:
+            return np.zeros(len(ordinals), dtype=np.float64)
+
+        start_ordinal_array = self.__get_column(self.__column_start_ordinal)
+        maturity_ordinal_array = self.__get_column(self.__column_maturity_ordinal)
+
+        # fixing starting on or before each date, the part of it before the date is accrued
+        positions = np.searchsorted(start_ordinal_array, ordinals, side='right') - 1
+        fixing_positions = np.maximum(positions, 0)
+
+        number_of_days_in_fixing = np.clip(ordinals - start_ordinal_array[fixing_positions],
+                                           0,
+                                           maturity_ordinal_array[fixing_positions] - start_ordinal_array[fixing_positions])
+
+        cumulative_rate_days = self.__get_column(self.__column_cumulative_rate_days)[fixing_positions] + self.__get_column(self.__column_mid)[fixing_positions] * number_of_days_in_fixing
+        return np.where(positions < 0, 0.0, cumulative_rate_days)
+
+    def get_rate_days_by_start_end_date(self, start_date:datetime.date, end_date:datetime.date)->float:
+        """
+        Sum of mid * number of days of the fixings in [start_date, end_date), partial fixings cut at both ends.
+
+        Same as the sum of mid * tenor.number_of_days over get_on_rate_dict_by_start_end_date, by binary search.
+        Days not covered by any fixing accrue nothing.
+        """
+        cumulative_rate_days = self.__get_cumulative_rate_days_by_ordinals(np.array([start_date.toordinal(), end_date.toordinal()], dtype=np.int32))
+        return float(cumulative_rate_days[1] - cumulative_rate_days[0])
+
+    def get_rate_days_by_start_end_dates(self, start_dates, end_dates)->np.ndarray:
+        """
+        Batch version of get_rate_days_by_start_end_date.
+
+        Args:
+            start_dates, end_dates: sequences of datetime.date of the same length
+
+        Returns:
+            np.ndarray: mid * number of days of each [start date, end date) window
+        """
+        return self.__get_cumulative_rate_days_by_ordinals(get_ordinal_array_by_dates(end_dates)) - self.__get_cumulative_rate_days_by_ordinals(get_ordinal_array_by_dates(start_dates))
+
+    def get_on_rate_dict_by_start_end_date(
+            self, start_date:datetime.date, end_date:datetime.date)->dict:
+
+        result_dict = {}
+        for on_rate_iter in self.on_rate_list:
+            if on_rate_iter.tenor.start_date >= start_date and on_rate_iter.tenor.maturity_date <= end_date :
+                result_dict[on_rate_iter.tenor.start_date] = on_rate_iter
+                #print("add to dict , key is " + on_rate_iter.tenor.start_date.strftime('%Y-%m-%d') + " maturity is " + on_rate_iter.tenor.maturity_date.strftime('%Y-%m-%d'))
+
+            if on_rate_iter.tenor.start_date < start_date and on_rate_iter.tenor.maturity_date <= end_date and on_rate_iter.tenor.maturity_date > start_date:
+                result_dict[on_rate_iter.tenor.start_date] = cls_overnight_funding_rate(self.currency,
+                                                                                        cls_tenor(start_date, on_rate_iter.tenor.maturity_date),
+                                                                                        on_rate_iter.mid,
+                                                                                        on_rate_iter.bid,
+                                                                                        on_rate_iter.ask
+                                                                                        )
+
+            if on_rate_iter.tenor.start_date < start_date and on_rate_iter.tenor.maturity_date > end_date:
+                result_dict[on_rate_iter.tenor.start_date] = cls_overnight_funding_rate(self.currency,
+                                                                                        cls_tenor(start_date, end_date),
+                                                                                        on_rate_iter.mid,
+                                                                                        on_rate_iter.bid,
+                                                                                        on_rate_iter.ask
+                                                                                        )
+                break
+            elif on_rate_iter.tenor.start_date >= start_date and on_rate_iter.tenor.maturity_date > end_date :
+                result_dict[on_rate_iter.tenor.start_date] = cls_overnight_funding_rate(self.currency,
+                                                                                        cls_tenor(on_rate_iter.tenor.start_date, end_date),
+                                                                                        on_rate_iter.mid,
+                                                                                        on_rate_iter.bid,
+                                                                                        on_rate_iter.ask
+                                                                                        )
+                #print("add to dict , key is " + on_rate_iter.tenor.start_date.strftime('%Y-%m-%d') + " maturity is " + end_date.strftime('%Y-%m-%d'))
+
+                break
+        return result_dict
+
+
+
+class cls_deal_price(cls_rate):
+    __slots__ = ('currency_pair', 'maturity_date', 'quotation_mode')
+
+    def __init__(self,
+                 currency_pair: cls_currency_pair,
+                 maturity_date: datetime.date,
+                 value: float=0,
+                 quotation_mode: quotation_mode_enum = None):
+        self.currency_pair = currency_pair
+        self.maturity_date = maturity_date
+        super().__init__(value, value, value)
+
+        if quotation_mode is None:
+            self.quotation_mode = self.currency_pair.quotation_mode
+        else:
+            self.quotation_mode = quotation_mode
+
+    @property
+    def value(self):
+        return self.mid
+
+    @value.setter
+    def value(self, value:float):
+        self.set_rate_by_mid_spread(value)
+
+
+    def get_deal_price_by_quotation_mode(self,quotation_mode: quotation_mode_enum):
+        if quotation_mode == self.quotation_mode:
+            return self
+        else:
+            return self.get_reversed_deal_price()
+
+    def get_reversed_deal_price(self)->cls_rate:
+        return cls_deal_price(self.currency_pair, self.maturity_date, 1/self.value, get_reversed_quotation_mode(self.quotation_mode))
+
+
+class cls_currency_pair_rate(cls_rate):
+    __slots__ = ('currency_pair', 'tenor', 'quotation_mode', '__unique_key')
+
+    def __init__(self,
+                 currency_pair: cls_currency_pair,
+                 tenor: cls_tenor=None,
+                 mid: float=0,
+                 bid: float=0,
+                 ask: float=0,
+                 quotation_mode: quotation_mode_enum=None):
+        self.currency_pair = currency_pair
+        self.tenor = tenor
+        super().__init__(mid, bid, ask)
+        self.__unique_key = None
+
+        if quotation_mode is None:
+            self.quotation_mode = self.currency_pair.quotation_mode
+        else:
+            self.quotation_mode = quotation_mode
+
+    def __get_unique_key(self)->str:
+        return (self.__class__.__name__.replace("cls_","") + "#" +
+                self.currency_pair.quotation + "#" +
+                self.tenor.start_date.strftime('%Y-%m-%d') + "#" +
+                self.tenor.maturity_date.strftime('%Y-%m-%d'))
+
+    @property
+    def unique_key(self):
+        # formatted on first access only
+        if self.__unique_key is None:
+            self.__unique_key = self.__get_unique_key()
+        return self.__unique_key
+
+    @property
+    def maturity_date(self)->datetime.date:
+        return self.tenor.maturity_date
+
+    @property
+    def start_date(self)->datetime.date:
+        return self.tenor.start_date
+
+    @property
+    def label(self)->str:
+        return self.tenor.label
+
+    @property
+    def quotation(self)->str:
+        if self.quotation_mode == quotation_mode_enum.base_und:
+            return build_quotation(self.currency_pair.base.label, self.currency_pair.underlying.label)
+        elif self.quotation_mode == quotation_mode_enum.und_base:
+            return build_quotation(self.currency_pair.underlying.label, self.currency_pair.base.label)
+
+
+class cls_fx_rate(cls_currency_pair_rate):
+    __slots__ = ()
+
+    def get_reversed_fx_rate(self):
+        return cls_fx_rate(self.currency_pair, self.tenor,
+                           1 / self.mid, 1 / self.bid, 1 / self.ask, get_reversed_quotation_mode(self.quotation_mode))
+
+    def get_fx_rate_by_quotation_mode(self,
+                                      quotation_mode: quotation_mode_enum):
+        if quotation_mode == self.quotation_mode:
+            return self
+        else:
+            return self.get_reversed_fx_rate()
+
+    def get_fx_rate_by_quotation(self, quotation: str):
+        if quotation == self.quotation:
+            return self
+        elif quotation == get_reversed_quotation(self.quotation):
+            return self.get_reversed_fx_rate()
+        else:
+            logger.critical("parameter quotation {quotation} is invalid".format(quotation=quotation))
+            return None
+
+    def init_by_cross_fx_rate(self, fx_rate_1, fx_rate_2):
+
+        # Assume Maturity Date of fx_rate_1 and fx_rate_2 are the same
+
+        fx1_base_und = fx_rate_1.get_fx_rate_by_quotation_mode(
+            quotation_mode_enum.base_und)
+        fx2_base_und = fx_rate_2.get_fx_rate_by_quotation_mode(
+            quotation_mode_enum.base_und)
+
+        if self.currency_pair.quotation == build_quotation(fx1_base_und.currency_pair.base.label, fx2_base_und.currency_pair.base.label) \
+                and fx1_base_und.currency_pair.underlying.label == fx2_base_und.currency_pair.base.label:
+            #EUR/USD GBP/USD --> EUR/GBP
+            self.set_rate_by_bid_ask(fx1_base_und.bid / fx2_base_und.ask,
+                                     fx1_base_und.ask / fx2_base_und.bid)
+
+        elif self.currency_pair.quotation == build_quotation(fx1_base_und.currency_pair.base.label, fx2_base_und.currency_pair.underlying.label) \
+                and fx1_base_und.currency_pair.underlying.label == fx2_base_und.currency_pair.base.label:
+            # EUR/USD USD/HKD --> EUR/HKD
+            self.set_rate_by_bid_ask(fx1_base_und.bid * fx2_base_und.bid,
+                                     fx1_base_und.ask * fx2_base_und.ask)
+
+        elif self.currency_pair.quotation == build_quotation(fx1_base_und.currency_pair.underlying.label, fx2_base_und.currency_pair.base.label) \
+                and fx1_base_und.currency_pair.base.label == fx2_base_und.currency_pair.underlying.label:
+            # USD/CAD AUD/USD --> CAD/AUD
+            self.set_rate_by_bid_ask(1 / (fx1_base_und.ask * fx2_base_und.ask),
+                                     1 / (fx1_base_und.bid * fx2_base_und.bid))
+
+        elif self.currency_pair.quotation == build_quotation(fx1_base_und.currency_pair.underlying.label, fx2_base_und.currency_pair.underlying.label) \
+                and fx1_base_und.currency_pair.base.label == fx2_base_und.currency_pair.base.label:
+            # USD/HKD USD/JPY --> HKD/JPY
+            self.set_rate_by_bid_ask(fx2_base_und.bid / fx1_base_und.ask,
+                                     fx2_base_und.ask / fx1_base_und.bid)
+
+        elif self.currency_pair.quotation == build_quotation(fx2_base_und.currency_pair.base.label, fx1_base_und.currency_pair.base.label) \
+                and fx1_base_und.currency_pair.underlying.label == fx2_base_und.currency_pair.underlying.label:
+            # GBP/USD EUR/USD --> EUR/GBP
+            self.set_rate_by_bid_ask(fx2_base_und.bid / fx1_base_und.ask,
+                                     fx2_base_und.ask / fx1_base_und.bid)
+
+        elif self.currency_pair.quotation == build_quotation(fx2_base_und.currency_pair.base.label, fx1_base_und.currency_pair.underlying.label) \
+                and fx1_base_und.currency_pair.base.label == fx2_base_und.currency_pair.underlying.label:
+            # USD/HKD EUR/USD  --> EUR/HKD
+            self.set_rate_by_bid_ask(fx1_base_und.bid * fx2_base_und.bid,
+                                     fx1_base_und.ask * fx2_base_und.ask)
+
+        elif self.currency_pair.quotation == build_quotation(fx2_base_und.currency_pair.underlying.label, fx1_base_und.currency_pair.base.label) \
+                and fx1_base_und.currency_pair.underlying.label == fx2_base_und.currency_pair.base.label:
+            # AUD/USD USD/CAD --> CAD/AUD
+            self.set_rate_by_bid_ask(1 / (fx1_base_und.ask * fx2_base_und.ask),
+                                     1 / (fx1_base_und.bid * fx2_base_und.bid))
+
+        elif self.currency_pair.quotation == build_quotation(fx2_base_und.currency_pair.underlying.label, fx1_base_und.currency_pair.underlying.label) \
+                and fx1_base_und.currency_pair.base.label == fx2_base_und.currency_pair.base.label:
+            # USD/JPY USD/HKD --> HKD/JPY
+            self.set_rate_by_bid_ask(fx1_base_und.ask / fx2_base_und.bid,
+                                     fx1_base_und.bid / fx2_base_und.ask)
+
+
+
+class cls_fx_spot_rate(cls_fx_rate):
+    __slots__ = ()
+
+    def __init__(self,
+                 currency_pair: cls_currency_pair,
+                 tenor: cls_tenor,
+                 mid: float=0,
+                 bid: float=0,
+                 ask: float=0,
+                 quotation_mode: quotation_mode_enum = None):
+
+        super().__init__(currency_pair, tenor, mid, bid, ask, quotation_mode)
+        self.tenor.label = "SPT"
+        # print(str(self.mid))
+
+    def get_spot_cls(self, fx_rate: cls_fx_rate):
+        return cls_fx_spot_rate(fx_rate.currency_pair, fx_rate.tenor,
+                                fx_rate.mid, fx_rate.bid, fx_rate.ask, fx_rate.quotation_mode)
+
+    def get_fx_rate_by_quotation(self, quotation: str):
+        if quotation == self.quotation:
+            return self
+        elif quotation == get_reversed_quotation(self.quotation):
+            return self.get_spot_cls(self.get_reversed_fx_rate())
+        else:
+            logger.critical("parameter quotation {quotation}is invalid.".format(quotation=quotation))
+            return None
+
+
+    def get_fx_rate_by_quotation_mode(self, quotation_mode: quotation_mode_enum):
+        if quotation_mode == self.quotation_mode:
+            return self
+        else:
+            return self.get_reversed_fx_rate()
+
+    def get_reversed_fx_rate(self):
+        return self.get_spot_cls(cls_fx_rate(self.currency_pair, self.tenor, 1 / self.mid, 1 / self.bid, 1 / self.ask, get_reversed_quotation_mode(self.quotation_mode)))
+
+
+
+    def get_discounted_spot_rate(self, base_ccy_df_t_s:cls_discount_factor, und_ccy_df_t_s:cls_discount_factor)->cls_fx_rate:
+
+        tenor = cls_tenor(self.start_date, self.start_date)
+
+        if self.quotation_mode == quotation_mode_enum.base_und :
+            return self.get_spot_cls(cls_fx_rate(self.currency_pair, tenor, self.mid * und_ccy_df_t_s.value / base_ccy_df_t_s.value, quotation_mode=self.quotation_mode))
+        else:
+            return self.get_spot_cls(cls_fx_rate(self.currency_pair, tenor, self.mid * base_ccy_df_t_s.value / und_ccy_df_t_s.value, quotation_mode=self.quotation_mode))
+
+    @property
+    def spot_date(self)->datetime.date:
+        return self.tenor.maturity_date
+
+
+class cls_cross_rate_engine:
+    """
+    Cross rates of any currency pair from a graph of quoted spot legs.
+
+    Each currency is priced against the pivot currency along a path of quoted legs (found once per
+    set of legs, any number of hops), then the bid and ask of every pair are computed at once as
+    outer products. Pairs quoted directly, or with a path shorter than the one through the pivot,
+    are then priced along that path instead. Leg rates can be updated without searching the paths again.
+
+    Attributes:
+        tenor: spot tenor of the rates produced
+        pivot_currency_label: currency the paths start from, the first currency of the legs if not quoted
+    """
+    def __init__(self,
+                 tenor: cls_tenor,
+                 fx_rate_list: list=None,
+                 pivot_currency_label: str='USD'):
+        self.tenor = tenor
+        self.pivot_currency_label = pivot_currency_label.upper()
+
+        # bid and ask of 1 base currency in underlying currency, by (base label, underlying label)
+        self.__leg_dict = {}
+        self.__path_dict = None
+        self.__shorter_path_dict = {}
+        self.__currency_label_list = []
+        self.__position_dict = {}
+        self.__bid_matrix = None
+        self.__ask_matrix = None
+
+        for fx_rate_iter in fx_rate_list or []:
+            self.set_fx_rate(fx_rate_iter)
+
+    def set_fx_rate(self, fx_rate: cls_fx_rate)->None:
+        """
+        Adds a quoted leg, or updates its rate if the currency pair is already quoted.
+        """
+        key = (fx_rate.currency_pair.base.label, fx_rate.currency_pair.underlying.label)
+
+        # paths searched again only when the graph changes
+        if key not in self.__leg_dict and key[::-1] not in self.__leg_dict:
+            self.__path_dict = None
+        else:
+            self.__leg_dict.pop(key[::-1], None)
+
+        if fx_rate.quotation_mode == quotation_mode_enum.base_und:
+            self.__leg_dict[key] = (fx_rate.bid, fx_rate.ask)
+        else:
+            # the bid of the inverse rate is the inverse of the ask
+            self.__leg_dict[key] = (1 / fx_rate.ask, 1 / fx_rate.bid)
+        self.__bid_matrix = None
+        self.__ask_matrix = None
+
+    def __get_leg(self, from_label: str, to_label: str)->tuple:
+        # bid and ask of 1 from currency in to currency
+        if (from_label, to_label) in self.__leg_dict:
+            return self.__leg_dict[(from_label, to_label)]
+        else:
+            bid, ask = self.__leg_dict[(to_label, from_label)]
+            return (1 / ask, 1 / bid)
+
+    def __refresh_path_dict(self)->None:
+        neighbor_dict = {}
+        for base_label, und_label in self.__leg_dict:
+            neighbor_dict.setdefault(base_label, []).append(und_label)
+            neighbor_dict.setdefault(und_label, []).append(base_label)
+
+        self.__currency_label_list = sorted(neighbor_dict)
+        self.__position_dict = {label: position for position, label in enumerate(self.__currency_label_list)}
+
+        pivot_label = self.pivot_currency_label if self.pivot_currency_label in neighbor_dict else (self.__currency_label_list[0] if self.__currency_label_list else None)
+
+        # breadth first, the path with the fewest legs from each currency to the pivot
+        self.__path_dict = {pivot_label: []} if pivot_label is not None else {}
+        label_queue = [pivot_label] if pivot_label is not None else []
+
+        for label_iter in label_queue:
+            for neighbor_label in neighbor_dict[label_iter]:
+                if neighbor_label not in self.__path_dict:
+                    self.__path_dict[neighbor_label] = [(neighbor_label, label_iter)] + self.__path_dict[label_iter]
+                    label_queue.append(neighbor_label)
+
+        # pairs with a path shorter than through the pivot, a direct leg or a common leg towards the pivot
+        self.__shorter_path_dict = {}
+        for from_label in self.__path_dict:
+            path_from_dict = {from_label: []}
+            label_queue = [from_label]
+
+            for label_iter in label_queue:
+                for neighbor_label in neighbor_dict[label_iter]:
+                    if neighbor_label not in path_from_dict:
+                        path_from_dict[neighbor_label] = path_from_dict[label_iter] + [(label_iter, neighbor_label)]
+                        label_queue.append(neighbor_label)
+
+            for to_label, path in path_from_dict.items():
+                if len(path) < len(self.__path_dict[from_label]) + len(self.__path_dict[to_label]):
+                    self.__shorter_path_dict[(from_label, to_label)] = path
+
+    def __get_path_rate(self, path: list)->tuple:
+        bid = ask = 1.0
+        for from_label, to_label in path:
+            leg_bid, leg_ask = self.__get_leg(from_label, to_label)
+            bid = bid * leg_bid
+            ask = ask * leg_ask
+        return (bid, ask)
+
+    def __refresh_matrices(self)->None:
+        if self.__path_dict is None:
+            self.__refresh_path_dict()
+
+        # bid and ask of 1 unit of each currency in pivot currency, nan if not connected to the pivot
+        pivot_bid_array = np.full(len(self.__currency_label_list), np.nan)
+        pivot_ask_array = np.full(len(self.__currency_label_list), np.nan)
+
+        for label_iter, path in self.__path_dict.items():
+            pivot_bid_array[self.__position_dict[label_iter]], pivot_ask_array[self.__position_dict[label_iter]] = self.__get_path_rate(path)
+
+        # from currency i to pivot, then pivot to currency j
+        self.__bid_matrix = np.outer(pivot_bid_array, 1 / pivot_ask_array)
+        self.__ask_matrix = np.outer(pivot_ask_array, 1 / pivot_bid_array)
+
+        for (from_label, to_label), path in self.__shorter_path_dict.items():
+            self.__bid_matrix[self.__position_dict[from_label], self.__position_dict[to_label]], \
+                self.__ask_matrix[self.__position_dict[from_label], self.__position_dict[to_label]] = self.__get_path_rate(path)
+
+    @property
+    def currency_label_list(self)->list:
+        if self.__path_dict is None:
+            self.__refresh_path_dict()
+        return self.__currency_label_list
+
+    def get_cross_matrices(self)->tuple:
+        """
+        Returns:
+            tuple: (bid matrix, ask matrix), element [i, j] being the rate of 1 unit of currency i in currency j
+            along the shortest path of quoted legs, in the order of currency_label_list, nan for currencies not connected
+        """
+        if self.__bid_matrix is None:
+            self.__refresh_matrices()
+        return (self.__bid_matrix, self.__ask_matrix)
+
+    def get_fx_spot_rate(self, currency_pair: cls_currency_pair)->cls_fx_spot_rate:
+        """
+        Spot rate of a currency pair, quoted as the currency pair quotation, on a tenor of its own.
+        A quoted leg is used directly, other pairs are crossed along the shortest path of quoted legs.
+        """
+        if currency_pair.quotation_mode == quotation_mode_enum.base_und:
+            from_label, to_label = currency_pair.base.label, currency_pair.underlying.label
+        else:
+            from_label, to_label = currency_pair.underlying.label, currency_pair.base.label
+
+        bid_matrix, ask_matrix = self.get_cross_matrices()
+
+        if (from_label, to_label) in self.__leg_dict or (to_label, from_label) in self.__leg_dict:
+            bid, ask = self.__get_leg(from_label, to_label)
+
+        elif from_label in self.__position_dict and to_label in self.__position_dict \
+                and not np.isnan(bid_matrix[self.__position_dict[from_label], self.__position_dict[to_label]]):
+            bid = float(bid_matrix[self.__position_dict[from_label], self.__position_dict[to_label]])
+            ask = float(ask_matrix[self.__position_dict[from_label], self.__position_dict[to_label]])
+
+        else:
+            logger.critical("{class_name} : currency pair {quotation} can not be crossed from the quoted legs".format(class_name=self.__class__.__name__.replace("cls_",""), quotation=currency_pair.quotation))
+            return None
+
+        return cls_fx_spot_rate(currency_pair, cls_tenor(self.tenor.start_date, self.tenor.maturity_date, self.tenor.label),
+                                0, bid, ask, currency_pair.quotation_mode)
+
+    def get_fx_spot_rate_by_quotation(self, quotation: str)->cls_fx_spot_rate:
+        return self.get_fx_spot_rate(currency_registry.get_currency_pair(quotation[0:3], quotation[4:7], quotation_mode_enum.base_und))
+
+
+class cls_fx_forward_rate(cls_fx_rate):
+    __slots__ = ('__spot_rate', '__swap_point')
+
+    def __init__(self,
+                 currency_pair: cls_currency_pair,
+                 tenor: cls_tenor,
+                 mid: float=0,
+                 bid: float=0,
+                 ask: float=0,
+                 quotation_mode: quotation_mode_enum = None):
+        super().__init__(currency_pair, tenor, mid, bid, ask, quotation_mode)
+
+        self.__spot_rate = cls_fx_spot_rate(currency_pair, tenor, mid, bid, ask, quotation_mode)
+        self.__swap_point = cls_swap_point(currency_pair, tenor, 0, 0, 0) #multiped by factor
+
+    @property
+    def swap_point_factor(self)->float:
+        return self.currency_pair.swap_point_factor
+
+    @property
+    def spot_rate(self)->cls_fx_spot_rate:
+        return self.__spot_rate
+
+
+    @spot_rate.setter
+    def spot_rate(self, spot_rate: cls_fx_rate):
+        self.__spot_rate.set_rate_by_mid_bid_ask(
+            spot_rate.mid, spot_rate.bid, spot_rate.ask)
+        self.set_rate_by_mid_bid_ask(
+            spot_rate.mid +
+            self.__swap_point.mid / self.swap_point_factor,
+            spot_rate.bid +
+            self.__swap_point.bid / self.swap_point_factor,
+            spot_rate.ask +
+            self.__swap_point.ask / self.swap_point_factor)
+
+    @property
+    def swap_point_value_with_factor(self)->float:
+        #multiplied with swap point factor
+        return self.__swap_point.mid
+
+    @property
+    def swap_point_value_in_unit(self)->float:
+        return self.__swap_point.mid / self.swap_point_factor
+
+    @property
+    def swap_point(self)->cls_currency_pair_rate:
+        return self.__swap_point
+
+
+    @swap_point.setter
+    def swap_point(self, swap_point_with_factor: cls_currency_pair_rate):
+        self.set_rate_by_mid_bid_ask(
+            swap_point_with_factor.mid, swap_point_with_factor.bid, swap_point_with_factor.ask)
+
+        self.set_rate_by_mid_bid_ask(
+            self.__spot_rate.mid + swap_point_with_factor.mid / self.swap_point_factor,
+            self.__spot_rate.bid + swap_point_with_factor.bid / self.swap_point_factor,
+            self.__spot_rate.ask + swap_point_with_factor.ask / self.swap_point_factor)
+
+    def set_forward_rate_by_spot_and_df(
+            self,
+            spot_rate: cls_fx_spot_rate,
+            base_ccy_df_s_m: cls_discount_factor, # Discount factor for base currency from maturity date to spot date
+            und_ccy_df_s_m: cls_discount_factor): # Discount factor for underlying currency from maturity date to spot date
+        """
+        Sets the forward rate using spot rate and discount factors.
+
+        Args:
+            spot_rate: The spot exchange rate
+            base_ccy_df_s_m: Discount factor for base currency, discounted from maturity date to spot date
+            und_ccy_df_s_m: Discount factor for underlying currency, discounted from maturity date to spot date
+
+        The forward rate is calculated by adjusting the spot rate with the ratio of discount factors
+        between the base and underlying currencies over the period from spot to maturity date.
+        """
+        spot_rate_with_aligned_quotation_mode = spot_rate.get_fx_rate_by_quotation_mode(self.currency_pair.quotation_mode)
+
+        # quotation is base-und
+        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
+            self.mid = spot_rate_with_aligned_quotation_mode.mid * (base_ccy_df_s_m.mid / und_ccy_df_s_m.mid )
+
+        # quotation is und-base
+        elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
+            self.mid = spot_rate_with_aligned_quotation_mode.mid * (und_ccy_df_s_m.mid / base_ccy_df_s_m.mid )
+
+
+    def set_forward_rate_by_discounted_spot_and_df(
+            self,
+            discounted_spot_rate: cls_fx_rate,
+            base_ccy_df_t_m: cls_discount_factor, #base currency discount factor spot date to maturity date
+            und_ccy_df_t_m: cls_discount_factor): #underlying currency discount factor spot date to maturity date
+
+        discounted_spot_rate_with_aligned_quotation_mode = discounted_spot_rate.get_fx_rate_by_quotation_mode(self.currency_pair.quotation_mode)
+
+        # quotation is base-und
+        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
+            self.mid =  discounted_spot_rate_with_aligned_quotation_mode.mid * (base_ccy_df_t_m.mid / und_ccy_df_t_m.mid)
+
+        # quotation is und-base
+        elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
+            self.mid = discounted_spot_rate_with_aligned_quotation_mode.mid * (und_ccy_df_t_m.mid / base_ccy_df_t_m.mid)
+
+    def set_forward_rate_by_spot_and_swp(self,
+                                         spot_rate: cls_fx_spot_rate,
+                                         swap_point: cls_currency_pair_rate):
+        self.spot_rate = spot_rate
+        self.swap_point = swap_point
+
+
+def create_forward_rate_by_spot_and_df(currency_pair: cls_currency_pair,
+                                       tenor: cls_tenor,
+                                       spot_rate: cls_fx_spot_rate,
+                                       base_ccy_df_s_m: cls_discount_factor,
+                                       und_ccy_df_s_m: cls_discount_factor)->cls_fx_forward_rate:
+
+    spot_rate_with_aligned_quotation_mode = spot_rate.get_fx_rate_by_quotation_mode(currency_pair.quotation_mode)
+
+    # quotation is base-und
+    if currency_pair.quotation_mode == quotation_mode_enum.base_und:
+        forward_rate_value = spot_rate_with_aligned_quotation_mode.mid * (base_ccy_df_s_m.mid / und_ccy_df_s_m.mid)
+
+    # quotation is und-base
+    elif currency_pair.quotation_mode == quotation_mode_enum.und_base:
+        forward_rate_value = spot_rate_with_aligned_quotation_mode.mid * (und_ccy_df_s_m.mid / base_ccy_df_s_m.mid)
+
+    else:
+        forward_rate_value = 0
+
+    return cls_fx_forward_rate(currency_pair, tenor, forward_rate_value)
+
+
+def create_forward_rate_by_discounted_spot_and_df(currency_pair: cls_currency_pair,
+                                                  tenor: cls_tenor,
+                                                  discounted_spot_rate: cls_fx_rate,
+                                                  base_ccy_df_t_m: cls_discount_factor,
+                                                  und_ccy_df_t_m: cls_discount_factor)->cls_fx_forward_rate:
+
+    discounted_spot_rate_with_aligned_quotation_mode = discounted_spot_rate.get_fx_rate_by_quotation_mode(currency_pair.quotation_mode)
+
+    # quotation is base-und
+    if currency_pair.quotation_mode == quotation_mode_enum.base_und:
+        forward_rate_value = discounted_spot_rate_with_aligned_quotation_mode.mid * (base_ccy_df_t_m.mid / und_ccy_df_t_m.mid)
+
+    # quotation is und-base
+    elif currency_pair.quotation_mode == quotation_mode_enum.und_base:
+        forward_rate_value = discounted_spot_rate_with_aligned_quotation_mode.mid * (und_ccy_df_t_m.mid / base_ccy_df_t_m.mid)
+
+    else:
+        forward_rate_value = 0
+
+    return cls_fx_forward_rate(currency_pair, tenor, forward_rate_value)
+
+
+
+
+class cls_fx_discounted_spot_rate(cls_fx_forward_rate):
+    """
+    A class representing a discounted spot rate for FX trades.
+    
+    This class inherits from cls_fx_forward_rate and represents the spot rate 
+    discounted to the current date (today). The discounted spot rate is used 
+    for calculating present values and mark-to-market valuations of FX trades.
+
+    Attributes:
+        currency_pair (cls_currency_pair): The currency pair for the rate
+        tenor (cls_tenor): The time period for the rate
+        mid (float): The mid-market rate value
+        bid (float): The bid rate value
+        ask (float): The ask rate value
+        
+    Notes:
+        - The tenor label is always set to "TDY" (today) since this represents 
+          a spot rate discounted to the current date
+        - Used in PnL calculations to determine the present value of future 
+          cash flows
+        - Inherits rate handling functionality from cls_fx_forward_rate
+    """
+    __slots__ = ()
+
+    def __init__(self,
+                 currency_pair: cls_currency_pair,
+                 tenor: cls_tenor, 
+                 mid: float=0,
+                 bid: float=0,
+                 ask: float=0):
+        """
+        Initialize a discounted spot rate.
+
+        Args:
+            currency_pair: The currency pair for the rate (e.g. EUR/USD)
+            tenor: The time period for the rate
+            mid: The mid-market rate value, defaults to 0
+            bid: The bid rate value, defaults to 0  
+            ask: The ask rate value, defaults to 0
+
+        Notes:
+            The tenor label is set to "TDY" on initialization to indicate 
+            this is a today-discounted rate.
+        """
+        super().__init__(currency_pair, tenor, mid, bid, ask)
+        self.tenor.label = "TDY"
+
+
+class cls_swap_point(cls_currency_pair_rate):
+    __slots__ = ()
+
+    def __init__(self,
+                 currency_pair: cls_currency_pair,
+                 tenor: cls_tenor,
+                 mid: float=0,
+                 bid: float=0,
+                 ask: float=0):
+        super().__init__(currency_pair, tenor, mid, bid, ask)
+
+    def set_swap_point_by_forward_rate_and_spot(
+                                                self, spot_rate: cls_fx_spot_rate,
+                                                forward_rate: cls_fx_forward_rate):
+
+        spot_rate_with_aligned_quotation_mode = spot_rate.get_fx_rate_by_quotation_mode(self.currency_pair.quotation_mode)
+        forward_rate_with_aligned_quotation_mode = forward_rate.get_fx_rate_by_quotation_mode(self.currency_pair.quotation_mode)
+
+        self.mid = (forward_rate_with_aligned_quotation_mode.mid - spot_rate_with_aligned_quotation_mode.mid) * self.currency_pair.swap_point_factor
+
+    def set_swap_point_by_discount_factors(
+            self,
+            spot_rate: cls_fx_spot_rate,
+            df_base_s_m: cls_discount_factor,
+            df_und_s_m: cls_discount_factor):
+
+        # for maturity is not spot date
+        if self.tenor.maturity_date > spot_rate.tenor.maturity_date or self.tenor.maturity_date < spot_rate.tenor.maturity_date :
+
+            # quotation is base-und
+            if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
+                self.set_rate_by_bid_ask(
+                    spot_rate.mid *
+                    (df_base_s_m.ask / df_und_s_m.bid - 1),
+                    spot_rate.mid *
+                    (df_base_s_m.bid / df_und_s_m.ask - 1))
+
+            # quotation is und-base
+            elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
+                self.set_rate_by_bid_ask(
+                    spot_rate.mid *
+                    (df_und_s_m.ask / df_base_s_m.bid - 1),
+                    spot_rate.mid *
+                    (df_und_s_m.bid / df_base_s_m.ask - 1))
+
+        # for maturity is spot date
+        # always return 0
+        elif self.tenor.maturity_date == spot_rate.tenor.maturity_date:
+            self.set_rate_by_bid_ask(0, 0)
+
+        else:
+            pass
+
+    @property
+    def swap_point_factor(self)->int:
+        return self.currency_pair.swap_point_factor
+
+    @property
+    def swap_point_value_multi_by_factor(self)->float:
+        return self.mid * self.swap_point_factor
+
+
+class cls_rate_list(list):
+    """
+    List of rates which counts its own modifications, so that a curve can tell
+    when the lookup index built over the list is out of date.
+    """
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.version = 0
+
+    def append(self, item):
+        super().append(item)
+        self.version += 1
+
+    def extend(self, iterable):
+        super().extend(iterable)
+        self.version += 1
+
+    def insert(self, position, item):
+        super().insert(position, item)
+        self.version += 1
+
+    def remove(self, item):
+        super().remove(item)
+        self.version += 1
+
+    def pop(self, *args):
+        item = super().pop(*args)
+        self.version += 1
+        return item
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+    def reverse(self):
+        super().reverse()
+        self.version += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __iadd__(self, iterable):
+        result = super().__iadd__(iterable)
+        self.version += 1
+        return result
+
+    def __imul__(self, times):
+        result = super().__imul__(times)
+        self.version += 1
+        return result
+
+    def __reduce__(self):
+        # pickled with its version, the items are not appended one by one on unpickling
+        return (self.__class__, (list(self),), self.__dict__)
+
+
+class cls_rate_columns:
+    """
+    Rates of a curve as columns, the arrays may be views of a memory-mapped file.
+
+    Attributes:
+        start_ordinal_array, maturity_ordinal_array: tenor dates as ordinals
+        mid_array, bid_array, ask_array: rate values
+        basis_array: basis of each rate, nan for rates without one
+        label_list: tenor labels
+    """
+    def __init__(self,
+                 start_ordinal_array: np.ndarray,
+                 maturity_ordinal_array: np.ndarray,
+                 mid_array: np.ndarray,
+                 bid_array: np.ndarray,
+                 ask_array: np.ndarray,
+                 basis_array: np.ndarray,
+                 label_list: list):
+        self.start_ordinal_array = start_ordinal_array
+        self.maturity_ordinal_array = maturity_ordinal_array
+        self.mid_array = mid_array
+        self.bid_array = bid_array
+        self.ask_array = ask_array
+        self.basis_array = basis_array
+        self.label_list = label_list
+
+    def __len__(self)->int:
+        return len(self.label_list)
+
+
+def get_rate_columns_by_rates(rate_list: list)->cls_rate_columns:
+    return cls_rate_columns(np.fromiter((rate_iter.tenor.start_ordinal for rate_iter in rate_list), dtype=np.int32, count=len(rate_list)),
+                            np.fromiter((rate_iter.tenor.maturity_ordinal for rate_iter in rate_list), dtype=np.int32, count=len(rate_list)),
+                            np.fromiter((rate_iter.mid for rate_iter in rate_list), dtype=np.float64, count=len(rate_list)),
+                            np.fromiter((rate_iter.bid for rate_iter in rate_list), dtype=np.float64, count=len(rate_list)),
+                            np.fromiter((rate_iter.ask for rate_iter in rate_list), dtype=np.float64, count=len(rate_list)),
+                            np.fromiter((getattr(rate_iter, 'basis', np.nan) for rate_iter in rate_list), dtype=np.float64, count=len(rate_list)),
+                            [rate_iter.tenor.label for rate_iter in rate_list])
+
+
+def get_concatenated_rate_columns(rate_columns_list: list)->cls_rate_columns:
+    return cls_rate_columns(np.concatenate([rate_columns_iter.start_ordinal_array for rate_columns_iter in rate_columns_list]).astype(np.int32),
+                            np.concatenate([rate_columns_iter.maturity_ordinal_array for rate_columns_iter in rate_columns_list]).astype(np.int32),
+                            np.concatenate([rate_columns_iter.mid_array for rate_columns_iter in rate_columns_list]).astype(np.float64),
+                            np.concatenate([rate_columns_iter.bid_array for rate_columns_iter in rate_columns_list]).astype(np.float64),
+                            np.concatenate([rate_columns_iter.ask_array for rate_columns_iter in rate_columns_list]).astype(np.float64),
+                            np.concatenate([rate_columns_iter.basis_array for rate_columns_iter in rate_columns_list]).astype(np.float64),
+                            [label_iter for rate_columns_iter in rate_columns_list for label_iter in rate_columns_iter.label_list])
+
+
+class cls_rate_curve:
+    def __init__(self, fx_rate_list: list):
+
+        # sort by maturity date, then start date
+        if fx_rate_list is not None:
+            fx_rate_list.sort(
+                key=lambda fx_rate: fx_rate.tenor.start_date, reverse=False)
+            fx_rate_list.sort(
+                key=lambda fx_rate: fx_rate.tenor.maturity_date, reverse=False)
+            self.fx_rate_list = fx_rate_list
+        else:
+            logger.info("Empty rate curve is created")
+            self.fx_rate_list = []
+
+    @property
+    def fx_rate_list(self)->cls_rate_list:
+        if self.__fx_rate_list is None:
+            self.__create_rates_from_columns()
+        return self.__fx_rate_list
+
+    @fx_rate_list.setter
+    def fx_rate_list(self, fx_rate_list:list):
+        self.__fx_rate_list = fx_rate_list if isinstance(fx_rate_list, cls_rate_list) else cls_rate_list(fx_rate_list)
+        self.__rate_columns = None
+        self.__rate_by_position_dict = {}
+        self.__index_version = None
+
+    def set_rate_columns(self, rate_columns: cls_rate_columns)->None:
+        """
+        Replaces the rates of the curve by columns, sorted by maturity date.
+
+        The curve is queried from the columns, a rate object is created only when asked for by position or label,
+        and fx_rate_list is created on first access.
+        """
+        self.__fx_rate_list = None
+        self.__rate_columns = rate_columns
+        self.__rate_by_position_dict = {}
+        self.__index_version = None
+
+    def get_rate_columns(self)->cls_rate_columns:
+        if self.__fx_rate_list is None:
+            return self.__rate_columns
+        return get_rate_columns_by_rates(self.fx_rate_list)
+
+    @property
+    def is_backed_by_columns(self)->bool:
+        """True while the rates are held as the columns set by set_rate_columns only."""
+        return self.__fx_rate_list is None
+
+    @property
+    def rates_state(self)->tuple:
+        """
+        (rate list or columns object, version of the rate list), to tell whether the rates changed without creating them from columns.
+
+        The first item is to be compared by identity.
+        """
+        if self.__fx_rate_list is None:
+            return (self.__rate_columns, -1)
+        return (self.fx_rate_list, self.fx_rate_list.version)
+
+    def create_rate_from_columns(self, position: int):
+        """
+        Creates the rate at a position of the columns set by set_rate_columns, implemented by the curves supporting them.
+        """
+        logger.critical("{class_name} can not create its rates from columns".format(class_name=self.__class__.__name__))
+        return None
+
+    def get_rate_by_position(self, position: int):
+        if self.__fx_rate_list is not None:
+            return self.__fx_rate_list[position]
+
+        # created once, the same object lands in fx_rate_list later
+        if position not in self.__rate_by_position_dict:
+            self.__rate_by_position_dict[position] = self.create_rate_from_columns(position)
+        return self.__rate_by_position_dict[position]
+
+    def __create_rates_from_columns(self)->None:
+        self.__fx_rate_list = cls_rate_list(self.get_rate_by_position(position) for position in range(len(self.__rate_columns)))
+        self.__rate_columns = None
+        self.__rate_by_position_dict = {}
+
+        # the index built over the columns holds for the rates created from them
+        if self.__index_version == -1:
+            self.__index_version = self.__fx_rate_list.version
+
+    def check_index(self)->None:
+        # the index follows the list; items modified in place are not detected
+        version = self.__fx_rate_list.version if self.__fx_rate_list is not None else -1
+
+        if self.__index_version != version:
+            self.__index_version = version
+            try:
+                self.refresh_index()
+            except Exception:
+                self.__index_version = None
+                raise
+
+    def refresh_index(self)->None:
+        """
+        Rebuilds the lookup structures over the rates of the curve.
+
+        Called automatically by check_index when fx_rate_list is replaced or modified.
+        Subclasses keeping their own lookup structures extend it, call super() and read indexed_rate_columns.
+        """
+        self.__indexed_rate_columns = self.get_rate_columns()
+        self.__maturity_ordinal_list = np.asarray(self.__indexed_rate_columns.maturity_ordinal_array, dtype=np.int64).tolist()
+
+    @property
+    def indexed_rate_columns(self)->cls_rate_columns:
+        self.check_index()
+        return self.__indexed_rate_columns
+
+    @property
+    def maturity_ordinal_list(self)->list:
+        self.check_index()
+        return self.__maturity_ordinal_list
+
+    def get_neighbor_positions_by_maturity_date(self, maturity_date: datetime.date)->tuple:
+        """
+        Binary search of the rates around a maturity date.
+
+        Returns:
+            tuple: (earlier position, later position)
+            - both positions are the same if a rate matures exactly on maturity_date
+            - the earlier position is None if maturity_date is before the first rate
+            - the later position is None if maturity_date is after the last rate
+        """
+        maturity_ordinal_list = self.maturity_ordinal_list
+        maturity_ordinal = maturity_date.toordinal()
+
+        position = bisect.bisect_left(maturity_ordinal_list, maturity_ordinal)
+
+        if position < len(maturity_ordinal_list) and maturity_ordinal_list[position] == maturity_ordinal:
+            return (position, position)
+        elif position == len(maturity_ordinal_list):
+            return (position - 1 if position > 0 else None, None)
+        elif position == 0:
+            return (None, position)
+        else:
+            return (position - 1, position)
+
+    @property
+    def max_maturity_date(self)->datetime.date:
+        return datetime.date.fromordinal(self.maturity_ordinal_list[-1])
+
+
+class cls_single_currency_rate_curve(cls_rate_curve):
+    # class of the rates created from columns
+    rate_class = cls_single_currency_rate
+
+    def __init__(self, currency: cls_currency, fx_rate_list: list, basis:int=None):
+
+        super().__init__(fx_rate_list)
+        self.currency = currency
+
+        if basis is not None:
+            self.basis = basis
+        else:
+            self.basis = currency.number_of_days_1year
+
+    @property
+    def spot_date_shift(self)->date_shift_enum:
+        return self.currency.spot_date_shift
+
+    @property
+    def currency_label(self):
+        return self.currency.label
+
+
+    def create_rate_from_columns(self, position: int):
+        rate_columns = self.get_rate_columns()
+        basis = rate_columns.basis_array[position]
+
+        rate = self.rate_class(self.currency,
+                               cls_tenor(datetime.date.fromordinal(int(rate_columns.start_ordinal_array[position])),
+                                         datetime.date.fromordinal(int(rate_columns.maturity_ordinal_array[position])),
+                                         rate_columns.label_list[position]),
+                               basis=int(basis) if not np.isnan(basis) else self.basis)
+
+        # mid, bid and ask as saved, the constructor would recompute the mid of an asymmetric quote
+        rate.set_rate_by_mid_bid_ask(float(rate_columns.mid_array[position]),
+                                     float(rate_columns.bid_array[position]),
+                                     float(rate_columns.ask_array[position]))
+        return rate
+
+    def refresh_index(self)->None:
+        super().refresh_index()
+        rate_columns = self.indexed_rate_columns
+
+        # position of the first item of each label, same as a scan of the list
+        self.__label_dict = {}
+        for position, label_iter in enumerate(rate_columns.label_list):
+            self.__label_dict.setdefault(label_iter, position)
+
+        position_on = self.__label_dict.get('O/N')
+        position_tn = self.__label_dict.get('T/N')
+
+        self.__today_ordinal = int(rate_columns.start_ordinal_array[position_on]) if position_on is not None else None
+        self.__today_date = datetime.date.fromordinal(self.__today_ordinal) if position_on is not None else None
+        self.__tom_date = datetime.date.fromordinal(int(rate_columns.maturity_ordinal_array[position_on])) if position_on is not None else None
+
+        if self.spot_date_shift == date_shift_enum.D1:
+            self.__spot_date = self.__tom_date
+
+        elif self.spot_date_shift == date_shift_enum.D2:
+            self.__spot_date = datetime.date.fromordinal(int(rate_columns.maturity_ordinal_array[position_tn])) if position_tn is not None else None
+
+        elif self.spot_date_shift == date_shift_enum.D0:
+            self.__spot_date = self.__today_date
+
+        else:
+            assert("invalid spot date shift")
+            self.__spot_date = None
+
+    def get_item_by_label(self, label:str):
+        self.check_index()
+        position = self.__label_dict.get(label.upper())
+        return self.get_rate_by_position(position) if position is not None else None
+
+    @property
+    def today_date(self)->datetime.date:
+        self.check_index()
+        return self.__today_date
+
+    @property
+    def today_ordinal(self)->int:
+        self.check_index()
+        return self.__today_ordinal
+
+    @property
+    def tom_date(self) -> datetime.date:
+        self.check_index()
+        return self.__tom_date
+
+    @property
+    def spot_date(self) -> datetime.date:
+        """
+        Gets the spot date based on the spot date shift convention.
+        
+        Returns:
+            datetime.date: The spot date determined by the following rules:
+            - For T+1 currencies (D1): Returns the maturity date of O/N rate
+            - For T+2 currencies (D2): Returns the maturity date of T/N rate  
+            - For T+0 currencies (D0): Returns the start date of O/N rate
+            
+        Notes:
+            - O/N = Overnight rate
+            - T/N = Tomorrow/Next rate
+            - The spot date is when FX trades typically settle
+            - Different currencies have different standard settlement periods (T+0, T+1, T+2)
+            - The dates are looked up once per version of fx_rate_list
+        """
+        self.check_index()
+        return self.__spot_date
+
+
+
+class cls_interpolation_segments:
+    """
+    Interpolation coefficients compiled from the pillars of a discount factor curve.
+
+    Segment i lies between pillar i and pillar i+1, and the interpolated quantity is
+    slope * number_of_days + intercept, number of days counted from today:
+    - log_ds_factor: natural logarithm of the discount factor
+    - linear_ds_rate: discount rate
+    - linear_rate_time: discount rate * time, i.e. 1 / discount factor - 1
+
+    Attributes:
+        linearization: linearization the coefficients are compiled for
+        basis: basis of the discount rates interpolated
+        slope_array, intercept_array: coefficients per segment, for batch queries
+        slope_list, intercept_list: the same coefficients as floats, for single queries
+    """
+    def __init__(self,
+                 linearization: linearization_enum,
+                 number_of_days_array: np.ndarray,
+                 mid_array: np.ndarray,
+                 basis_array: np.ndarray,
+                 basis: int):
+        self.linearization = linearization
+        self.basis = basis
+
+        if linearization == linearization_enum.log_ds_factor:
+            pillar_value_array = np.log(mid_array)
+
+        elif linearization == linearization_enum.linear_ds_rate:
+            pillar_value_array = (1 / mid_array - 1) * basis_array / number_of_days_array
+
+        elif linearization == linearization_enum.linear_rate_time:
+            pillar_value_array = 1 / mid_array - 1
+
+        else:
+            logger.critical("linearization {linearization} can not be compiled".format(linearization=linearization.__repr__()))
+            pillar_value_array = np.full(len(mid_array), np.nan)
+
+        self.slope_array = np.diff(pillar_value_array) / np.diff(number_of_days_array)
+        self.intercept_array = pillar_value_array[:-1] - self.slope_array * number_of_days_array[:-1]
+
+        self.slope_list = self.slope_array.tolist()
+        self.intercept_list = self.intercept_array.tolist()
+
+    def get_value(self, segment_position: int, number_of_days: int)->float:
+        interpolated_value = self.slope_list[segment_position] * number_of_days + self.intercept_list[segment_position]
+
+        if self.linearization == linearization_enum.log_ds_factor:
+            return math.exp(interpolated_value)
+        elif self.linearization == linearization_enum.linear_rate_time:
+            return 1 / (1 + interpolated_value)
+        else:
+            return 1 / (1 + interpolated_value * number_of_days / self.basis)
+
+    def get_values(self, segment_positions: np.ndarray, number_of_days_array: np.ndarray)->np.ndarray:
+        interpolated_values = self.slope_array[segment_positions] * number_of_days_array + self.intercept_array[segment_positions]
+
+        if self.linearization == linearization_enum.log_ds_factor:
+            return np.exp(interpolated_values)
+        elif self.linearization == linearization_enum.linear_rate_time:
+            return 1 / (1 + interpolated_values)
+        else:
+            return 1 / (1 + interpolated_values * number_of_days_array / self.basis)
+
+
+class cls_discount_factor_curve(cls_single_currency_rate_curve):
+    rate_class = cls_discount_factor
+
+    def __init__(self,
+                 currency: cls_currency,
+                 fx_rate_list: list,
+                 linearization: linearization_enum,
+                 basis: int = None):
+        super().__init__(currency, fx_rate_list, basis)
+        self.linearization = linearization
+
+    def refresh_index(self)->None:
+        super().refresh_index()
+
+        # pillar values as arrays, for the batch queries
+        rate_columns = self.indexed_rate_columns
+        self.__maturity_ordinal_array = np.asarray(rate_columns.maturity_ordinal_array, dtype=np.int32)
+        self.__number_of_days_array = (self.__maturity_ordinal_array - np.asarray(rate_columns.start_ordinal_array, dtype=np.int32)).astype(np.float64)
+        self.__basis_array = np.where(np.isnan(rate_columns.basis_array), self.basis, rate_columns.basis_array)
+        self.__mid_array = np.asarray(rate_columns.mid_array, dtype=np.float64)
+
+        # compiled again on the next query
+        self.__interpolation_segments_dict = {}
+
+    def get_interpolation_segments(self, linearization: linearization_enum=None)->cls_interpolation_segments:
+        """
+        Compiles the pillars into per segment interpolation coefficients, once per linearization.
+
+        The result is kept until fx_rate_list is replaced or modified.
+        """
+        self.check_index()
+
+        if linearization is None:
+            linearization = self.linearization
+
+        if linearization not in self.__interpolation_segments_dict:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self.__interpolation_segments_dict[linearization] = cls_interpolation_segments(linearization,
+                                                                                               self.__number_of_days_array,
+                                                                                               self.__mid_array,
+                                                                                               self.__basis_array,
+                                                                                               self.basis)
+
+        return self.__interpolation_segments_dict[linearization]
+
+    def get_discount_factor_by_interpolation(
+            self,
+            df_early: cls_discount_factor,
+            df_late: cls_discount_factor,
+            tenor_mid: cls_tenor,
+            linearization: linearization_enum,
+            basis:int)->cls_discount_factor:
+
+        if linearization == linearization_enum.log_ds_factor:
+            value_of_df_mid = 10 ** ((math.log10(df_late.mid) - math.log10(df_early.mid)) / (df_late.tenor.number_of_days - df_early.tenor.number_of_days) * (tenor_mid.number_of_days - df_early.tenor.number_of_days) + math.log10(df_early.mid))
+            return cls_discount_factor(df_early.currency, tenor_mid, value_of_df_mid, basis=basis)
+
+        elif linearization == linearization_enum.linear_ds_rate:
+
+            ds_rate_late = df_late.get_discount_rate()
+            ds_rate_early = df_early.get_discount_rate()
+
+            value_of_ds_mid = (ds_rate_late.mid - ds_rate_early.mid) / (
+                ds_rate_late.tenor.number_of_days -
+                ds_rate_early.tenor.number_of_days
+            ) * (tenor_mid.number_of_days - ds_rate_early.tenor.number_of_days
+                 ) + ds_rate_early.mid
+
+            return cls_discount_rate(df_early.currency, tenor_mid, value_of_ds_mid, basis=basis).get_discount_factor()
+
+        elif linearization == linearization_enum.linear_rate_time:
+
+            # discount rate * time of a discount factor is 1 / discount factor - 1
+            rate_time_late = 1 / df_late.mid - 1
+            rate_time_early = 1 / df_early.mid - 1
+
+            value_of_rate_time_mid = (rate_time_late - rate_time_early) / (
+                df_late.tenor.number_of_days -
+                df_early.tenor.number_of_days
+            ) * (tenor_mid.number_of_days - df_early.tenor.number_of_days
+                 ) + rate_time_early
+
+            return cls_discount_factor(df_early.currency, tenor_mid, 1 / (1 + value_of_rate_time_mid), basis=basis)
+
+        else:
+            return None
+
+    def __get_pillar_and_discount_factor_value_by_maturity_date(self, maturity_date: datetime.date) -> tuple:
+        """
+        Float only lookup shared by the scalar queries.
+
+        Returns:
+            tuple: (pillar discount factor on exact hit else None, discount factor value today -> maturity date)
+            - the value is None if the linearization is not supported
+        """
+        early_position, late_position = self.get_neighbor_positions_by_maturity_date(maturity_date)
+
+        #search in existing tenor
+        if early_position is not None and early_position == late_position:
+            pillar = self.get_rate_by_position(early_position)
+            return (pillar, pillar.mid)
+
+        number_of_days_mid = maturity_date.toordinal() - self.today_ordinal
+
+        if number_of_days_mid == 0:
+            return (None, 1)
+
+        elif early_position is None:
+            # before the first tenor, the first one is used on both sides
+            df_late = self.get_rate_by_position(late_position)
+            df_mid = self.get_discount_factor_by_interpolation(df_late, df_late, cls_tenor(self.today_date, maturity_date), self.linearization, self.basis)
+            return (None, df_mid.mid if df_mid is not None else None)
+
+        elif self.linearization not in (linearization_enum.log_ds_factor, linearization_enum.linear_ds_rate, linearization_enum.linear_rate_time):
+            return (None, None)
+
+        else:
+            # the segment between the discount factor earlier than target one , and the one later than target one
+            # after the last tenor, extrapolation by the segment of the last two ones
+            segment_position = early_position if late_position is not None else len(self.maturity_ordinal_list) - 2
+
+            return (None, self.get_interpolation_segments().get_value(segment_position, number_of_days_mid))
+
+    def get_discount_factor_value_by_maturity_date(self, maturity_date: datetime.date) -> float:
+        """
+        Value only version of get_discount_factor_by_maturity_date, no discount factor object is created.
+        """
+        return self.__get_pillar_and_discount_factor_value_by_maturity_date(maturity_date)[1]
+
+    def get_discount_factor_by_maturity_date(
+            self, maturity_date: datetime.date) -> cls_discount_factor:
+
+        pillar, value_of_df_mid = self.__get_pillar_and_discount_factor_value_by_maturity_date(maturity_date)
+
+        #search in existing tenor
+        if pillar is not None:
+            return pillar
+
+        elif value_of_df_mid is None:
+            return None
+
+        #interpolation
+        else:
+            return cls_discount_factor(self.currency, cls_tenor(self.today_date, maturity_date), value_of_df_mid, basis=self.basis)
+
+    def get_discount_factors_by_maturity_dates(self, maturity_dates) -> np.ndarray:
+        """
+        Batch version of get_discount_factor_by_maturity_date, returning the values only.
+
+        Args:
+            maturity_dates: sequence of datetime.date, or np.ndarray of their ordinals
+
+        Returns:
+            np.ndarray: discount factor values today -> maturity date, in the order of maturity_dates
+            - exact pillar hits return the pillar value, today returns 1
+            - dates after the last pillar are extrapolated from the last two pillars
+            - dates before the first pillar (other than today) can not be interpolated and return nan
+            - on a curve of less than two pillars, only exact pillar hits and today have a value, other dates return nan
+        """
+        self.check_index()
+
+        maturity_ordinals = np.asarray(maturity_dates, dtype=np.int32) if isinstance(maturity_dates, np.ndarray) else get_ordinal_array_by_dates(maturity_dates)
+        number_of_pillars = len(self.__maturity_ordinal_array)
+
+        positions = np.searchsorted(self.__maturity_ordinal_array, maturity_ordinals, side='left')
+
+        # segment of the bracketing pillars, the one of the last two pillars for extrapolation
+        late_positions = np.minimum(positions, number_of_pillars - 1)
+        segment_positions = np.clip(positions - 1, 0, number_of_pillars - 2)
+
+        number_of_days_mid = (maturity_ordinals - self.today_ordinal).astype(np.float64)
+
+        if self.linearization not in (linearization_enum.log_ds_factor, linearization_enum.linear_ds_rate, linearization_enum.linear_rate_time):
+            logger.critical("linearization {linearization} is not supported in batch query".format(linearization=self.linearization.__repr__()))
+            return None
+
+        if number_of_pillars < 2:
+            # no segment to interpolate on
+            values = np.full(len(maturity_ordinals), np.nan, dtype=np.float64)
+        else:
+            values = self.get_interpolation_segments().get_values(segment_positions, number_of_days_mid)
+            values[positions == 0] = np.nan
+
+        values[number_of_days_mid == 0] = 1
+
+        if number_of_pillars > 0:
+            exact_hit = self.__maturity_ordinal_array[late_positions] == maturity_ordinals
+            values[exact_hit] = self.__mid_array[late_positions[exact_hit]]
+
+        return values
+
+    def get_discount_factor_by_start_maturity(self, start_date: datetime.date, maturity_date: datetime.date) -> cls_discount_factor:
+
+        # print("get_discount_factor_by_tenor ", "tenor_input.start_date is ", tenor_input.start_date, "tenor_input.maturity_date is ", tenor_input.maturity_date)
+
+        if start_date == maturity_date:
+            return cls_discount_factor(self.currency, cls_tenor(start_date, start_date), 1, basis=self.basis)
+
+        # both legs from today, divided as floats, one discount factor object created
+        pillar_maturity, value_today_maturity = self.__get_pillar_and_discount_factor_value_by_maturity_date(maturity_date)
+        pillar_start, value_today_start = self.__get_pillar_and_discount_factor_value_by_maturity_date(start_date)
+
+        if value_today_maturity is not None and value_today_start is not None \
+                and (pillar_maturity is None or pillar_maturity.tenor.start_ordinal == self.today_ordinal) \
+                and (pillar_start is None or pillar_start.tenor.start_ordinal == self.today_ordinal):
+
+            return cls_discount_factor(pillar_start.currency if pillar_start is not None else self.currency,
+                                       cls_tenor(start_date, maturity_date, pillar_maturity.tenor.label if pillar_maturity is not None else None),
+                                       value_today_maturity / value_today_start,
+                                       basis=pillar_maturity.basis if pillar_maturity is not None else self.basis)
+
+        df_today_maturity = self.get_discount_factor_by_maturity_date(maturity_date)
+        # print("get_discount_factor_by_tenor ", "df_today_maturity.tenor.start_date is ", df_today_maturity.tenor.start_date, "df_today_maturity.tenor.maturity_date is ", df_today_maturity.tenor.maturity_date)
+
+        df_today_start = self.get_discount_factor_by_maturity_date(start_date)
+        # print("get_discount_factor_by_tenor ", "df_today_start.tenor.start_date is ", df_today_start.tenor.start_date, "df_today_start.tenor.maturity_date is ", df_today_start.tenor.maturity_date)
+
+
+        if start_date != maturity_date:
+            df_start_maturity = df_today_maturity.get_remaining_df(df_today_start, df_today_maturity.tenor.label)
+        else:
+            df_start_maturity = cls_discount_factor(self.currency, cls_tenor(start_date, start_date), 1, basis=self.basis)
+        # print("get_discount_factor_by_tenor ", "df_start_maturity.tenor.start_date is ", df_start_maturity.tenor.start_date, "df_start_maturity.tenor.maturity_date is ", df_start_maturity.tenor.maturity_date)
+
+        return df_start_maturity
+
+    def get_discount_factor_by_label(
+            self, label: str) -> cls_discount_factor:
+
+        return self.get_item_by_label(label)
+
+        # for ds_factor_iter in self.fx_rate_list:
+        #     if ds_factor_iter.tenor.label == label.upper():
+        #         return ds_factor_iter
+        # else:
+        #     return None
+
+
+    def get_neighbor_tenor_dates_by_maturity_date(
+            self, maturity_date: datetime.date) -> tuple:
+
+        early_position, late_position = self.get_neighbor_positions_by_maturity_date(maturity_date)
+
+        #search in existing tenor
+        if early_position is not None and early_position == late_position:
+            return (maturity_date, maturity_date)
+
+        # beyond the last tenor
+        elif late_position is None:
+            return None
+
+        else:
+
+            # the discount factor earlier than target one , and the one later than target one
+            df_late = self.get_rate_by_position(late_position)
+            df_early = self.get_rate_by_position(early_position) if early_position is not None else df_late
+
+            return (df_early.maturity_date, df_late.maturity_date)
+
+    def get_neighbor_discount_factors_by_maturity_date(
+            self, maturity_date: datetime.date) -> tuple:
+
+        early_position, late_position = self.get_neighbor_positions_by_maturity_date(maturity_date)
+
+        #search in existing tenor
+        if early_position is not None and early_position == late_position:
+            return (maturity_date, maturity_date)
+
+        # beyond the last tenor
+        elif late_position is None:
+            return None
+
+        else:
+
+            # the discount factor earlier than target one , and the one later than target one
+            df_late = self.get_rate_by_position(late_position)
+            df_early = self.get_rate_by_position(early_position) if early_position is not None else df_late
+
+            return (df_early, df_late)
+
+
+class cls_capitalized_factor_curve(cls_single_currency_rate_curve):
+    def __init__(self,
+                 currency: cls_currency,
+                 fx_rate_list: list,
+                 linearization: linearization_enum,
+                 basis: int=None):
+
+        super().__init__(currency, fx_rate_list, basis)
+        self.linearization = linearization
+        self.discount_factor_curve = cls_discount_factor_curve(currency, [capitalized_factor_iter.get_discount_factor_by_label()
+                                                                          for capitalized_factor_iter in self.fx_rate_list
+                                                                         ],
+                                                               linearization,
+                                                               basis
+                                                               )
+
+    def get_capitalized_factor_by_maturity_date(self, maturity_date: datetime.date) -> cls_capitalized_factor:
+        return self.discount_factor_curve.get_discount_factor_by_maturity_date(
+            maturity_date).get_capitalized_factor()
+
+
+class cls_tenor_label:
+    """
+    Parsed tenor label, a number of units of D, W, M or Y, e.g. 18M or 2Y.
+
+    Labels such as O/N, T/N and S/N are not parsed, their number of units and unit are None.
+    """
+    __slots__ = ('label', 'number_of_units', 'unit')
+
+    __pattern = re.compile(r'^(\d+)([DWMY])$')
+
+    def __init__(self, label: str):
+        self.label = label.upper()
+
+        matched = self.__pattern.match(self.label)
+        self.number_of_units = int(matched.group(1)) if matched is not None else None
+        self.unit = matched.group(2) if matched is not None else None
+
+    @property
+    def number_of_months(self)->int:
+        """Number of months of M and Y labels, None for the others."""
+        if self.unit == 'M':
+            return self.number_of_units
+        elif self.unit == 'Y':
+            return self.number_of_units * 12
+        else:
+            return None
+
+    def get_shifted_label(self, number_of_months: int)->str:
+        """
+        Label of this tenor shifted by a number of months, None if not counted in months or not after today any more.
+
+        A shifted Y label stays in years when a whole number of years is left, e.g. 3Y -> 2Y, 30M -> 18M, 2Y -> 18M by -6.
+        """
+        if self.number_of_months is None or self.number_of_months + number_of_months <= 0:
+            return None
+
+        shifted_number_of_months = self.number_of_months + number_of_months
+
+        if self.unit == 'Y' and shifted_number_of_months % 12 == 0:
+            return str(shifted_number_of_months // 12) + 'Y'
+        else:
+            return str(shifted_number_of_months) + 'M'
+
+
+@functools.lru_cache(maxsize=None)
+def get_tenor_label(label: str)->cls_tenor_label:
+    return cls_tenor_label(label)
+
+
+def get_1Ybackwardshifted_tenor_label(input_tenor_label:str)->str:
+    """
+    Label of the tenor 1Y before, e.g. 2Y -> 1Y, 18M -> 6M, 24M -> 12M.
+
+    None for tenors of 1Y and under (1Y, 12M, 6M) and labels not counted in months (O/N, 1W), for which
+    earlier versions returned labels of no pillar such as 0Y, 11M or 5M, or raised.
+    """
+    if input_tenor_label is None:
+        return None
+
+    return get_tenor_label(input_tenor_label).get_shifted_label(-12)
+
+
+@functools.lru_cache(maxsize=256)
+def get_annual_coupon_schedule_dict(label_tuple: tuple)->types.MappingProxyType:
+    """
+    Annual coupon schedule of every tenor over 1Y in a curve, resolved once per set of pillar labels.
+
+    The tenor 1Y before a pillar is looked up by number of months, going one more year back while
+    the curve has no pillar there (4Y -> 2Y if 3Y is missing).
+
+    Args:
+        label_tuple: pillar labels of the curve
+
+    Returns:
+        types.MappingProxyType: read-only, shared by the callers of the cache; by label of the tenors over 1Y,
+        the tuple of the labels of the annual interest payment dates before maturity, ascending
+        - the first one is within 1Y
+        - an empty tuple if no pillar 1Y before could be found
+    """
+    number_of_months_list = [get_tenor_label(label_iter).number_of_months if label_iter is not None else None for label_iter in label_tuple]
+
+    label_by_number_of_months = {}
+    for label_iter, number_of_months in zip(label_tuple, number_of_months_list):
+        if number_of_months is not None:
+            label_by_number_of_months.setdefault(number_of_months, label_iter)
+
+    schedule_dict = {}
+
+    for label_iter, number_of_months in zip(label_tuple, number_of_months_list):
+        if number_of_months is None or number_of_months <= 12:
+            continue
+
+        schedule = []
+        shifted_number_of_months = number_of_months - 12
+
+        while shifted_number_of_months > 0:
+            if shifted_number_of_months in label_by_number_of_months:
+                schedule.append(label_by_number_of_months[shifted_number_of_months])
+
+                if shifted_number_of_months <= 12:
+                    break
+
+            shifted_number_of_months = shifted_number_of_months - 12
+
+        else:
+            # no pillar within 1Y at the start of the schedule
+            schedule = []
+
+        schedule.reverse()
+        schedule_dict[label_iter.upper()] = tuple(schedule)
+
+    return types.MappingProxyType(schedule_dict)
+
+
+class cls_market_quote_curve(cls_single_currency_rate_curve):
+    rate_class = cls_market_quote
+
+    def __init__(self,
+                 currency: cls_currency,
+                 fx_rate_list: list,
+                 basis: int=None):
+
+        super().__init__(currency, fx_rate_list, basis)
+
+    def get_market_quote_by_label(self, label: str) -> cls_market_quote:
+
+        return self.get_item_by_label(label)
+
+        # for market_quote_iter in self.fx_rate_list:
+        #     if market_quote_iter.tenor.label == label.upper():
+        #         return market_quote_iter
+        # else:
+        #     return None
+
+    def __get_discount_factor_on(self)->cls_discount_factor:
+        market_quote_on = self.get_market_quote_by_label("O/N")
+
+        return cls_discount_factor(
+            self.currency, market_quote_on.tenor,
+            1 / (1 + market_quote_on.mid * market_quote_on.tenor.number_of_days / market_quote_on.basis), basis=self.basis)
+
+    def __get_discount_factor_tn(self, ds_factor_on:cls_discount_factor)->cls_discount_factor:
+
+        market_quote_tn = self.get_market_quote_by_label("T/N")
+        if market_quote_tn is not None :
+            ds_factor_tomorrow_next = cls_discount_factor(
+            self.currency, market_quote_tn.tenor,
+            1 / (1 + market_quote_tn.mid * market_quote_tn.tenor.number_of_days / market_quote_tn.basis), basis=self.basis)
+        else:
+            ds_factor_tomorrow_next = cls_discount_factor(
+            self.currency, cls_tenor(ds_factor_on.tenor.maturity_date,ds_factor_on.tenor.maturity_date),1 , basis=self.basis)
+
+        return ds_factor_on.extend_by_df(ds_factor_tomorrow_next,"T/N")
+
+    # to be tested
+    def get_discount_factor_today_spot(self)->cls_discount_factor:
+
+        ds_factor_on = self.__get_discount_factor_on()
+
+        if self.spot_date_shift == date_shift_enum.D1:
+            return ds_factor_on
+
+        elif self.spot_date_shift == date_shift_enum.D2:
+            return self.__get_discount_factor_tn(ds_factor_on)
+
+        elif self.spot_date_shift == date_shift_enum.D0:
+            return cls_discount_factor(self.currency, cls_tenor(self.today_date, self.today_date, "TDY"), 1, basis=self.basis)
+
+
+    def get_discount_factor_by_label(self, tenor_label:str)->cls_discount_factor:
+        if tenor_label == 'O/N':
+            return self.__get_discount_factor_on()
+
+        elif tenor_label == 'T/N':
+            return self.get_discount_factor_today_spot()
+
+        else:
+            market_quote = self.get_market_quote_by_label(tenor_label)
+            if market_quote is None:
+                assert("tenor label {tenor_label} is not found in market quote curve".format(tenor_label=tenor_label))
+                return None
+            else:
+                return market_quote.get_discount_factor_today_maturity(self.get_discount_factor_today_spot())
+
+
+    def refresh_index(self)->None:
+        super().refresh_index()
+
+        # shared by all the curves with the same pillar labels
+        self.__annual_coupon_schedule_dict = get_annual_coupon_schedule_dict(tuple(self.indexed_rate_columns.label_list))
+
+    def get_annual_coupon_schedule(self, input_tenor_label:str)->tuple:
+        """
+        Labels of the annual interest payment dates before the maturity of a tenor over 1Y, ascending.
+
+        None for the tenors within 1Y, an empty tuple if the schedule can not be resolved in this curve.
+        The tuple is shared with the other curves of the same pillar labels.
+        """
+        self.check_index()
+        return self.__annual_coupon_schedule_dict.get(input_tenor_label.upper())
+
+    def get_market_quote_backwardshifted(self, input_tenor_label:str)->cls_market_quote:
+
+        mq_input_tenor = self.get_market_quote_by_label(input_tenor_label)
+        mq_1Y = self.get_market_quote_by_label('1Y')
+
+        # already within 1Y
+        if mq_input_tenor.maturity_date <= mq_1Y.maturity_date:
+            return mq_input_tenor
+
+        # greater than 1Y, the first payment date of the annual schedule
+        else:
+            annual_coupon_schedule = self.get_annual_coupon_schedule(input_tenor_label)
+
+            if not annual_coupon_schedule:
+                assert ("backwardshifted tenor not found")
+                return None
+
+            return self.get_market_quote_by_label(annual_coupon_schedule[0])
+
+
+    def get_market_quote_list_backwardshifted(self, input_tenor_label:str, market_quote_list_input:list=None)->list:
+
+        mq_input_tenor = self.get_market_quote_by_label(input_tenor_label)
+        mq_1Y = self.get_market_quote_by_label('1Y')
+
+        # already within 1Y
+        if mq_input_tenor.maturity_date <= mq_1Y.maturity_date:
+            return [mq_input_tenor]
+
+        # greater than 1Y
+        else:
+            annual_coupon_schedule = self.get_annual_coupon_schedule(input_tenor_label)
+
+            if not annual_coupon_schedule:
+                assert("not able to find the backward shifted tenor for {input_tenor_label}".format(input_tenor_label=input_tenor_label))
+                # to be enhanced
+
+            mq_result_list = market_quote_list_input if market_quote_list_input is not None else []
+            mq_result_list.extend(self.get_market_quote_by_label(label_iter) for label_iter in annual_coupon_schedule or [])
+
+            return mq_result_list
+
+
+    def __get_market_quote_1Ybackwardshifted_in_curve(self, input_tenor_label:str)->cls_market_quote:
+
+        annual_coupon_schedule = self.get_annual_coupon_schedule(input_tenor_label)
+
+        return self.get_market_quote_by_label(annual_coupon_schedule[-1]) if annual_coupon_schedule else None
+
+    def __get_discount_factor_list_spot_annual_strip(self, market_quote:cls_market_quote, market_quote_1Y:cls_market_quote, strip_dict:dict)->list:
+        """
+        Discount factors spot date -> each annual interest payment date of market_quote, the last one being its maturity date,
+        as tuples (label, number of days, value, basis).
+
+        The strip of a tenor over 1Y is the strip of its 1Y backward shifted tenor plus the tenor itself,
+        so each strip is solved once per bootstrap and kept in strip_dict by label.
+        """
+        if market_quote.label not in strip_dict:
+
+            # the first payment date is within 1Y , discount factor could be calculated directly.
+            if market_quote.maturity_date <= market_quote_1Y.maturity_date:
+                strip_dict[market_quote.label] = [(market_quote.label,
+                                                   market_quote.tenor.number_of_days,
+                                                   1 / (  1 + market_quote.mid * market_quote.tenor.number_of_days / market_quote.basis),
+                                                   market_quote.basis)]
+
+            else:
+                mq_backward_1Y_shifted = self.__get_market_quote_1Ybackwardshifted_in_curve(market_quote.label)
+
+                if mq_backward_1Y_shifted is None:
+                    assert("not able to find the backward shifted tenor for {input_tenor_label}".format(input_tenor_label=market_quote.label))
+                    # to be enhanced
+
+                discount_factor_list_spot_backwardshifteddate = self.__get_discount_factor_list_spot_annual_strip(mq_backward_1Y_shifted, market_quote_1Y, strip_dict)
+                discount_factor_spot_maturity_value = get_discount_factor_value_spot_maturity_from_market_quote_over_1Ys(discount_factor_list_spot_backwardshifteddate,
+                                                                                                                        market_quote.value,
+                                                                                                                        market_quote.tenor.number_of_days)
+
+                strip_dict[market_quote.label] = discount_factor_list_spot_backwardshifteddate + [(market_quote.label,
+                                                                                                   market_quote.tenor.number_of_days,
+                                                                                                   discount_factor_spot_maturity_value,
+                                                                                                   market_quote.basis)]
+
+        return strip_dict[market_quote.label]
+
+    def get_discount_factor_curve(self,
+                                  linearization:linearization_enum,
+                                  basis_input:int=None,
+                                  base_discount_factor_curve=None) -> cls_discount_factor_curve:
+        """
+        Bootstraps the discount factor curve of the market quotes.
+
+        Args:
+            linearization: interpolation of the resulting curve
+            basis_input: basis of the resulting curve, the one of the market quote curve by default
+            base_discount_factor_curve: a curve bootstrapped earlier from a previous version of this market quote curve
+                (see update_market_quote). The discount factors of the market quotes shared with that version are
+                reused, only the changed market quotes and the tenors whose annual strip passes through them are solved.
+
+        Returns:
+            cls_bootstrapped_discount_factor_curve
+        """
+        if basis_input is None:
+            basis = self.basis
+        else:
+            basis = basis_input
+
+        discount_factor_today_spot = self.get_discount_factor_today_spot()
+
+        ds_factor_list = []
+
+        market_quote_1Y = self.get_market_quote_by_label('1Y')
+
+        # annual strips solved so far, reused by the strips of the later tenors
+        strip_dict = {}
+
+        ds_factor_list_reused = [None] * len(self.fx_rate_list)
+
+        if base_discount_factor_curve is not None:
+            market_quote_list_base = base_discount_factor_curve.market_quote_curve.fx_rate_list
+            pillar_ds_factor_list_base = base_discount_factor_curve.pillar_discount_factor_list
+
+            # market quote objects are shared between the versions, changed ones are new objects
+            if len(market_quote_list_base) == len(self.fx_rate_list):
+                changed_label_set = {market_quote_iter.label for market_quote_iter, market_quote_base_iter in zip(self.fx_rate_list, market_quote_list_base)
+                                     if market_quote_iter is not market_quote_base_iter}
+            else:
+                changed_label_set = None
+
+            # O/N and T/N move the spot discount factor, hence every tenor
+            if changed_label_set is not None and 'O/N' not in changed_label_set and 'T/N' not in changed_label_set:
+                for label, strip in base_discount_factor_curve.annual_strip_dict.items():
+                    if not any(strip_label in changed_label_set for strip_label, _, _, _ in strip):
+                        strip_dict[label] = strip
+
+                for i, market_quote_iter in enumerate(self.fx_rate_list):
+                    if market_quote_iter.label in changed_label_set:
+                        continue
+                    elif market_quote_iter.label in base_discount_factor_curve.annual_strip_dict and market_quote_iter.label not in strip_dict:
+                        continue
+                    else:
+                        ds_factor_list_reused[i] = pillar_ds_factor_list_base[i]
+
+        for market_quote_iter, ds_factor_reused in zip(self.fx_rate_list, ds_factor_list_reused):
+            if ds_factor_reused is not None:
+                discount_factor_iter = ds_factor_reused
+            elif market_quote_iter.tenor.label == 'O/N':
+                discount_factor_iter = self.__get_discount_factor_on()
+            elif market_quote_iter.tenor.label == 'T/N':
+                discount_factor_iter = discount_factor_today_spot
+            else:
+
+                if market_quote_1Y is None :
+                    discount_factor_iter = market_quote_iter.get_discount_factor_today_maturity(discount_factor_today_spot)
+
+                elif market_quote_iter.maturity_date <= market_quote_1Y.maturity_date :
+                    discount_factor_iter = market_quote_iter.get_discount_factor_today_maturity(discount_factor_today_spot)
+
+                else:
+                    _, _, discount_factor_spot_maturity_value, _ = self.__get_discount_factor_list_spot_annual_strip(market_quote_iter, market_quote_1Y, strip_dict)[-1]
+
+                    # same as extending the discount factor today -> spot by the one spot -> maturity
+                    discount_factor_iter = cls_discount_factor(self.currency,
+                                                               cls_tenor(discount_factor_today_spot.start_date, market_quote_iter.maturity_date, market_quote_iter.label),
+                                                               discount_factor_today_spot.mid * discount_factor_spot_maturity_value,
+                                                               basis=discount_factor_today_spot.basis)
+
+            ds_factor_list.append(discount_factor_iter)
+
+            #print("--", df_iter.tenor.label, df_iter.mid )
+
+        return cls_bootstrapped_discount_factor_curve(self, ds_factor_list, strip_dict, linearization, basis)
+
+    def update_market_quote(self, label:str, mid:float):
+        """
+        Returns a new version of the curve with the market quote of label set to mid.
+
+        The other market quote objects are shared with this version, which is left unchanged.
+        """
+        market_quote_old = self.get_market_quote_by_label(label)
+
+        if market_quote_old is None:
+            logger.critical("parameter label {label} is not found in market quote curve".format(label=label))
+            return None
+
+        market_quote_new = cls_market_quote(market_quote_old.currency, market_quote_old.tenor, mid, basis=market_quote_old.basis)
+
+        market_quote_list = [market_quote_new if market_quote_iter is market_quote_old else market_quote_iter for market_quote_iter in self.fx_rate_list]
+
+        return cls_market_quote_curve(self.currency, market_quote_list, self.basis)
+
+    @property
+    def last_item(self)->cls_market_quote:
+        return self.fx_rate_list[-1]
+
+
+class cls_bootstrapped_discount_factor_curve(cls_discount_factor_curve):
+    """
+    Discount factor curve bootstrapped from a market quote curve.
+
+    Keeps what the bootstrap solved, so that a change of a single market quote is bootstrapped incrementally.
+
+    Attributes:
+        market_quote_curve: the market quote curve bootstrapped
+        pillar_discount_factor_list: discount factor today -> maturity date of each market quote, in the order of market_quote_curve.fx_rate_list
+        annual_strip_dict: discount factors spot date -> annual interest payment dates, by label of the tenors within 1Y and over 1Y,
+            as tuples (label, number of days, value, basis)
+    """
+    def __init__(self,
+                 market_quote_curve: cls_market_quote_curve,
+                 pillar_discount_factor_list: list,
+                 annual_strip_dict: dict,
+                 linearization: linearization_enum,
+                 basis: int = None):
+        super().__init__(market_quote_curve.currency, list(pillar_discount_factor_list), linearization, basis)
+        self.market_quote_curve = market_quote_curve
+        self.pillar_discount_factor_list = pillar_discount_factor_list
+        self.annual_strip_dict = annual_strip_dict
+
+    def update_market_quote(self, label:str, mid:float):
+        """
+        Returns a new version of the curve, bootstrapped with the market quote of label set to mid.
+
+        Only the discount factor of that tenor, and of the tenors whose annual strip passes through it, are solved again.
+        The other discount factor objects are shared with this version, which is left unchanged.
+        """
+        market_quote_curve = self.market_quote_curve.update_market_quote(label, mid)
+
+        if market_quote_curve is None:
+            return None
+
+        return market_quote_curve.get_discount_factor_curve(self.linearization, self.basis, self)
+
+
+def get_discounted_factor_spot_maturity_from_market_quote_over_1Y(discount_factor_spot_backwardshifteddate:cls_discount_factor, market_quote_spot_maturity:cls_market_quote)->cls_discount_factor:
+    #                                                       |<-----------------1 year--------->|
+    # |-------------------|---------------------------------|-------------------------|--------|-------------------time axis--->
+    # today-----------spot date------------intermediate interest payment date -------1Y------maturity date
+
+
+    # for easy calculation only , any positive amount is workable. Not refecting in  result.
+    virtual_principal = 1000000
+
+    cash_flow_principal_spot_date = virtual_principal
+    cash_flow_principal_maturity = -1 * virtual_principal
+
+    # Calculate interest payment at intermediate date
+    cash_flow_intermediate_interest = -1 * virtual_principal * (
+        market_quote_spot_maturity.value * 
+        discount_factor_spot_backwardshifteddate.tenor.number_of_days / 
+        discount_factor_spot_backwardshifteddate.basis
+    )
+
+    # Discount intermediate interest payment to spot date
+    discounted_cash_flow_intermediate_interest = cash_flow_intermediate_interest * discount_factor_spot_backwardshifteddate.value
+
+    # Calculate total discounted cash flow at maturity (including principal)
+    discounted_cash_flow_maturity = 0 - cash_flow_principal_spot_date - discounted_cash_flow_intermediate_interest
+
+    # Calculate interest for period from intermediate date to maturity
+    cash_flow_maturity_interest = -1 * virtual_principal * (
+        market_quote_spot_maturity.value * 
+        (market_quote_spot_maturity.tenor.number_of_days - discount_factor_spot_backwardshifteddate.tenor.number_of_days) / 
+        discount_factor_spot_backwardshifteddate.basis
+    )
+
+    # Calculate discount factor value from cash flows
+    discount_factor_spot_maturity_value = discounted_cash_flow_maturity / (cash_flow_maturity_interest + cash_flow_principal_maturity)
+
+    # Create and return discount factor object
+    discount_factor_spot_maturity = market_quote_spot_maturity.get_discount_factor_spot_maturity(discount_factor_spot_maturity_value)
+
+    return discount_factor_spot_maturity
+
+
+
+
+def get_discounted_factor_today_maturity_from_market_quote_over_1Y(discount_factor_today_spot:cls_discount_factor,
+                                                                   market_quote_spot_backwardshifteddate:cls_market_quote,
+                                                                   market_quote_spot_maturity:cls_market_quote
+                                                                  )->cls_discount_factor:
+    # backward shift date is the interpayment date
+    discount_factor_spot_interpayment = market_quote_spot_backwardshifteddate.get_discount_factor_spot_maturity()
+
+    discount_factor_spot_maturity = get_discounted_factor_spot_maturity_from_market_quote_over_1Y(discount_factor_spot_interpayment, market_quote_spot_maturity)
+
+    discount_factor_today_maturity = discount_factor_today_spot.extend_by_df(discount_factor_spot_maturity, discount_factor_spot_maturity.label)
+
+    return discount_factor_today_maturity
+
+
+
+def get_discount_factor_value_spot_maturity_from_market_quote_over_1Ys(discount_factor_field_list_spot_backwardshifteddate:list,
+                                                                      market_quote_value:float,
+                                                                      number_of_days_spot_to_maturity:int)->float:
+    """
+    Float only version of get_discounted_factor_spot_maturity_from_market_quote_over_1Ys.
+
+    Args:
+        discount_factor_field_list_spot_backwardshifteddate: discount factors spot date -> each intermediate payment date,
+            as tuples (label, number of days, value, basis)
+        market_quote_value: market quote spot date -> maturity date
+        number_of_days_spot_to_maturity: number of days spot date -> maturity date
+
+    Returns:
+        float: discount factor value spot date -> maturity date
+    """
+    #                                                            |<-----------------1 year------------>|<--------------------1 year--------->|
+    # |-------------------|--------------------------------------|-------------------|-----------------|----------------------------|--------|-------------------time axis--->
+    # today-----------spot date----------intermediate interest payment date1--------1Y---intermediate interest payment date2-------2Y------maturity date
+
+
+    # for easy calculation only , any positive amount is workable. Not reflecting in result.
+    virtual_principal = 1000000
+
+    cash_flow_spot_date_principal = virtual_principal
+    cash_flow_maturity_principal = -1 * virtual_principal
+
+    # sum up the intermediate discounted interest payment
+    discounted_cash_flow_intermediate_interest_sum = 0
+
+    aggregated_days = 0
+
+    for _, number_of_days, discount_factor_value, basis in discount_factor_field_list_spot_backwardshifteddate :
+        # duration is last intermediate payment date  to current intermediate payment date
+        cash_flow_intermediate_interest = -1 * virtual_principal * (market_quote_value * (number_of_days - aggregated_days )/ basis)
+
+        # get the discounted amount of the cash flow , discounted from intermediate payment date to spot date.
+        discounted_cash_flow_intermediate_interest = cash_flow_intermediate_interest * discount_factor_value
+
+
+        discounted_cash_flow_intermediate_interest_sum = discounted_cash_flow_intermediate_interest_sum + discounted_cash_flow_intermediate_interest
+        aggregated_days = number_of_days
+
+    # including principal and maturity payment
+    discounted_cash_flow_maturity = 0 - cash_flow_spot_date_principal - discounted_cash_flow_intermediate_interest_sum
+
+    # duration is the last intermediate interest payment date to maturity date
+    # equal to ( spot date to maturity date   MINUS   spot date to last intermediate interest payment date  )
+    _, number_of_days_spot_lastinterpayment, _, basis_lastinterpayment = discount_factor_field_list_spot_backwardshifteddate[-1]
+
+    cash_flow_maturity_interest = -1 * virtual_principal * (market_quote_value * (number_of_days_spot_to_maturity - number_of_days_spot_lastinterpayment) / basis_lastinterpayment)
+
+    return discounted_cash_flow_maturity / (cash_flow_maturity_interest + cash_flow_maturity_principal)
+
+
+def get_discounted_factor_spot_maturity_from_market_quote_over_1Ys(discount_factor_list_spot_backwardshifteddate:list, market_quote_spot_maturity:cls_market_quote)->cls_discount_factor:
+
+    discount_factor_field_list = [(discount_factor_iter.label, discount_factor_iter.tenor.number_of_days, discount_factor_iter.value, discount_factor_iter.basis)
+                                  for discount_factor_iter in discount_factor_list_spot_backwardshifteddate]
+
+    discount_factor_spot_maturity_value = get_discount_factor_value_spot_maturity_from_market_quote_over_1Ys(discount_factor_field_list,
+                                                                                                            market_quote_spot_maturity.value,
+                                                                                                            market_quote_spot_maturity.tenor.number_of_days)
+
+    discount_factor_spot_maturity = market_quote_spot_maturity.get_discount_factor_spot_maturity(discount_factor_spot_maturity_value)
+
+    return discount_factor_spot_maturity
+
+
+def get_discounted_factor_today_maturity_from_market_quote_over_1Ys(discount_factor_today_spot:cls_discount_factor,
+                                                                    market_quote_list_spot_backwardshifteddate:list,
+                                                                    market_quote_spot_maturity:cls_market_quote
+                                                                   )->cls_discount_factor:
+    discount_factor_list =[]
+
+    market_quote_list = market_quote_list_spot_backwardshifteddate + [market_quote_spot_maturity]
+
+    #market_quote_spot_backwardshifteddate_iter = cls_market_quote()
+
+    for i in range(len(market_quote_list) - 1):
+        if i == 0:
+            # assume the first one is within 1Y
+            market_quote_spot_backwardshifteddate_iter = market_quote_list[i]
+
+            # for the market quote within 1Y, discount factor could be calculated directly.
+            discount_factor_spot_backwardshifteddate_iter = market_quote_spot_backwardshifteddate_iter.get_discount_factor_spot_maturity()
+            discount_factor_list.append(discount_factor_spot_backwardshifteddate_iter)
+
+        else:
+            pass
+
+        # the next payment date as iterated maturity date
+        market_quote_spot_next_backwardshifteddate_iter = market_quote_list[i + 1]
+
+        discount_factor_spot_maturity_iter = get_discounted_factor_spot_maturity_from_market_quote_over_1Ys(discount_factor_list, market_quote_spot_next_backwardshifteddate_iter)
+
+        # add result to discount factor list
+        discount_factor_list.append(discount_factor_spot_maturity_iter)
+
+    else:
+        discount_factor_spot_maturity = discount_factor_list[-1]
+        discount_factor_today_maturity = discount_factor_today_spot.extend_by_df(discount_factor_spot_maturity, discount_factor_spot_maturity.label)
+
+    return discount_factor_today_maturity
+
+
+
+class cls_swap_point_panel(cls_rate_curve):
+
+    def __init__(
+            self,
+            currency_pair: cls_currency_pair,
+            spot_rate_input: cls_fx_spot_rate=None,
+            df_curve_base_ccy: cls_discount_factor_curve=None,
+            df_curve_und_ccy: cls_discount_factor_curve=None,
+            set_swap_point_list_when_initial: bool = True,
+            forward_rate_cache_size: int = 1024):
+
+        self.currency_pair = currency_pair
+
+        super().__init__([])
+
+        self.df_curve_base_ccy = df_curve_base_ccy
+        self.df_curve_und_ccy = df_curve_und_ccy
+
+        self.spot_rate = spot_rate_input.get_fx_rate_by_quotation(currency_pair.quotation)
+
+        # forward rate values by maturity ordinal, least recently used first
+        self.forward_rate_cache_size = forward_rate_cache_size
+        self.__forward_rate_cache = collections.OrderedDict()
+        self.__forward_rate_cache_state = ((None,) * 5, None)
+
+        if set_swap_point_list_when_initial == True :
+            #logger.info("swap point list is auto set.")
+            # swap points kept as columns, created as objects when asked for
+            self.__refresh_swap_point_columns()
+        else:
+            pass
+            #logger.info("swap point list is not auto set.")
+
+    @property
+    def swap_point_factor(self)->int:
+        return self.currency_pair.swap_point_factor
+
+    @property
+    def spot_date(self)->datetime.date:
+        return self.spot_rate.tenor.maturity_date
+
+    @property
+    def today_date(self)->datetime.date:
+        return self.spot_rate.tenor.start_date
+
+    def create_rate_from_columns(self, position: int)->cls_swap_point:
+        return self.__create_swap_point(self.get_rate_columns(), position)
+
+    def __create_swap_point(self, rate_columns: cls_rate_columns, position: int)->cls_swap_point:
+        swap_point = cls_swap_point(self.currency_pair,
+                                    cls_tenor(datetime.date.fromordinal(int(rate_columns.start_ordinal_array[position])),
+                                              datetime.date.fromordinal(int(rate_columns.maturity_ordinal_array[position])),
+                                              rate_columns.label_list[position]))
+        swap_point.set_rate_by_mid_bid_ask(float(rate_columns.mid_array[position]),
+                                           float(rate_columns.bid_array[position]),
+                                           float(rate_columns.ask_array[position]))
+        return swap_point
+
+    def refresh_index(self)->None:
+        super().refresh_index()
+
+        # position of the first swap point of each label and maturity, same as a scan of the list
+        self.__label_dict = {}
+        for position, label_iter in enumerate(self.indexed_rate_columns.label_list):
+            self.__label_dict.setdefault(label_iter, position)
+
+        self.__maturity_dict = {}
+        for position, maturity_ordinal in enumerate(self.maturity_ordinal_list):
+            self.__maturity_dict.setdefault(maturity_ordinal, position)
+
+    @property
+    def swap_point_list(self)->list:
+        return self.fx_rate_list
+
+    @property
+    def base_currency_label(self)->str:
+        return self.currency_pair.base.label
+
+    @property
+    def und_currency_label(self)->str:
+        return self.currency_pair.underlying.label
+
+    def get_swap_point_from_list_by_tenor_label(self, label:str) -> cls_swap_point:
+        self.check_index()
+        position = self.__label_dict.get(label.upper().strip())
+
+        if position is None:
+            logger.warning("parameter label {label} is not found in swap point list.".format(label=label))
+            return None
+
+        # only the swap point asked for is created
+        return self.get_rate_by_position(position)
+
+
+    def get_swap_point_from_list_by_maturity(self, maturity_date: datetime.date) -> cls_swap_point:
+        self.check_index()
+        position = self.__maturity_dict.get(maturity_date.toordinal())
+
+        if position is None:
+            logger.warning("parameter maturity_date {maturity_date} is not found in swap point list.".format(maturity_date=maturity_date.__str__()))
+            return None
+
+        return self.get_rate_by_position(position)
+
+
+
+    def refresh_swap_point_list(self)->list:
+        """
+        Appends the swap points of the tenors of the underlying currency curve, computed as arrays in one pass.
+
+        Returns:
+            list: swap point list, created as objects; get_rate_columns reads the swap points without creating them
+        """
+        self.__refresh_swap_point_columns()
+        return self.swap_point_list
+
+    def __refresh_swap_point_columns(self)->None:
+        df_curve_und = self.df_curve_und_ccy
+        und_rate_columns = df_curve_und.indexed_rate_columns
+        maturity_ordinal_array = np.asarray(und_rate_columns.maturity_ordinal_array, dtype=np.int32)
+        tom_date = df_curve_und.tom_date if df_curve_und.tom_date is not None else self.today_date
+
+        # spot date, today and tom first, then the tenors
+        query_ordinal_array = np.concatenate((np.array([self.spot_rate.tenor.maturity_ordinal, self.spot_rate.tenor.start_ordinal, tom_date.toordinal()], dtype=np.int32),
+                                              maturity_ordinal_array))
+        df_base_today_values = self.df_curve_base_ccy.get_discount_factors_by_maturity_dates(query_ordinal_array)
+        df_und_today_values = df_curve_und.get_discount_factors_by_maturity_dates(query_ordinal_array)
+
+        if df_base_today_values is None or df_und_today_values is None:
+            self.__refresh_swap_point_list_by_maturity()
+            return
+
+        # swap points spot date -> each date
+        df_base_spot_values = df_base_today_values / df_base_today_values[0]
+        df_und_spot_values = df_und_today_values / df_und_today_values[0]
+
+        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
+            swap_point_spot_values = self.spot_rate.mid * (df_base_spot_values / df_und_spot_values - 1)
+        else:
+            swap_point_spot_values = self.spot_rate.mid * (df_und_spot_values / df_base_spot_values - 1)
+
+        swap_point_spot_values[query_ordinal_array == self.spot_rate.tenor.maturity_ordinal] = 0
+
+        swap_point_spot_today, swap_point_spot_tom = swap_point_spot_values[1], swap_point_spot_values[2]
+        swap_point_values = swap_point_spot_values[3:]
+
+        is_on = maturity_ordinal_array == tom_date.toordinal() if df_curve_und.tom_date is not None else np.zeros(len(maturity_ordinal_array), dtype=bool)
+        is_spot = (maturity_ordinal_array == df_curve_und.spot_date.toordinal()) & ~is_on if df_curve_und.spot_date is not None else np.zeros(len(maturity_ordinal_array), dtype=bool)
+        is_tn = is_spot & (df_curve_und.spot_date_shift == date_shift_enum.D2)
+        is_tdy = is_spot & (df_curve_und.spot_date_shift == date_shift_enum.D0)
+
+        swap_point_values = np.where(is_on, swap_point_spot_tom - swap_point_spot_today, swap_point_values)
+        swap_point_values = np.where(is_tn, -1 * swap_point_spot_tom, swap_point_values)
+        swap_point_values = np.where(is_tdy, 0, swap_point_values)
+
+        # bid and ask as set by set_swap_point_by_discount_factors, from discount factors spot -> maturity which,
+        # divided from the curve mids like the ones of get_discount_factor_by_start_maturity, carry no spread;
+        # O/N, T/N and TDY swap points are mids only
+        swap_point_bid_values = swap_point_values.copy()
+        swap_point_ask_values = swap_point_values.copy()
+
+        start_ordinal_array = np.full(len(maturity_ordinal_array), self.spot_rate.tenor.maturity_ordinal, dtype=np.int32)
+        start_ordinal_array = np.where(is_on, self.spot_rate.tenor.start_ordinal, start_ordinal_array)
+        start_ordinal_array = np.where(is_tn, tom_date.toordinal(), start_ordinal_array)
+        start_ordinal_array = np.where(is_tdy, maturity_ordinal_array, start_ordinal_array)
+
+        label_list = ['O/N' if is_on_iter else 'T/N' if is_tn_iter else 'TDY' if is_tdy_iter else label_iter
+                      for label_iter, is_on_iter, is_tn_iter, is_tdy_iter in zip(und_rate_columns.label_list, is_on.tolist(), is_tn.tolist(), is_tdy.tolist())]
+
+        # tenors the base currency curve can not reach are left out
+        is_valid = ~np.isnan(df_base_today_values[3:])
+
+        self.__append_swap_point_columns(cls_rate_columns(start_ordinal_array[is_valid].astype(np.int32),
+                                                          maturity_ordinal_array[is_valid],
+                                                          swap_point_values[is_valid],
+                                                          swap_point_bid_values[is_valid],
+                                                          swap_point_ask_values[is_valid],
+                                                          np.full(int(np.count_nonzero(is_valid)), np.nan),
+                                                          [label_list[position] for position in np.flatnonzero(is_valid).tolist()]))
+
+    def __append_swap_point_columns(self, rate_columns: cls_rate_columns)->None:
+        # kept as columns unless the swap points were already created as objects
+        if self.is_backed_by_columns:
+            self.set_rate_columns(get_concatenated_rate_columns([self.get_rate_columns(), rate_columns]))
+        elif len(self.fx_rate_list) == 0:
+            self.set_rate_columns(rate_columns)
+        else:
+            self.fx_rate_list.extend(self.__create_swap_point(rate_columns, position) for position in range(len(rate_columns)))
+
+    def __refresh_swap_point_list_by_maturity(self)->None:
+        # follow the tenors of underlying currency
+        for df_und_iter in self.df_curve_und_ccy.fx_rate_list:
+
+            df_base_iter = self.df_curve_base_ccy.get_discount_factor_by_maturity_date(df_und_iter.tenor.maturity_date)
+
+            if df_base_iter is not None:
+                swap_point_iter = self.get_swap_point_by_maturity(df_und_iter.tenor.maturity_date)
+                self.swap_point_list.append(swap_point_iter)
+
+    def get_swap_point_by_maturity(self, maturity_date: datetime.date) -> cls_swap_point:
+
+        if maturity_date == self.df_curve_und_ccy.tom_date :
+
+            df_base_spot_tom = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
+            df_und_spot_tom = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
+
+            df_base_spot_today = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, self.today_date)
+            df_und_spot_today = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, self.today_date)
+
+            swap_point_spot_tom = self.__set_and_return_swap_point_by_df(df_base_spot_tom, df_und_spot_tom)
+            swap_point_spot_today = self.__set_and_return_swap_point_by_df(df_base_spot_today, df_und_spot_today)
+
+            return cls_swap_point(self.currency_pair, cls_tenor(self.today_date, maturity_date, 'O/N'), swap_point_spot_tom.mid - swap_point_spot_today.mid)
+
+        elif maturity_date == self.df_curve_und_ccy.spot_date and self.df_curve_und_ccy.spot_date_shift == date_shift_enum.D2:
+
+            date_tom = self.get_swap_point_from_list_by_tenor_label("O/N").tenor.maturity_date
+
+            df_base_spot_tom = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, date_tom)
+            df_und_spot_tom = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, date_tom)
+
+            swap_point_spot_tom = self.__set_and_return_swap_point_by_df(df_base_spot_tom, df_und_spot_tom)
+
+            return cls_swap_point(self.currency_pair, cls_tenor(date_tom, maturity_date, 'T/N'), -1 * swap_point_spot_tom.mid)
+
+        elif maturity_date == self.df_curve_und_ccy.spot_date and self.df_curve_und_ccy.spot_date_shift == date_shift_enum.D0:
+
+            return cls_swap_point(self.currency_pair, cls_tenor(maturity_date, maturity_date, 'TDY'),  0)
+
+        else:
+            df_base_spot_maturity = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
+            # print("get_swap_point_by_start_maturity ", "df_base_s_m.tenor.start_date is ", df_base_s_m.tenor.start_date, "df_base_s_m.tenor.maturity_date is ", df_base_s_m.tenor.maturity_date)
+
+            df_und_spot_maturity = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
+
+            return self.__set_and_return_swap_point_by_df(df_base_spot_maturity, df_und_spot_maturity)
+
+    def __set_and_return_swap_point_by_df(
+                            self,
+                            df_base: cls_discount_factor,
+                            df_und: cls_discount_factor) -> cls_swap_point:
+
+        swap_point = cls_swap_point(self.currency_pair, df_und.tenor)
+
+        swap_point.set_swap_point_by_discount_factors(
+                                                    self.spot_rate,
+                                                    df_base,
+                                                    df_und)
+
+        return swap_point
+
+    def __check_forward_rate_cache(self)->None:
+        # cached forward rates are dropped once a curve or the spot rate is replaced or modified,
+        # the rates of the curves compared by identity plus version, without creating them from columns
+        base_rates, base_version = self.df_curve_base_ccy.rates_state if self.df_curve_base_ccy is not None else (None, None)
+        und_rates, und_version = self.df_curve_und_ccy.rates_state if self.df_curve_und_ccy is not None else (None, None)
+
+        object_state = (self.df_curve_base_ccy, base_rates, self.df_curve_und_ccy, und_rates, self.spot_rate)
+        value_state = (base_version, und_version, self.spot_rate.mid)
+
+        cached_object_state, cached_value_state = self.__forward_rate_cache_state
+        if any(object_iter is not cached_object_iter for object_iter, cached_object_iter in zip(object_state, cached_object_state)) \
+                or value_state != cached_value_state:
+            self.__forward_rate_cache.clear()
+            self.__forward_rate_cache_state = (object_state, value_state)
+
+    @property
+    def number_of_cached_forward_rates(self)->int:
+        return len(self.__forward_rate_cache)
+
+    def get_forward_rate_value_by_maturity(self, maturity_date:datetime.date)->float:
+        """
+        Forward rate value of a maturity date in the currency pair quotation, kept in a bounded least recently used
+        cache by maturity ordinal; a cache hit creates no object, the accessor for the callers which need the value only.
+        """
+        self.__check_forward_rate_cache()
+
+        maturity_ordinal = maturity_date.toordinal()
+
+        forward_rate_value = self.__forward_rate_cache.get(maturity_ordinal)
+        if forward_rate_value is not None:
+            self.__forward_rate_cache.move_to_end(maturity_ordinal)
+            return forward_rate_value
+
+        forward_rate_value = self.__calculate_forward_rate_value_by_maturity(maturity_date)
+
+        if self.forward_rate_cache_size > 0:
+            self.__forward_rate_cache[maturity_ordinal] = forward_rate_value
+            if len(self.__forward_rate_cache) > self.forward_rate_cache_size:
+                self.__forward_rate_cache.popitem(last=False)
+
+        return forward_rate_value
+
+    def get_forward_rate_by_maturity(self, maturity_date:datetime.date)->cls_fx_forward_rate:
+        """
+        Forward rate of a maturity date, its value from the cache of get_forward_rate_value_by_maturity.
+
+        The cached objects are not shared: a new cls_fx_forward_rate, with its spot rate and swap point, is created
+        on each call so that the caller can modify it; hot callers which need the value only use
+        get_forward_rate_value_by_maturity.
+        """
+        return cls_fx_forward_rate(self.currency_pair, cls_tenor(self.today_date, maturity_date),
+                                   self.get_forward_rate_value_by_maturity(maturity_date), quotation_mode=self.currency_pair.quotation_mode)
+
+    def get_forward_rates_by_maturities(self, maturity_dates)->np.ndarray:
+        """
+        Batch version of get_forward_rate_by_maturity, returning the values only.
+
+        Args:
+            maturity_dates: sequence of datetime.date
+
+        Returns:
+            np.ndarray: forward rate values in the currency pair quotation, in the order of maturity_dates
+            - nan for dates before the first pillar of a curve (other than today)
+            - None if a curve linearization is not supported in batch query
+        """
+        maturity_dates = list(maturity_dates)
+
+        df_base_today_values = self.df_curve_base_ccy.get_discount_factors_by_maturity_dates([self.spot_date] + maturity_dates)
+        df_und_today_values = self.df_curve_und_ccy.get_discount_factors_by_maturity_dates([self.spot_date] + maturity_dates)
+
+        if df_base_today_values is None or df_und_today_values is None:
+            return None
+
+        # spot date -> maturity date
+        df_base_spot_maturity_values = df_base_today_values[1:] / df_base_today_values[0]
+        df_und_spot_maturity_values = df_und_today_values[1:] / df_und_today_values[0]
+
+        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
+            return self.spot_rate.mid * df_base_spot_maturity_values / df_und_spot_maturity_values
+        else:
+            return self.spot_rate.mid * df_und_spot_maturity_values / df_base_spot_maturity_values
+
+    def __calculate_forward_rate_value_by_maturity(self, maturity_date:datetime.date)->float:
+
+        df_base_spot_maturity = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
+
+        df_und_spot_maturity = self.df_curve_und_ccy.get_discount_factor_by_start_maturity(self.spot_date, maturity_date)
+
+        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
+            return self.spot_rate.mid * df_base_spot_maturity.mid / df_und_spot_maturity.mid
+        elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
+            return self.spot_rate.mid * df_und_spot_maturity.mid / df_base_spot_maturity.mid
+
+
+    # get underlying currency discount factor curve by base currency discount factor curve and swap point
+    def get_und_df_curve_by_swap_point_list(self, linearization_of_df_curve_und:linearization_enum, basis_input: int=None)->cls_discount_factor_curve:
+
+        und_ccy = self.currency_pair.underlying
+
+        if basis_input is None :
+            basis = und_ccy.number_of_days_1year
+        else:
+            basis = basis_input
+
+
+        df_list_und = []
+
+        swap_point_on = self.get_swap_point_from_list_by_tenor_label("O/N")
+
+
+        # get swap point of today --> spot date
+        if und_ccy.spot_date_shift == date_shift_enum.D2:
+            swap_point_tn = self.get_swap_point_from_list_by_tenor_label("T/N")
+
+            swap_point_today_spot_value = swap_point_on.value + swap_point_tn.value
+            swap_point_today_spot = cls_swap_point(self.currency_pair, cls_tenor(self.today_date, self.spot_date), swap_point_today_spot_value)
+
+        elif und_ccy.spot_date_shift == date_shift_enum.D1:
+            swap_point_today_spot = cls_swap_point(self.currency_pair, cls_tenor(self.today_date, self.spot_date), swap_point_on.value)
+
+        elif und_ccy.spot_date_shift == date_shift_enum.D0:
+            swap_point_today_spot = cls_swap_point(self.currency_pair, cls_tenor(self.today_date, self.today_date), 0)
+
+        else:
+            pass
+
+        # get discount factor of underlying currency , today --> spot
+        df_base_today_spot = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.today_date, self.spot_date)
+        if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
+            df_und_today_spot_value = df_base_today_spot.value * (1 - swap_point_today_spot.value / self.spot_rate.value )
+
+
+        elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
+            df_und_today_spot_value = df_base_today_spot.value / (1 - swap_point_today_spot.value / self.spot_rate.value )
+
+        else:
+            pass
+
+        if und_ccy.spot_date_shift == date_shift_enum.D2:
+            df_und_today_spot = cls_discount_factor(und_ccy, cls_tenor(self.today_date, self.spot_date, "T/N"), df_und_today_spot_value, basis=basis)
+        elif und_ccy.spot_date_shift == date_shift_enum.D1:
+            df_und_today_spot = cls_discount_factor(und_ccy, cls_tenor(self.today_date, self.spot_date, "O/N"), df_und_today_spot_value, basis=basis)
+        elif und_ccy.spot_date_shift == date_shift_enum.D0:
+            df_und_today_spot = cls_discount_factor(und_ccy, cls_tenor(self.today_date, self.spot_date, "TDY"), 1, basis=basis)
+        else:
+            pass
+
+        #print("df_und_today_spot_value={df_und_today_spot_value}".format(df_und_today_spot_value=df_und_today_spot_value))
+        df_list_und.append(df_und_today_spot) # append discount factor "T/N" to result
+
+
+
+        # get discount factor of underlying currency , today -> tom , and others
+        for swap_point_iter in self.fx_rate_list:
+
+            df_base_spot_maturity = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(self.spot_date, swap_point_iter.maturity_date)
+
+            if swap_point_iter.label == "O/N":
+                pass
+
+            elif swap_point_iter.label == "T/N" and und_ccy.spot_date_shift == date_shift_enum.D2:
+                df_base_tom_spot = self.df_curve_base_ccy.get_discount_factor_by_start_maturity(swap_point_iter.start_date, self.spot_date)
+
+                if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
+                    df_und_tom_spot_value = df_base_tom_spot.value * (1 - swap_point_iter.value / self.spot_rate.value)
+
+                elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
+                    df_und_tom_spot_value = df_base_tom_spot.value / (1 - swap_point_iter.value / self.spot_rate.value)
+
+                else:
+                    pass
+
+                df_und_today_tom_value = df_und_today_spot.value / df_und_tom_spot_value
+
+                df_und_today_tom = cls_discount_factor(und_ccy, cls_tenor(self.today_date, swap_point_iter.maturity_date, "O/N"), df_und_today_tom_value, basis=basis)
+
+                #print("df_und_on_value={df_und_on_value}".format(df_und_on_value=df_und_today_tom_value))
+                df_list_und.append(df_und_today_tom) # append discount factor "O/N" to result
+
+            else:
+                if self.currency_pair.quotation_mode == quotation_mode_enum.base_und:
+                    df_und_spot_maturity_value = df_base_spot_maturity.value / (swap_point_iter.value / self.spot_rate.value + 1)
+
+                elif self.currency_pair.quotation_mode == quotation_mode_enum.und_base:
+                    df_und_spot_maturity_value = df_base_spot_maturity.value * (swap_point_iter.value / self.spot_rate.value + 1)
+
+                else:
+                    pass
+
+                df_und_today_maturity_value = df_und_today_spot_value * df_und_spot_maturity_value
+
+                df_und_today_maturity = cls_discount_factor(und_ccy,
+                                                            cls_tenor(self.today_date, swap_point_iter.maturity_date, swap_point_iter.label),
+                                                            df_und_today_maturity_value,
+                                                            basis=basis)
+
+                df_list_und.append(df_und_today_maturity) # append discount factor greater than "T/N" to result
+
+        df_curve_und = cls_discount_factor_curve(und_ccy, df_list_und, linearization_of_df_curve_und, basis=basis)
+        return df_curve_und
+
+    def get_and_set_und_df_curve_by_swap_point_list(self, linearization_of_df_curve_und:linearization_enum):
+        self.df_curve_und_ccy = self.get_und_df_curve_by_swap_point_list(linearization_of_df_curve_und)
+
+
+def get_und_df_curves_by_swap_point_panels(df_curve_base_ccy: cls_discount_factor_curve,
+                                           swap_point_panel_list: list,
+                                           linearization_of_df_curve_und: linearization_enum,
+                                           basis_input: int=None)->list:
+    """
+    Batch version of cls_swap_point_panel.get_und_df_curve_by_swap_point_list, for panels sharing one base currency curve.
+
+    The swap points are read from the columns of the panels and the base currency discount factors are evaluated once
+    on the union of the dates of all panels, the implied curves are column-backed: no swap point or discount factor
+    object is created.
+
+    Args:
+        df_curve_base_ccy: discount factor curve of the base currency, used in place of df_curve_base_ccy of each panel
+        swap_point_panel_list: swap point panels with their swap point list set
+        linearization_of_df_curve_und: linearization of the implied curves
+        basis_input: basis of the implied curves, the one of each underlying currency if None
+
+    Returns:
+        list: implied cls_discount_factor_curve of the underlying currency, in the order of swap_point_panel_list
+        - None for a panel whose today is not the one of df_curve_base_ccy, or without the O/N, T/N swap points its spot date shift needs
+    """
+    today_ordinal = df_curve_base_ccy.today_ordinal
+
+    # the swap points are read as columns, no swap point object is created
+    rate_columns_list = [swap_point_panel_iter.get_rate_columns() for swap_point_panel_iter in swap_point_panel_list]
+
+    # union of the dates of all panels
+    ordinal_array = np.unique(np.concatenate(
+        [np.array([swap_point_panel_iter.today_date.toordinal(), swap_point_panel_iter.spot_date.toordinal()], dtype=np.int32)
+         for swap_point_panel_iter in swap_point_panel_list] +
+        [rate_columns_iter.start_ordinal_array for rate_columns_iter in rate_columns_list] +
+        [rate_columns_iter.maturity_ordinal_array for rate_columns_iter in rate_columns_list]).astype(np.int32))
+
+    df_base_values = df_curve_base_ccy.get_discount_factors_by_maturity_dates(ordinal_array)
+    if df_base_values is None:
+        df_base_values = np.array([df_curve_base_ccy.get_discount_factor_value_by_maturity_date(datetime.date.fromordinal(ordinal_iter))
+                                   for ordinal_iter in ordinal_array.tolist()], dtype=np.float64)
+
+    def get_df_base_values(ordinals)->np.ndarray:
+        return df_base_values[np.searchsorted(ordinal_array, ordinals)]
+
+    df_curve_und_list = []
+
+    for swap_point_panel_iter, rate_columns_iter in zip(swap_point_panel_list, rate_columns_list):
+
+        if swap_point_panel_iter.today_date.toordinal() != today_ordinal:
+            logger.critical("today of swap point panel {currency_pair} is not the one of the base currency curve".format(currency_pair=swap_point_panel_iter.currency_pair.label))
+            df_curve_und_list.append(None)
+            continue
+
+        und_ccy = swap_point_panel_iter.currency_pair.underlying
+        basis = und_ccy.number_of_days_1year if basis_input is None else basis_input
+
+        today_date = swap_point_panel_iter.today_date
+        spot_date = swap_point_panel_iter.spot_date
+        spot_rate_value = swap_point_panel_iter.spot_rate.value
+        is_base_und = swap_point_panel_iter.currency_pair.quotation_mode == quotation_mode_enum.base_und
+
+        label_list = rate_columns_iter.label_list
+        mid_array = rate_columns_iter.mid_array
+
+        # get swap point of today --> spot date
+        required_label_list = {date_shift_enum.D2: ["O/N", "T/N"], date_shift_enum.D1: ["O/N"]}.get(und_ccy.spot_date_shift, [])
+        missing_label_list = [label_iter for label_iter in required_label_list if label_iter not in label_list]
+        if missing_label_list:
+            logger.critical("swap point panel {currency_pair} has no swap point {labels}".format(currency_pair=swap_point_panel_iter.currency_pair.label,
+                                                                                              labels=", ".join(missing_label_list)))
+            df_curve_und_list.append(None)
+            continue
+        swap_point_today_spot_value = sum(float(mid_array[label_list.index(label_iter)]) for label_iter in required_label_list)
+
+        # get discount factor of underlying currency , today --> spot
+        df_base_today_value, df_base_spot_value = get_df_base_values([today_date.toordinal(), spot_date.toordinal()]).tolist()
+        df_base_today_spot_value = df_base_spot_value / df_base_today_value
+
+        if is_base_und:
+            df_und_today_spot_value = df_base_today_spot_value * (1 - swap_point_today_spot_value / spot_rate_value)
+        else:
+            df_und_today_spot_value = df_base_today_spot_value / (1 - swap_point_today_spot_value / spot_rate_value)
+
+        if und_ccy.spot_date_shift == date_shift_enum.D2:
+            today_spot_label = "T/N"
+        elif und_ccy.spot_date_shift == date_shift_enum.D1:
+            today_spot_label = "O/N"
+        else:
+            today_spot_label = "TDY"
+
+        # get discount factor of underlying currency , today -> tom , and others
+        label_array = np.array(label_list, dtype=object)
+        is_kept = label_array != "O/N"
+        label_array = label_array[is_kept]
+        swap_point_values = np.asarray(mid_array, dtype=np.float64)[is_kept]
+        start_ordinals = np.asarray(rate_columns_iter.start_ordinal_array)[is_kept]
+        maturity_ordinals = np.asarray(rate_columns_iter.maturity_ordinal_array)[is_kept]
+        is_tn = (label_array == "T/N") & (und_ccy.spot_date_shift == date_shift_enum.D2)
+
+        df_base_spot_maturity_values = get_df_base_values(maturity_ordinals) / df_base_spot_value
+        df_base_start_spot_values = df_base_spot_value / get_df_base_values(start_ordinals)
+
+        if is_base_und:
+            df_und_today_maturity_values = df_und_today_spot_value * df_base_spot_maturity_values / (swap_point_values / spot_rate_value + 1)
+            df_und_today_tom_values = df_und_today_spot_value / (df_base_start_spot_values * (1 - swap_point_values / spot_rate_value))
+        else:
+            df_und_today_maturity_values = df_und_today_spot_value * df_base_spot_maturity_values * (swap_point_values / spot_rate_value + 1)
+            df_und_today_tom_values = df_und_today_spot_value / (df_base_start_spot_values / (1 - swap_point_values / spot_rate_value))
+
+        # implied curve as columns, sorted by maturity date, the today --> spot discount factor first on ties
+        df_und_values = np.concatenate([[df_und_today_spot_value if today_spot_label != "TDY" else 1.0], np.where(is_tn, df_und_today_tom_values, df_und_today_maturity_values)])
+        df_maturity_ordinals = np.concatenate([[spot_date.toordinal()], maturity_ordinals]).astype(np.int32)
+        df_label_list = [today_spot_label] + np.where(is_tn, "O/N", label_array).tolist()
+
+        order = np.argsort(df_maturity_ordinals, kind="stable")
+        df_und_values = df_und_values[order]
+
+        df_curve_und = cls_discount_factor_curve(und_ccy, [], linearization_of_df_curve_und, basis=basis)
+        df_curve_und.set_rate_columns(cls_rate_columns(np.full(len(order), today_ordinal, dtype=np.int32),
+                                                       df_maturity_ordinals[order],
+                                                       df_und_values,
+                                                       df_und_values.copy(),
+                                                       df_und_values.copy(),
+                                                       np.full(len(order), basis, dtype=np.float64),
+                                                       [df_label_list[index_iter] for index_iter in order.tolist()]))
+        df_curve_und_list.append(df_curve_und)
+
+    return df_curve_und_list
+
+
+def create_swap_point_panel_by_market_quote_curves(currency_pair: cls_currency_pair,
+                                                   spot_rate_input: cls_fx_spot_rate,
+                                                   mq_curve_base_ccy: cls_market_quote_curve,
+                                                   mq_curve_und_ccy: cls_market_quote_curve,
+                                                   df_curve_base_linearization: linearization_enum = linearization_enum.log_ds_factor,
+                                                   df_curve_und_linearization: linearization_enum = linearization_enum.log_ds_factor,
+                                                   df_curve_base_basis: int=None,
+                                                   df_curve_und_basis: int=None,
+                                                   set_swap_point_list_when_initial: bool = False
+                                                   )->cls_swap_point_panel:
+
+    df_curve_base_ccy = mq_curve_base_ccy.get_discount_factor_curve(df_curve_base_linearization,df_curve_base_basis)
+    df_curve_und_ccy = mq_curve_und_ccy.get_discount_factor_curve(df_curve_und_linearization, df_curve_und_basis)
+
+    return cls_swap_point_panel(currency_pair, spot_rate_input, df_curve_base_ccy, df_curve_und_ccy, set_swap_point_list_when_initial)
+
+
+def get_curve_content_hash(curve: cls_rate_curve)->str:
+    """
+    Hash of the content of a curve: its type, currency, linearization, basis and the tenors and values of its rates.
+
+    Two curves with the same content have the same hash, whichever objects they are made of.
+    """
+    currency = getattr(curve, 'currency', None)
+    linearization = getattr(curve, 'linearization', None)
+    rate_columns = curve.get_rate_columns()
+
+    content_hash = hashlib.sha1(repr((curve.__class__.__name__,
+                                      currency.label if currency is not None else None,
+                                      linearization.value if linearization is not None else None,
+                                      getattr(curve, 'basis', None),
+                                      rate_columns.label_list)).encode('utf-8'))
+
+    # the same bytes whether the columns come from rate objects or from a file
+    content_hash.update(np.asarray(rate_columns.start_ordinal_array, dtype=np.int64).tobytes())
+    content_hash.update(np.asarray(rate_columns.maturity_ordinal_array, dtype=np.int64).tobytes())
+    for value_array in (rate_columns.mid_array, rate_columns.bid_array, rate_columns.ask_array, rate_columns.basis_array):
+        content_hash.update(np.asarray(value_array, dtype=np.float64).tobytes())
+
+    return content_hash.hexdigest()
+
+
+class cls_rate_dict:
+    """
+    Curves by currency label, with copy-on-write snapshots.
+
+    Each change made through add_curve_to_dict, remove_curve_from_dict or clear_dict increases version.
+    snapshot() returns a frozen rate dict of the same class, sharing the curves with the live one, which
+    is left as it is by later changes: the live dict copies its curve dict on the first change after a snapshot.
+    Curves are expected to be replaced, not modified in place, once they are in a snapshot.
+    """
+    # ids of the snapshots of all rate dicts
+    __snapshot_id_counter = itertools.count(1)
+
+    def __init__(self ,
+                 today_date: datetime.date,
+                 curve_dict: dict=None):
+        self.today_date = today_date
+        self.curve_dict = {} if curve_dict is None else curve_dict
+
+        self.__version = 0
+        self.__snapshot = None
+        self.__snapshot_id = None
+        self.__is_curve_dict_shared = False
+
+        # label -> (curve, rates_state of the curve, content hash)
+        self.__curve_hash_cache = {}
+
+    @property
+    def version(self)->int:
+        return self.__version
+
+    @property
+    def is_snapshot(self)->bool:
+        return self.__snapshot_id is not None
+
+    @property
+    def snapshot_id(self)->int:
+        """
+        Id of the snapshot, increasing over the snapshots of all rate dicts; None for a live rate dict.
+        """
+        return self.__snapshot_id
+
+    def get_curve_by_currency_label(self, currency_label:str)->cls_discount_factor_curve:
+        if currency_label in self.curve_dict:
+            return self.curve_dict[currency_label]
+        else:
+            return None
+
+    def get_curve_hash_by_currency_label(self, currency_label:str)->str:
+        """
+        Content hash of the curve of a currency, see get_curve_content_hash; None if the currency is not in the dict.
+
+        The hashes of a snapshot are the ones of the curves when the snapshot was taken.
+        """
+        if currency_label not in self.curve_dict:
+            return None
+
+        curve = self.curve_dict[currency_label]
+        cached_curve, cached_rates_state, curve_hash = self.__curve_hash_cache.get(currency_label, (None, (None, None), None))
+
+        if self.is_snapshot:
+            return curve_hash
+
+        rates, version = curve.rates_state
+        if cached_curve is curve and cached_rates_state[0] is rates and cached_rates_state[1] == version:
+            return curve_hash
+
+        curve_hash = get_curve_content_hash(curve)
+        self.__curve_hash_cache[currency_label] = (curve, (rates, version), curve_hash)
+        return curve_hash
+
+    def snapshot(self)->'cls_rate_dict':
+        """
+        Frozen copy of the rate dict at its current version, the same object until the next change.
+
+        Returns:
+            cls_rate_dict: rate dict of the same class, whose curve_dict is read only and whose changes are refused
+        """
+        if self.is_snapshot:
+            return self
+
+        if self.__snapshot is None:
+            snapshot = self.__class__.__new__(self.__class__)
+            snapshot.today_date = self.today_date
+            snapshot.curve_dict = types.MappingProxyType(self.curve_dict)
+
+            snapshot.__version = self.__version
+            snapshot.__snapshot = None
+            snapshot.__snapshot_id = next(cls_rate_dict.__snapshot_id_counter)
+            snapshot.__is_curve_dict_shared = True
+            snapshot.__curve_hash_cache = {label: (curve, (None, None), self.get_curve_hash_by_currency_label(label)) for label, curve in self.curve_dict.items()}
+
+            self.__snapshot = snapshot
+            self.__is_curve_dict_shared = True
+
+        return self.__snapshot
+
+    def __prepare_change(self)->bool:
+        if self.is_snapshot:
+            logger.critical("snapshot {snapshot_id} of rate dict can not be changed".format(snapshot_id=self.__snapshot_id))
+            return False
+
+        # copy on write, the curve dict is left to the snapshot
+        if self.__is_curve_dict_shared:
+            self.curve_dict = dict(self.curve_dict)
+            self.__is_curve_dict_shared = False
+
+        self.__snapshot = None
+        self.__version += 1
+        return True
+
+    def add_curve_to_dict(self, label:str, curve:cls_rate_curve)->None:
+        if self.__prepare_change():
+            self.curve_dict[label] = curve
+
+    def remove_curve_from_dict(self, label:str)->None:
+        if self.__prepare_change():
+            del self.curve_dict[label]
+            self.__curve_hash_cache.pop(label, None)
+
+    def clear_dict(self)->None:
+        if self.__prepare_change():
+            self.curve_dict.clear()
+            self.__curve_hash_cache.clear()
+
+
+class cls_discount_factor_curve_dict(cls_rate_dict):
+    def get_swap_point_panel_by_currency_pair(self,currency_pair:cls_currency_pair, spot_rate:cls_fx_spot_rate)->cls_swap_point_panel:
+
+        if currency_pair.base.label in self.curve_dict:
+            df_curve_base_ccy = self.get_curve_by_currency_label(currency_pair.base.label)
+        else:
+            assert("currency {label} is not in dict".format(label=currency_pair.base.label))
+            return None
+
+        if currency_pair.underlying.label in self.curve_dict:
+            df_curve_und_ccy = self.get_curve_by_currency_label(currency_pair.underlying.label)
+        else:
+            assert ("currency {label} is not in dict".format(label=currency_pair.underlying.label))
+            return None
+
+        return cls_swap_point_panel(currency_pair, spot_rate, df_curve_base_ccy, df_curve_und_ccy)
+
+
+class cls_market_quote_curve_dict(cls_rate_dict):
+
+    def get_discount_factor_curve_dict(self,
+                                       linearization:linearization_enum,
+                                       linearization_dict:dict=None,
+                                       executor:concurrent.futures.Executor=None,
+                                       error_dict:dict=None)->cls_discount_factor_curve_dict:
+        """
+        Bootstraps the discount factor curve of every currency.
+
+        Args:
+            linearization: linearization of the discount factor curves
+            linearization_dict: linearization by currency label, overriding linearization for those currencies
+            executor: thread or process pool executor bootstrapping the currencies in parallel, serially if None
+            error_dict: filled with the exception by currency label of the currencies which fail to bootstrap
+
+        Returns:
+            cls_discount_factor_curve_dict: curves in the order of curve_dict whichever order they complete in,
+            without the currencies which fail to bootstrap
+        """
+        df_curve_dict = cls_discount_factor_curve_dict(self.today_date)
+
+        bootstrap_list = []
+        for ccy_label, mq_curve_iter in self.curve_dict.items():
+            linearization_iter = linearization_dict.get(ccy_label, linearization) if linearization_dict is not None else linearization
+
+            if executor is None:
+                bootstrap_list.append((ccy_label, functools.partial(mq_curve_iter.get_discount_factor_curve, linearization_iter, mq_curve_iter.basis)))
+            else:
+                bootstrap_list.append((ccy_label, executor.submit(mq_curve_iter.get_discount_factor_curve, linearization_iter, mq_curve_iter.basis).result))
+
+        for ccy_label, get_df_curve in bootstrap_list:
+            try:
+                df_curve_iter = get_df_curve()
+                if df_curve_iter is None:
+                    raise ValueError("bootstrap returned no curve")
+
+            except Exception as error:
+                logger.critical("discount factor curve of {ccy_label} can not be bootstrapped: {error}".format(ccy_label=ccy_label, error=repr(error)))
+                if error_dict is not None:
+                    error_dict[ccy_label] = error
+                continue
+
+            df_curve_dict.add_curve_to_dict(ccy_label, df_curve_iter)
+
+        return df_curve_dict
+
+
+def save_curve_snapshot(file_path: str, curve_list: list)->None:
+    """
+    Saves discount factor and market quote curves in a columnar format, to be memory-mapped by load_curve_snapshot.
+
+    Two files are written:
+    - file_path + '.npy': the rates of all the curves one after another, as the columns start ordinal,
+      maturity ordinal, mid, bid, ask and basis of a fortran ordered float64 array
+    - file_path + '.json': the tenor labels, currency conventions, basis, linearization and rows of each curve
+
+    Args:
+        file_path: path of the files, without extension
+        curve_list: cls_discount_factor_curve or cls_market_quote_curve
+    """
+    curve_meta_list = []
+    rate_columns_list = []
+    number_of_rows = 0
+
+    for curve_iter in curve_list:
+        if isinstance(curve_iter, cls_discount_factor_curve):
+            curve_type = "discount_factor_curve"
+        elif isinstance(curve_iter, cls_market_quote_curve):
+            curve_type = "market_quote_curve"
+        else:
+            logger.critical("{class_name} can not be saved in a curve snapshot".format(class_name=curve_iter.__class__.__name__))
+            return None
+
+        rate_columns = curve_iter.get_rate_columns()
+        rate_columns_list.append(rate_columns)
+
+        curve_meta_list.append({"curve_type": curve_type,
+                                "currency": curve_iter.currency.label,
+                                "number_of_days_1year": curve_iter.currency.number_of_days_1year,
+                                "spot_date_shift": curve_iter.currency.spot_date_shift.name,
+                                "basis": curve_iter.basis,
+                                "linearization": curve_iter.linearization.value if curve_type == "discount_factor_curve" else None,
+                                "first_row": number_of_rows,
+                                "number_of_rows": len(rate_columns),
+                                "label_list": list(rate_columns.label_list)})
+        number_of_rows += len(rate_columns)
+
+    column_array = np.empty((number_of_rows, 6), dtype=np.float64, order='F')
+    for curve_meta_iter, rate_columns_iter in zip(curve_meta_list, rate_columns_list):
+        rows = slice(curve_meta_iter["first_row"], curve_meta_iter["first_row"] + curve_meta_iter["number_of_rows"])
+        for column, value_array in enumerate((rate_columns_iter.start_ordinal_array, rate_columns_iter.maturity_ordinal_array,
+                                              rate_columns_iter.mid_array, rate_columns_iter.bid_array, rate_columns_iter.ask_array,
+                                              rate_columns_iter.basis_array)):
+            column_array[rows, column] = value_array
+
+    np.save(file_path + ".npy", column_array)
+    with open(file_path + ".json", "w") as meta_file:
+        json.dump({"curve_list": curve_meta_list}, meta_file)
+
+
+def load_curve_snapshot(file_path: str, mmap_mode: str='r')->list:
+    """
+    Loads the curves saved by save_curve_snapshot.
+
+    The curves are backed by the columns of the memory-mapped file: a rate object is created only when asked
+    for by position or label, and all of them when fx_rate_list is first accessed.
+
+    Args:
+        file_path: path of the files, without extension
+        mmap_mode: memory-map mode of numpy.load, None to read the file in memory
+
+    Returns:
+        list: the curves in the order they were saved
+        - the currencies are the ones of currency_registry when the saved conventions are the registered ones,
+          otherwise one cls_currency per currency label with the saved conventions, and a warning is logged
+    """
+    column_array = np.load(file_path + ".npy", mmap_mode=mmap_mode)
+    with open(file_path + ".json", "r") as meta_file:
+        curve_meta_list = json.load(meta_file)["curve_list"]
+
+    currency_dict = {}
+    curve_list = []
+
+    for curve_meta_iter in curve_meta_list:
+        currency = currency_dict.get(curve_meta_iter["currency"])
+        if currency is None:
+            currency = currency_dict[curve_meta_iter["currency"]] = currency_registry.get_currency_by_conventions(curve_meta_iter["currency"],
+                                                                                                                 curve_meta_iter["number_of_days_1year"],
+                                                                                                                 date_shift_enum[curve_meta_iter["spot_date_shift"]])
+            if not currency.is_canonical:
+                logger.warning("conventions of {currency} in snapshot {file_path} are not the registered ones, a currency of its own is used".format(currency=currency.label,
+                                                                                                                                                     file_path=file_path))
+
+        if curve_meta_iter["curve_type"] == "discount_factor_curve":
+            curve = cls_discount_factor_curve(currency, [], linearization_enum(curve_meta_iter["linearization"]), curve_meta_iter["basis"])
+        else:
+            curve = cls_market_quote_curve(currency, [], curve_meta_iter["basis"])
+
+        rows = column_array[curve_meta_iter["first_row"]:curve_meta_iter["first_row"] + curve_meta_iter["number_of_rows"]]
+        curve.set_rate_columns(cls_rate_columns(rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3], rows[:, 4], rows[:, 5], curve_meta_iter["label_list"]))
+
+        curve_list.append(curve)
+
+    return curve_list
+
+
+def get_numbered_rows(opened_file, file_format: str):
+    """
+    Iterates the rows of a CSV or JSONL file with the line number of each in the file.
+
+    Args:
+        opened_file: file opened with newline=""
+        file_format: "csv" or "jsonl"
+
+    Yields:
+        tuple: (line number, row); a row is a dict for CSV, the line to be parsed by json.loads for JSONL,
+        so that a line which is not JSON is reported by the caller with its line number
+        - the line number of a CSV row is the last line of the row, the header being line 1; blank JSONL lines are skipped
+    """
+    if file_format == "csv":
+        row_reader = csv.DictReader(opened_file)
+        for row in row_reader:
+            yield row_reader.line_num, row
+    else:
+        for line_number, line in enumerate(opened_file, 1):
+            if line.strip():
+                yield line_number, line
+
+
+def read_market_quote_curve_dicts(file_path: str,
+                                  file_format: str=None,
+                                  chunk_size: int=10000,
+                                  currency_convention_dict: dict=None,
+                                  error_dict: dict=None):
+    """
+    Streams a file of market quotes as one cls_market_quote_curve_dict per as-of date.
+
+    The file is CSV with a header line, or JSONL with one object per line, with the fields
+    as_of_date, currency, label, start, maturity, mid, bid and ask; dates as YYYY-MM-DD.
+    - bid and ask may be empty, mid may be empty if bid and ask are given
+    - the quotes of an as-of date are contiguous, as-of dates ascending; a quote of an as-of date already
+      emitted is logged and skipped
+    - without as_of_date, the file is one as-of date, the earliest start date
+    The file carries no conventions: the basis and spot date shift of a currency are the ones of currency_convention_dict,
+    otherwise the ones of its canonical currency in currency_registry; a currency with neither is read with the
+    cls_currency defaults (365, D2) and logged.
+
+    Args:
+        file_path: path of the file
+        file_format: "csv" or "jsonl", from the file extension if None
+        chunk_size: number of lines read at a time
+        currency_convention_dict: (number_of_days_1year, spot_date_shift) by currency label, the registry is left as it is
+        error_dict: filled with the error message by line number of the lines skipped
+
+    Yields:
+        cls_market_quote_curve_dict: curves of an as-of date, once all its quotes are read; memory is bounded
+        by the quotes of one as-of date
+    """
+    if file_format is None:
+        file_format = "jsonl" if file_path.lower().endswith((".jsonl", ".json")) else "csv"
+
+    currency_convention_dict = {label.upper(): convention for label, convention in (currency_convention_dict or {}).items()}
+    currency_dict = {}
+
+    def get_currency(ccy_label: str)->cls_currency:
+        currency = currency_dict.get(ccy_label)
+        if currency is None:
+            if ccy_label in currency_convention_dict:
+                currency = currency_registry.get_currency_by_conventions(ccy_label, *currency_convention_dict[ccy_label])
+            else:
+                currency = currency_registry.get_currency(ccy_label)
+                if not currency_registry.is_currency_configured(ccy_label):
+                    logger.warning("conventions of {currency} are not configured, quotes of {file_path} are read with basis {basis} and spot date shift {shift}".format(
+                        currency=ccy_label, file_path=file_path, basis=currency.number_of_days_1year, shift=currency.spot_date_shift.name))
+            currency_dict[ccy_label] = currency
+        return currency
+
+    def create_market_quote_curve_dict(as_of_date: datetime.date, quote_list_dict: dict)->cls_market_quote_curve_dict:
+        if as_of_date is None:
+            as_of_date = min(market_quote_iter.start_date for quote_list_iter in quote_list_dict.values() for market_quote_iter in quote_list_iter)
+
+        mq_curve_dict = cls_market_quote_curve_dict(as_of_date)
+        for ccy_label, quote_list_iter in quote_list_dict.items():
+            mq_curve_dict.add_curve_to_dict(ccy_label, cls_market_quote_curve(get_currency(ccy_label), quote_list_iter))
+        return mq_curve_dict
+
+    def get_float(value)->float:
+        return float(value) if value not in (None, "") else 0
+
+    with open(file_path, "r", newline="") as quote_file:
+        row_iter = get_numbered_rows(quote_file, file_format)
+
+        current_as_of_date = None
+        quote_list_dict = {}
+
+        while True:
+            row_chunk = list(itertools.islice(row_iter, chunk_size))
+            if not row_chunk:
+                break
+
+            for line_number, row in row_chunk:
+                try:
+                    if file_format != "csv":
+                        row = json.loads(row)
+                    as_of_date = datetime.date.fromisoformat(row["as_of_date"]) if row.get("as_of_date") else None
+                    ccy_label = row["currency"].upper().strip()
+                    market_quote = cls_market_quote(get_currency(ccy_label),
+                                                    cls_tenor(datetime.date.fromisoformat(row["start"]), datetime.date.fromisoformat(row["maturity"]), row["label"]),
+                                                    get_float(row.get("mid")),
+                                                    get_float(row.get("bid")),
+                                                    get_float(row.get("ask")))
+                except (KeyError, ValueError, TypeError, AttributeError) as error:
+                    logger.critical("line {line_number} of {file_path} is skipped: {error}".format(line_number=line_number, file_path=file_path, error=repr(error)))
+                    if error_dict is not None:
+                        error_dict[line_number] = repr(error)
+                    continue
+
+                if as_of_date != current_as_of_date:
+                    if as_of_date is not None and current_as_of_date is not None and as_of_date < current_as_of_date:
+                        error = "as-of date {as_of_date} is already emitted".format(as_of_date=as_of_date)
+                        logger.critical("line {line_number} of {file_path} is skipped: {error}".format(line_number=line_number, file_path=file_path, error=error))
+                        if error_dict is not None:
+                            error_dict[line_number] = error
+                        continue
+
+                    if quote_list_dict:
+                        yield create_market_quote_curve_dict(current_as_of_date, quote_list_dict)
+
+                    current_as_of_date = as_of_date
+                    quote_list_dict = {}
+
+                quote_list_dict.setdefault(ccy_label, []).append(market_quote)
+
+        if quote_list_dict:
+            yield create_market_quote_curve_dict(current_as_of_date, quote_list_dict)
\ No newline at end of file
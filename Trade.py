@@ -1,297 +1,796 @@
-#!/usr/bin/python
-# -*- coding: utf-8 -*-
-
-"""
-Trade module for handling FX trading functionality.
-
-This module provides classes and utilities for creating and managing FX trades,
-including spot and forward trades. It handles trade creation, price calculations,
-and trade details.
-
-Classes:
-    product_type_enum: Enumeration of supported FX product types
-    cls_fx_trade: Base class for FX trades
-    cls_spot_forward_trade: Class for spot and forward FX trades
-    simple_cash_flow: Class representing a cash flow
-    cls_spot_forward_trade_detail: Extended spot/forward trade with additional details
-
-Functions:
-    create_fx_trade: Factory function to create FX trades
-    create_fx_trade_detail: Factory function to create detailed FX trades
-
-Dependencies:
-    - datetime: For date handling
-    - log4py: For logging
-    - Rate2: For FX rate and currency functionality
-    - enum: For enumeration support
-"""
-
-import datetime
-from log4py import logger
-import Rate2 as Rate
-from enum import Enum
-
-class product_type_enum(Enum):
-    """Enumeration of supported FX product types."""
-    fx_spot_forward = "fx_spot_forward"
-    fx_time_option = "fx_time_option"
-    fx_ndf = "fx_ndf"
-
-
-class cls_fx_trade:
-    """
-    Base class for FX trades.
-    
-    Represents a foreign exchange trade with core attributes and functionality.
-    Handles trade identification, counterparty details, and price information.
-    """
-    
-    def __init__(self,
-                 trade_uti: str=None,
-                 counterparty: str=None,
-                 portfolio: str=None,
-                 product_type: product_type_enum=None,
-                 trade_date: datetime.date=None,
-                 contract_price: Rate.cls_deal_price=None,
-                 base_ccy_notional: float=None,
-                 und_ccy_notional: float=None):
-        """
-        Initialize an FX trade.
-
-        Args:
-            trade_uti: Unique trade identifier
-            counterparty: Trading counterparty identifier
-            portfolio: Portfolio identifier
-            product_type: Type of FX product
-            trade_date: Date of trade execution
-            contract_price: Price details of the trade
-            base_ccy_notional: Notional amount in base currency
-            und_ccy_notional: Notional amount in underlying currency
-        """
-        self.trade_uti = trade_uti
-        self.counterparty = counterparty
-        self.portfolio = portfolio
-        self.product_type = product_type
-        self.trade_date = trade_date
-        self.contract_price = contract_price
-        self.base_ccy_notional = base_ccy_notional
-        self.und_ccy_notional = und_ccy_notional
-
-    @property
-    def base_ccy_label(self)->str:
-        """Get the base currency label."""
-        return self.contract_price.currency_pair.base.label
-
-    @property
-    def und_ccy_label(self)->str:
-        """Get the underlying currency label."""
-        return self.contract_price.currency_pair.underlying.label
-
-    @property
-    def maturity_date(self)->datetime.date:
-        """Get the trade maturity date."""
-        return self.contract_price.maturity_date
-
-    @property
-    def quotation_mode(self)->Rate.quotation_mode_enum:
-        """Get the quotation mode of the currency pair."""
-        return self.contract_price.currency_pair.quotation_mode
-
-    @property
-    def quotation(self)->str:
-        """Get the currency pair quotation string."""
-        return self.contract_price.currency_pair.quotation
-
-    @property
-    def get_reversed_price(self)->float:
-        """Calculate the reversed price (1/price)."""
-        return 1/self.contract_price.value
-
-    @property
-    def get_reversed_quotation_mode(self)->Rate.quotation_mode_enum:
-        """Get the reversed quotation mode."""
-        return Rate.quotation_mode_enum.base_und if self.quotation_mode == Rate.quotation_mode_enum.und_base else Rate.quotation_mode_enum.und_base
-
-    @property
-    def price(self)->float:
-        """Get the trade price."""
-        return self.contract_price.value
-
-    @property
-    def currency_pair(self)->Rate.cls_currency_pair:
-        """Get the currency pair object."""
-        return self.contract_price.currency_pair
-
-    @property
-    def currency_pair_label(self)->str:
-        """Get the currency pair label."""
-        return self.contract_price.currency_pair.label
-
-class cls_spot_forward_trade(cls_fx_trade):
-    """Class representing spot and forward FX trades."""
-    
-    def __init__(self,
-                 trade_uti: str=None,
-                 counterparty: str=None,
-                 portfolio: str=None,
-                 trade_date: datetime.date=None,
-                 contract_price: Rate.cls_deal_price=None,
-                 base_ccy_notional: float=None,
-                 und_ccy_notional: float=None):
-        """Initialize a spot/forward trade with FX trade attributes."""
-        super().__init__(trade_uti, counterparty, portfolio, product_type_enum.fx_spot_forward, trade_date, contract_price, base_ccy_notional, und_ccy_notional)
-
-
-def create_fx_trade(trade_uti: str=None,
-                    counterparty: str=None,
-                    portfolio: str=None,
-                    trade_date: datetime.date=None,
-                    maturity_date: datetime.date=None,
-                    base_ccy_input: str=None,
-                    quotation_input: str=None,
-                    ccy1_input: str=None,
-                    ccy1_notional: float=None,
-                    ccy2_input: str=None,
-                    ccy2_notional: float=None)->cls_spot_forward_trade:
-    """
-    Factory function to create an FX trade.
-    
-    Creates a spot/forward trade based on input parameters, handling currency pair
-    creation and price calculations.
-
-    Args:
-        trade_uti: Unique trade identifier
-        counterparty: Trading counterparty
-        portfolio: Portfolio identifier
-        trade_date: Trade execution date
-        maturity_date: Trade maturity date
-        base_ccy_input: Base currency code
-        quotation_input: Currency pair quotation string
-        ccy1_input: First currency code
-        ccy1_notional: First currency notional amount
-        ccy2_input: Second currency code
-        ccy2_notional: Second currency notional amount
-
-    Returns:
-        cls_spot_forward_trade: Created trade object
-    """
-    ccy1 = ccy1_input.upper().strip()
-    ccy2 = ccy2_input.upper().strip()
-    base_ccy = base_ccy_input.upper().strip()
-    quotation = quotation_input.upper().strip()
-
-    ccy1_ = Rate.cls_currency(ccy1)
-    ccy2_ = Rate.cls_currency(ccy2)
-
-    if base_ccy == ccy1 :
-        base_ccy_notional = ccy1_notional
-        und_ccy_notional = ccy2_notional
-
-        if quotation == Rate.build_quotation(ccy1, ccy2):
-            ccy_pair = Rate.cls_currency_pair(ccy1_, ccy2_, Rate.quotation_mode_enum.base_und)
-            fx_price = Rate.cls_deal_price(ccy_pair,maturity_date, abs(ccy2_notional/ccy1_notional))
-
-        elif quotation == Rate.build_quotation(ccy2, ccy1):
-            ccy_pair = Rate.cls_currency_pair(ccy1_, ccy2_, Rate.quotation_mode_enum.und_base)
-            fx_price = Rate.cls_deal_price(ccy_pair, maturity_date, abs(ccy1_notional/ccy2_notional))
-
-    elif base_ccy == ccy2 :
-        base_ccy_notional = ccy2_notional
-        und_ccy_notional = ccy1_notional
-
-        if quotation == Rate.build_quotation(ccy1,ccy2):
-            ccy_pair = Rate.cls_currency_pair(ccy2_, ccy1_, Rate.quotation_mode_enum.und_base)
-            fx_price = Rate.cls_deal_price(ccy_pair, maturity_date, abs(ccy2_notional/ccy1_notional))
-
-        elif quotation == Rate.build_quotation(ccy2, ccy1):
-            ccy_pair = Rate.cls_currency_pair(ccy2_, ccy1_, Rate.quotation_mode_enum.base_und)
-            fx_price = Rate.cls_deal_price(ccy_pair, maturity_date, abs(ccy1_notional/ccy2_notional))
-
-    else:
-        fx_price = None
-        base_ccy_notional = None
-        und_ccy_notional = None
-
-    return cls_spot_forward_trade(trade_uti.upper().strip(),counterparty.upper().strip(), portfolio.upper().strip(), trade_date, fx_price, base_ccy_notional,und_ccy_notional)
-
-
-class simple_cash_flow():
-    """Class representing a simple cash flow with amount, date and currency."""
-    
-    def __init__(self,
-                 amount:float,
-                 payment_date:datetime.date,
-                 currency:Rate.cls_currency,
-                 ):
-        """
-        Initialize a cash flow.
-
-        Args:
-            amount: Cash flow amount
-            payment_date: Date of payment
-            currency: Currency of the cash flow
-        """
-        self.amount = amount
-        self.payment_date = payment_date
-        self.currency = currency
-
-
-class cls_spot_forward_trade_detail(cls_spot_forward_trade):
-    """Extended spot/forward trade class with additional price details."""
-    
-    def __init__(self,
-                 trade_uti: str=None,
-                 counterparty: str=None,
-                 portfolio: str=None,
-                 trade_date: datetime.date=None,
-                 contract_price: Rate.cls_deal_price=None,
-                 contract_spot_price: Rate.cls_deal_price = None,
-                 base_ccy_notional: float=None,
-                 und_ccy_notional: float=None):
-        """
-        Initialize a detailed spot/forward trade.
-
-        Additional Args:
-            contract_spot_price: Spot price at trade execution
-        """
-        super().__init__(trade_uti, counterparty, portfolio, trade_date, contract_price, base_ccy_notional, und_ccy_notional)
-
-        self.spot_price = contract_spot_price
-        self.swap_points_value = contract_price.value - contract_spot_price.value
-
-
-def create_fx_trade_detail(trade_uti: str=None,
-                           counterparty: str=None,
-                           portfolio: str=None,
-                           trade_date: datetime.date=None,
-                           maturity_date: datetime.date=None,
-                           base_ccy_input: str=None,
-                           quotation_input: str=None,
-                           ccy1_input: str=None,
-                           ccy1_notional: float=None,
-                           ccy2_input: str=None,
-                           ccy2_notional: float=None,
-                           contract_spot_value: float=None)->cls_spot_forward_trade_detail:
-    """
-    Factory function to create a detailed FX trade.
-    
-    Creates a detailed spot/forward trade with additional spot price information.
-
-    Additional Args:
-        contract_spot_value: Spot price value at trade execution
-
-    Returns:
-        cls_spot_forward_trade_detail: Created detailed trade object
-    """
-    fx_trade = create_fx_trade(trade_uti, counterparty, portfolio, trade_date, maturity_date, base_ccy_input, quotation_input, ccy1_input, ccy1_notional, ccy2_input, ccy2_notional)
-    spot_price = Rate.cls_deal_price(fx_trade.currency_pair, fx_trade.maturity_date, contract_spot_value)
-
-    return cls_spot_forward_trade_detail(fx_trade.trade_uti,
-                                         fx_trade.counterparty,
-                                         fx_trade.portfolio,
-                                         fx_trade.trade_date,
-                                         fx_trade.contract_price,
-                                         spot_price,
-                                         fx_trade.base_ccy_notional,
-                                         fx_trade.und_ccy_notional
-                                        )
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""
+Trade module for handling FX trading functionality.
+
+This module provides classes and utilities for creating and managing FX trades,
+including spot and forward trades. It handles trade creation, price calculations,
+and trade details.
+
+Classes:
+    product_type_enum: Enumeration of supported FX product types
+    cls_fx_trade: Base class for FX trades
+    cls_spot_forward_trade: Class for spot and forward FX trades
+    simple_cash_flow: Class representing a cash flow
+    cls_spot_forward_trade_detail: Extended spot/forward trade with additional details
+    cls_trade_book: Columnar book of spot/forward trades
+
+Functions:
+    create_fx_trade: Factory function to create FX trades
+    create_fx_trade_detail: Factory function to create detailed FX trades
+    create_trade_book_by_trades: Factory function to create a trade book from trades
+    create_trade_book: Factory function to create a trade book from trade columns
+    read_trade_books: Generator of trade books from a trade file, chunk by chunk
+
+Dependencies:
+    - csv, json, itertools: For reading trade files
+    - datetime: For date handling
+    - numpy: For the columns of trade books
+    - log4py: For logging
+    - Rate2: For FX rate and currency functionality
+    - enum: For enumeration support
+"""
+
+import datetime
+import itertools
+import json
+import numpy as np
+from log4py import logger
+import Rate2 as Rate
+from enum import Enum
+
+class product_type_enum(Enum):
+    """Enumeration of supported FX product types."""
+    fx_spot_forward = "fx_spot_forward"
+    fx_time_option = "fx_time_option"
+    fx_ndf = "fx_ndf"
+
+
+class cls_fx_trade:
+    """
+    Base class for FX trades.
+    
+    Represents a foreign exchange trade with core attributes and functionality.
+    Handles trade identification, counterparty details, and price information.
+    """
+    __slots__ = ('trade_uti', 'counterparty', 'portfolio', 'product_type', 'trade_date',
+                 'contract_price', 'base_ccy_notional', 'und_ccy_notional')
+    
+    def __init__(self,
+                 trade_uti: str=None,
+                 counterparty: str=None,
+                 portfolio: str=None,
+                 product_type: product_type_enum=None,
+                 trade_date: datetime.date=None,
+                 contract_price: Rate.cls_deal_price=None,
+                 base_ccy_notional: float=None,
+                 und_ccy_notional: float=None):
+        """
+        Initialize an FX trade.
+
+        Args:
+            trade_uti: Unique trade identifier
+            counterparty: Trading counterparty identifier
+            portfolio: Portfolio identifier
+            product_type: Type of FX product
+            trade_date: Date of trade execution
+            contract_price: Price details of the trade
+            base_ccy_notional: Notional amount in base currency
+            und_ccy_notional: Notional amount in underlying currency
+        """
+        self.trade_uti = trade_uti
+        self.counterparty = counterparty
+        self.portfolio = portfolio
+        self.product_type = product_type
+        self.trade_date = trade_date
+        self.contract_price = contract_price
+        self.base_ccy_notional = base_ccy_notional
+        self.und_ccy_notional = und_ccy_notional
+
+    @property
+    def base_ccy_label(self)->str:
+        """Get the base currency label."""
+        return self.contract_price.currency_pair.base.label
+
+    @property
+    def und_ccy_label(self)->str:
+        """Get the underlying currency label."""
+        return self.contract_price.currency_pair.underlying.label
+
+    @property
+    def maturity_date(self)->datetime.date:
+        """Get the trade maturity date."""
+        return self.contract_price.maturity_date
+
+    @property
+    def quotation_mode(self)->Rate.quotation_mode_enum:
+        """Get the quotation mode of the currency pair."""
+        return self.contract_price.currency_pair.quotation_mode
+
+    @property
+    def quotation(self)->str:
+        """Get the currency pair quotation string."""
+        return self.contract_price.currency_pair.quotation
+
+    @property
+    def get_reversed_price(self)->float:
+        """Calculate the reversed price (1/price)."""
+        return 1/self.contract_price.value
+
+    @property
+    def get_reversed_quotation_mode(self)->Rate.quotation_mode_enum:
+        """Get the reversed quotation mode."""
+        return Rate.quotation_mode_enum.base_und if self.quotation_mode == Rate.quotation_mode_enum.und_base else Rate.quotation_mode_enum.und_base
+
+    @property
+    def price(self)->float:
+        """Get the trade price."""
+        return self.contract_price.value
+
+    @property
+    def currency_pair(self)->Rate.cls_currency_pair:
+        """Get the currency pair object."""
+        return self.contract_price.currency_pair
+
+    @property
+    def currency_pair_label(self)->str:
+        """Get the currency pair label."""
+        return self.contract_price.currency_pair.label
+
+class cls_spot_forward_trade(cls_fx_trade):
+    """Class representing spot and forward FX trades."""
+    __slots__ = ()
+    
+    def __init__(self,
+                 trade_uti: str=None,
+                 counterparty: str=None,
+                 portfolio: str=None,
+                 trade_date: datetime.date=None,
+                 contract_price: Rate.cls_deal_price=None,
+                 base_ccy_notional: float=None,
+                 und_ccy_notional: float=None):
+        """Initialize a spot/forward trade with FX trade attributes."""
+        super().__init__(trade_uti, counterparty, portfolio, product_type_enum.fx_spot_forward, trade_date, contract_price, base_ccy_notional, und_ccy_notional)
+
+
+def create_fx_trade(trade_uti: str=None,
+                    counterparty: str=None,
+                    portfolio: str=None,
+                    trade_date: datetime.date=None,
+                    maturity_date: datetime.date=None,
+                    base_ccy_input: str=None,
+                    quotation_input: str=None,
+                    ccy1_input: str=None,
+                    ccy1_notional: float=None,
+                    ccy2_input: str=None,
+                    ccy2_notional: float=None)->cls_spot_forward_trade:
+    """
+    Factory function to create an FX trade.
+    
+    Creates a spot/forward trade based on input parameters, handling currency pair
+    creation and price calculations.
+
+    Args:
+        trade_uti: Unique trade identifier
+        counterparty: Trading counterparty
+        portfolio: Portfolio identifier
+        trade_date: Trade execution date
+        maturity_date: Trade maturity date
+        base_ccy_input: Base currency code
+        quotation_input: Currency pair quotation string
+        ccy1_input: First currency code
+        ccy1_notional: First currency notional amount
+        ccy2_input: Second currency code
+        ccy2_notional: Second currency notional amount
+
+    Returns:
+        cls_spot_forward_trade: Created trade object
+    """
+    ccy1 = ccy1_input.upper().strip()
+    ccy2 = ccy2_input.upper().strip()
+    base_ccy = base_ccy_input.upper().strip()
+    quotation = quotation_input.upper().strip()
+
+    # canonical currency pairs, shared by all trades
+    if base_ccy == ccy1 :
+        base_ccy_notional = ccy1_notional
+        und_ccy_notional = ccy2_notional
+
+        if quotation == Rate.build_quotation(ccy1, ccy2):
+            ccy_pair = Rate.currency_registry.get_currency_pair(ccy1, ccy2, Rate.quotation_mode_enum.base_und)
+            fx_price = Rate.cls_deal_price(ccy_pair,maturity_date, abs(ccy2_notional/ccy1_notional))
+
+        elif quotation == Rate.build_quotation(ccy2, ccy1):
+            ccy_pair = Rate.currency_registry.get_currency_pair(ccy1, ccy2, Rate.quotation_mode_enum.und_base)
+            fx_price = Rate.cls_deal_price(ccy_pair, maturity_date, abs(ccy1_notional/ccy2_notional))
+
+    elif base_ccy == ccy2 :
+        base_ccy_notional = ccy2_notional
+        und_ccy_notional = ccy1_notional
+
+        if quotation == Rate.build_quotation(ccy1,ccy2):
+            ccy_pair = Rate.currency_registry.get_currency_pair(ccy2, ccy1, Rate.quotation_mode_enum.und_base)
+            fx_price = Rate.cls_deal_price(ccy_pair, maturity_date, abs(ccy2_notional/ccy1_notional))
+
+        elif quotation == Rate.build_quotation(ccy2, ccy1):
+            ccy_pair = Rate.currency_registry.get_currency_pair(ccy2, ccy1, Rate.quotation_mode_enum.base_und)
+            fx_price = Rate.cls_deal_price(ccy_pair, maturity_date, abs(ccy1_notional/ccy2_notional))
+
+    else:
+        fx_price = None
+        base_ccy_notional = None
+        und_ccy_notional = None
+
+    return cls_spot_forward_trade(trade_uti.upper().strip(),counterparty.upper().strip(), portfolio.upper().strip(), trade_date, fx_price, base_ccy_notional,und_ccy_notional)
+
+
+class simple_cash_flow():
+    """Class representing a simple cash flow with amount, date and currency."""
+    __slots__ = ('amount', 'payment_date', 'currency')
+    
+    def __init__(self,
+                 amount:float,
+                 payment_date:datetime.date,
+                 currency:Rate.cls_currency,
+                 ):
+        """
+        Initialize a cash flow.
+
+        Args:
+            amount: Cash flow amount
+            payment_date: Date of payment
+            currency: Currency of the cash flow
+        """
+        self.amount = amount
+        self.payment_date = payment_date
+        self.currency = currency
+
+
+class cls_spot_forward_trade_detail(cls_spot_forward_trade):
+    """Extended spot/forward trade class with additional price details."""
+    __slots__ = ('spot_price', 'swap_points_value')
+    
+    def __init__(self,
+                 trade_uti: str=None,
+                 counterparty: str=None,
+                 portfolio: str=None,
+                 trade_date: datetime.date=None,
+                 contract_price: Rate.cls_deal_price=None,
+                 contract_spot_price: Rate.cls_deal_price = None,
+                 base_ccy_notional: float=None,
+                 und_ccy_notional: float=None):
+        """
+        Initialize a detailed spot/forward trade.
+
+        Additional Args:
+            contract_spot_price: Spot price at trade execution
+        """
+        super().__init__(trade_uti, counterparty, portfolio, trade_date, contract_price, base_ccy_notional, und_ccy_notional)
+
+        self.spot_price = contract_spot_price
+        self.swap_points_value = contract_price.value - contract_spot_price.value
+
+
+def create_fx_trade_detail(trade_uti: str=None,
+                           counterparty: str=None,
+                           portfolio: str=None,
+                           trade_date: datetime.date=None,
+                           maturity_date: datetime.date=None,
+                           base_ccy_input: str=None,
+                           quotation_input: str=None,
+                           ccy1_input: str=None,
+                           ccy1_notional: float=None,
+                           ccy2_input: str=None,
+                           ccy2_notional: float=None,
+                           contract_spot_value: float=None)->cls_spot_forward_trade_detail:
+    """
+    Factory function to create a detailed FX trade.
+    
+    Creates a detailed spot/forward trade with additional spot price information.
+
+    Additional Args:
+        contract_spot_value: Spot price value at trade execution
+
+    Returns:
+        cls_spot_forward_trade_detail: Created detailed trade object
+    """
+    fx_trade = create_fx_trade(trade_uti, counterparty, portfolio, trade_date, maturity_date, base_ccy_input, quotation_input, ccy1_input, ccy1_notional, ccy2_input, ccy2_notional)
+    spot_price = Rate.cls_deal_price(fx_trade.currency_pair, fx_trade.maturity_date, contract_spot_value)
+
+    return cls_spot_forward_trade_detail(fx_trade.trade_uti,
+                                         fx_trade.counterparty,
+                                         fx_trade.portfolio,
+                                         fx_trade.trade_date,
+                                         fx_trade.contract_price,
+                                         spot_price,
+                                         fx_trade.base_ccy_notional,
+                                         fx_trade.und_ccy_notional
+                                        )
+
+
+def get_ordinal_array_by_dates_or_ordinals(dates, error_list: list=None, name: str="date")->np.ndarray:
+    """
+    Ordinals of a date column given as datetime.date or as int ordinals, in a list or an array.
+
+    Args:
+        dates: datetime.date or int ordinals
+        error_list: error message by row, the rows which are not dates get 0 and their error here if they have none yet;
+            without it, a row which is not a date raises TypeError
+        name: name of the column in the error messages
+
+    Returns:
+        np.ndarray: int32 ordinals
+    """
+    date_array = np.asarray(dates)
+    if date_array.dtype.kind in "iu":
+        return date_array.astype(np.int32)
+
+    ordinal_array = np.zeros(len(date_array), dtype=np.int32)
+    for row, date_iter in enumerate(date_array.tolist()):
+        if isinstance(date_iter, datetime.date):
+            ordinal_array[row] = date_iter.toordinal()
+        elif isinstance(date_iter, (int, np.integer)) and not isinstance(date_iter, bool):
+            ordinal_array[row] = date_iter
+        else:
+            error = "{name} {date} is not a date".format(name=name, date=repr(date_iter))
+            if error_list is None:
+                raise TypeError(error)
+            if error_list[row] is None:
+                error_list[row] = error
+    return ordinal_array
+
+
+def get_float_array_by_values(values, error_list: list, name: str)->np.ndarray:
+    """
+    Float column of values, converted as a whole, else row by row.
+
+    Args:
+        values: numbers, or strings of numbers
+        error_list: error message by row, the rows which are not numbers get nan and their error here if they have none yet
+        name: name of the column in the error messages
+
+    Returns:
+        np.ndarray: float64 values
+    """
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+
+    value_array = np.full(len(values), np.nan, dtype=np.float64)
+    for row, value_iter in enumerate(values):
+        try:
+            value_array[row] = float(value_iter)
+        except (TypeError, ValueError):
+            if error_list[row] is None:
+                error_list[row] = "{name} {value} is not a number".format(name=name, value=repr(value_iter))
+    return value_array
+
+
+def get_codes_by_labels(label_list: list, normalize: bool=False)->tuple:
+    """
+    Encode labels as int codes, in order of first appearance.
+
+    Args:
+        label_list: Labels to encode
+        normalize: Uppercase and strip the labels, once per distinct label, as create_fx_trade does.
+            Labels equal once normalized share their code, None is normalized to ""
+
+    Returns:
+        tuple: (np.ndarray of int32 codes, list of the labels by code)
+    """
+    code_dict = {}
+    code_array = np.fromiter((code_dict.setdefault(label, len(code_dict)) for label in label_list), dtype=np.int32, count=len(label_list))
+
+    if not normalize:
+        return (code_array, list(code_dict))
+
+    normalized_code_array, normalized_label_list = get_codes_by_labels([str(label).upper().strip() if label is not None else "" for label in code_dict])
+    return (normalized_code_array[code_array] if len(code_array) > 0 else code_array, normalized_label_list)
+
+
+class cls_trade_book:
+    """
+    Columnar book of spot/forward trades.
+
+    Trades are held as arrays instead of one object per trade: counterparties, portfolios and
+    currency pairs as int codes into label lists, dates as ordinals, notionals and prices as float64.
+    Iterating the book, or indexing it, creates cls_spot_forward_trade views one at a time, so code
+    working on trade objects works on a book unchanged.
+
+    Attributes:
+        trade_uti_list: Unique trade identifiers
+        counterparty_code_array, counterparty_label_list: Counterparty of each trade
+        portfolio_code_array, portfolio_label_list: Portfolio of each trade
+        currency_pair_code_array, currency_pair_list: Canonical currency pair of each trade
+        trade_date_ordinal_array, maturity_ordinal_array: Trade and maturity dates as ordinals
+        base_ccy_notional_array, und_ccy_notional_array: Notional amounts
+        price_array: Contract price, in the quotation mode of the currency pair
+        spot_price_array: Contract spot price, None for books of trades without one
+        quotation_mode_array: 1 for base_und, -1 for und_base pairs
+    """
+    def __init__(self,
+                 trade_uti_list: list,
+                 counterparty_code_array: np.ndarray,
+                 counterparty_label_list: list,
+                 portfolio_code_array: np.ndarray,
+                 portfolio_label_list: list,
+                 currency_pair_code_array: np.ndarray,
+                 currency_pair_list: list,
+                 trade_date_ordinal_array: np.ndarray,
+                 maturity_ordinal_array: np.ndarray,
+                 base_ccy_notional_array: np.ndarray,
+                 und_ccy_notional_array: np.ndarray,
+                 price_array: np.ndarray,
+                 spot_price_array: np.ndarray=None):
+        """
+        Initialize a trade book from its columns.
+
+        Args:
+            trade_uti_list: Unique trade identifiers
+            counterparty_code_array: Code of the counterparty of each trade in counterparty_label_list
+            counterparty_label_list: Counterparty labels by code
+            portfolio_code_array: Code of the portfolio of each trade in portfolio_label_list
+            portfolio_label_list: Portfolio labels by code
+            currency_pair_code_array: Code of the currency pair of each trade in currency_pair_list
+            currency_pair_list: Currency pairs by code
+            trade_date_ordinal_array: Trade dates as ordinals
+            maturity_ordinal_array: Maturity dates as ordinals
+            base_ccy_notional_array: Notional amounts in base currency
+            und_ccy_notional_array: Notional amounts in underlying currency
+            price_array: Contract prices
+            spot_price_array: Contract spot prices, optional
+        """
+        self.trade_uti_list = trade_uti_list
+        self.counterparty_code_array = np.asarray(counterparty_code_array, dtype=np.int32)
+        self.counterparty_label_list = counterparty_label_list
+        self.portfolio_code_array = np.asarray(portfolio_code_array, dtype=np.int32)
+        self.portfolio_label_list = portfolio_label_list
+        self.currency_pair_code_array = np.asarray(currency_pair_code_array, dtype=np.int32)
+        self.currency_pair_list = currency_pair_list
+        self.trade_date_ordinal_array = np.asarray(trade_date_ordinal_array, dtype=np.int32)
+        self.maturity_ordinal_array = np.asarray(maturity_ordinal_array, dtype=np.int32)
+        self.base_ccy_notional_array = np.asarray(base_ccy_notional_array, dtype=np.float64)
+        self.und_ccy_notional_array = np.asarray(und_ccy_notional_array, dtype=np.float64)
+        self.price_array = np.asarray(price_array, dtype=np.float64)
+        self.spot_price_array = np.asarray(spot_price_array, dtype=np.float64) if spot_price_array is not None else None
+
+        # quotation mode of each trade, from the one of its currency pair
+        quotation_mode_by_code = np.array([1 if currency_pair_iter.quotation_mode == Rate.quotation_mode_enum.base_und else -1
+                                           for currency_pair_iter in currency_pair_list], dtype=np.int8)
+        self.quotation_mode_array = quotation_mode_by_code[self.currency_pair_code_array] if len(currency_pair_list) > 0 else np.zeros(0, dtype=np.int8)
+
+    def __len__(self)->int:
+        """Get the number of trades."""
+        return len(self.trade_uti_list)
+
+    def __getitem__(self, position: int)->cls_spot_forward_trade:
+        """Get a trade view by position."""
+        return self.get_trade(position)
+
+    def __iter__(self):
+        """Iterate the trades as views, created one at a time."""
+        for position in range(len(self)):
+            yield self.get_trade(position)
+
+    def get_trade(self, position: int)->cls_spot_forward_trade:
+        """
+        Create the trade object of a position.
+
+        Args:
+            position: Position of the trade in the book
+
+        Returns:
+            cls_spot_forward_trade: Trade view, cls_spot_forward_trade_detail for books with spot prices
+        """
+        if position < 0:
+            position += len(self)
+
+        currency_pair = self.currency_pair_list[self.currency_pair_code_array[position]]
+        maturity_date = datetime.date.fromordinal(int(self.maturity_ordinal_array[position]))
+        contract_price = Rate.cls_deal_price(currency_pair, maturity_date, float(self.price_array[position]))
+
+        trade_args = (self.trade_uti_list[position],
+                      self.counterparty_label_list[self.counterparty_code_array[position]],
+                      self.portfolio_label_list[self.portfolio_code_array[position]],
+                      datetime.date.fromordinal(int(self.trade_date_ordinal_array[position])),
+                      contract_price)
+
+        if self.spot_price_array is None:
+            return cls_spot_forward_trade(*trade_args,
+                                          float(self.base_ccy_notional_array[position]),
+                                          float(self.und_ccy_notional_array[position]))
+
+        return cls_spot_forward_trade_detail(*trade_args,
+                                             Rate.cls_deal_price(currency_pair, maturity_date, float(self.spot_price_array[position])),
+                                             float(self.base_ccy_notional_array[position]),
+                                             float(self.und_ccy_notional_array[position]))
+
+
+def create_trade_book_by_trades(trade_list: list)->cls_trade_book:
+    """
+    Factory function to create a trade book from spot/forward trades.
+
+    Args:
+        trade_list: cls_spot_forward_trade objects, all of them or none with a spot price
+
+    Returns:
+        cls_trade_book: Book of the trades, in the same order
+    """
+    counterparty_code_array, counterparty_label_list = get_codes_by_labels([trade_iter.counterparty for trade_iter in trade_list])
+    portfolio_code_array, portfolio_label_list = get_codes_by_labels([trade_iter.portfolio for trade_iter in trade_list])
+    currency_pair_code_array, currency_pair_list = get_codes_by_labels([trade_iter.currency_pair for trade_iter in trade_list])
+
+    has_spot_price = len(trade_list) > 0 and all(isinstance(trade_iter, cls_spot_forward_trade_detail) for trade_iter in trade_list)
+
+    return cls_trade_book([trade_iter.trade_uti for trade_iter in trade_list],
+                          counterparty_code_array,
+                          counterparty_label_list,
+                          portfolio_code_array,
+                          portfolio_label_list,
+                          currency_pair_code_array,
+                          currency_pair_list,
+                          Rate.get_ordinal_array_by_dates([trade_iter.trade_date for trade_iter in trade_list]),
+                          Rate.get_ordinal_array_by_dates([trade_iter.maturity_date for trade_iter in trade_list]),
+                          [trade_iter.base_ccy_notional for trade_iter in trade_list],
+                          [trade_iter.und_ccy_notional for trade_iter in trade_list],
+                          [trade_iter.price for trade_iter in trade_list],
+                          [trade_iter.spot_price.value for trade_iter in trade_list] if has_spot_price else None)
+
+
+
+def create_trade_book(trade_uti_list: list,
+                      counterparty_list: list,
+                      portfolio_list: list,
+                      trade_dates,
+                      maturity_dates,
+                      base_ccy_list: list,
+                      quotation_list: list,
+                      ccy1_list: list,
+                      ccy1_notionals,
+                      ccy2_list: list,
+                      ccy2_notionals,
+                      contract_spot_values=None,
+                      error_dict: dict=None)->cls_trade_book:
+    """
+    Factory function to create a trade book from trade columns, the bulk version of create_fx_trade.
+
+    Strings are normalized once per distinct value and the currency pair and price convention are
+    resolved once per distinct (ccy1, ccy2, base currency, quotation), the rest is done on whole columns.
+    Rows create_fx_trade would create without price (base currency not in the trade, quotation not of
+    its currencies) or with a price which is not finite and positive are left out of the book and reported,
+    and so are the rows without trade uti, with a date which is not a date or an amount which is not a number.
+
+    Args:
+        trade_uti_list: Unique trade identifiers
+        counterparty_list: Trading counterparties
+        portfolio_list: Portfolio identifiers
+        trade_dates: Trade execution dates, as datetime.date or int ordinals
+        maturity_dates: Trade maturity dates, as datetime.date or int ordinals
+        base_ccy_list: Base currency codes
+        quotation_list: Currency pair quotation strings
+        ccy1_list: First currency codes
+        ccy1_notionals: First currency notional amounts
+        ccy2_list: Second currency codes
+        ccy2_notionals: Second currency notional amounts
+        contract_spot_values: Spot price values at trade execution, optional
+        error_dict: filled with the error message by row of the rows left out of the book
+
+    Returns:
+        cls_trade_book: Book of the valid rows, in the same order, None if the columns are not of the same length
+    """
+    number_of_rows = len(trade_uti_list)
+    column_list = [counterparty_list, portfolio_list, trade_dates, maturity_dates, base_ccy_list, quotation_list,
+                   ccy1_list, ccy1_notionals, ccy2_list, ccy2_notionals]
+    if contract_spot_values is not None:
+        column_list.append(contract_spot_values)
+
+    if any(len(column_iter) != number_of_rows for column_iter in column_list):
+        logger.critical("trade columns are not of the same length, trade book can not be created")
+        return None
+
+    # values converted row by row where a column can not be converted as a whole, the rows which fail are reported
+    conversion_error_list = [None] * number_of_rows
+    for row in [row for row, trade_uti in enumerate(trade_uti_list) if trade_uti is None]:
+        conversion_error_list[row] = "trade uti is missing"
+
+    trade_date_ordinal_array = get_ordinal_array_by_dates_or_ordinals(trade_dates, conversion_error_list, "trade date")
+    maturity_ordinal_array = get_ordinal_array_by_dates_or_ordinals(maturity_dates, conversion_error_list, "maturity date")
+    ccy1_notional_array = get_float_array_by_values(ccy1_notionals, conversion_error_list, "ccy1 notional")
+    ccy2_notional_array = get_float_array_by_values(ccy2_notionals, conversion_error_list, "ccy2 notional")
+    spot_price_array = get_float_array_by_values(contract_spot_values, conversion_error_list, "spot price") if contract_spot_values is not None else None
+
+    is_converted_array = np.fromiter((error_iter is None for error_iter in conversion_error_list), dtype=bool, count=number_of_rows)
+
+    # currencies share one code space, so that ccy1, ccy2 and base currency codes can be compared
+    ccy_code_array, ccy_label_list = get_codes_by_labels(list(ccy1_list) + list(ccy2_list) + list(base_ccy_list), True)
+    ccy1_code_array = ccy_code_array[:number_of_rows]
+    ccy2_code_array = ccy_code_array[number_of_rows:2*number_of_rows]
+    base_ccy_code_array = ccy_code_array[2*number_of_rows:]
+    quotation_code_array, quotation_label_list = get_codes_by_labels(quotation_list, True)
+
+    # one key per distinct (ccy1, ccy2, base currency, quotation), resolved once each
+    number_of_ccys = np.int64(max(len(ccy_label_list), 1))
+    key_array = ((ccy1_code_array.astype(np.int64) * number_of_ccys + ccy2_code_array) * number_of_ccys + base_ccy_code_array) * len(quotation_label_list) + quotation_code_array
+    key_unique_array, key_inverse_array = np.unique(key_array, return_inverse=True)
+
+    key_error_list = []
+    key_is_base_ccy1_array = np.zeros(len(key_unique_array), dtype=bool)
+    key_is_base_und_array = np.zeros(len(key_unique_array), dtype=bool)
+    key_currency_pair_code_array = np.zeros(len(key_unique_array), dtype=np.int32)
+    currency_pair_dict = {}
+
+    for key_position, key_iter in enumerate(key_unique_array.tolist()):
+        key_iter, quotation_code = divmod(key_iter, len(quotation_label_list))
+        key_iter, base_ccy_code = divmod(key_iter, int(number_of_ccys))
+        ccy1_code, ccy2_code = divmod(key_iter, int(number_of_ccys))
+
+        ccy1 = ccy_label_list[ccy1_code]
+        ccy2 = ccy_label_list[ccy2_code]
+        base_ccy = ccy_label_list[base_ccy_code]
+        quotation = quotation_label_list[quotation_code]
+
+        if ccy1 == "" or ccy2 == "" or ccy1 == ccy2:
+            key_error_list.append("currencies {ccy1} and {ccy2} are not a currency pair".format(ccy1=ccy1, ccy2=ccy2))
+            continue
+
+        if base_ccy not in (ccy1, ccy2):
+            key_error_list.append("base currency {base_ccy} is neither {ccy1} nor {ccy2}".format(base_ccy=base_ccy, ccy1=ccy1, ccy2=ccy2))
+            continue
+
+        und_ccy = ccy2 if base_ccy == ccy1 else ccy1
+        if quotation == Rate.build_quotation(base_ccy, und_ccy):
+            quotation_mode = Rate.quotation_mode_enum.base_und
+        elif quotation == Rate.build_quotation(und_ccy, base_ccy):
+            quotation_mode = Rate.quotation_mode_enum.und_base
+        else:
+            key_error_list.append("quotation {quotation} is not of {ccy1} and {ccy2}".format(quotation=quotation, ccy1=ccy1, ccy2=ccy2))
+            continue
+
+        key_error_list.append(None)
+        key_is_base_ccy1_array[key_position] = base_ccy == ccy1
+        key_is_base_und_array[key_position] = quotation_mode == Rate.quotation_mode_enum.base_und
+        key_currency_pair_code_array[key_position] = currency_pair_dict.setdefault(Rate.currency_registry.get_currency_pair(base_ccy, und_ccy, quotation_mode),
+                                                                                    len(currency_pair_dict))
+
+    # notionals and prices on whole columns, the way create_fx_trade does per trade
+    is_base_ccy1_array = key_is_base_ccy1_array[key_inverse_array]
+    base_ccy_notional_array = np.where(is_base_ccy1_array, ccy1_notional_array, ccy2_notional_array)
+    und_ccy_notional_array = np.where(is_base_ccy1_array, ccy2_notional_array, ccy1_notional_array)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        price_array = np.where(key_is_base_und_array[key_inverse_array], np.abs(und_ccy_notional_array/base_ccy_notional_array), np.abs(base_ccy_notional_array/und_ccy_notional_array))
+
+    key_is_valid_array = np.fromiter((error_iter is None for error_iter in key_error_list), dtype=bool, count=len(key_error_list))
+    is_valid_array = key_is_valid_array[key_inverse_array]
+    is_price_valid_array = np.isfinite(price_array) & (price_array > 0)
+
+    if spot_price_array is not None:
+        is_spot_price_valid_array = np.isfinite(spot_price_array) & (spot_price_array > 0)
+    else:
+        is_spot_price_valid_array = np.ones(number_of_rows, dtype=bool)
+
+    is_row_valid_array = is_converted_array & is_valid_array & is_price_valid_array & is_spot_price_valid_array
+
+    for row in np.flatnonzero(~is_row_valid_array).tolist():
+        if not is_converted_array[row]:
+            error = conversion_error_list[row]
+        elif not is_valid_array[row]:
+            error = key_error_list[key_inverse_array[row]]
+        elif not is_price_valid_array[row]:
+            error = "notionals {ccy1_notional} and {ccy2_notional} do not give a price".format(ccy1_notional=ccy1_notional_array[row], ccy2_notional=ccy2_notional_array[row])
+        else:
+            error = "spot price {spot_price} is not a price".format(spot_price=spot_price_array[row])
+
+        logger.critical("trade {trade_uti} at row {row} is left out of the trade book: {error}".format(trade_uti=trade_uti_list[row], row=row, error=error))
+        if error_dict is not None:
+            error_dict[row] = error
+
+    valid_row_array = np.flatnonzero(is_row_valid_array)
+    counterparty_code_array, counterparty_label_list = get_codes_by_labels([counterparty_list[row] for row in valid_row_array.tolist()], True)
+    portfolio_code_array, portfolio_label_list = get_codes_by_labels([portfolio_list[row] for row in valid_row_array.tolist()], True)
+
+    return cls_trade_book([str(trade_uti_list[row]).upper().strip() for row in valid_row_array.tolist()],
+                          counterparty_code_array,
+                          counterparty_label_list,
+                          portfolio_code_array,
+                          portfolio_label_list,
+                          key_currency_pair_code_array[key_inverse_array[valid_row_array]],
+                          list(currency_pair_dict),
+                          trade_date_ordinal_array[valid_row_array],
+                          maturity_ordinal_array[valid_row_array],
+                          base_ccy_notional_array[valid_row_array],
+                          und_ccy_notional_array[valid_row_array],
+                          price_array[valid_row_array],
+                          spot_price_array[valid_row_array] if spot_price_array is not None else None)
+
+
+def read_trade_books(file_path: str, file_format: str=None, chunk_size: int=10000, error_dict: dict=None):
+    """
+    Streams a file of spot/forward trades as one cls_trade_book per chunk of lines.
+
+    The file is CSV with a header line, or JSONL with one object per line, with the fields
+    trade_uti, counterparty, portfolio, trade_date, maturity_date, base_ccy, quotation, ccy1,
+    ccy1_notional, ccy2 and ccy2_notional; dates as YYYY-MM-DD. With a contract_spot_value field
+    in the first line, every trade of the file is read with its spot price.
+    Trades are normalized and validated as create_trade_book does; lines which can not be parsed or
+    are left out of their book are logged and skipped.
+
+    Args:
+        file_path: path of the file
+        file_format: "csv" or "jsonl", from the file extension if None
+        chunk_size: number of lines read at a time
+        error_dict: filled with the error message by line number of the lines skipped
+
+    Yields:
+        cls_trade_book: trades of a chunk, in file order, as soon as the chunk is read; memory is bounded
+        by chunk_size rather than by the size of the file
+    """
+    if file_format is None:
+        file_format = "jsonl" if file_path.lower().endswith((".jsonl", ".json")) else "csv"
+
+    field_list = ["trade_uti", "counterparty", "portfolio", "base_ccy", "quotation", "ccy1", "ccy2"]
+
+    with open(file_path, "r", newline="") as trade_file:
+        row_iter = Rate.get_numbered_rows(trade_file, file_format)
+
+        has_spot_value = None
+
+        while True:
+            row_chunk = list(itertools.islice(row_iter, chunk_size))
+            if not row_chunk:
+                break
+
+            column_dict = {field: [] for field in field_list}
+            value_list = []
+            line_number_list = []
+
+            for line_number, row in row_chunk:
+                try:
+                    if file_format != "csv":
+                        row = json.loads(row)
+                    if has_spot_value is None:
+                        has_spot_value = "contract_spot_value" in row
+                    label_list = [row[field] for field in field_list]
+                    values = (datetime.date.fromisoformat(row["trade_date"]).toordinal(),
+                              datetime.date.fromisoformat(row["maturity_date"]).toordinal(),
+                              float(row["ccy1_notional"]),
+                              float(row["ccy2_notional"]),
+                              float(row["contract_spot_value"]) if has_spot_value else 0.0)
+                except (KeyError, ValueError, TypeError, AttributeError) as error:
+                    logger.critical("line {line_number} of {file_path} is skipped: {error}".format(line_number=line_number, file_path=file_path, error=repr(error)))
+                    if error_dict is not None:
+                        error_dict[line_number] = repr(error)
+                    continue
+
+                for field, label in zip(field_list, label_list):
+                    column_dict[field].append(label)
+                value_list.append(values)
+                line_number_list.append(line_number)
+
+            if not line_number_list:
+                continue
+
+            value_array = np.array(value_list, dtype=np.float64)
+            book_error_dict = {}
+            trade_book = create_trade_book(column_dict["trade_uti"],
+                                           column_dict["counterparty"],
+                                           column_dict["portfolio"],
+                                           value_array[:, 0].astype(np.int32),
+                                           value_array[:, 1].astype(np.int32),
+                                           column_dict["base_ccy"],
+                                           column_dict["quotation"],
+                                           column_dict["ccy1"],
+                                           value_array[:, 2],
+                                           column_dict["ccy2"],
+                                           value_array[:, 3],
+                                           value_array[:, 4] if has_spot_value else None,
+                                           book_error_dict)
+
+            if error_dict is not None:
+                for row, error in book_error_dict.items():
+                    error_dict[line_number_list[row]] = error
+
+            if len(trade_book) > 0:
+                yield trade_book
\ No newline at end of file
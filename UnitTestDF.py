@@ -3,9 +3,15 @@
 
 import unittest
 
+import concurrent.futures
 import datetime
+import json
+import os
+import pickle
+import tempfile
 
 import Rate2 as Rate
+from log4py import logger
 
 
 
@@ -36,6 +42,57 @@ class Test_cls_currency_pair(unittest.TestCase):
         self.assertEqual(USDEUR.get_reversed_quotation_mode(), Rate.quotation_mode_enum.base_und)
 
 
+class Test_cls_currency_registry(unittest.TestCase):
+    def test_init(self):
+        registry = Rate.cls_currency_registry()
+
+        EURUSD = registry.get_currency_pair("eur", "USD", Rate.quotation_mode_enum.base_und)
+        self.assertIs(registry.get_currency_pair("EUR", "USD", Rate.quotation_mode_enum.base_und), EURUSD)
+        self.assertIs(registry.get_currency("EUR"), EURUSD.base)
+        self.assertIsNot(registry.get_currency_pair("EUR", "USD", Rate.quotation_mode_enum.und_base), EURUSD)
+
+        # conventions configured later replace the canonical instances, those handed out are left as they are
+        USD = registry.set_currency_convention("USD", 360, Rate.date_shift_enum.D1)
+        self.assertIs(registry.get_currency("USD"), USD)
+        self.assertIsNot(EURUSD.underlying, USD)
+        self.assertNotEqual(EURUSD.underlying, USD)
+        self.assertEqual(EURUSD.underlying.number_of_days_1year, 365)
+        self.assertIs(registry.set_currency_convention("USD", 360, Rate.date_shift_enum.D1), USD)
+        self.assertTrue(registry.is_currency_configured("usd"))
+        self.assertFalse(registry.is_currency_configured("EUR"))
+
+        registry.set_currency_convention("EUR", 360, Rate.date_shift_enum.D1)
+        self.assertEqual(EURUSD.day_shift, Rate.date_shift_enum.D2)
+        self.assertEqual(registry.get_currency_pair("EUR", "USD", Rate.quotation_mode_enum.base_und).day_shift, Rate.date_shift_enum.D1)
+
+        registry.set_swap_point_factor("USD", "JPY", 100)
+        self.assertEqual(registry.get_currency_pair("USD", "JPY", Rate.quotation_mode_enum.base_und).swap_point_factor, 100)
+
+        # a convention set back gets its canonical instance back, equality is transitive across the round trip
+        USD_365 = registry.set_currency_convention("USD", 365, Rate.date_shift_enum.D2)
+        registry.set_currency_convention("USD", 360, Rate.date_shift_enum.D2)
+        self.assertIs(registry.set_currency_convention("USD", 365, Rate.date_shift_enum.D2), USD_365)
+        self.assertEqual(USD_365, EURUSD.underlying)
+        self.assertEqual(hash(USD_365), hash(EURUSD.underlying))
+        self.assertEqual(len({USD_365, EURUSD.underlying, Rate.cls_currency("USD")}), 1)
+        with self.assertRaises(AttributeError):
+            USD_365.is_canonical = False
+
+        # other instances compare by label and conventions
+        self.assertEqual(Rate.cls_currency("EUR", 360), Rate.cls_currency("EUR", 360))
+        self.assertNotEqual(Rate.cls_currency("EUR", 360), Rate.cls_currency("EUR", 365))
+        self.assertEqual(USD, Rate.cls_currency("USD", 360, Rate.date_shift_enum.D1))
+        self.assertEqual(EURUSD.get_another_currency(Rate.cls_currency("EUR")), EURUSD.underlying)
+        self.assertEqual(EURUSD.get_base_or_und(EURUSD.base), Rate.base_or_und_enum.base)
+        self.assertEqual(EURUSD.get_base_or_und(Rate.cls_currency("USD", 360)), Rate.base_or_und_enum.und)
+        self.assertIsNone(EURUSD.get_base_or_und(Rate.cls_currency("GBP")))
+        self.assertNotEqual(EURUSD.base, EURUSD.underlying)
+
+        # canonical currencies are unpickled as the canonical instances
+        self.assertIs(pickle.loads(pickle.dumps(Rate.currency_registry.get_currency("EUR"))), Rate.currency_registry.get_currency("EUR"))
+        self.assertFalse(pickle.loads(pickle.dumps(Rate.cls_currency("EUR"))).is_canonical)
+
+
 class Test_cls_tenor(unittest.TestCase):
 
     def test_init(self):
@@ -51,6 +108,31 @@ class Test_cls_tenor(unittest.TestCase):
         self.assertEqual(one_month_inverse.label, "1M inverse".upper())
 
 
+class Test_date_ordinals(unittest.TestCase):
+    def test_init(self):
+        one_month = Rate.cls_tenor(datetime.date(2016,12,17),datetime.date(2017,1,17), "1M")
+        self.assertEqual(one_month.start_ordinal, datetime.date(2016,12,17).toordinal())
+        self.assertEqual(one_month.maturity_ordinal, datetime.date(2017,1,17).toordinal())
+        self.assertEqual(one_month.number_of_days, 31)
+
+        one_month.maturity_date = datetime.date(2017,2,17)
+        self.assertEqual(one_month.number_of_days, 62)
+
+        date_list = [datetime.date(2017,1,17), datetime.date(2017,6,30), datetime.date(2018,1,2)]
+        ordinal_array = Rate.get_ordinal_array_by_dates(date_list)
+        self.assertEqual(Rate.get_dates_by_ordinal_array(ordinal_array), date_list)
+
+        earlier_bucket_date = datetime.date(2017,1,17)
+        later_bucket_date = datetime.date(2018,1,17)
+        earlier_fractions, later_fractions = Rate.get_buckets_fractions_by_ordinals(earlier_bucket_date.toordinal(), later_bucket_date.toordinal(), ordinal_array)
+
+        for date_iter, earlier_fraction, later_fraction in zip(date_list, earlier_fractions, later_fractions):
+            self.assertEqual(earlier_fraction, (later_bucket_date - date_iter) / (later_bucket_date - earlier_bucket_date))
+            self.assertEqual(later_fraction, (date_iter - earlier_bucket_date) / (later_bucket_date - earlier_bucket_date))
+
+        self.assertEqual(Rate.get_buckets_fractions_by_ordinals(earlier_bucket_date.toordinal(), earlier_bucket_date.toordinal(), ordinal_array[0]), (1, 0))
+
+
 class Test_cls_rate(unittest.TestCase):
 
     def test_init(self):
@@ -126,6 +208,68 @@ class Test_cls_on_funding_rate_panel(unittest.TestCase):
 
 
 
+class Test_cls_cross_rate_engine(unittest.TestCase):
+    def test_init(self):
+        EUR = Rate.cls_currency("EUR", 360)
+        USD = Rate.cls_currency("USD", 360)
+        GBP = Rate.cls_currency("GBP", 365)
+        HKD = Rate.cls_currency("HKD", 365)
+        CNH = Rate.cls_currency("CNH", 365)
+        spot_tenor = Rate.cls_tenor(datetime.date(2017, 6, 13), datetime.date(2017, 6, 15))
+
+        EURUSD = Rate.cls_fx_spot_rate(Rate.cls_currency_pair(EUR, USD, Rate.quotation_mode_enum.base_und), spot_tenor, 0, 1.1210, 1.1214)
+        GBPUSD = Rate.cls_fx_spot_rate(Rate.cls_currency_pair(GBP, USD, Rate.quotation_mode_enum.base_und), spot_tenor, 0, 1.2750, 1.2755)
+        USDHKD = Rate.cls_fx_spot_rate(Rate.cls_currency_pair(USD, HKD, Rate.quotation_mode_enum.base_und), spot_tenor, 0, 7.8010, 7.8020)
+        CNHHKD = Rate.cls_fx_spot_rate(Rate.cls_currency_pair(HKD, CNH, Rate.quotation_mode_enum.und_base), spot_tenor, 0, 1.1450, 1.1460)
+
+        engine = Rate.cls_cross_rate_engine(spot_tenor, [EURUSD, GBPUSD, USDHKD, CNHHKD])
+        self.assertEqual(engine.currency_label_list, ["CNH", "EUR", "GBP", "HKD", "USD"])
+
+        for currency_pair, bid_expected, ask_expected in ((Rate.cls_currency_pair(EUR, GBP, Rate.quotation_mode_enum.base_und), 1.1210 / 1.2755, 1.1214 / 1.2750),
+                                                          (Rate.cls_currency_pair(EUR, HKD, Rate.quotation_mode_enum.base_und), 1.1210 * 7.8010, 1.1214 * 7.8020),
+                                                          (Rate.cls_currency_pair(HKD, GBP, Rate.quotation_mode_enum.und_base), 1.2750 * 7.8010, 1.2755 * 7.8020)):
+            fx_cross = engine.get_fx_spot_rate(currency_pair)
+            self.assertTrue(isinstance(fx_cross, Rate.cls_fx_spot_rate))
+            self.assertEqual(fx_cross.quotation, currency_pair.quotation)
+            self.assertAlmostEqual(fx_cross.bid, bid_expected, 12)
+            self.assertAlmostEqual(fx_cross.ask, ask_expected, 12)
+            self.assertAlmostEqual(fx_cross.mid, (bid_expected + ask_expected) / 2, 12)
+
+        # two hops, CNH through HKD then USD
+        fx_cross = engine.get_fx_spot_rate_by_quotation("EUR-CNH")
+        self.assertAlmostEqual(fx_cross.bid, 1.1210 * 7.8010 / 1.1460, 12)
+        self.assertAlmostEqual(fx_cross.ask, 1.1214 * 7.8020 / 1.1450, 12)
+
+        bid_matrix, ask_matrix = engine.get_cross_matrices()
+        self.assertEqual(bid_matrix.shape, (5, 5))
+        self.assertAlmostEqual(bid_matrix[1, 4], 1.1210, 12)
+
+        # quoted leg updated, no new path
+        engine.set_fx_rate(Rate.cls_fx_spot_rate(Rate.cls_currency_pair(EUR, USD, Rate.quotation_mode_enum.base_und), spot_tenor, 0, 1.1310, 1.1314))
+        self.assertAlmostEqual(engine.get_fx_spot_rate_by_quotation("EUR-HKD").bid, 1.1310 * 7.8010, 12)
+
+        with self.assertLogs(logger, "CRITICAL"):
+            self.assertIsNone(engine.get_fx_spot_rate_by_quotation("EUR-JPY"))
+
+        # each rate on a tenor of its own
+        self.assertIsNot(engine.get_fx_spot_rate_by_quotation("EUR-GBP").tenor, engine.get_fx_spot_rate_by_quotation("EUR-GBP").tenor)
+        self.assertIsNot(engine.get_fx_spot_rate_by_quotation("EUR-GBP").tenor, engine.tenor)
+
+        # quoted directly and shorter than through the pivot, SGD through HKD only
+        SGD = Rate.cls_currency("SGD", 365)
+        engine.set_fx_rate(Rate.cls_fx_spot_rate(Rate.cls_currency_pair(EUR, GBP, Rate.quotation_mode_enum.base_und), spot_tenor, 0, 0.8800, 0.8802))
+        engine.set_fx_rate(Rate.cls_fx_spot_rate(Rate.cls_currency_pair(SGD, HKD, Rate.quotation_mode_enum.base_und), spot_tenor, 0, 5.8000, 5.8010))
+
+        fx_cross = engine.get_fx_spot_rate_by_quotation("EUR-GBP")
+        self.assertEqual((fx_cross.bid, fx_cross.ask), (0.8800, 0.8802))
+        fx_cross = engine.get_fx_spot_rate_by_quotation("SGD-CNH")
+        self.assertAlmostEqual(fx_cross.bid, 5.8000 / 1.1460, 12)
+        self.assertAlmostEqual(fx_cross.ask, 5.8010 / 1.1450, 12)
+
+        bid_matrix, ask_matrix = engine.get_cross_matrices()
+        self.assertAlmostEqual(bid_matrix[engine.currency_label_list.index("EUR"), engine.currency_label_list.index("GBP")], 0.8800, 12)
+
+
 class Test_cls_discount_factor(unittest.TestCase):
     def test_init(self):
         EUR = Rate.cls_currency("EUR",365)
@@ -136,6 +280,24 @@ class Test_cls_discount_factor(unittest.TestCase):
         DR1 = DF1.get_discount_rate()
         self.assertEqual(1/(DR1.mid * (datetime.date(2017,1,17) - datetime.date(2016,12,17)).days / 365 + 1), DF1.mid)
 
+class Test_slotted_rate(unittest.TestCase):
+    def test_init(self):
+        EUR = Rate.cls_currency("EUR",365)
+        USD = Rate.cls_currency("USD",360)
+        EURUSD = Rate.cls_currency_pair(EUR, USD, Rate.quotation_mode_enum.base_und)
+        one_month=Rate.cls_tenor(datetime.date(2016,12,17),datetime.date(2017,1,17), "1M")
+
+        DF1 = Rate.cls_discount_factor(EUR,one_month,0.997)
+        FWD1 = Rate.cls_fx_forward_rate(EURUSD, one_month, 1.1)
+
+        for rate_object in (EUR, EURUSD, one_month, DF1, FWD1, FWD1.spot_rate, FWD1.swap_point):
+            self.assertFalse(hasattr(rate_object, "__dict__"))
+
+        self.assertEqual(DF1.unique_key, "discount_factor#EUR#2016-12-17#2017-01-17")
+        self.assertIs(DF1.unique_key, DF1.unique_key)
+        self.assertEqual(FWD1.unique_key, "fx_forward_rate#EUR-USD#2016-12-17#2017-01-17")
+
+
 class Test_cls_market_quote(unittest.TestCase):
     def test_init(self):
         EUR = Rate.cls_currency("EUR", 365)
@@ -280,6 +442,75 @@ class Test_cls_market_quote_curve_over1Ys(unittest.TestCase):
         df_6Y = usd_df_curve.get_discount_factor_by_label("6Y")
         self.assertEqual(round(df_6Y.mid, 9), round(0.925849027816251, 9))
 
+class Test_cls_market_quote_curve_annual_strip(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+        spot_date = datetime.date(2016, 9, 6)
+
+        mq_list = [Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(datetime.date(2016, 9,1),datetime.date(2016,9,2),"O/N"),0.699101474/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(datetime.date(2016, 9,2),spot_date,"T/N"),0.699087898/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2017,3,6),"6M"),0.901456991/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2017,9,6),"1Y"),0.961456991/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2018,3,6),"18M"),1.006697823/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2018,9,6),"2Y"),1.046697823/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2019,3,6),"30M"),1.079205635/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2019,9,6),"3Y"),1.109205635/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2021,9,7),"5Y"),1.215669606/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2026,9,8),"10Y"),1.568288701/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2028,9,6),"12Y"),1.668288701/100)]
+
+        usd_mq_curve = Rate.cls_market_quote_curve(usd_ccy, mq_list)
+        usd_df_curve = usd_mq_curve.get_discount_factor_curve(Rate.linearization_enum.log_ds_factor)
+
+        # same values as solving each tenor's backward shifted strip from scratch
+        df_today_spot = usd_mq_curve.get_discount_factor_today_spot()
+        for label in ("18M", "2Y", "30M", "3Y", "5Y", "10Y", "12Y"):
+            mq_list_backwardshifted = usd_mq_curve.get_market_quote_list_backwardshifted(label)
+            df_expected = Rate.get_discounted_factor_today_maturity_from_market_quote_over_1Ys(df_today_spot, mq_list_backwardshifted, usd_mq_curve.get_market_quote_by_label(label))
+
+            self.assertEqual(usd_df_curve.get_discount_factor_by_label(label).mid, df_expected.mid)
+            self.assertEqual(usd_df_curve.get_discount_factor_by_label(label).maturity_date, df_expected.maturity_date)
+
+
+class Test_update_market_quote(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+        spot_date = datetime.date(2016, 9, 6)
+
+        mq_list = [Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(datetime.date(2016, 9,1),datetime.date(2016,9,2),"O/N"),0.699101474/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(datetime.date(2016, 9,2),spot_date,"T/N"),0.699087898/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2017,3,6),"6M"),0.901456991/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2017,9,6),"1Y"),0.961456991/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2018,3,6),"18M"),1.006697823/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2018,9,6),"2Y"),1.046697823/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2019,3,6),"30M"),1.079205635/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2019,9,6),"3Y"),1.109205635/100)]
+
+        usd_mq_curve = Rate.cls_market_quote_curve(usd_ccy, mq_list)
+        usd_df_curve = usd_mq_curve.get_discount_factor_curve(Rate.linearization_enum.log_ds_factor)
+
+        for label, mid, changed_label_list in (("6M", 0.951456991/100, ["6M", "18M", "30M"]),
+                                               ("2Y", 1.146697823/100, ["2Y", "3Y"]),
+                                               ("O/N", 0.709101474/100, ["O/N", "T/N", "6M", "1Y", "18M", "2Y", "30M", "3Y"])):
+            usd_df_curve_updated = usd_df_curve.update_market_quote(label, mid)
+            usd_df_curve_expected = usd_mq_curve.update_market_quote(label, mid).get_discount_factor_curve(Rate.linearization_enum.log_ds_factor)
+
+            # the original version is left unchanged
+            self.assertEqual(usd_mq_curve.get_market_quote_by_label(label).mid, [mq for mq in mq_list if mq.label == label][0].mid)
+
+            for mq in mq_list:
+                df_updated = usd_df_curve_updated.get_discount_factor_by_label(mq.label)
+                self.assertEqual(df_updated.mid, usd_df_curve_expected.get_discount_factor_by_label(mq.label).mid)
+
+                if mq.label in changed_label_list:
+                    self.assertIsNot(df_updated, usd_df_curve.get_discount_factor_by_label(mq.label))
+                else:
+                    self.assertIs(df_updated, usd_df_curve.get_discount_factor_by_label(mq.label))
+
+        with self.assertLogs(logger, "CRITICAL"):
+            self.assertIsNone(usd_mq_curve.update_market_quote("7Y", 0.01))
+
+
 class Test_cls_discount_factor_curve_log_ds_factor(unittest.TestCase):
     def test_init(self):
         usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
@@ -305,6 +536,198 @@ class Test_cls_discount_factor_curve_log_ds_factor(unittest.TestCase):
         self.assertEqual(round(df1.mid,9), round(0.998657734071825,9))
 
 
+class Test_cls_discount_factor_curve_neighbor_search(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+
+        df_ON = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,14),"O/N"),0.999968868900009)
+        df_TN = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,15),"T/N"),0.999937738800022)
+        df_1M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,7,17),"1M"),0.998942551320812)
+        df_3M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,9,15),"3M"),0.996788096599609)
+        df_1Y = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2018,6,17),"1Y"),0.986029614300948)
+
+        usd_df_curve = Rate.cls_discount_factor_curve(usd_ccy, [df_1Y, df_TN, df_3M, df_ON, df_1M], Rate.linearization_enum.log_ds_factor)
+
+        self.assertEqual(usd_df_curve.get_neighbor_positions_by_maturity_date(datetime.date(2017, 6, 13)), (None, 0))
+        self.assertEqual(usd_df_curve.get_neighbor_positions_by_maturity_date(datetime.date(2017, 6, 15)), (1, 1))
+        self.assertEqual(usd_df_curve.get_neighbor_positions_by_maturity_date(datetime.date(2017, 8, 1)), (2, 3))
+        self.assertEqual(usd_df_curve.get_neighbor_positions_by_maturity_date(datetime.date(2019, 1, 1)), (4, None))
+
+        self.assertIs(usd_df_curve.get_discount_factor_by_maturity_date(datetime.date(2017, 9, 15)), df_3M)
+        self.assertEqual(usd_df_curve.get_discount_factor_by_maturity_date(datetime.date(2017, 6, 13)).mid, 1)
+        self.assertEqual(usd_df_curve.get_neighbor_tenor_dates_by_maturity_date(datetime.date(2017, 8, 1)), (datetime.date(2017, 7, 17), datetime.date(2017, 9, 15)))
+        self.assertEqual(usd_df_curve.get_neighbor_discount_factors_by_maturity_date(datetime.date(2017, 8, 1)), (df_1M, df_3M))
+        self.assertEqual(usd_df_curve.get_neighbor_discount_factors_by_maturity_date(datetime.date(2017, 6, 1)), (df_ON, df_ON))
+        self.assertIsNone(usd_df_curve.get_neighbor_tenor_dates_by_maturity_date(datetime.date(2019, 1, 1)))
+
+        # the index follows modifications of the rate list
+        df_2M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,8,15),"2M"),0.997910475099995)
+        usd_df_curve.fx_rate_list.insert(3, df_2M)
+        self.assertEqual(usd_df_curve.get_neighbor_discount_factors_by_maturity_date(datetime.date(2017, 8, 1)), (df_1M, df_2M))
+
+
+class Test_get_discount_factors_by_maturity_dates(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+
+        df_ON = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,14),"O/N"),0.999968868900009)
+        df_TN = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,15),"T/N"),0.999937738800022)
+        df_1M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,7,17),"1M"),0.998942551320812)
+        df_3M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,9,15),"3M"),0.996788096599609)
+        df_1Y = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2018,6,17),"1Y"),0.986029614300948)
+
+        maturity_dates = [datetime.date(2017, 6, 13), datetime.date(2017, 6, 15), datetime.date(2017, 7, 25),
+                          datetime.date(2017, 12, 29), datetime.date(2018, 6, 17), datetime.date(2019, 3, 20)]
+
+        for linearization in (Rate.linearization_enum.log_ds_factor, Rate.linearization_enum.linear_ds_rate, Rate.linearization_enum.linear_rate_time):
+            usd_df_curve = Rate.cls_discount_factor_curve(usd_ccy, [df_ON, df_TN, df_1M, df_3M, df_1Y], linearization)
+
+            df_values = usd_df_curve.get_discount_factors_by_maturity_dates(maturity_dates)
+            self.assertEqual(len(df_values), len(maturity_dates))
+
+            for maturity_date, df_value in zip(maturity_dates, df_values):
+                self.assertEqual(round(df_value, 12), round(usd_df_curve.get_discount_factor_by_maturity_date(maturity_date).mid, 12))
+
+        # one pillar: exact hits and today only, as the scalar query, nan otherwise
+        usd_df_curve_ON = Rate.cls_discount_factor_curve(usd_ccy, [df_ON], Rate.linearization_enum.log_ds_factor)
+        df_values = usd_df_curve_ON.get_discount_factors_by_maturity_dates([datetime.date(2017, 6, 14), datetime.date(2017, 6, 13), datetime.date(2017, 7, 25)])
+        self.assertEqual(df_values[:2].tolist(), [usd_df_curve_ON.get_discount_factor_value_by_maturity_date(datetime.date(2017, 6, 14)), 1])
+        self.assertNotEqual(df_values[2], df_values[2])
+
+
+class Test_cls_interpolation_segments(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+
+        df_ON = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,14),"O/N"),0.999968868900009)
+        df_TN = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,15),"T/N"),0.999937738800022)
+        df_1M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,7,17),"1M"),0.998942551320812)
+        df_3M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,9,15),"3M"),0.996788096599609)
+        df_1Y = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2018,6,17),"1Y"),0.986029614300948)
+
+        for linearization in (Rate.linearization_enum.log_ds_factor, Rate.linearization_enum.linear_ds_rate, Rate.linearization_enum.linear_rate_time):
+            usd_df_curve = Rate.cls_discount_factor_curve(usd_ccy, [df_ON, df_TN, df_1M, df_3M, df_1Y], linearization)
+
+            segments = usd_df_curve.get_interpolation_segments()
+            self.assertEqual(len(segments.slope_list), 4)
+            self.assertIs(usd_df_curve.get_interpolation_segments(), segments)
+
+            # same result as interpolating the bracketing pillars, including extrapolation
+            for df_early, df_late, maturity_date in ((df_1M, df_3M, datetime.date(2017, 7, 25)),
+                                                     (df_3M, df_1Y, datetime.date(2018, 1, 31)),
+                                                     (df_3M, df_1Y, datetime.date(2019, 3, 20))):
+                tenor_mid = Rate.cls_tenor(datetime.date(2017, 6, 13), maturity_date)
+                df_expected = usd_df_curve.get_discount_factor_by_interpolation(df_early, df_late, tenor_mid, linearization, usd_df_curve.basis)
+                self.assertEqual(round(usd_df_curve.get_discount_factor_by_maturity_date(maturity_date).mid, 12), round(df_expected.mid, 12))
+
+        # compiled again once the rate list changes
+        usd_df_curve.fx_rate_list.pop()
+        self.assertIsNot(usd_df_curve.get_interpolation_segments(), segments)
+        self.assertEqual(len(usd_df_curve.get_interpolation_segments().slope_list), 3)
+
+
+class Test_linear_rate_time(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+
+        df_ON = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,14),"O/N"),0.999968868900009)
+        df_TN = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,15),"T/N"),0.999937738800022)
+        df_1M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,7,17),"1M"),0.998942551320812)
+        df_3M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,9,15),"3M"),0.996788096599609)
+
+        usd_df_curve = Rate.cls_discount_factor_curve(usd_ccy, [df_ON, df_TN, df_1M, df_3M], Rate.linearization_enum.linear_rate_time)
+
+        # rate * time (1 / df - 1) is linear in number of days between 1M and 3M
+        maturity_date = datetime.date(2017, 8, 16)
+        number_of_days = (maturity_date - datetime.date(2017, 6, 13)).days
+        rate_time = (1/df_1M.mid - 1) + ((1/df_3M.mid - 1) - (1/df_1M.mid - 1)) / (df_3M.tenor.number_of_days - df_1M.tenor.number_of_days) * (number_of_days - df_1M.tenor.number_of_days)
+
+        self.assertEqual(round(usd_df_curve.get_discount_factor_by_maturity_date(maturity_date).mid, 12), round(1 / (1 + rate_time), 12))
+        self.assertEqual(round(usd_df_curve.get_discount_factors_by_maturity_dates([maturity_date])[0], 12), round(1 / (1 + rate_time), 12))
+
+        eur_ccy = Rate.cls_currency("EUR", 360, Rate.date_shift_enum.D2)
+        mq_curve_dict = Rate.cls_market_quote_curve_dict(datetime.date(2016, 9, 1))
+
+        for ccy_iter in (usd_ccy, eur_ccy):
+            mq_curve_dict.add_curve_to_dict(ccy_iter.label, Rate.cls_market_quote_curve(ccy_iter, [
+                Rate.cls_market_quote(ccy_iter, Rate.cls_tenor(datetime.date(2016, 9,1),datetime.date(2016,9,2),"O/N"),0.699101474/100),
+                Rate.cls_market_quote(ccy_iter, Rate.cls_tenor(datetime.date(2016, 9,2),datetime.date(2016,9,6),"T/N"),0.699087898/100),
+                Rate.cls_market_quote(ccy_iter, Rate.cls_tenor(datetime.date(2016, 9,6),datetime.date(2017,3,6),"6M"),0.901456991/100),
+                Rate.cls_market_quote(ccy_iter, Rate.cls_tenor(datetime.date(2016, 9,6),datetime.date(2017,9,6),"1Y"),0.961456991/100)]))
+
+        df_curve_dict = mq_curve_dict.get_discount_factor_curve_dict(Rate.linearization_enum.log_ds_factor, {"EUR": Rate.linearization_enum.linear_rate_time})
+        self.assertEqual(df_curve_dict.get_curve_by_currency_label("USD").linearization, Rate.linearization_enum.log_ds_factor)
+        self.assertEqual(df_curve_dict.get_curve_by_currency_label("EUR").linearization, Rate.linearization_enum.linear_rate_time)
+
+
+class Test_cls_single_currency_rate_curve_label_index(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+
+        df_ON = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,14),"O/N"),0.999968868900009)
+        df_TN = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,6,15),"T/N"),0.999937738800022)
+        df_1M = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,13),datetime.date(2017,7,17),"1M"),0.998942551320812)
+
+        usd_df_curve = Rate.cls_discount_factor_curve(usd_ccy, [df_1M, df_TN, df_ON], Rate.linearization_enum.log_ds_factor)
+
+        self.assertIs(usd_df_curve.get_discount_factor_by_label("1m"), df_1M)
+        self.assertIsNone(usd_df_curve.get_discount_factor_by_label("2M"))
+        self.assertEqual(usd_df_curve.today_date, datetime.date(2017, 6, 13))
+        self.assertEqual(usd_df_curve.tom_date, datetime.date(2017, 6, 14))
+        self.assertEqual(usd_df_curve.spot_date, datetime.date(2017, 6, 15))
+
+        # the index follows a new rate list
+        df_ON_next = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,14),datetime.date(2017,6,15),"O/N"),0.999968868900009)
+        df_TN_next = Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(datetime.date(2017, 6,14),datetime.date(2017,6,16),"T/N"),0.999937738800022)
+        usd_df_curve.fx_rate_list = [df_ON_next, df_TN_next]
+
+        self.assertIsNone(usd_df_curve.get_discount_factor_by_label("1M"))
+        self.assertEqual(usd_df_curve.today_date, datetime.date(2017, 6, 14))
+        self.assertEqual(usd_df_curve.spot_date, datetime.date(2017, 6, 16))
+
+        usd_mq_curve = Rate.cls_market_quote_curve(usd_ccy, [Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(datetime.date(2018, 8,24),datetime.date(2018,8,27),"O/N"),2.25464634/100),
+                                                             Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(datetime.date(2018, 8,27),datetime.date(2018,8,28),"T/N"),2.254506667/100)])
+        self.assertEqual(usd_mq_curve.today_date, datetime.date(2018, 8, 24))
+        self.assertEqual(usd_mq_curve.spot_date, datetime.date(2018, 8, 28))
+
+
+class Test_get_discount_factor_value_by_maturity_date(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+        spot_date = datetime.date(2016, 9, 6)
+
+        mq_list = [Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(datetime.date(2016, 9,1),datetime.date(2016,9,2),"O/N"),0.699101474/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(datetime.date(2016, 9,2),spot_date,"T/N"),0.699087898/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2017,3,6),"6M"),0.901456991/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2017,9,6),"1Y"),0.961456991/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2018,9,6),"2Y"),1.046697823/100),
+                   Rate.cls_market_quote(usd_ccy, Rate.cls_tenor(spot_date,datetime.date(2019,9,6),"3Y"),1.109205635/100)]
+
+        usd_df_curve = Rate.cls_market_quote_curve(usd_ccy, mq_list).get_discount_factor_curve(Rate.linearization_enum.log_ds_factor)
+
+        date_list = [datetime.date(2016, 9, 1), datetime.date(2016, 9, 6), datetime.date(2016, 12, 6),
+                     datetime.date(2017, 9, 6), datetime.date(2018, 1, 15), datetime.date(2020, 3, 6)]
+
+        for maturity_date in date_list:
+            df = usd_df_curve.get_discount_factor_by_maturity_date(maturity_date)
+            self.assertEqual(usd_df_curve.get_discount_factor_value_by_maturity_date(maturity_date), df.mid)
+
+        for start_date, maturity_date in ((datetime.date(2016, 9, 6), datetime.date(2017, 9, 6)),
+                                          (datetime.date(2016, 12, 6), datetime.date(2018, 1, 15)),
+                                          (datetime.date(2016, 9, 1), datetime.date(2020, 3, 6))):
+            df_today_maturity = usd_df_curve.get_discount_factor_by_maturity_date(maturity_date)
+            df_today_start = usd_df_curve.get_discount_factor_by_maturity_date(start_date)
+            df_expected = df_today_maturity.get_remaining_df(df_today_start, df_today_maturity.tenor.label)
+
+            df = usd_df_curve.get_discount_factor_by_start_maturity(start_date, maturity_date)
+            self.assertEqual(df.mid, df_expected.mid)
+            self.assertEqual(df.tenor.label, df_expected.tenor.label)
+            self.assertEqual(df.start_date, start_date)
+            self.assertEqual(df.maturity_date, maturity_date)
+
+        self.assertEqual(usd_df_curve.get_discount_factor_by_start_maturity(spot_date, spot_date).mid, 1)
+
+
 class Test_cls_swap_point_panel(unittest.TestCase):
     def test_init(self):
         usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
@@ -408,6 +831,64 @@ class Test_cls_swap_point_panel(unittest.TestCase):
 # 12Y	-721.902727505068
 
 
+class Test_get_forward_rates_by_maturities(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+        sgd_ccy = Rate.cls_currency("SGD", 365, Rate.date_shift_enum.D2)
+        date_of_today = datetime.date(2017, 6, 13)
+
+        df_curve_usd = Rate.cls_discount_factor_curve(usd_ccy, [Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,14),"O/N"),0.999968868900009),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,15),"T/N"),0.999937738800022),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,7,17),"1M"),0.998942551320812),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,12,15),"6M"),0.993355657098983),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2018,6,15),"1Y"),0.986029614300948)],
+                                                      Rate.linearization_enum.log_ds_factor)
+
+        df_curve_sgd = Rate.cls_discount_factor_curve(sgd_ccy, [Rate.cls_discount_factor(sgd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,14),"O/N"),0.999985489497763),
+                                                                Rate.cls_discount_factor(sgd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,15),"T/N"),0.999970979621296),
+                                                                Rate.cls_discount_factor(sgd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,7,17),"1M"),0.999372474118876),
+                                                                Rate.cls_discount_factor(sgd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,12,15),"6M"),0.995520369701573),
+                                                                Rate.cls_discount_factor(sgd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2018,6,15),"1Y"),0.989835750383861)],
+                                                      Rate.linearization_enum.log_ds_factor)
+
+        usdsgd = Rate.cls_currency_pair(usd_ccy, sgd_ccy, Rate.quotation_mode_enum.base_und, 10000)
+        spot_rate_usdsgd = Rate.cls_fx_spot_rate(usdsgd, Rate.cls_tenor(date_of_today, datetime.date(2017,6,15)), 1.38375)
+
+        swap_point_panel_usdsgd = Rate.cls_swap_point_panel(usdsgd, spot_rate_usdsgd, df_curve_usd, df_curve_sgd, False, forward_rate_cache_size=2)
+
+        maturity_dates = [datetime.date(2017, 6, 15), datetime.date(2017, 7, 17), datetime.date(2017, 9, 20), datetime.date(2018, 3, 21), datetime.date(2018, 9, 19)]
+        forward_rate_values = swap_point_panel_usdsgd.get_forward_rates_by_maturities(maturity_dates)
+
+        for maturity_date, forward_rate_value in zip(maturity_dates, forward_rate_values):
+            self.assertAlmostEqual(forward_rate_value, swap_point_panel_usdsgd.get_forward_rate_by_maturity(maturity_date).mid, 12)
+
+        # cached by maturity and bounded, a new object on each call that the caller can modify
+        forward_rate = swap_point_panel_usdsgd.get_forward_rate_by_maturity(datetime.date(2018, 9, 19))
+        forward_rate_value = forward_rate.mid
+        forward_rate.mid = 0
+        self.assertIsNot(swap_point_panel_usdsgd.get_forward_rate_by_maturity(datetime.date(2018, 9, 19)), forward_rate)
+        self.assertEqual(swap_point_panel_usdsgd.get_forward_rate_by_maturity(datetime.date(2018, 9, 19)).mid, forward_rate_value)
+        self.assertEqual(swap_point_panel_usdsgd.number_of_cached_forward_rates, 2)
+        forward_rate = swap_point_panel_usdsgd.get_forward_rate_by_maturity(datetime.date(2018, 9, 19))
+
+        # the value accessor hands out the cached float itself
+        forward_rate_value = swap_point_panel_usdsgd.get_forward_rate_value_by_maturity(datetime.date(2018, 9, 19))
+        self.assertIsInstance(forward_rate_value, float)
+        self.assertIs(swap_point_panel_usdsgd.get_forward_rate_value_by_maturity(datetime.date(2018, 9, 19)), forward_rate_value)
+        self.assertEqual(forward_rate.mid, forward_rate_value)
+
+        # dropped when a curve changes, column backed curves not created as objects to tell
+        df_curve_usd.set_rate_columns(df_curve_usd.get_rate_columns())
+        self.assertEqual(swap_point_panel_usdsgd.get_forward_rate_by_maturity(datetime.date(2017, 7, 17)).mid, forward_rate_values[1])
+        self.assertEqual(swap_point_panel_usdsgd.number_of_cached_forward_rates, 1)
+        self.assertEqual(df_curve_usd.rates_state[1], -1)
+
+        swap_point_panel_usdsgd.spot_rate.mid = 1.39
+        forward_rate_moved = swap_point_panel_usdsgd.get_forward_rate_by_maturity(datetime.date(2018, 9, 19))
+        self.assertIsNot(forward_rate_moved, forward_rate)
+        self.assertAlmostEqual(forward_rate_moved.mid / forward_rate.mid, 1.39 / 1.38375, 12)
+
+
 class Test_create_swap_point_panel_by_market_quote(unittest.TestCase):
     def test_init(self):
         #today's date = 2018-08-24
@@ -1138,5 +1619,469 @@ class Test_get_market_quote_list_backwardshifted(unittest.TestCase):
 
 
 
+class Test_cls_tenor_label(unittest.TestCase):
+    def test_init(self):
+        self.assertEqual(Rate.get_tenor_label("30m").number_of_months, 30)
+        self.assertEqual(Rate.get_tenor_label("2Y").number_of_months, 24)
+        self.assertIsNone(Rate.get_tenor_label("O/N").number_of_months)
+        self.assertIs(Rate.get_tenor_label("2Y"), Rate.get_tenor_label("2Y"))
+
+        for input_tenor_label, shifted_tenor_label in (("13M", "1M"), ("18M", "6M"), ("2Y", "1Y"), ("30M", "18M"), ("10Y", "9Y"), ("15Y", "14Y"), ("24M", "12M"),
+                                                         ("1Y", None), ("12M", None), ("6M", None), ("1W", None), ("O/N", None), (None, None)):
+            self.assertEqual(Rate.get_1Ybackwardshifted_tenor_label(input_tenor_label), shifted_tenor_label)
+
+        schedule_dict = Rate.get_annual_coupon_schedule_dict(("O/N", "T/N", "6M", "1Y", "18M", "2Y", "30M", "5Y"))
+        self.assertEqual(schedule_dict["30M"], ("6M", "18M"))
+        # 4Y and 3Y missing, going back one more year each time
+        self.assertEqual(schedule_dict["5Y"], ("1Y", "2Y"))
+        self.assertNotIn("1Y", schedule_dict)
+        self.assertIs(Rate.get_annual_coupon_schedule_dict(("O/N", "T/N", "6M", "1Y", "18M", "2Y", "30M", "5Y")), schedule_dict)
+
+        # the cached schedules are shared, so they can not be changed by a caller
+        with self.assertRaises(TypeError):
+            schedule_dict["5Y"] = ()
+        with self.assertRaises(AttributeError):
+            schedule_dict["5Y"].append("X")
+        self.assertEqual(Rate.get_annual_coupon_schedule_dict(("O/N", "T/N", "6M", "1Y", "18M", "2Y", "30M", "5Y"))["5Y"], ("1Y", "2Y"))
+
+
+class Test_refresh_swap_point_list(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+        sgd_ccy = Rate.cls_currency("SGD", 365, Rate.date_shift_enum.D2)
+
+        date_of_today = datetime.date(2017, 6, 13)
+
+        df_curve_usd = Rate.cls_discount_factor_curve(usd_ccy, [Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,14),"O/N"),0.999968868900009),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,15),"T/N"),0.999937738800022),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,7,17),"1M"),0.998942551320812),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2018,6,15),"1Y"),0.986029614300948)],
+                                                      Rate.linearization_enum.log_ds_factor)
+
+        df_curve_sgd = Rate.cls_discount_factor_curve(sgd_ccy, [Rate.cls_discount_factor(sgd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,14),"O/N"),0.999985489497763),
+                                                                Rate.cls_discount_factor(sgd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,15),"T/N"),0.999970979621296),
+                                                                Rate.cls_discount_factor(sgd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,7,17),"1M"),0.999372474118876),
+                                                                Rate.cls_discount_factor(sgd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,9,15),"3M"),0.997894307136919)],
+                                                      Rate.linearization_enum.log_ds_factor)
+
+        usdsgd = Rate.cls_currency_pair(usd_ccy, sgd_ccy, Rate.quotation_mode_enum.base_und, 10000)
+        spot_rate_usdsgd = Rate.cls_fx_spot_rate(usdsgd, Rate.cls_tenor(date_of_today, datetime.date(2017,6,15)), 1.38375)
+
+        swap_point_panel_usdsgd = Rate.cls_swap_point_panel(usdsgd, spot_rate_usdsgd, df_curve_usd, df_curve_sgd)
+        swap_point_columns = swap_point_panel_usdsgd.get_rate_columns()
+
+        self.assertEqual(len(swap_point_columns), 4)
+        self.assertEqual(swap_point_columns.bid_array.tolist(), swap_point_columns.mid_array.tolist())
+
+        # looked up by label and maturity without creating the other swap points
+        swap_point_1M = swap_point_panel_usdsgd.get_swap_point_from_list_by_tenor_label("1M")
+        self.assertEqual(swap_point_1M.tenor.start_date, datetime.date(2017, 6, 15))
+        self.assertIs(swap_point_panel_usdsgd.get_swap_point_from_list_by_maturity(datetime.date(2017, 7, 17)), swap_point_1M)
+        with self.assertLogs(logger, "WARNING"):
+            self.assertIsNone(swap_point_panel_usdsgd.get_swap_point_from_list_by_tenor_label("1Y"))
+        self.assertTrue(swap_point_panel_usdsgd.is_backed_by_columns)
+
+        # the swap point asked for is the one kept in the list afterwards
+        swap_point_list = swap_point_panel_usdsgd.swap_point_list
+        self.assertEqual([swap_point_iter.tenor.label for swap_point_iter in swap_point_list], ["O/N", "T/N", "1M", "3M"])
+        self.assertIs(swap_point_list[2], swap_point_1M)
+        self.assertEqual(swap_point_list[1].tenor.start_date, datetime.date(2017, 6, 14))
+
+        for swap_point_iter, swap_point_value_iter in zip(swap_point_list, swap_point_columns.mid_array.tolist()):
+            self.assertEqual(swap_point_iter.mid, swap_point_value_iter)
+            swap_point_expected = swap_point_panel_usdsgd.get_swap_point_by_maturity(swap_point_iter.tenor.maturity_date)
+            self.assertAlmostEqual(swap_point_iter.mid, swap_point_expected.mid, places=12)
+            self.assertAlmostEqual(swap_point_iter.bid, swap_point_expected.bid, places=12)
+            self.assertAlmostEqual(swap_point_iter.ask, swap_point_expected.ask, places=12)
+
+        # refreshed later, the swap point list is returned
+        swap_point_panel_usdsgd = Rate.cls_swap_point_panel(usdsgd, spot_rate_usdsgd, df_curve_usd, df_curve_sgd, False)
+        swap_point_list = swap_point_panel_usdsgd.refresh_swap_point_list()
+        self.assertIs(swap_point_list, swap_point_panel_usdsgd.swap_point_list)
+        self.assertEqual(len(swap_point_list), 4)
+
+
+class Test_get_und_df_curves_by_swap_point_panels(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+        sgd_ccy = Rate.cls_currency("SGD", 365, Rate.date_shift_enum.D2)
+        eur_ccy = Rate.cls_currency("EUR", 360, Rate.date_shift_enum.D2)
+        usdsgd = Rate.cls_currency_pair(usd_ccy, sgd_ccy, Rate.quotation_mode_enum.base_und, 10000)
+        eurusd = Rate.cls_currency_pair(usd_ccy, eur_ccy, Rate.quotation_mode_enum.und_base, 10000)
+
+        date_of_today = datetime.date(2017, 6, 13)
+        spot_tenor = Rate.cls_tenor(date_of_today, datetime.date(2017, 6, 15))
+
+        df_curve_usd = Rate.cls_discount_factor_curve(usd_ccy, [Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,14),"O/N"),0.999968868900009),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,15),"T/N"),0.999937738800022),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,7,17),"1M"),0.998942551320812),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,9,15),"3M"),0.996788096599609),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2018,6,15),"1Y"),0.986029614300948)],
+                                                      Rate.linearization_enum.log_ds_factor)
+
+        swap_point_panel_list = []
+        for currency_pair, spot_rate_value, swap_point_values in ((usdsgd, 1.38375, (-0.229998504268636, -0.230000000172037, -5.49299163299821, -14.8799999861171, -52.7500000673187)),
+                                                                  (eurusd, 1.12150, (0.4512, 0.4498, 19.35, 56.21, 245.5))):
+            swap_point_panel = Rate.cls_swap_point_panel(currency_pair, Rate.cls_fx_spot_rate(currency_pair, spot_tenor, spot_rate_value), df_curve_usd, None, False)
+            swap_point_panel.fx_rate_list = [Rate.cls_swap_point(currency_pair, Rate.cls_tenor(date_of_today, datetime.date(2017,6,14), "O/N"), swap_point_values[0] / 10000),
+                                             Rate.cls_swap_point(currency_pair, Rate.cls_tenor(datetime.date(2017,6,14), datetime.date(2017,6,15), "T/N"), swap_point_values[1] / 10000),
+                                             Rate.cls_swap_point(currency_pair, Rate.cls_tenor(datetime.date(2017,6,15), datetime.date(2017,7,17), "1M"), swap_point_values[2] / 10000),
+                                             Rate.cls_swap_point(currency_pair, Rate.cls_tenor(datetime.date(2017,6,15), datetime.date(2017,9,15), "3M"), swap_point_values[3] / 10000),
+                                             Rate.cls_swap_point(currency_pair, Rate.cls_tenor(datetime.date(2017,6,15), datetime.date(2018,6,15), "1Y"), swap_point_values[4] / 10000)]
+            swap_point_panel_list.append(swap_point_panel)
+
+        # one panel held as columns only
+        swap_point_panel_list[1].set_rate_columns(swap_point_panel_list[1].get_rate_columns())
+
+        df_curve_und_list = Rate.get_und_df_curves_by_swap_point_panels(df_curve_usd, swap_point_panel_list, Rate.linearization_enum.log_ds_factor)
+
+        self.assertEqual(len(df_curve_und_list), 2)
+        self.assertTrue(swap_point_panel_list[1].is_backed_by_columns)
+        self.assertTrue(all(df_curve_und.is_backed_by_columns for df_curve_und in df_curve_und_list))
+        self.assertEqual(df_curve_und_list[0].get_rate_columns().label_list, ["T/N", "O/N", "1M", "3M", "1Y"])
+        self.assertEqual(round(df_curve_und_list[0].get_discount_factor_by_label("O/N").value, 9), round(0.999985489497763, 9))
+        self.assertEqual(round(df_curve_und_list[0].get_discount_factor_by_label("1M").value, 9), round(0.999372474118876, 9))
+
+        # same curves as one panel at a time
+        for swap_point_panel, df_curve_und in zip(swap_point_panel_list, df_curve_und_list):
+            df_curve_und_expected = swap_point_panel.get_und_df_curve_by_swap_point_list(Rate.linearization_enum.log_ds_factor)
+
+            self.assertEqual(df_curve_und.currency, swap_point_panel.currency_pair.underlying)
+            self.assertEqual([df_iter.tenor.label for df_iter in df_curve_und.fx_rate_list], [df_iter.tenor.label for df_iter in df_curve_und_expected.fx_rate_list])
+            self.assertEqual([df_iter.tenor.maturity_date for df_iter in df_curve_und.fx_rate_list], [df_iter.tenor.maturity_date for df_iter in df_curve_und_expected.fx_rate_list])
+
+            for df_iter, df_expected_iter in zip(df_curve_und.fx_rate_list, df_curve_und_expected.fx_rate_list):
+                self.assertAlmostEqual(df_iter.value, df_expected_iter.value, places=12)
+
+        # a panel without T/N has no implied curve
+        swap_point_panel_list[0].fx_rate_list = [swap_point_iter for swap_point_iter in swap_point_panel_list[0].fx_rate_list if swap_point_iter.label != "T/N"]
+        with self.assertLogs(logger, "CRITICAL"):
+            df_curve_und_list = Rate.get_und_df_curves_by_swap_point_panels(df_curve_usd, swap_point_panel_list, Rate.linearization_enum.log_ds_factor)
+        self.assertIsNone(df_curve_und_list[0])
+        self.assertIsNotNone(df_curve_und_list[1])
+
+
+class Test_get_rate_days_by_start_end_date(unittest.TestCase):
+    def test_init(self):
+        USD= Rate.cls_currency("USD")
+
+        ON_RATE1 = Rate.cls_overnight_funding_rate(USD, Rate.cls_tenor(datetime.date(2017,10,1), datetime.date(2017,10,2), ""),0.001)
+        ON_RATE2 = Rate.cls_overnight_funding_rate(USD, Rate.cls_tenor(datetime.date(2017,10,2), datetime.date(2017,10,4), ""),0.002)
+        ON_RATE3 = Rate.cls_overnight_funding_rate(USD, Rate.cls_tenor(datetime.date(2017,10,4), datetime.date(2017,10,9), ""),0.003)
+
+        ON_RATE_PANEL = Rate.cls_on_funding_rate_panel(USD,[ON_RATE3, ON_RATE1, ON_RATE2])
+
+        window_list = [(datetime.date(2017,10,1), datetime.date(2017,10,9)),
+                       (datetime.date(2017,10,1), datetime.date(2017,10,8)),
+                       (datetime.date(2017,10,3), datetime.date(2017,10,9)),
+                       (datetime.date(2017,10,3), datetime.date(2017,10,6)),
+                       (datetime.date(2017,10,5), datetime.date(2017,10,7)),
+                       (datetime.date(2017,10,2), datetime.date(2017,10,4))]
+
+        for start_date, end_date in window_list:
+            rate_days_expected = sum(on_rate_iter.mid * on_rate_iter.tenor.number_of_days
+                                     for on_rate_iter in ON_RATE_PANEL.get_on_rate_dict_by_start_end_date(start_date, end_date).values())
+
+            self.assertAlmostEqual(ON_RATE_PANEL.get_rate_days_by_start_end_date(start_date, end_date), rate_days_expected, places=15)
+
+        self.assertAlmostEqual(ON_RATE_PANEL.get_rate_days_by_start_end_date(datetime.date(2017,10,3), datetime.date(2017,10,6)), 0.002 + 0.003 * 2, places=15)
+
+        # days outside the fixings accrue nothing
+        self.assertAlmostEqual(ON_RATE_PANEL.get_rate_days_by_start_end_date(datetime.date(2017,9,25), datetime.date(2017,10,12)), 0.001 + 0.002 * 2 + 0.003 * 5, places=15)
+
+        rate_days_array = ON_RATE_PANEL.get_rate_days_by_start_end_dates([start_date for start_date, _ in window_list], [end_date for _, end_date in window_list])
+        self.assertEqual(len(rate_days_array), len(window_list))
+        for rate_days_iter, (start_date, end_date) in zip(rate_days_array.tolist(), window_list):
+            self.assertEqual(rate_days_iter, ON_RATE_PANEL.get_rate_days_by_start_end_date(start_date, end_date))
+
+
+class Test_append_on_funding_rate(unittest.TestCase):
+    def test_init(self):
+        USD= Rate.cls_currency("USD")
+
+        ON_RATE1 = Rate.cls_overnight_funding_rate(USD, Rate.cls_tenor(datetime.date(2017,10,1), datetime.date(2017,10,2), ""),0.001)
+        ON_RATE2 = Rate.cls_overnight_funding_rate(USD, Rate.cls_tenor(datetime.date(2017,10,2), datetime.date(2017,10,4), ""),0.002)
+        ON_RATE3 = Rate.cls_overnight_funding_rate(USD, Rate.cls_tenor(datetime.date(2017,10,4), datetime.date(2017,10,9), ""),0.003)
+        ON_RATE4 = Rate.cls_overnight_funding_rate(USD, Rate.cls_tenor(datetime.date(2017,10,9), datetime.date(2017,10,10), ""),0.004, 0.0039, 0.0041)
+
+        ON_RATE_PANEL = Rate.cls_on_funding_rate_panel(USD, None)
+        self.assertEqual(ON_RATE_PANEL.list_start_date, None)
+        self.assertEqual(ON_RATE_PANEL.get_rate_days_by_start_end_date(datetime.date(2017,10,1), datetime.date(2017,10,9)), 0)
+
+        self.assertTrue(ON_RATE_PANEL.append(ON_RATE1))
+        self.assertTrue(ON_RATE_PANEL.extend([ON_RATE2, ON_RATE3]))
+
+        # overlapping or out of order fixings are rejected
+        with self.assertLogs(logger, "CRITICAL") as log_context:
+            self.assertFalse(ON_RATE_PANEL.append(ON_RATE2))
+            self.assertFalse(ON_RATE_PANEL.extend([ON_RATE4, Rate.cls_overnight_funding_rate(USD, Rate.cls_tenor(datetime.date(2017,10,9), datetime.date(2017,10,10), ""),0.004)]))
+        self.assertEqual(len(log_context.records), 2)
+        self.assertEqual(ON_RATE_PANEL.number_of_fixings, 3)
+
+        self.assertEqual(ON_RATE_PANEL.list_start_date, ON_RATE1.tenor.start_date)
+        self.assertEqual(ON_RATE_PANEL.list_end_date, ON_RATE3.tenor.maturity_date)
+        self.assertEqual(ON_RATE_PANEL.on_rate_list, [ON_RATE1, ON_RATE2, ON_RATE3])
+        self.assertAlmostEqual(ON_RATE_PANEL.get_rate_days_by_start_end_date(datetime.date(2017,10,3), datetime.date(2017,10,6)), 0.002 + 0.003 * 2, places=15)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "usd_on.npy")
+            ON_RATE_PANEL.save_fixings(file_path)
+
+            ON_RATE_PANEL_LOADED = Rate.cls_on_funding_rate_panel(USD, None)
+            ON_RATE_PANEL_LOADED.load_fixings(file_path)
+
+            self.assertEqual(ON_RATE_PANEL_LOADED.number_of_fixings, 3)
+            self.assertEqual(ON_RATE_PANEL_LOADED.list_end_date, ON_RATE3.tenor.maturity_date)
+            self.assertEqual(ON_RATE_PANEL_LOADED.get_rate_days_by_start_end_date(datetime.date(2017,10,1), datetime.date(2017,10,9)),
+                             ON_RATE_PANEL.get_rate_days_by_start_end_date(datetime.date(2017,10,1), datetime.date(2017,10,9)))
+
+            # the memory-mapped history is copied on the first append
+            self.assertTrue(ON_RATE_PANEL_LOADED.append(ON_RATE4))
+            self.assertEqual(ON_RATE_PANEL_LOADED.list_end_date, ON_RATE4.tenor.maturity_date)
+            self.assertAlmostEqual(ON_RATE_PANEL_LOADED.get_rate_days_by_start_end_date(datetime.date(2017,10,8), datetime.date(2017,10,10)), 0.003 + 0.004, places=15)
+
+            on_rate_list = ON_RATE_PANEL_LOADED.on_rate_list
+            self.assertEqual([on_rate_iter.tenor.start_date for on_rate_iter in on_rate_list], [ON_RATE1.start_date, ON_RATE2.start_date, ON_RATE3.start_date, ON_RATE4.start_date])
+            self.assertEqual(on_rate_list[1].mid, ON_RATE2.mid)
+            self.assertEqual(on_rate_list[3].ask, ON_RATE4.ask)
+
+            del ON_RATE_PANEL_LOADED
+
+
+class Test_rate_dict_snapshot(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+        sgd_ccy = Rate.cls_currency("SGD", 365, Rate.date_shift_enum.D2)
+
+        date_of_today = datetime.date(2017, 6, 13)
+
+        def create_df_curve(currency, df_1M_value):
+            return Rate.cls_discount_factor_curve(currency, [Rate.cls_discount_factor(currency, Rate.cls_tenor(date_of_today, datetime.date(2017,6,14), "O/N"), 0.99997),
+                                                             Rate.cls_discount_factor(currency, Rate.cls_tenor(date_of_today, datetime.date(2017,7,17), "1M"), df_1M_value)],
+                                                  Rate.linearization_enum.log_ds_factor)
+
+        df_curve_usd = create_df_curve(usd_ccy, 0.9989)
+
+        df_curve_dict = Rate.cls_discount_factor_curve_dict(date_of_today)
+        df_curve_dict.add_curve_to_dict("USD", df_curve_usd)
+        self.assertEqual(df_curve_dict.version, 1)
+        self.assertFalse(df_curve_dict.is_snapshot)
+
+        snapshot_1 = df_curve_dict.snapshot()
+        self.assertIs(df_curve_dict.snapshot(), snapshot_1)
+        self.assertTrue(snapshot_1.is_snapshot)
+        self.assertIsInstance(snapshot_1, Rate.cls_discount_factor_curve_dict)
+        self.assertIs(snapshot_1.get_curve_by_currency_label("USD"), df_curve_usd)
+
+        # later changes are not seen by the snapshot
+        df_curve_dict.add_curve_to_dict("SGD", create_df_curve(sgd_ccy, 0.9993))
+        snapshot_2 = df_curve_dict.snapshot()
+
+        self.assertEqual(snapshot_1.version, 1)
+        self.assertEqual(snapshot_2.version, 2)
+        self.assertGreater(snapshot_2.snapshot_id, snapshot_1.snapshot_id)
+        self.assertEqual(snapshot_1.get_curve_by_currency_label("SGD"), None)
+        self.assertIs(snapshot_2.get_curve_by_currency_label("USD"), df_curve_usd)
+
+        # same content, same hash
+        df_curve_dict.add_curve_to_dict("USD", create_df_curve(usd_ccy, 0.9989))
+        self.assertEqual(df_curve_dict.get_curve_hash_by_currency_label("USD"), snapshot_1.get_curve_hash_by_currency_label("USD"))
+
+        df_curve_dict.add_curve_to_dict("USD", create_df_curve(usd_ccy, 0.9988))
+        self.assertNotEqual(df_curve_dict.get_curve_hash_by_currency_label("USD"), snapshot_1.get_curve_hash_by_currency_label("USD"))
+        self.assertEqual(snapshot_2.get_curve_hash_by_currency_label("USD"), snapshot_1.get_curve_hash_by_currency_label("USD"))
+
+        # snapshots are frozen
+        with self.assertLogs(logger, "CRITICAL"):
+            snapshot_2.remove_curve_from_dict("USD")
+        self.assertIs(snapshot_2.get_curve_by_currency_label("USD"), df_curve_usd)
+        with self.assertRaises(TypeError):
+            snapshot_2.curve_dict["USD"] = None
+
+        df_curve_dict.clear_dict()
+        self.assertEqual(df_curve_dict.version, 5)
+        self.assertEqual(len(snapshot_2.curve_dict), 2)
+
+
+class Test_get_discount_factor_curve_dict_by_executor(unittest.TestCase):
+    def test_init(self):
+        mq_curve_dict = Rate.cls_market_quote_curve_dict(datetime.date(2016, 9, 1))
+
+        for ccy_label in ("USD", "EUR", "JPY", "XXX"):
+            ccy_iter = Rate.cls_currency(ccy_label, 360, Rate.date_shift_enum.D2)
+            mq_curve_dict.add_curve_to_dict(ccy_label, Rate.cls_market_quote_curve(ccy_iter, [] if ccy_label == "XXX" else [
+                Rate.cls_market_quote(ccy_iter, Rate.cls_tenor(datetime.date(2016, 9,1),datetime.date(2016,9,2),"O/N"),0.699101474/100),
+                Rate.cls_market_quote(ccy_iter, Rate.cls_tenor(datetime.date(2016, 9,2),datetime.date(2016,9,6),"T/N"),0.699087898/100),
+                Rate.cls_market_quote(ccy_iter, Rate.cls_tenor(datetime.date(2016, 9,6),datetime.date(2017,9,6),"1Y"),0.961456991/100)]))
+
+        error_dict = {}
+        with self.assertLogs(logger, "CRITICAL"):
+            df_curve_dict = mq_curve_dict.get_discount_factor_curve_dict(Rate.linearization_enum.log_ds_factor, error_dict=error_dict)
+
+        # XXX has no market quote
+        self.assertEqual(list(df_curve_dict.curve_dict), ["USD", "EUR", "JPY"])
+        self.assertEqual(list(error_dict), ["XXX"])
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor, self.assertLogs(logger, "CRITICAL"):
+            error_dict_by_executor = {}
+            df_curve_dict_by_executor = mq_curve_dict.get_discount_factor_curve_dict(Rate.linearization_enum.log_ds_factor, executor=executor, error_dict=error_dict_by_executor)
+
+        self.assertEqual(list(df_curve_dict_by_executor.curve_dict), ["USD", "EUR", "JPY"])
+        self.assertEqual(list(error_dict_by_executor), ["XXX"])
+
+        for ccy_label in ("USD", "EUR", "JPY"):
+            self.assertEqual(df_curve_dict_by_executor.get_curve_hash_by_currency_label(ccy_label), df_curve_dict.get_curve_hash_by_currency_label(ccy_label))
+
+
+class Test_curve_snapshot(unittest.TestCase):
+    def test_init(self):
+        usd_ccy = Rate.cls_currency("USD", 360, Rate.date_shift_enum.D2)
+        eur_ccy = Rate.cls_currency("EUR", 360, Rate.date_shift_enum.D2)
+
+        date_of_today = datetime.date(2017, 6, 13)
+
+        df_curve_usd = Rate.cls_discount_factor_curve(usd_ccy, [Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,14),"O/N"),0.999968868900009),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,6,15),"T/N"),0.999937738800022),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,7,17),"1M"),0.998942551320812),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2017,9,15),"3M"),0.996788096599609),
+                                                                Rate.cls_discount_factor(usd_ccy,Rate.cls_tenor(date_of_today,datetime.date(2018,6,15),"1Y"),0.986029614300948)],
+                                                      Rate.linearization_enum.linear_rate_time)
+
+        mq_curve_eur = Rate.cls_market_quote_curve(eur_ccy, [
+                Rate.cls_market_quote(eur_ccy, Rate.cls_tenor(datetime.date(2016, 9,1),datetime.date(2016,9,2),"O/N"),0.699101474/100, 0.69/100, 0.71/100),
+                Rate.cls_market_quote(eur_ccy, Rate.cls_tenor(datetime.date(2016, 9,2),datetime.date(2016,9,6),"T/N"),0.699087898/100),
+                Rate.cls_market_quote(eur_ccy, Rate.cls_tenor(datetime.date(2016, 9,6),datetime.date(2017,9,6),"1Y"),0.961456991/100),
+                Rate.cls_market_quote(eur_ccy, Rate.cls_tenor(datetime.date(2016, 9,6),datetime.date(2018,9,6),"2Y"),1.061456991/100)], 365)
+        mq_curve_eur.get_market_quote_by_label("O/N").set_rate_by_mid_bid_ask(0.699101474/100, 0.69/100, 0.71/100)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "curves")
+            Rate.save_curve_snapshot(file_path, [df_curve_usd, mq_curve_eur])
+
+            # neither USD 360 nor EUR 360 is the registered convention
+            with self.assertLogs(logger, "WARNING") as log_context:
+                df_curve_usd_loaded, mq_curve_eur_loaded = Rate.load_curve_snapshot(file_path)
+            self.assertEqual(len(log_context.records), 2)
+
+            self.assertIsInstance(df_curve_usd_loaded, Rate.cls_discount_factor_curve)
+            self.assertEqual(df_curve_usd_loaded.linearization, Rate.linearization_enum.linear_rate_time)
+            self.assertEqual(df_curve_usd_loaded.currency.spot_date_shift, Rate.date_shift_enum.D2)
+            self.assertEqual(df_curve_usd_loaded.spot_date, datetime.date(2017, 6, 15))
+            self.assertEqual(mq_curve_eur_loaded.basis, 365)
+
+            maturity_date_list = [datetime.date(2017, 6, 20), datetime.date(2017, 9, 15), datetime.date(2018, 1, 31), datetime.date(2018, 9, 3)]
+            self.assertEqual(df_curve_usd_loaded.get_discount_factors_by_maturity_dates(maturity_date_list).tolist(),
+                             df_curve_usd.get_discount_factors_by_maturity_dates(maturity_date_list).tolist())
+            self.assertEqual(df_curve_usd_loaded.get_discount_factor_value_by_maturity_date(datetime.date(2017, 8, 1)),
+                             df_curve_usd.get_discount_factor_value_by_maturity_date(datetime.date(2017, 8, 1)))
+
+            # the pillar asked for is created alone, then kept in fx_rate_list
+            df_1M = df_curve_usd_loaded.get_discount_factor_by_label("1M")
+            self.assertEqual(df_1M.mid, 0.998942551320812)
+            self.assertEqual(df_1M.tenor.start_date, date_of_today)
+            self.assertIs(df_curve_usd_loaded.get_rate_columns(), df_curve_usd_loaded.get_rate_columns())
+
+            self.assertIs(df_curve_usd_loaded.fx_rate_list[2], df_1M)
+            self.assertEqual([df_iter.tenor.label for df_iter in df_curve_usd_loaded.fx_rate_list], ["O/N", "T/N", "1M", "3M", "1Y"])
+
+            # an asymmetric quote keeps its mid
+            mq_on_loaded = mq_curve_eur_loaded.get_market_quote_by_label("O/N")
+            self.assertEqual((mq_on_loaded.mid, mq_on_loaded.bid, mq_on_loaded.ask), (0.699101474/100, 0.69/100, 0.71/100))
+            self.assertEqual(mq_curve_eur_loaded.get_market_quote_by_label("T/N").mid, 0.699087898/100)
+
+            # conventions other than the registered ones: a currency of its own, with the saved conventions
+            self.assertFalse(mq_curve_eur_loaded.currency.is_canonical)
+            self.assertEqual(mq_curve_eur_loaded.currency, eur_ccy)
+            self.assertIs(mq_curve_eur_loaded.currency, mq_curve_eur_loaded.get_market_quote_by_label("1Y").currency)
+
+            self.assertEqual(mq_curve_eur_loaded.get_market_quote_by_label("O/N").ask, 0.71/100)
+            self.assertEqual(mq_curve_eur_loaded.get_annual_coupon_schedule("2Y"), ("1Y",))
+            self.assertEqual(mq_curve_eur_loaded.get_discount_factor_curve(Rate.linearization_enum.log_ds_factor).get_discount_factor_by_label("2Y").mid,
+                             mq_curve_eur.get_discount_factor_curve(Rate.linearization_enum.log_ds_factor).get_discount_factor_by_label("2Y").mid)
+
+            # the same content hash as the curves the snapshot was saved from
+            self.assertEqual(Rate.get_curve_content_hash(mq_curve_eur_loaded), Rate.get_curve_content_hash(mq_curve_eur))
+
+            del df_curve_usd_loaded, mq_curve_eur_loaded, df_1M, mq_on_loaded
+
+            # registered conventions: the canonical currency
+            sgd_ccy = Rate.currency_registry.get_currency("SGD")
+            df_curve_sgd = Rate.cls_discount_factor_curve(sgd_ccy, [Rate.cls_discount_factor(sgd_ccy, Rate.cls_tenor(date_of_today, datetime.date(2017,7,17), "1M"), 0.9993)],
+                                                          Rate.linearization_enum.log_ds_factor)
+            Rate.save_curve_snapshot(file_path, [df_curve_sgd])
+            df_curve_sgd_loaded, = Rate.load_curve_snapshot(file_path, None)
+            self.assertIs(df_curve_sgd_loaded.currency, sgd_ccy)
+            self.assertIs(df_curve_sgd_loaded.get_discount_factor_by_label("1M").currency, sgd_ccy)
+
+
+class Test_read_market_quote_curve_dicts(unittest.TestCase):
+    def test_init(self):
+        quote_line_list = ["as_of_date,currency,label,start,maturity,mid,bid,ask",
+                           "2016-09-01,USD,O/N,2016-09-01,2016-09-02,0.00699101474,,",
+                           "2016-09-01,USD,T/N,2016-09-02,2016-09-06,0.00699087898,,",
+                           "2016-09-01,USD,1Y,2016-09-06,2017-09-06,0.00961456991,,",
+                           "2016-09-01,EUR,O/N,2016-09-01,2016-09-02,,-0.0036,-0.0034",
+                           "2016-09-01,EUR,T/N,2016-09-02,2016-09-06,-0.0035,,",
+                           "2016-09-02,USD,O/N,2016-09-02,2016-09-05,0.007,,",
+                           "2016-09-02,USD,T/N,2016-09-05,2016-09-06,0.007,,",
+                           "2016-09-01,USD,1Y,2016-09-06,2017-09-06,0.0096,,",
+                           "2016-09-02,USD,1Y,2016-09-06,2017-09-06,not a rate,,",
+                           "2016-09-02,USD,1Y,2016-09-06,2017-09-06,0.0097,,"]
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_file_path = os.path.join(directory, "quotes.csv")
+            with open(csv_file_path, "w") as quote_file:
+                quote_file.write("\n".join(quote_line_list) + "\n")
+
+            error_dict = {}
+            with self.assertLogs(logger, "CRITICAL") as log_context:
+                mq_curve_dict_list = list(Rate.read_market_quote_curve_dicts(csv_file_path, chunk_size=3,
+                                                                             currency_convention_dict={"usd": (360, Rate.date_shift_enum.D2)},
+                                                                             error_dict=error_dict))
+            self.assertEqual(len(log_context.records), 2)
+
+            # a blank line and a line which is not JSON are counted as lines of the file
+            jsonl_file_path = os.path.join(directory, "quotes.jsonl")
+            with open(jsonl_file_path, "w") as quote_file:
+                field_list = quote_line_list[0].split(",")
+                for quote_line in quote_line_list[1:4]:
+                    quote_file.write(json.dumps(dict(zip(field_list, quote_line.split(",")))) + "\n")
+                quote_file.write("\n{not json\n")
+                for quote_line in quote_line_list[4:6]:
+                    quote_file.write(json.dumps(dict(zip(field_list, quote_line.split(",")))) + "\n")
+
+            error_dict_jsonl = {}
+            with self.assertLogs(logger, "CRITICAL") as log_context:
+                mq_curve_dict_list_jsonl = list(Rate.read_market_quote_curve_dicts(jsonl_file_path, error_dict=error_dict_jsonl))
+            self.assertEqual(len(log_context.records), 1)
+
+        # the quote of 2016-09-01 after 2016-09-02 and the one which is not a rate are skipped, by line of the file
+        self.assertEqual(sorted(error_dict), [9, 10])
+        self.assertEqual(sorted(error_dict_jsonl), [5])
+
+        self.assertEqual([mq_curve_dict_iter.today_date for mq_curve_dict_iter in mq_curve_dict_list], [datetime.date(2016, 9, 1), datetime.date(2016, 9, 2)])
+        self.assertEqual(list(mq_curve_dict_list[0].curve_dict), ["USD", "EUR"])
+        self.assertEqual(list(mq_curve_dict_list[1].curve_dict), ["USD"])
+
+        # USD with the conventions given, EUR with the registered ones, one currency per label for the whole file
+        mq_curve_usd = mq_curve_dict_list[1].get_curve_by_currency_label("USD")
+        self.assertEqual((mq_curve_usd.currency.number_of_days_1year, mq_curve_usd.currency.spot_date_shift), (360, Rate.date_shift_enum.D2))
+        self.assertIs(mq_curve_usd.currency, mq_curve_dict_list[0].get_curve_by_currency_label("USD").currency)
+        self.assertIs(mq_curve_dict_list[0].get_curve_by_currency_label("EUR").currency, Rate.currency_registry.get_currency("EUR"))
+        self.assertEqual([market_quote_iter.tenor.label for market_quote_iter in mq_curve_usd.fx_rate_list], ["O/N", "T/N", "1Y"])
+        self.assertEqual(mq_curve_usd.get_market_quote_by_label("1Y").mid, 0.0097)
+
+        mq_curve_eur = mq_curve_dict_list[0].get_curve_by_currency_label("EUR")
+        self.assertAlmostEqual(mq_curve_eur.get_market_quote_by_label("O/N").mid, -0.0035, places=15)
+        self.assertEqual(mq_curve_eur.get_market_quote_by_label("O/N").ask, -0.0034)
+
+        df_curve_dict = mq_curve_dict_list[0].get_discount_factor_curve_dict(Rate.linearization_enum.log_ds_factor)
+        self.assertEqual(round(df_curve_dict.get_curve_by_currency_label("USD").get_discount_factor_by_label("1Y").mid, 12),
+                         round(1 / (1 + 0.00699101474 / 360) / (1 + 0.00699087898 * 4 / 360) / (1 + 0.00961456991 * 365 / 360), 12))
+
+        self.assertEqual(len(mq_curve_dict_list_jsonl), 1)
+        self.assertEqual(mq_curve_dict_list_jsonl[0].get_curve_hash_by_currency_label("EUR"), mq_curve_dict_list[0].get_curve_hash_by_currency_label("EUR"))
+
+
 if __name__ == '__main__':
     unittest.main()
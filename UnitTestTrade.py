@@ -1,128 +1,300 @@
-#!/usr/bin/python
-# -*- coding: utf-8 -*-
-
-import unittest
-import datetime
-import Rate2 as Rate
-import Trade
-
-class TestFXTrade(unittest.TestCase):
-    """Test cases for FX trade creation and management"""
-
-    def setUp(self):
-        """Set up test fixtures before each test method"""
-        # Define common test data
-        self.trade_date = datetime.date(2023, 1, 1)
-        self.maturity_date = datetime.date(2023, 1, 3)
-        self.trade_uti = "TEST123"
-        self.counterparty = "CPTY1"
-        self.portfolio = "PORT1"
-        
-        # Define currency amounts
-        self.usd_amount = -1000000
-        self.eur_amount = 925000
-
-    def test_create_fx_trade_eurusd(self):
-        """Test creation of EUR/USD trade"""
-        trade = Trade.create_fx_trade(
-            trade_uti=self.trade_uti,
-            counterparty=self.counterparty,
-            portfolio=self.portfolio,
-            trade_date=self.trade_date,
-            maturity_date=self.maturity_date,
-            base_ccy_input="EUR",
-            quotation_input="EUR-USD",
-            ccy1_input="EUR",
-            ccy1_notional=self.eur_amount,
-            ccy2_input="USD",
-            ccy2_notional=self.usd_amount
-        )
-
-        # Verify trade attributes
-        self.assertEqual(trade.trade_uti, self.trade_uti.upper())
-        self.assertEqual(trade.counterparty, self.counterparty.upper())
-        self.assertEqual(trade.portfolio, self.portfolio.upper())
-        self.assertEqual(trade.trade_date, self.trade_date)
-        self.assertEqual(trade.maturity_date, self.maturity_date)
-        self.assertEqual(trade.base_ccy_label, "EUR")
-        self.assertEqual(trade.und_ccy_label, "USD")
-        self.assertEqual(trade.base_ccy_notional, self.eur_amount)
-        self.assertEqual(trade.und_ccy_notional, self.usd_amount)
-        self.assertAlmostEqual(trade.price, abs(self.usd_amount/self.eur_amount))
-
-    def test_create_fx_trade_detail(self):
-        """Test creation of detailed FX trade with spot price"""
-        spot_price = 1.0800
-        trade_detail = Trade.create_fx_trade_detail(
-            trade_uti=self.trade_uti,
-            counterparty=self.counterparty,
-            portfolio=self.portfolio,
-            trade_date=self.trade_date,
-            maturity_date=self.maturity_date,
-            base_ccy_input="EUR",
-            quotation_input="EUR-USD",
-            ccy1_input="EUR",
-            ccy1_notional=self.eur_amount,
-            ccy2_input="USD",
-            ccy2_notional=self.usd_amount,
-            contract_spot_value=spot_price
-        )
-
-        # Verify detailed trade attributes
-        self.assertEqual(trade_detail.spot_price.value, spot_price)
-        self.assertAlmostEqual(
-            trade_detail.swap_points_value, 
-            trade_detail.price - spot_price
-        )
-
-    def test_quotation_modes(self):
-        """Test different quotation modes for trades"""
-        # Test EUR-USD quotation
-        trade_eurusd = Trade.create_fx_trade(
-            trade_uti=self.trade_uti,
-            counterparty=self.counterparty,
-            portfolio=self.portfolio,
-            trade_date=self.trade_date,
-            maturity_date=self.maturity_date,
-            base_ccy_input="EUR",
-            quotation_input="EUR-USD",
-            ccy1_input="EUR",
-            ccy1_notional=self.eur_amount,
-            ccy2_input="USD",
-            ccy2_notional=self.usd_amount
-        )
-
-        # Test USD-EUR quotation
-        trade_usdeur = Trade.create_fx_trade(
-            trade_uti=self.trade_uti,
-            counterparty=self.counterparty,
-            portfolio=self.portfolio,
-            trade_date=self.trade_date,
-            maturity_date=self.maturity_date,
-            base_ccy_input="EUR",
-            quotation_input="USD-EUR",
-            ccy1_input="EUR",
-            ccy1_notional=self.eur_amount,
-            ccy2_input="USD",
-            ccy2_notional=self.usd_amount
-        )
-
-        # Verify quotation modes and prices
-        self.assertEqual(trade_eurusd.quotation_mode, Rate.quotation_mode_enum.base_und)
-        self.assertEqual(trade_usdeur.quotation_mode, Rate.quotation_mode_enum.und_base)
-        self.assertAlmostEqual(trade_eurusd.price * trade_usdeur.price, 1.0)
-
-    def test_cash_flow(self):
-        """Test cash flow creation"""
-        amount = 1000000
-        payment_date = datetime.date(2023, 1, 3)
-        currency = Rate.cls_currency("USD")
-        
-        cash_flow = Trade.simple_cash_flow(amount, payment_date, currency)
-        
-        self.assertEqual(cash_flow.amount, amount)
-        self.assertEqual(cash_flow.payment_date, payment_date)
-        self.assertEqual(cash_flow.currency.label, "USD")
-
-if __name__ == '__main__':
-    unittest.main()
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import unittest
+import datetime
+import json
+import os
+import tempfile
+import Rate2 as Rate
+import Trade
+from log4py import logger
+
+class TestFXTrade(unittest.TestCase):
+    """Test cases for FX trade creation and management"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        # Define common test data
+        self.trade_date = datetime.date(2023, 1, 1)
+        self.maturity_date = datetime.date(2023, 1, 3)
+        self.trade_uti = "TEST123"
+        self.counterparty = "CPTY1"
+        self.portfolio = "PORT1"
+        
+        # Define currency amounts
+        self.usd_amount = -1000000
+        self.eur_amount = 925000
+
+    def test_create_fx_trade_eurusd(self):
+        """Test creation of EUR/USD trade"""
+        trade = Trade.create_fx_trade(
+            trade_uti=self.trade_uti,
+            counterparty=self.counterparty,
+            portfolio=self.portfolio,
+            trade_date=self.trade_date,
+            maturity_date=self.maturity_date,
+            base_ccy_input="EUR",
+            quotation_input="EUR-USD",
+            ccy1_input="EUR",
+            ccy1_notional=self.eur_amount,
+            ccy2_input="USD",
+            ccy2_notional=self.usd_amount
+        )
+
+        # Verify trade attributes
+        self.assertEqual(trade.trade_uti, self.trade_uti.upper())
+        self.assertEqual(trade.counterparty, self.counterparty.upper())
+        self.assertEqual(trade.portfolio, self.portfolio.upper())
+        self.assertEqual(trade.trade_date, self.trade_date)
+        self.assertEqual(trade.maturity_date, self.maturity_date)
+        self.assertEqual(trade.base_ccy_label, "EUR")
+        self.assertEqual(trade.und_ccy_label, "USD")
+        self.assertEqual(trade.base_ccy_notional, self.eur_amount)
+        self.assertEqual(trade.und_ccy_notional, self.usd_amount)
+        self.assertAlmostEqual(trade.price, abs(self.usd_amount/self.eur_amount))
+
+    def test_canonical_currency_pair(self):
+        """Test trades of the same currency pair share one canonical currency pair"""
+        trade_list = [Trade.create_fx_trade(trade_uti=self.trade_uti + str(trade_iter),
+                                            counterparty=self.counterparty,
+                                            portfolio=self.portfolio,
+                                            trade_date=self.trade_date,
+                                            maturity_date=self.maturity_date,
+                                            base_ccy_input="EUR",
+                                            quotation_input="EUR-USD",
+                                            ccy1_input="EUR",
+                                            ccy1_notional=self.eur_amount,
+                                            ccy2_input="USD",
+                                            ccy2_notional=self.usd_amount) for trade_iter in range(2)]
+
+        self.assertIs(trade_list[0].currency_pair, trade_list[1].currency_pair)
+        self.assertIs(trade_list[0].currency_pair.base, Rate.currency_registry.get_currency("EUR"))
+        self.assertEqual(trade_list[0].currency_pair.base, Rate.cls_currency("EUR"))
+        self.assertNotEqual(trade_list[0].currency_pair.base, Rate.cls_currency("EUR", 360))
+
+    def test_create_fx_trade_detail(self):
+        """Test creation of detailed FX trade with spot price"""
+        spot_price = 1.0800
+        trade_detail = Trade.create_fx_trade_detail(
+            trade_uti=self.trade_uti,
+            counterparty=self.counterparty,
+            portfolio=self.portfolio,
+            trade_date=self.trade_date,
+            maturity_date=self.maturity_date,
+            base_ccy_input="EUR",
+            quotation_input="EUR-USD",
+            ccy1_input="EUR",
+            ccy1_notional=self.eur_amount,
+            ccy2_input="USD",
+            ccy2_notional=self.usd_amount,
+            contract_spot_value=spot_price
+        )
+
+        # Verify detailed trade attributes
+        self.assertEqual(trade_detail.spot_price.value, spot_price)
+        self.assertAlmostEqual(
+            trade_detail.swap_points_value, 
+            trade_detail.price - spot_price
+        )
+
+    def test_quotation_modes(self):
+        """Test different quotation modes for trades"""
+        # Test EUR-USD quotation
+        trade_eurusd = Trade.create_fx_trade(
+            trade_uti=self.trade_uti,
+            counterparty=self.counterparty,
+            portfolio=self.portfolio,
+            trade_date=self.trade_date,
+            maturity_date=self.maturity_date,
+            base_ccy_input="EUR",
+            quotation_input="EUR-USD",
+            ccy1_input="EUR",
+            ccy1_notional=self.eur_amount,
+            ccy2_input="USD",
+            ccy2_notional=self.usd_amount
+        )
+
+        # Test USD-EUR quotation
+        trade_usdeur = Trade.create_fx_trade(
+            trade_uti=self.trade_uti,
+            counterparty=self.counterparty,
+            portfolio=self.portfolio,
+            trade_date=self.trade_date,
+            maturity_date=self.maturity_date,
+            base_ccy_input="EUR",
+            quotation_input="USD-EUR",
+            ccy1_input="EUR",
+            ccy1_notional=self.eur_amount,
+            ccy2_input="USD",
+            ccy2_notional=self.usd_amount
+        )
+
+        # Verify quotation modes and prices
+        self.assertEqual(trade_eurusd.quotation_mode, Rate.quotation_mode_enum.base_und)
+        self.assertEqual(trade_usdeur.quotation_mode, Rate.quotation_mode_enum.und_base)
+        self.assertAlmostEqual(trade_eurusd.price * trade_usdeur.price, 1.0)
+
+    def test_trade_book(self):
+        """Test trade book columns and trade views"""
+        trade_list = [Trade.create_fx_trade(self.trade_uti + str(trade_iter), "CPTY" + str(trade_iter % 2), self.portfolio,
+                                            self.trade_date, self.maturity_date + datetime.timedelta(days=trade_iter),
+                                            "EUR", "EUR-USD" if trade_iter % 3 else "USD-EUR",
+                                            "EUR", self.eur_amount, "USD", self.usd_amount - trade_iter) for trade_iter in range(6)]
+
+        trade_book = Trade.create_trade_book_by_trades(trade_list)
+
+        # Verify the columns
+        self.assertEqual(len(trade_book), 6)
+        self.assertEqual(trade_book.counterparty_label_list, ["CPTY0", "CPTY1"])
+        self.assertEqual(trade_book.counterparty_code_array.tolist(), [0, 1, 0, 1, 0, 1])
+        self.assertEqual(len(trade_book.currency_pair_list), 2)
+        self.assertEqual(trade_book.quotation_mode_array.tolist(), [-1, 1, 1, -1, 1, 1])
+        self.assertEqual(trade_book.spot_price_array, None)
+
+        # Verify the views are the trades the book was created from
+        for trade_iter, trade_view_iter in zip(trade_list, trade_book):
+            self.assertIsInstance(trade_view_iter, Trade.cls_spot_forward_trade)
+            self.assertEqual(trade_view_iter.trade_uti, trade_iter.trade_uti)
+            self.assertEqual(trade_view_iter.counterparty, trade_iter.counterparty)
+            self.assertEqual(trade_view_iter.trade_date, trade_iter.trade_date)
+            self.assertEqual(trade_view_iter.maturity_date, trade_iter.maturity_date)
+            self.assertIs(trade_view_iter.currency_pair, trade_iter.currency_pair)
+            self.assertEqual(trade_view_iter.price, trade_iter.price)
+            self.assertEqual(trade_view_iter.base_ccy_notional, trade_iter.base_ccy_notional)
+            self.assertEqual(trade_view_iter.und_ccy_notional, trade_iter.und_ccy_notional)
+
+        self.assertEqual(trade_book[-1].trade_uti, trade_list[-1].trade_uti)
+
+        # Verify books of trades with spot prices
+        trade_detail_book = Trade.create_trade_book_by_trades([Trade.create_fx_trade_detail(self.trade_uti, self.counterparty, self.portfolio,
+                                                                                            self.trade_date, self.maturity_date, "EUR", "EUR-USD",
+                                                                                            "EUR", self.eur_amount, "USD", self.usd_amount, 1.08)])
+        self.assertEqual(trade_detail_book[0].spot_price.value, 1.08)
+        self.assertAlmostEqual(trade_detail_book[0].swap_points_value, abs(self.usd_amount/self.eur_amount) - 1.08)
+
+    def test_create_trade_book(self):
+        """Test bulk trade book creation against create_fx_trade"""
+        row_list = [(" eur", "EUR-USD", "eur", self.eur_amount, "USD", self.usd_amount),
+                    ("EUR", "USD-EUR ", "EUR", self.eur_amount, "usd", self.usd_amount),
+                    ("usd", "EUR-USD", "EUR", self.eur_amount, "USD", self.usd_amount),
+                    ("USD", "USD-EUR", "USD", self.usd_amount, "EUR", self.eur_amount),
+                    ("GBP", "EUR-USD", "EUR", self.eur_amount, "USD", self.usd_amount),
+                    ("EUR", "EUR-GBP", "EUR", self.eur_amount, "USD", self.usd_amount),
+                    ("EUR", "EUR-USD", "EUR", 0.0, "USD", self.usd_amount)]
+        number_of_rows = len(row_list)
+
+        error_dict = {}
+        with self.assertLogs(logger, "CRITICAL") as log_context:
+            trade_book = Trade.create_trade_book([" uti" + str(row) for row in range(number_of_rows)],
+                                                 ["cpty "] * number_of_rows,
+                                                 [self.portfolio] * number_of_rows,
+                                                 [self.trade_date] * number_of_rows,
+                                                 [self.maturity_date] * number_of_rows,
+                                                 *[[row_iter[column] for row_iter in row_list] for column in range(6)],
+                                                 error_dict=error_dict)
+        self.assertEqual(len(log_context.records), 3)
+
+        # Verify the bad rows are reported instead of creating trades without price
+        self.assertEqual(sorted(error_dict), [4, 5, 6])
+        self.assertEqual(len(trade_book), 4)
+        self.assertEqual(trade_book.counterparty_label_list, ["CPTY"])
+
+        # Verify the valid rows are the trades create_fx_trade creates
+        for row, trade_view_iter in enumerate(trade_book):
+            trade_iter = Trade.create_fx_trade(" uti" + str(row), "cpty ", self.portfolio, self.trade_date, self.maturity_date, *row_list[row])
+            self.assertEqual(trade_view_iter.trade_uti, trade_iter.trade_uti)
+            self.assertEqual(trade_view_iter.counterparty, trade_iter.counterparty)
+            self.assertIs(trade_view_iter.currency_pair, trade_iter.currency_pair)
+            self.assertAlmostEqual(trade_view_iter.price, trade_iter.price)
+            self.assertEqual(trade_view_iter.base_ccy_notional, trade_iter.base_ccy_notional)
+            self.assertEqual(trade_view_iter.und_ccy_notional, trade_iter.und_ccy_notional)
+
+        # Verify spot prices and columns of different lengths
+        with self.assertLogs(logger, "CRITICAL"):
+            trade_detail_book = Trade.create_trade_book(["UTI1", "UTI2"], ["CPTY"] * 2, ["PF"] * 2, [self.trade_date] * 2, [self.maturity_date] * 2,
+                                                        ["EUR"] * 2, ["EUR-USD"] * 2, ["EUR"] * 2, [1.0, 1.0], ["USD"] * 2, [-1.1, -1.1], [1.08, float("nan")])
+        self.assertEqual(len(trade_detail_book), 1)
+        self.assertEqual(trade_detail_book[0].spot_price.value, 1.08)
+        with self.assertLogs(logger, "CRITICAL"):
+            self.assertIsNone(Trade.create_trade_book(["UTI1"], [], [], [], [], [], [], [], [], [], []))
+
+        # Verify dates given as lists of int ordinals
+        trade_ordinal_book = Trade.create_trade_book(["UTI1"], ["CPTY"], ["PF"], [self.trade_date.toordinal()], [self.maturity_date.toordinal()],
+                                                     ["EUR"], ["EUR-USD"], ["EUR"], [1.0], ["USD"], [-1.1])
+        self.assertEqual(len(trade_ordinal_book), 1)
+        self.assertEqual(trade_ordinal_book[0].trade_date, self.trade_date)
+        self.assertEqual(trade_ordinal_book[0].maturity_date, self.maturity_date)
+
+        # Verify rows which can not be converted are reported instead of failing the book
+        error_dict = {}
+        with self.assertLogs(logger, "CRITICAL") as log_context:
+            trade_bad_value_book = Trade.create_trade_book(["UTI1", None, "UTI3", "UTI4", "UTI5"], ["CPTY"] * 5, ["PF"] * 5,
+                                                           [self.trade_date] * 5,
+                                                           [self.maturity_date, self.maturity_date, None, self.maturity_date, self.maturity_date],
+                                                           ["EUR"] * 5, ["EUR-USD"] * 5, ["EUR"] * 5, [1.0, 1.0, 1.0, "abc", 1.0], ["USD"] * 5, [-1.1] * 5,
+                                                           error_dict=error_dict)
+        self.assertEqual(len(log_context.records), 3)
+        self.assertEqual(sorted(error_dict), [1, 2, 3])
+        self.assertEqual(error_dict[1], "trade uti is missing")
+        self.assertEqual(error_dict[2], "maturity date None is not a date")
+        self.assertEqual(error_dict[3], "ccy1 notional 'abc' is not a number")
+        self.assertEqual([trade_view_iter.trade_uti for trade_view_iter in trade_bad_value_book], ["UTI1", "UTI5"])
+        self.assertEqual(trade_bad_value_book[1].maturity_date, self.maturity_date)
+
+    def test_read_trade_books(self):
+        """Test streaming trade files as trade books by chunk"""
+        field_list = ["trade_uti", "counterparty", "portfolio", "trade_date", "maturity_date", "base_ccy",
+                      "quotation", "ccy1", "ccy1_notional", "ccy2", "ccy2_notional"]
+        row_list = [["uti" + str(row), "cpty", "pf", "2023-01-01", "2023-01-03", "EUR", "EUR-USD", "eur", "925000", "USD", "-1000000"]
+                    for row in range(5)]
+        row_list[1][3] = "2023-13-01"
+        row_list[3][6] = "EUR-GBP"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, "trades.csv")
+            with open(csv_path, "w") as trade_file:
+                trade_file.write("\n".join(",".join(row_iter) for row_iter in [field_list] + row_list) + "\n")
+
+            error_dict = {}
+            with self.assertLogs(logger, "CRITICAL") as log_context:
+                trade_book_list = list(Trade.read_trade_books(csv_path, chunk_size=2, error_dict=error_dict))
+            self.assertEqual(len(log_context.records), 2)
+
+            # Verify the chunks and the skipped lines, by line of the file after the header line
+            self.assertEqual([len(trade_book_iter) for trade_book_iter in trade_book_list], [1, 1, 1])
+            self.assertEqual(sorted(error_dict), [3, 5])
+            self.assertEqual([trade_book_iter[0].trade_uti for trade_book_iter in trade_book_list], ["UTI0", "UTI2", "UTI4"])
+
+            trade_iter = trade_book_list[0][0]
+            self.assertEqual(trade_iter.maturity_date, self.maturity_date)
+            self.assertIs(trade_iter.currency_pair, Rate.currency_registry.get_currency_pair("EUR", "USD", Rate.quotation_mode_enum.base_und))
+            self.assertAlmostEqual(trade_iter.price, abs(self.usd_amount/self.eur_amount))
+
+            # Verify JSONL files with spot prices
+            jsonl_path = os.path.join(tmp_dir, "trades.jsonl")
+            with open(jsonl_path, "w") as trade_file:
+                for row_iter in row_list[:1]:
+                    trade_file.write(json.dumps(dict(zip(field_list, row_iter), contract_spot_value=1.08)) + "\n")
+                trade_file.write("\n{not json\n")
+
+            error_dict = {}
+            with self.assertLogs(logger, "CRITICAL"):
+                trade_detail_book = next(Trade.read_trade_books(jsonl_path, error_dict=error_dict))
+            self.assertEqual(trade_detail_book[0].spot_price.value, 1.08)
+            self.assertEqual(sorted(error_dict), [3])
+
+    def test_cash_flow(self):
+        """Test cash flow creation"""
+        amount = 1000000
+        payment_date = datetime.date(2023, 1, 3)
+        currency = Rate.cls_currency("USD")
+        
+        cash_flow = Trade.simple_cash_flow(amount, payment_date, currency)
+        
+        self.assertEqual(cash_flow.amount, amount)
+        self.assertEqual(cash_flow.payment_date, payment_date)
+        self.assertEqual(cash_flow.currency.label, "USD")
+
+if __name__ == '__main__':
+    unittest.main()